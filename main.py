@@ -4,8 +4,8 @@
 Batocera Gamelist 翻譯工具 - 主程式入口
 
 這是程式的進入點，負責初始化應用程式並啟動主視窗。
+帶有子命令時（scan/dict/translate/write/all）改用命令列模式，不載入 PyQt6。
 """
-from src.ui import MainWindow
 import sys
 import os
 from pathlib import Path
@@ -41,8 +41,14 @@ _ensure_config_dir()
 
 def main():
     """主程式進入點"""
+    from src.cli import is_cli_invocation
+    if is_cli_invocation(sys.argv[1:]):
+        from src.cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
+
     from PyQt6.QtWidgets import QApplication
     from PyQt6.QtCore import Qt
+    from src.ui import MainWindow
 
     # 啟用高 DPI 支援
     if hasattr(Qt.ApplicationAttribute, 'AA_EnableHighDpiScaling'):
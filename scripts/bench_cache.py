@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+GlobalCache 查詢成本微基準測試
+
+比較兩種存取方式的每次查詢成本：
+- legacy：舊版做法（每次 get 都重新 connect、命中時 UPDATE + commit、
+          記憶體快取滿了以 min() 掃描整個 dict 淘汰）
+- current：目前的 GlobalCache（OrderedDict LRU、執行緒持久連線、命中次數批次寫回）
+
+使用方式：
+    python scripts/bench_cache.py [筆數] [記憶體快取大小]
+"""
+import sqlite3
+import sys
+import os
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.cache import GlobalCache
+
+
+class LegacyCache(GlobalCache):
+    """重現舊版存取模式，僅供比較用"""
+
+    def get(self, service, query, language):
+        key = self._make_key(service, query, language)
+        with self._lock:
+            if key in self._memory_cache:
+                value, timestamp = self._memory_cache[key]
+                if time.time() - timestamp < self.max_age_days * 86400:
+                    return value
+                del self._memory_cache[key]
+
+        with sqlite3.connect(self.cache_file, timeout=10.0) as conn:
+            row = conn.execute(
+                'SELECT result, created_at FROM cache WHERE key = ?', (key,)).fetchone()
+            if row:
+                result, created_at = row
+                conn.execute(
+                    'UPDATE cache SET hit_count = hit_count + 1 WHERE key = ?', (key,))
+                conn.commit()
+                with self._lock:
+                    self._add_to_memory_cache(key, result, created_at)
+                return result
+        return None
+
+    def _add_to_memory_cache(self, key, value, timestamp):
+        if len(self._memory_cache) >= self.memory_cache_size:
+            oldest_key = min(self._memory_cache.items(),
+                             key=lambda x: x[1][1])[0]
+            del self._memory_cache[oldest_key]
+        self._memory_cache[key] = (value, timestamp)
+
+
+def populate(cache_file: Path, count: int) -> None:
+    """建立測試資料"""
+    cache = GlobalCache(cache_file=cache_file, memory_cache_size=count + 1)
+    for i in range(count):
+        cache.set('bench', f'Game Title {i}', 'zh-TW', f'遊戲 {i}')
+    cache.flush_to_db()
+    cache.close()
+
+
+def run(cache_cls, cache_file: Path, count: int, memory_size: int) -> float:
+    """
+    依序查詢全部資料兩輪（第一輪大多落到資料庫，第二輪測 LRU 淘汰）
+
+    Returns:
+        每次查詢平均耗時（微秒）
+    """
+    cache = cache_cls(cache_file=cache_file, memory_cache_size=memory_size)
+    start = time.perf_counter()
+    for _ in range(2):
+        for i in range(count):
+            cache.get('bench', f'Game Title {i}', 'zh-TW')
+    elapsed = time.perf_counter() - start
+    cache.close()
+    return elapsed / (count * 2) * 1_000_000
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    memory_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    print("=" * 60)
+    print(f"GlobalCache 微基準測試：{count} 筆 × 2 輪，記憶體快取 {memory_size}")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_file = Path(temp_dir) / 'bench_cache.db'
+        populate(cache_file, count)
+
+        legacy = run(LegacyCache, cache_file, count, memory_size)
+        current = run(GlobalCache, cache_file, count, memory_size)
+
+    print(f"  legacy : {legacy:8.1f} µs/次")
+    print(f"  current: {current:8.1f} µs/次")
+    if current > 0:
+        print(f"  加速   : {legacy / current:8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
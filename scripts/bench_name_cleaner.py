@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+檔名清理微基準測試
+
+以 gamelists_local/ 中實際的遊戲名稱比較兩種清理方式：
+- legacy：舊版 TranslationEngine.clean_filename（每次呼叫都執行五個未編譯的 re.sub）
+- current：name_cleaner.clean（預先編譯的清理步驟 + LRU 快取）
+
+每個項目模擬翻譯流程中的呼叫次數（翻譯名稱、搜尋描述、清除快取、跨平台去重），
+並確認兩者的清理結果完全相同。
+
+使用方式：
+    python scripts/bench_name_cleaner.py [gamelists 目錄] [每項呼叫次數]
+"""
+import re
+import sys
+import os
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils import iter_gamelist
+from src.utils.name_cleaner import clean, clean_game_name
+
+
+def legacy_clean(filename: str) -> str:
+    """重現舊版 clean_filename，僅供比較用"""
+    name = re.sub(r'\.[a-zA-Z0-9]+$', '', filename)
+    name = re.sub(r'\s*\([^)]*\)', '', name)
+    name = re.sub(r'\s*\[[^\]]*\]', '', name)
+    name = re.sub(r'\s*(Rev\s*\d+|v\d+\.?\d*|Ver\.?\s*\d+)',
+                  '', name, flags=re.IGNORECASE)
+    name = re.sub(r'\s+', ' ', name).strip()
+    return name
+
+
+def load_names(gamelists_dir: Path) -> list:
+    """讀取所有 gamelist.xml 的遊戲名稱"""
+    names = []
+    for gamelist in sorted(gamelists_dir.glob('*/gamelist.xml')):
+        try:
+            names.extend(game.name for game in iter_gamelist(gamelist) if game.name)
+        except Exception as e:
+            print(f"  略過 {gamelist}: {e}")
+    return names
+
+
+def run(func, names: list, calls: int) -> float:
+    """
+    依序清理所有名稱，每個名稱呼叫 calls 次
+
+    Returns:
+        每次呼叫平均耗時（微秒）
+    """
+    start = time.perf_counter()
+    for name in names:
+        for _ in range(calls):
+            func(name)
+    elapsed = time.perf_counter() - start
+    return elapsed / (len(names) * calls) * 1_000_000
+
+
+def main():
+    gamelists_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path('gamelists_local')
+    calls = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    names = load_names(gamelists_dir)
+    if not names:
+        print(f"找不到任何遊戲名稱: {gamelists_dir}")
+        return
+
+    mismatches = [n for n in names if legacy_clean(n) != clean(n)]
+    clean.cache_clear()
+    clean_game_name.cache_clear()
+
+    print("=" * 60)
+    print(f"檔名清理微基準測試：{len(names)} 個名稱（{len(set(names))} 個不重複）× {calls} 次")
+    print("=" * 60)
+
+    legacy = run(legacy_clean, names, calls)
+    current = run(clean, names, calls)
+    info = clean.cache_info()
+
+    print(f"  legacy : {legacy:8.2f} µs/次")
+    print(f"  current: {current:8.2f} µs/次（快取命中 {info.hits}，未命中 {info.misses}）")
+    if current > 0:
+        print(f"  加速   : {legacy / current:8.1f}x")
+    print(f"  結果不一致: {len(mismatches)}")
+    for name in mismatches[:10]:
+        print(f"    {name!r}: {legacy_clean(name)!r} != {clean(name)!r}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,12 @@
+# 基準測試套件
+"""
+離線、可重複執行的效能基準測試：
+
+- stub_server: 重播錄製的 Wikipedia / DuckDuckGo / googletrans / Gemini 回應，
+  可設定延遲、抖動、錯誤率與限流率
+- metrics: 單項延遲百分位數、吞吐量與記憶體峰值量測
+- run_pipeline: 以 gamelists_local/ 的實際資料執行階段一到四並輸出報告
+
+錄製檔位於 fixtures/recorded.json，以服務名稱分組，鍵值格式見
+stub_server.request_key；可將實際 API 的回應依相同格式加入。
+"""
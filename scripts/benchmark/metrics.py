@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+基準測試量測工具：單項延遲百分位數、吞吐量與記憶體峰值
+"""
+import functools
+import os
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+    psutil = None
+
+
+def percentile(values: List[float], p: float) -> Optional[float]:
+    """
+    百分位數（nearest-rank 法，結果一定是實際量到的值）
+
+    Args:
+        values: 量測值
+        p: 百分位（0~100）
+
+    Returns:
+        百分位數；沒有量測值時回傳 None
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * p // 100))  # ceil(n * p / 100)
+    return ordered[int(rank) - 1]
+
+
+class LatencyRecorder:
+    """記錄每個項目的處理時間（可在多個執行緒同時記錄）"""
+
+    def __init__(self):
+        self.samples: List[float] = []
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self.samples.append(seconds)
+
+    def wrap(self, func: Callable) -> Callable:
+        """包裝函式，每次呼叫都記錄耗時"""
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            began = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add(time.perf_counter() - began)
+        return timed
+
+
+class MethodTimer:
+    """
+    暫時以 LatencyRecorder 包裝類別方法，離開時還原
+
+    使用方式：
+        with MethodTimer(TranslationEngine, 'translate_game') as recorder:
+            pipeline.translate(...)
+        print(percentile(recorder.samples, 99))
+    """
+
+    def __init__(self, cls: type, method_name: str):
+        self.cls = cls
+        self.method_name = method_name
+        self.recorder = LatencyRecorder()
+        self._original = None
+
+    def __enter__(self) -> LatencyRecorder:
+        self._original = self.cls.__dict__[self.method_name]
+        setattr(self.cls, self.method_name, self.recorder.wrap(self._original))
+        return self.recorder
+
+    def __exit__(self, *exc) -> None:
+        setattr(self.cls, self.method_name, self._original)
+
+
+def current_rss() -> Optional[int]:
+    """
+    目前的常駐記憶體（位元組）
+
+    Linux 讀取 /proc/self/statm；其他平台需要 psutil，沒有安裝時回傳 None。
+    """
+    if PSUTIL_AVAILABLE:
+        return psutil.Process().memory_info().rss
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def process_peak_rss() -> Optional[int]:
+    """整個行程至今的記憶體峰值（位元組），無法取得時回傳 None"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS 以位元組為單位，Linux 以 KB 為單位
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class RssSampler:
+    """
+    在背景執行緒定期取樣記憶體，記錄區段內的峰值
+
+    ru_maxrss 是整個行程的峰值，無法分辨各階段；因此各階段另外取樣。
+    無法取得目前記憶體時，退回使用行程峰值。
+    """
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        rss = current_rss()
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> 'RssSampler':
+        self._sample()
+        self._thread = threading.Thread(target=self._run, name='rss-sampler', daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+        if self.peak is None:
+            self.peak = process_peak_rss()
+
+
+@dataclass
+class StageReport:
+    """單一階段的量測結果"""
+    stage: str
+    items: int                      # 處理的項目數（平台或遊戲）
+    unit: str                       # 項目單位
+    elapsed: float                  # 耗時（秒）
+    p50_ms: Optional[float] = None  # 單項延遲中位數（毫秒）
+    p99_ms: Optional[float] = None  # 單項延遲 p99（毫秒）
+    peak_rss_mb: Optional[float] = None  # 階段內記憶體峰值（MB）
+
+    @property
+    def throughput(self) -> float:
+        """每秒處理的項目數"""
+        return self.items / self.elapsed if self.elapsed > 0 else 0.0
+
+    @classmethod
+    def build(cls, stage: str, items: int, unit: str, elapsed: float,
+              samples: Optional[List[float]] = None,
+              peak_rss: Optional[int] = None) -> 'StageReport':
+        """由量測值建立報告"""
+        def ms(value):
+            return round(value * 1000, 3) if value is not None else None
+        return cls(stage=stage, items=items, unit=unit, elapsed=round(elapsed, 3),
+                   p50_ms=ms(percentile(samples or [], 50)),
+                   p99_ms=ms(percentile(samples or [], 99)),
+                   peak_rss_mb=round(peak_rss / 1024 / 1024, 1) if peak_rss else None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data['throughput'] = round(self.throughput, 2)
+        return data
@@ -0,0 +1,286 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+完整處理流程基準測試
+
+以 gamelists_local/ 的實際 gamelist.xml 執行階段一到四，所有外部服務改接本機
+stub server（重播錄製的回應，可設定延遲、錯誤率與限流率），因此可離線重複執行。
+每個階段量測吞吐量、單項延遲 p50/p99 與記憶體峰值，並可與先前的基準報告比較。
+
+字典、快取、變更清單與暫存區都建立在暫存資料夾中，不會動到使用者的資料。
+
+使用方式：
+    python scripts/benchmark/run_pipeline.py --platforms nes snes --latency 80 --jitter 40
+    python scripts/benchmark/run_pipeline.py --output baseline.json
+    python scripts/benchmark/run_pipeline.py --baseline baseline.json --error-rate 0.02
+"""
+import argparse
+import contextlib
+import io
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.benchmark.metrics import MethodTimer, RssSampler, StageReport, process_peak_rss
+from scripts.benchmark.stub_server import StubGeminiModel, StubServer, StubTranslator
+
+DEFAULT_FIXTURES = Path(__file__).parent / 'fixtures' / 'recorded.json'
+
+# 基準測試時各服務的速率上限（每秒請求數），避免限制器成為唯一的瓶頸
+RATE_LIMITED_SERVICES = ('wikipedia', 'search', 'googletrans', 'gemini')
+
+
+def prepare_roms(gamelists_dir: Path, roms_dir: Path,
+                 platforms: Optional[List[str]] = None) -> List[str]:
+    """
+    將 gamelists_local/<平台>/gamelist.xml 複製成 ROM 目錄結構（階段一的來源）
+
+    Returns:
+        複製的平台清單
+    """
+    copied = []
+    for gamelist in sorted(gamelists_dir.glob('*/gamelist.xml')):
+        platform = gamelist.parent.name
+        if platforms and platform not in platforms:
+            continue
+        (roms_dir / platform).mkdir(parents=True, exist_ok=True)
+        shutil.copy2(gamelist, roms_dir / platform / 'gamelist.xml')
+        copied.append(platform)
+    return copied
+
+
+@contextlib.contextmanager
+def isolated_environment(temp: Path, stub: StubServer, rate_limit: float):
+    """
+    將字典目錄、全局快取與外部服務暫時指向暫存資料夾與 stub server，離開時還原
+    """
+    from src.core import dictionary as dictionary_module
+    from src.services.gemini import GeminiService
+    from src.services.gemini_batch import GeminiBatchService
+    from src.services.search import SearchService
+    from src.services.translate import GoogleTransService
+    from src.services.wikipedia import WikipediaService
+    from src.utils import cache as cache_module
+    from src.utils.rate_limiter import configure_rate_limits
+
+    saved = {
+        'dicts': (dictionary_module.get_dictionaries_dir,
+                  dictionary_module.get_language_packs_dir),
+        'cache': cache_module._global_cache,
+        'wiki': WikipediaService.API_URL,
+        'search': SearchService.API_URL,
+        'translator': GoogleTransService.TRANSLATOR_FACTORY,
+        'gemini': GeminiService.MODEL_FACTORY,
+        'gemini_batch': GeminiBatchService.MODEL_FACTORY,
+    }
+
+    dictionary_module.get_dictionaries_dir = lambda: temp / 'dictionaries'
+    dictionary_module.get_language_packs_dir = lambda: temp / 'language_packs'
+    cache_module._global_cache = cache_module.GlobalCache(cache_file=temp / 'cache.db')
+    WikipediaService.API_URL = stub.url + '/wikipedia/{domain}/w/api.php'
+    SearchService.API_URL = stub.url + '/duckduckgo/'
+    GoogleTransService.TRANSLATOR_FACTORY = lambda: StubTranslator(stub.url)
+    GeminiService.MODEL_FACTORY = lambda name: StubGeminiModel(stub.url, name)
+    GeminiBatchService.MODEL_FACTORY = lambda name: StubGeminiModel(stub.url, name)
+    configure_rate_limits({name: {'rate': rate_limit, 'burst': rate_limit}
+                           for name in RATE_LIMITED_SERVICES})
+    try:
+        yield
+    finally:
+        cache_module._global_cache.close()
+        (dictionary_module.get_dictionaries_dir,
+         dictionary_module.get_language_packs_dir) = saved['dicts']
+        cache_module._global_cache = saved['cache']
+        WikipediaService.API_URL = saved['wiki']
+        SearchService.API_URL = saved['search']
+        GoogleTransService.TRANSLATOR_FACTORY = saved['translator']
+        GeminiService.MODEL_FACTORY = saved['gemini']
+        GeminiBatchService.MODEL_FACTORY = saved['gemini_batch']
+        configure_rate_limits(None)
+
+
+@contextlib.contextmanager
+def quiet(enabled: bool):
+    """隱藏各服務的 print 輸出（--verbose 時不隱藏）"""
+    if not enabled:
+        yield
+        return
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def run_benchmark(args) -> Dict:
+    """執行一次完整流程並回傳報告"""
+    from src.core import Scanner, TranslationEngine, XmlWriter
+    from src.core.pipeline import StagePipeline
+    from src.utils.settings import AppSettings
+
+    fixtures = StubServer.load_fixtures(args.fixtures) if args.fixtures.exists() else {}
+    stub = StubServer(fixtures, latency_ms=args.latency, jitter_ms=args.jitter,
+                      error_rate=args.error_rate, throttle_rate=args.throttle_rate,
+                      seed=args.seed)
+
+    log_counts: Dict[str, int] = {}
+
+    def on_log(level, module, message):
+        log_counts[level] = log_counts.get(level, 0) + 1
+        if args.verbose:
+            print(f"[{level}] {module}: {message}", file=sys.stderr)
+
+    settings = AppSettings()
+    settings.max_workers = max(args.in_flight, 1)
+    settings.max_in_flight = args.in_flight
+    settings.auto_backup = False
+
+    reports: List[StageReport] = []
+
+    with tempfile.TemporaryDirectory() as temp_dir, stub:
+        temp = Path(temp_dir)
+        platforms = prepare_roms(args.gamelists, temp / 'roms', args.platforms)
+        if not platforms:
+            raise SystemExit(f"找不到任何 gamelist.xml: {args.gamelists}")
+        print(f"平台數: {len(platforms)}，stub server: {stub.url}")
+
+        with isolated_environment(temp, stub, args.rate_limit), quiet(not args.verbose):
+            pipeline = StagePipeline(on_log=on_log, settings=settings,
+                                     local_cache_path=str(temp / 'cache'),
+                                     manifest_path=temp / 'manifest.json')
+
+            # 階段一：單項 = 平台（複製 gamelist.xml）
+            with RssSampler() as rss, MethodTimer(Scanner, 'copy_gamelist_to_cache') as rec:
+                began = time.perf_counter()
+                result = pipeline.scan(str(temp / 'roms'))
+                elapsed = time.perf_counter() - began
+            reports.append(StageReport.build('1-scan', result['copied'], 'platform',
+                                             elapsed, rec.samples, rss.peak))
+
+            # 階段二：平台內的解析為串流處理，沒有單項延遲
+            with RssSampler() as rss:
+                began = time.perf_counter()
+                result = pipeline.build_dictionaries(args.language)
+                elapsed = time.perf_counter() - began
+            reports.append(StageReport.build('2-dictionary', result['games'], 'game',
+                                             elapsed, None, rss.peak))
+
+            # 階段三：單項 = 一次 TranslationEngine.translate_game 呼叫（跨平台去重時名稱與描述分開查詢）
+            with RssSampler() as rss, MethodTimer(TranslationEngine, 'translate_game') as rec:
+                began = time.perf_counter()
+                pipeline.translate(args.language, translate_name=True,
+                                   translate_desc=args.desc,
+                                   gemini_api_key='benchmark' if args.gemini else '',
+                                   request_delay=0)
+                elapsed = time.perf_counter() - began
+            reports.append(StageReport.build('3-translate', len(rec.samples), 'call',
+                                             elapsed, rec.samples, rss.peak))
+
+            # 階段四：單項 = 平台（XmlWriter.write_translations）
+            with RssSampler() as rss, MethodTimer(XmlWriter, 'write_translations') as rec:
+                began = time.perf_counter()
+                pipeline.write_back(args.language, auto_backup=False)
+                elapsed = time.perf_counter() - began
+            reports.append(StageReport.build('4-writeback', len(rec.samples), 'platform',
+                                             elapsed, rec.samples, rss.peak))
+
+    peak = process_peak_rss()
+    return {
+        'config': {
+            'platforms': len(platforms),
+            'language': args.language,
+            'latency_ms': args.latency,
+            'jitter_ms': args.jitter,
+            'error_rate': args.error_rate,
+            'throttle_rate': args.throttle_rate,
+            'in_flight': args.in_flight,
+            'rate_limit': args.rate_limit,
+            'translate_desc': args.desc,
+            'gemini': args.gemini,
+            'seed': args.seed,
+        },
+        'stages': [report.to_dict() for report in reports],
+        'stub': stub.stats.to_dict(),
+        'logs': log_counts,
+        'process_peak_rss_mb': round(peak / 1024 / 1024, 1) if peak else None,
+    }
+
+
+def _format(value, spec: str) -> str:
+    return format(value, spec) if value is not None else '-'
+
+
+def print_report(report: Dict, baseline: Optional[Dict] = None) -> None:
+    """輸出報告表格（有基準報告時附上變化百分比）"""
+    base_stages = {s['stage']: s for s in (baseline or {}).get('stages', [])}
+
+    def change(current, previous, higher_is_better: bool) -> str:
+        if current is None or not previous:
+            return ''
+        delta = (current - previous) / previous * 100
+        better = delta >= 0 if higher_is_better else delta <= 0
+        return f" ({'+' if delta >= 0 else ''}{delta:.1f}%{'' if better else ' ▼'})"
+
+    print("=" * 78)
+    print(f"{'階段':<14}{'項目':>10}{'耗時(s)':>10}{'項目/秒':>12}{'p50(ms)':>10}{'p99(ms)':>10}{'RSS(MB)':>10}")
+    print("-" * 78)
+    for stage in report['stages']:
+        print(f"{stage['stage']:<14}{stage['items']:>10}{stage['elapsed']:>10.2f}"
+              f"{stage['throughput']:>12.1f}{_format(stage['p50_ms'], '.1f'):>10}"
+              f"{_format(stage['p99_ms'], '.1f'):>10}{_format(stage['peak_rss_mb'], '.1f'):>10}")
+        base = base_stages.get(stage['stage'])
+        if base:
+            print(f"{'  vs 基準':<14}{'':>10}{'':>10}"
+                  f"{change(stage['throughput'], base['throughput'], True):>12}"
+                  f"{change(stage['p50_ms'], base['p50_ms'], False):>10}"
+                  f"{change(stage['p99_ms'], base['p99_ms'], False):>10}"
+                  f"{change(stage['peak_rss_mb'], base['peak_rss_mb'], False):>10}")
+    print("=" * 78)
+    stub = report['stub']
+    print(f"stub 請求: {stub['requests']}，重播 {stub['replayed']}，未錄製 {stub['missed']}，"
+          f"注入錯誤 {stub['errors']}，注入限流 {stub['throttled']}")
+    print(f"行程記憶體峰值: {_format(report['process_peak_rss_mb'], '.1f')} MB，"
+          f"日誌: {report['logs']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='完整處理流程基準測試（離線）')
+    parser.add_argument('--gamelists', type=Path, default=project_root / 'gamelists_local',
+                        help='gamelist.xml 來源目錄（預設 gamelists_local/）')
+    parser.add_argument('--platforms', nargs='*', help='只測試指定平台')
+    parser.add_argument('--language', default='zh-TW', help='目標語系')
+    parser.add_argument('--fixtures', type=Path, default=DEFAULT_FIXTURES, help='錄製檔')
+    parser.add_argument('--latency', type=float, default=50.0, help='每個請求的平均延遲（毫秒）')
+    parser.add_argument('--jitter', type=float, default=20.0, help='延遲抖動（± 毫秒）')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='503 錯誤比例（0~1）')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='429 限流比例（0~1）')
+    parser.add_argument('--in-flight', type=int, default=32, help='階段三同時進行的項目數')
+    parser.add_argument('--rate-limit', type=float, default=200.0, help='各服務每秒請求上限')
+    parser.add_argument('--no-desc', dest='desc', action='store_false', help='不翻譯描述')
+    parser.add_argument('--gemini', action='store_true', help='啟用 Gemini 服務（stub）')
+    parser.add_argument('--seed', type=int, default=0, help='亂數種子')
+    parser.add_argument('--output', type=Path, help='將報告寫入 JSON 檔（可作為之後的基準）')
+    parser.add_argument('--baseline', type=Path, help='與先前的 JSON 報告比較')
+    parser.add_argument('--verbose', action='store_true', help='顯示流程日誌與服務輸出')
+    args = parser.parse_args()
+
+    report = run_benchmark(args)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"報告已寫入: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
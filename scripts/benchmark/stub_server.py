@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+"""
+本機 stub server：重播錄製的 Wikipedia / DuckDuckGo / googletrans / Gemini 回應
+
+路由：
+- GET  /wikipedia/<網域>/w/api.php   → 維基百科 API（search 與 extracts 查詢）
+- GET  /duckduckgo/                  → DuckDuckGo Instant Answer API
+- POST /googletrans                  → {"text", "dest", "src"}，回傳 {"text"}
+- POST /gemini/<模型名稱>             → {"prompt"}，回傳 {"text"}
+
+錄製檔（JSON）以服務名稱分組，每個回應依請求內容產生的鍵值查詢（見 request_key）；
+沒有錄製的請求回傳各服務「查無結果」格式的回應，確保整個流程都能離線執行。
+
+可設定延遲（平均值 ± 抖動）、錯誤率（503）與限流率（429 + Retry-After），
+用來模擬真實網路環境下的行為。
+"""
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+
+SERVICES = ('wikipedia', 'duckduckgo', 'googletrans', 'gemini')
+
+# Gemini 批次 prompt 中的編號清單（"1. Game Name"）
+_NUMBERED_LINE = re.compile(r'^(\d+)\.\s+(.+)$', re.MULTILINE)
+
+
+def prompt_hash(prompt: str) -> str:
+    """Gemini prompt 的鍵值（prompt 很長，以雜湊代替）"""
+    return hashlib.sha1(prompt.encode('utf-8')).hexdigest()
+
+
+def request_key(service: str, params: Dict[str, Any]) -> str:
+    """
+    由請求內容產生錄製檔的鍵值
+
+    Args:
+        service: 服務名稱
+        params: 查詢參數（GET）或請求內容（POST）
+
+    Returns:
+        鍵值
+    """
+    if service == 'wikipedia':
+        if params.get('list') == 'search':
+            return f"search:{params.get('srsearch', '')}"
+        return f"page:{params.get('titles', '')}"
+    if service == 'duckduckgo':
+        return params.get('q', '')
+    if service == 'googletrans':
+        return f"{params.get('dest', '')}|{params.get('text', '')}"
+    return prompt_hash(params.get('prompt', ''))
+
+
+def default_response(service: str, params: Dict[str, Any]) -> Any:
+    """
+    沒有錄製時的回應（各服務「查無結果」的格式）
+
+    Args:
+        service: 服務名稱
+        params: 查詢參數或請求內容
+
+    Returns:
+        回應內容（JSON 可序列化）
+    """
+    if service == 'wikipedia':
+        if params.get('list') == 'search':
+            return {'batchcomplete': '', 'query': {'search': []}}
+        return {'batchcomplete': '', 'query': {'pages': {'-1': {'missing': ''}}}}
+    if service == 'duckduckgo':
+        return {'Abstract': '', 'Heading': '', 'RelatedTopics': []}
+    if service == 'googletrans':
+        # 翻譯失敗時 googletrans 會回傳原文
+        return {'text': params.get('text', '')}
+
+    # 批次 prompt：遊戲清單是最後一段從 1 開始的編號清單（前面的規則說明也有編號）
+    ids = []
+    for number, _ in _NUMBERED_LINE.findall(params.get('prompt', '')):
+        if number == '1':
+            ids = []
+        ids.append(int(number))
+    if ids:
+        # 每個項目都回答不知道
+        return {'text': json.dumps([{'id': i, 'name': None} for i in ids])}
+    return {'text': 'UNKNOWN'}
+
+
+@dataclass
+class StubStats:
+    """stub server 的請求統計"""
+    requests: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(SERVICES, 0))
+    replayed: int = 0       # 命中錄製檔的請求數
+    missed: int = 0         # 沒有錄製、回傳預設回應的請求數
+    errors: int = 0         # 注入的 503 錯誤數
+    throttled: int = 0      # 注入的 429 限流數
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'requests': dict(self.requests), 'replayed': self.replayed,
+                'missed': self.missed, 'errors': self.errors,
+                'throttled': self.throttled}
+
+
+class StubServer:
+    """
+    重播錄製回應的本機 HTTP 伺服器
+
+    使用方式：
+        with StubServer(fixtures, latency_ms=80, error_rate=0.01) as stub:
+            WikipediaService.API_URL = stub.url + '/wikipedia/{domain}/w/api.php'
+            ...
+        print(stub.stats.to_dict())
+    """
+
+    def __init__(self, fixtures: Optional[Dict[str, Dict[str, Any]]] = None,
+                 latency_ms: float = 0.0,
+                 jitter_ms: float = 0.0,
+                 error_rate: float = 0.0,
+                 throttle_rate: float = 0.0,
+                 service_latency_ms: Optional[Dict[str, float]] = None,
+                 seed: int = 0):
+        """
+        初始化
+
+        Args:
+            fixtures: 錄製的回應 {服務名稱: {鍵值: 回應}}
+            latency_ms: 每個請求的平均延遲（毫秒）
+            jitter_ms: 延遲的隨機抖動範圍（± 毫秒）
+            error_rate: 回傳 503 的比例（0~1）
+            throttle_rate: 回傳 429 的比例（0~1）
+            service_latency_ms: 個別服務的平均延遲，覆寫 latency_ms
+            seed: 亂數種子（相同設定可重現相同的延遲與錯誤）
+        """
+        self.fixtures = {service: dict((fixtures or {}).get(service, {}))
+                         for service in SERVICES}
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.service_latency_ms = service_latency_ms or {}
+        self.stats = StubStats()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def load_fixtures(cls, path: Path) -> Dict[str, Dict[str, Any]]:
+        """讀取錄製檔"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    @property
+    def url(self) -> str:
+        """伺服器網址（http://127.0.0.1:<port>）"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'StubServer':
+        """在背景執行緒啟動伺服器（使用隨機可用的連接埠）"""
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name='stub-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """停止伺服器"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> 'StubServer':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def respond(self, service: str, params: Dict[str, Any]) -> Tuple[int, Any]:
+        """
+        決定回應內容（延遲由呼叫端處理）
+
+        Returns:
+            (HTTP 狀態碼, 回應內容)
+        """
+        with self._lock:
+            self.stats.requests[service] += 1
+            roll = self._random.random()
+            if roll < self.throttle_rate:
+                self.stats.throttled += 1
+                return 429, {'error': 'Too Many Requests'}
+            if roll < self.throttle_rate + self.error_rate:
+                self.stats.errors += 1
+                return 503, {'error': 'Service Unavailable'}
+
+            recorded = self.fixtures[service].get(request_key(service, params))
+            if recorded is not None:
+                self.stats.replayed += 1
+            else:
+                self.stats.missed += 1
+
+        if recorded is None:
+            return 200, default_response(service, params)
+        if service in ('googletrans', 'gemini') and isinstance(recorded, str):
+            return 200, {'text': recorded}
+        return 200, recorded
+
+    def delay(self, service: str) -> float:
+        """這次請求的延遲（秒）"""
+        mean = self.service_latency_ms.get(service, self.latency_ms)
+        with self._lock:
+            jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+        return max(mean + jitter, 0.0) / 1000.0
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'   # 保持連線，與真實 API 的連線重用行為一致
+
+            def _route(self) -> Optional[str]:
+                path = urlsplit(self.path).path
+                for service in SERVICES:
+                    if path.startswith(f'/{service}'):
+                        return service
+                return None
+
+            def _reply(self, service: Optional[str], params: Dict[str, Any]) -> None:
+                if service is None:
+                    status, body = 404, {'error': 'Not Found'}
+                else:
+                    status, body = stub.respond(service, params)
+                    time.sleep(stub.delay(service))
+
+                data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                if status == 429:
+                    self.send_header('Retry-After', '1')
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                query = parse_qs(urlsplit(self.path).query)
+                self._reply(self._route(), {k: v[0] for k, v in query.items()})
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                try:
+                    params = json.loads(self.rfile.read(length) or b'{}')
+                except ValueError:
+                    params = {}
+                self._reply(self._route(), params)
+
+            def log_message(self, format, *args):
+                pass  # 不輸出每個請求的存取記錄
+
+        return Handler
+
+
+# ==================== SDK 替代用戶端 ====================
+# googletrans 與 google-generativeai 無法改指向 http 網址，
+# 以相同介面的精簡用戶端呼叫 stub server（透過 TRANSLATOR_FACTORY / MODEL_FACTORY 注入）
+
+class StubHTTPError(Exception):
+    """stub server 回傳錯誤狀態碼（訊息含狀態碼，is_rate_limit_error 可辨識 429）"""
+
+    def __init__(self, status: int):
+        super().__init__(f"{status} {'Too Many Requests' if status == 429 else 'Service Unavailable'}")
+        self.status = status
+
+
+def _post_json(url: str, payload: Dict[str, Any], timeout: float = 30.0) -> Dict[str, Any]:
+    """以 POST 傳送 JSON 並取得 JSON 回應"""
+    request = urllib.request.Request(
+        url, data=json.dumps(payload).encode('utf-8'),
+        headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return json.loads(response.read().decode('utf-8'))
+    except urllib.error.HTTPError as e:
+        raise StubHTTPError(e.code) from None
+
+
+@dataclass
+class StubText:
+    """具有 text 屬性的回應（對應 googletrans 的 Translated 與 Gemini 的 response）"""
+    text: str
+
+
+class StubTranslator:
+    """googletrans.Translator 的替代用戶端"""
+
+    def __init__(self, base_url: str):
+        self.url = f"{base_url}/googletrans"
+
+    def translate(self, text: str, dest: str = 'en', src: str = 'auto') -> StubText:
+        data = _post_json(self.url, {'text': text, 'dest': dest, 'src': src})
+        return StubText(data.get('text', ''))
+
+
+class StubGeminiModel:
+    """genai.GenerativeModel 的替代用戶端"""
+
+    # 串流時每個片段的字元數
+    STREAM_CHUNK_SIZE = 64
+
+    def __init__(self, base_url: str, model_name: str):
+        self.url = f"{base_url}/gemini/{model_name}"
+
+    def generate_content(self, prompt: str, stream: bool = False):
+        data = _post_json(self.url, {'prompt': prompt})
+        text = data.get('text', '')
+        if not stream:
+            return StubText(text)
+        # 串流：將完整回應切成片段依序產生
+        size = self.STREAM_CHUNK_SIZE
+        return [StubText(text[i:i + size]) for i in range(0, len(text), size)]
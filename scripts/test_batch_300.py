@@ -77,7 +77,8 @@ def main():
     service = GeminiBatchService(
         api_key=api_key,
         batch_size=settings.gemini_batch_size,
-        request_delay=1.0
+        request_delay=1.0,
+        adaptive_batch_size=False  # 測試設定的批次大小
     )
 
     # 執行翻譯
@@ -23,7 +23,8 @@ def test_batch_size(api_key: str, game_names: list, batch_size: int, platform: s
     service = GeminiBatchService(
         api_key=api_key,
         batch_size=batch_size,
-        request_delay=1.0
+        request_delay=1.0,
+        adaptive_batch_size=False  # 比較固定的批次大小
     )
 
     result = service.translate_batch(
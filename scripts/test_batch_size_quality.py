@@ -65,7 +65,8 @@ def main():
     print(f"測試 A：批次大小 20 筆/次")
     print(f"{'='*60}")
     service = GeminiBatchService(
-        api_key=api_key, batch_size=20, request_delay=1.0)
+        api_key=api_key, batch_size=20, request_delay=1.0,
+        adaptive_batch_size=False)
     result_a = service.translate_batch(group_a, 'zh-TW', 'mame')
     print(f"  成功: {result_a.success_count}/{result_a.total}")
     print(f"  範例翻譯：")
@@ -79,7 +80,8 @@ def main():
     print(f"測試 B：批次大小 10 筆/次")
     print(f"{'='*60}")
     service = GeminiBatchService(
-        api_key=api_key, batch_size=10, request_delay=1.0)
+        api_key=api_key, batch_size=10, request_delay=1.0,
+        adaptive_batch_size=False)
     result_b = service.translate_batch(group_b, 'zh-TW', 'mame')
     print(f"  成功: {result_b.success_count}/{result_b.total}")
     print(f"  範例翻譯：")
@@ -93,7 +95,8 @@ def main():
     print(f"測試 C：批次大小 5 筆/次")
     print(f"{'='*60}")
     service = GeminiBatchService(
-        api_key=api_key, batch_size=5, request_delay=1.0)
+        api_key=api_key, batch_size=5, request_delay=1.0,
+        adaptive_batch_size=False)
     result_c = service.translate_batch(group_c, 'zh-TW', 'mame')
     print(f"  成功: {result_c.success_count}/{result_c.total}")
     print(f"  範例翻譯：")
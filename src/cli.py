@@ -0,0 +1,232 @@
+# 命令列介面
+"""
+無 UI 的命令列入口，適合在無桌面環境（例如掛載 Batocera 網路分享的伺服器）
+或排程工作（cron）中執行。
+
+用法：
+    python main.py scan --roms /mnt/batocera/roms
+    python main.py translate --language zh-TW --platforms nes,snes --json
+    python -m src.cli all --roms /mnt/batocera/roms
+
+加上 --json 時，每個事件輸出一行 JSON（progress/log/result/error），方便其他程式解析。
+本模組不匯入任何 Qt 套件。
+"""
+import argparse
+import json
+import signal
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from .core.pipeline import StagePipeline, PipelineError, MANIFEST_FILENAME
+from .utils.settings import AppSettings, SettingsManager
+from .utils.rate_limiter import configure_rate_limits
+from .core.storage import set_default_storage
+
+
+# 子命令 -> 執行順序（all 依序執行四個階段）
+STAGES = {
+    'scan': ['scan'],
+    'dict': ['dict'],
+    'translate': ['translate'],
+    'write': ['write'],
+    'all': ['scan', 'dict', 'translate', 'write'],
+}
+
+# 中斷結束碼（與 shell 的 SIGINT 慣例一致）
+EXIT_CANCELLED = 130
+
+
+class EventPrinter:
+    """輸出進度與日誌（純文字或 JSON Lines）"""
+
+    def __init__(self, as_json: bool = False, verbose: bool = False, stream=None):
+        """
+        初始化
+
+        Args:
+            as_json: 是否輸出 JSON Lines
+            verbose: 純文字模式下是否也輸出進度
+            stream: 輸出目標，預設為 stdout
+        """
+        self.as_json = as_json
+        self.verbose = verbose
+        self.stream = stream or sys.stdout
+        self.stage = ''
+
+    def emit(self, event: str, **fields) -> None:
+        """輸出一個事件"""
+        if self.as_json:
+            record = {'event': event, 'stage': self.stage,
+                      'time': round(time.time(), 3)}
+            record.update(fields)
+            self.stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+        elif event == 'log':
+            self.stream.write(
+                f"[{fields['level']}] {fields['module']}: {fields['message']}\n")
+        elif event == 'progress':
+            if not self.verbose:
+                return
+            self.stream.write(
+                f"({fields['current']}/{fields['total']}) {fields['message']}\n")
+        elif event == 'result':
+            summary = ', '.join(f'{k}={v}' for k, v in fields['result'].items())
+            self.stream.write(f"[{self.stage}] 完成：{summary}\n")
+        elif event == 'error':
+            self.stream.write(f"[{self.stage}] 錯誤：{fields['message']}\n")
+        self.stream.flush()
+
+    def progress(self, current: int, total: int, message: str) -> None:
+        self.emit('progress', current=current, total=total, message=message)
+
+    def log(self, level: str, module: str, message: str) -> None:
+        self.emit('log', level=level, module=module, message=message)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """建立命令列參數解析器"""
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--language', '-l',
+                        help='目標語系（預設為設定檔的 last_language）')
+    common.add_argument('--platforms', '-p',
+                        help='只處理指定平台，以逗號分隔（預設全部）')
+    common.add_argument('--settings', type=Path,
+                        help='設定檔路徑（預設為使用者資料目錄中的 settings.json）')
+    common.add_argument('--cache-dir', default='./gamelists_local',
+                        help='gamelist.xml 暫存區（預設 ./gamelists_local）')
+    common.add_argument('--json', action='store_true',
+                        help='以 JSON Lines 輸出進度與結果')
+    common.add_argument('--verbose', '-v', action='store_true',
+                        help='純文字模式下也輸出進度')
+    common.add_argument('--force', action='store_true',
+                        help='不依變更清單略過未變更的平台，全部重新處理')
+
+    roms = argparse.ArgumentParser(add_help=False)
+    roms.add_argument('--roms', help='ROM 根目錄（預設為設定檔的 last_roms_path）')
+
+    translate = argparse.ArgumentParser(add_help=False)
+    translate.add_argument('--no-name', action='store_true', help='不翻譯名稱')
+    translate.add_argument('--no-desc', action='store_true', help='不翻譯描述')
+    translate.add_argument('--desc', action='store_true', help='翻譯描述（覆寫設定檔）')
+    translate.add_argument('--retranslate', action='store_true',
+                           help='重新翻譯已翻譯的項目')
+    translate.add_argument('--request-delay', type=int,
+                           help='API 請求間隔（毫秒）')
+
+    write = argparse.ArgumentParser(add_help=False)
+    write.add_argument('--no-backup', action='store_true', help='寫回前不備份')
+
+    parser = argparse.ArgumentParser(
+        prog='batocera-translator',
+        description='Batocera Gamelist 翻譯工具（命令列模式）')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('scan', parents=[common, roms], help='階段一：掃描並取回 gamelist.xml')
+    sub.add_parser('dict', parents=[common], help='階段二：產生字典檔')
+    sub.add_parser('translate', parents=[common, translate], help='階段三：翻譯')
+    sub.add_parser('write', parents=[common, write], help='階段四：寫回 XML')
+    sub.add_parser('all', parents=[common, roms, translate, write],
+                   help='依序執行四個階段')
+    return parser
+
+
+def is_cli_invocation(argv: List[str]) -> bool:
+    """命令列參數是否為 CLI 子命令（main.py 用來決定是否啟動 GUI）"""
+    return bool(argv) and (argv[0] in STAGES or argv[0] in ('-h', '--help'))
+
+
+def _run_stage(stage: str, pipeline: StagePipeline, args, settings: AppSettings,
+               language: str, platforms: List[str]) -> dict:
+    """執行單一階段"""
+    if stage == 'scan':
+        roms_path = args.roms or settings.last_roms_path
+        if not roms_path:
+            raise PipelineError("請以 --roms 指定 ROM 根目錄")
+        return pipeline.scan(roms_path, platforms)
+
+    if stage == 'dict':
+        return pipeline.build_dictionaries(language, platforms)
+
+    if stage == 'translate':
+        translate_desc = settings.translate_desc or args.desc
+        return pipeline.translate(
+            language,
+            translate_name=settings.translate_name and not args.no_name,
+            translate_desc=translate_desc and not args.no_desc,
+            skip_translated=settings.skip_translated and not args.retranslate,
+            selected_platforms=platforms,
+            gemini_api_key=settings.gemini_api_key,
+            request_delay=args.request_delay if args.request_delay is not None
+            else settings.request_delay)
+
+    return pipeline.write_back(
+        language,
+        auto_backup=settings.auto_backup and not args.no_backup,
+        selected_platforms=platforms,
+        write_rules=settings.write_rules)
+
+
+def main(argv: Optional[List[str]] = None, stream=None) -> int:
+    """
+    命令列主程式
+
+    Args:
+        argv: 命令列參數（不含程式名稱），None 使用 sys.argv
+        stream: 輸出目標，預設為 stdout
+
+    Returns:
+        結束碼：0 成功、1 失敗、130 中斷
+    """
+    args = build_parser().parse_args(argv)
+    printer = EventPrinter(as_json=args.json, verbose=args.verbose, stream=stream)
+
+    settings = SettingsManager(args.settings).load()
+    if args.force:
+        settings.skip_unchanged = False
+    configure_rate_limits(settings.rate_limits)
+    set_default_storage(settings.dictionary_storage)
+    language = args.language or settings.last_language
+    platforms = [p.strip() for p in (args.platforms or '').split(',') if p.strip()]
+
+    # 指定設定檔時，變更清單與設定檔放在同一個資料夾
+    manifest_path = args.settings.parent / MANIFEST_FILENAME if args.settings else None
+    pipeline = StagePipeline(on_progress=printer.progress, on_log=printer.log,
+                             settings=settings, local_cache_path=args.cache_dir,
+                             manifest_path=manifest_path)
+
+    # 第一次 Ctrl+C / SIGTERM 完成目前項目並儲存後停止，第二次直接結束
+    def request_cancel(signum, frame):
+        if pipeline.cancelled:
+            raise KeyboardInterrupt
+        pipeline.cancel()
+        printer.log('WARNING', 'CLI', '收到中斷訊號，完成目前項目後停止...')
+
+    handled = [signal.SIGINT]
+    if hasattr(signal, 'SIGTERM'):
+        handled.append(signal.SIGTERM)
+    previous = {signum: signal.signal(signum, request_cancel) for signum in handled}
+
+    try:
+        for stage in STAGES[args.command]:
+            printer.stage = stage
+            try:
+                result = _run_stage(stage, pipeline, args, settings, language, platforms)
+            except KeyboardInterrupt:
+                printer.emit('error', message='已中斷')
+                return EXIT_CANCELLED
+            except Exception as e:
+                printer.emit('error', message=str(e))
+                return 1
+            printer.emit('result', result=result)
+
+            if pipeline.cancelled:
+                return EXIT_CANCELLED
+    finally:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
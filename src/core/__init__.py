@@ -3,13 +3,22 @@
 核心模組包含：
 - scanner: ROM 資料夾掃描
 - dictionary: 字典檔管理
+- storage: 字典儲存後端（JSON / SQLite）
 - translator: 翻譯引擎
+- async_engine: 非同步翻譯排程
+- dedup: 跨平台名稱翻譯去重
+- pipeline: 不依賴 UI 的四階段處理流程
 - writer: XML 寫回
 """
 
 from .scanner import Scanner
 from .dictionary import DictionaryManager
+from .storage import JsonStorage, SqliteStorage
 from .translator import TranslationEngine
+from .async_engine import AsyncTranslationEngine
+from .dedup import CrossPlatformDedup
+from .pipeline import StagePipeline, PipelineError
 from .writer import XmlWriter
 
-__all__ = ['Scanner', 'DictionaryManager', 'TranslationEngine', 'XmlWriter']
+__all__ = ['Scanner', 'DictionaryManager', 'JsonStorage', 'SqliteStorage', 'TranslationEngine',
+           'AsyncTranslationEngine', 'CrossPlatformDedup', 'StagePipeline', 'PipelineError', 'XmlWriter']
@@ -0,0 +1,169 @@
+# 非同步翻譯排程模組
+"""
+以 asyncio 驅動 TranslationEngine，持續保持多個翻譯項目同時進行。
+
+各服務（requests、googletrans、google-generativeai）都是同步 API，
+因此實際的網路呼叫在執行緒池中執行，由 event loop 負責排程：
+- 任何一個項目完成就立即補上下一個，不會因為單一慢請求卡住整批
+- 同時進行的項目數由 max_in_flight 限制
+- 各服務的併發數由 TranslationEngine.set_service_concurrency 限制
+- 請求速率由 rate_limiter 的共用限制器控制
+- 結果回呼都在 event loop 所在的執行緒執行，更新字典不需要額外加鎖
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional
+
+from .dictionary import GameEntry
+from .translator import TranslationEngine, TranslationOutput
+
+
+# 各服務預設的同時請求上限
+DEFAULT_SERVICE_LIMITS = {
+    'wikipedia': 8,
+    'gemini': 4,
+    'search': 2,
+    'translate': 4,
+}
+
+
+@dataclass
+class AsyncRunStats:
+    """非同步翻譯執行統計"""
+    submitted: int = 0      # 已送出的項目數
+    completed: int = 0      # 已完成的項目數
+    errors: int = 0         # 發生例外的項目數
+    cancelled: bool = False  # 是否被取消
+    elapsed: float = 0.0    # 耗時（秒）
+
+    @property
+    def throughput(self) -> float:
+        """每秒完成的項目數"""
+        return self.completed / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class AsyncTranslationEngine:
+    """
+    非同步翻譯排程器
+
+    使用方式（在 QThread 或一般執行緒中）：
+        engine = AsyncTranslationEngine(translator, max_in_flight=32)
+        stats = engine.run(entries, on_result=apply_output,
+                           is_cancelled=lambda: worker._is_cancelled)
+    """
+
+    def __init__(self, engine: TranslationEngine,
+                 max_in_flight: int = 32,
+                 service_limits: Optional[Dict[str, int]] = None):
+        """
+        初始化排程器
+
+        Args:
+            engine: 已設定好服務的翻譯引擎
+            max_in_flight: 同時進行的翻譯項目上限
+            service_limits: 各服務的同時請求上限（覆寫 DEFAULT_SERVICE_LIMITS）
+        """
+        self.engine = engine
+        self.max_in_flight = max(1, max_in_flight)
+
+        limits = dict(DEFAULT_SERVICE_LIMITS)
+        limits.update(service_limits or {})
+        self.service_limits = limits
+        engine.set_service_concurrency(limits)
+
+    async def translate_entries(
+            self, entries: Iterable[GameEntry],
+            translate_name: bool = True,
+            translate_desc: bool = True,
+            skip_translated: bool = True,
+            on_result: Optional[Callable[[GameEntry, TranslationOutput, bool], None]] = None,
+            on_error: Optional[Callable[[GameEntry, BaseException], None]] = None,
+            is_cancelled: Optional[Callable[[], bool]] = None,
+            skip_name: Optional[Callable[[GameEntry], bool]] = None) -> AsyncRunStats:
+        """
+        翻譯所有項目（協程版本）
+
+        Args:
+            entries: 要翻譯的遊戲項目
+            translate_name: 是否翻譯名稱
+            translate_desc: 是否翻譯描述
+            skip_translated: 是否跳過已翻譯的項目（標記重翻的項目一律翻譯）
+            on_result: 完成回呼 (entry, output, force_retranslate)
+            on_error: 例外回呼 (entry, exception)
+            is_cancelled: 取消檢查函數，回傳 True 時停止送出新項目
+            skip_name: 回傳 True 的項目不翻譯名稱（例如已由跨平台去重處理）
+
+        Returns:
+            執行統計
+        """
+        stats = AsyncRunStats()
+        start = time.time()
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(self.max_in_flight)
+        pending = set()
+
+        # 執行緒數與同時進行的項目數一致，等待服務配額的項目只是阻塞在 semaphore 上
+        executor = ThreadPoolExecutor(max_workers=self.max_in_flight,
+                                      thread_name_prefix='translate')
+
+        async def translate_one(entry: GameEntry):
+            force_retranslate = entry.needs_retranslate
+            name = translate_name and not (skip_name and skip_name(entry))
+            try:
+                output = await loop.run_in_executor(
+                    executor, self._translate_sync, entry,
+                    name, translate_desc,
+                    skip_translated and not force_retranslate)
+                if on_result:
+                    on_result(entry, output, force_retranslate)
+            except Exception as e:
+                stats.errors += 1
+                if on_error:
+                    on_error(entry, e)
+            finally:
+                stats.completed += 1
+                slots.release()
+
+        try:
+            for entry in entries:
+                await slots.acquire()
+                if is_cancelled and is_cancelled():
+                    slots.release()
+                    stats.cancelled = True
+                    break
+                task = asyncio.ensure_future(translate_one(entry))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+                stats.submitted += 1
+
+            # 等待進行中的項目完成（執行緒中的請求無法中斷，取消時也需等它們結束）
+            if pending:
+                await asyncio.gather(*pending)
+        finally:
+            executor.shutdown(wait=True)
+
+        stats.elapsed = time.time() - start
+        return stats
+
+    def _translate_sync(self, entry: GameEntry, translate_name: bool,
+                        translate_desc: bool, skip_translated: bool) -> TranslationOutput:
+        """在執行緒池中執行的同步翻譯"""
+        return self.engine.translate_game(
+            entry,
+            translate_name=translate_name,
+            translate_desc=translate_desc,
+            skip_translated=skip_translated
+        )
+
+    def run(self, entries: Iterable[GameEntry], **kwargs) -> AsyncRunStats:
+        """
+        在目前執行緒建立 event loop 並翻譯所有項目
+
+        供 QThread.run 等同步環境呼叫，參數同 translate_entries。
+
+        Returns:
+            執行統計
+        """
+        return asyncio.run(self.translate_entries(entries, **kwargs))
@@ -0,0 +1,162 @@
+# 跨平台去重模組
+"""
+同一款遊戲（如 Tetris、Pac-Man、Street Fighter II）常同時出現在
+nes、gb、mame、arcade、fbneo 等多個平台。名稱翻譯只取決於清理後的標題，
+因此先把所有選取平台的項目依 clean_filename 分組：
+- 同標題已有其他項目翻譯過：直接沿用，不需查詢
+- 同標題都尚未翻譯：只查詢一個代表項目，完成後套用到同組其他項目
+
+描述仍由各平台逐項翻譯（各平台的原始描述可能不同）。
+"""
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .dictionary import GameEntry
+
+
+@dataclass
+class DedupStats:
+    """跨平台去重統計"""
+    entries: int = 0          # 參與分組的項目數
+    titles: int = 0           # 不重複標題數
+    lookups: int = 0          # 實際需要查詢的標題數（代表項目數）
+    reused: int = 0           # 直接沿用既有譯名的項目數
+    fanned_out: int = 0       # 套用代表項目查詢結果的項目數
+
+    @property
+    def lookups_avoided(self) -> int:
+        """省下的名稱查詢次數"""
+        return self.reused + self.fanned_out
+
+
+@dataclass
+class TitleGroup:
+    """同一清理後標題的項目群組"""
+    title: str
+    # (平台, 項目)
+    entries: List[Tuple[str, GameEntry]] = field(default_factory=list)
+    # 需要名稱翻譯的項目
+    pending: List[GameEntry] = field(default_factory=list)
+
+
+class CrossPlatformDedup:
+    """
+    跨平台名稱翻譯去重
+
+    使用方式：
+        dedup = CrossPlatformDedup(translator.clean_filename)
+        dedup.build(dictionaries)                 # {平台: 字典}
+        for entry in dedup.representatives:       # 只查詢代表項目
+            ...套用翻譯結果...
+            dedup.fan_out(entry)                  # 套用到同標題其他項目
+        # 之後逐平台翻譯時略過 dedup.is_resolved(entry) 的名稱
+    """
+
+    def __init__(self, clean_func: Callable[[str], str],
+                 skip_translated: bool = True):
+        """
+        初始化
+
+        Args:
+            clean_func: 標題清理函數（TranslationEngine.clean_filename）
+            skip_translated: 是否沿用已翻譯的名稱；False 時同組仍只查詢一次，但不沿用舊譯名
+        """
+        self.clean_func = clean_func
+        self.skip_translated = skip_translated
+        self.stats = DedupStats()
+        self._groups: Dict[str, TitleGroup] = {}
+        self._representatives: Dict[int, TitleGroup] = {}  # id(代表項目) -> 群組
+        self._resolved: set = set()  # 名稱已由去重處理的項目 id
+
+    def build(self, dictionaries: Dict[str, Dict[str, GameEntry]]) -> DedupStats:
+        """
+        依清理後標題分組，並直接沿用同標題的既有譯名
+
+        Args:
+            dictionaries: {平台名稱: 字典}
+
+        Returns:
+            去重統計
+        """
+        for platform, dictionary in dictionaries.items():
+            for entry in dictionary.values():
+                # 標記重翻的項目需要重新查詢，不參與去重
+                if entry.needs_retranslate or not entry.original_name:
+                    continue
+                title = self.clean_func(entry.original_name)
+                if not title:
+                    continue
+                group = self._groups.get(title)
+                if group is None:
+                    group = self._groups[title] = TitleGroup(title=title)
+                group.entries.append((platform, entry))
+                self.stats.entries += 1
+
+                if not self.skip_translated or not entry.has_name_translation():
+                    group.pending.append(entry)
+
+        self.stats.titles = len(self._groups)
+
+        for group in self._groups.values():
+            if not group.pending:
+                continue
+
+            donor = self._find_donor(group) if self.skip_translated else None
+            if donor is not None:
+                for entry in group.pending:
+                    self._copy_name(donor, entry)
+                self.stats.reused += len(group.pending)
+            else:
+                representative = group.pending[0]
+                self._representatives[id(representative)] = group
+                self.stats.lookups += 1
+
+        return self.stats
+
+    @property
+    def representatives(self) -> List[GameEntry]:
+        """需要實際查詢名稱的代表項目（每個標題一個）"""
+        return [group.pending[0] for group in self._representatives.values()]
+
+    def fan_out(self, representative: GameEntry) -> int:
+        """
+        將代表項目的名稱翻譯套用到同標題的其他待翻譯項目
+
+        Args:
+            representative: 已完成名稱翻譯的代表項目
+
+        Returns:
+            套用的項目數
+        """
+        group = self._representatives.get(id(representative))
+        # 查詢失敗的群組不標記，逐平台翻譯時照常處理
+        if group is None or not representative.name:
+            return 0
+
+        self._resolved.add(id(representative))
+        count = 0
+        for entry in group.pending[1:]:
+            self._copy_name(representative, entry)
+            count += 1
+        self.stats.fanned_out += count
+        return count
+
+    def is_resolved(self, entry: GameEntry) -> bool:
+        """名稱是否已由去重處理（逐平台翻譯時不需再翻譯名稱）"""
+        return id(entry) in self._resolved
+
+    def _find_donor(self, group: TitleGroup) -> Optional[GameEntry]:
+        """找出同標題中已有譯名的項目（優先使用非保留原文的結果）"""
+        candidates = [entry for _, entry in group.entries
+                      if entry.has_name_translation()]
+        for entry in candidates:
+            if entry.name_source != 'original':
+                return entry
+        return candidates[0] if candidates else None
+
+    def _copy_name(self, source: GameEntry, target: GameEntry) -> None:
+        """複製名稱翻譯欄位"""
+        target.name = source.name
+        target.name_source = source.name_source
+        target.name_translated_at = source.name_translated_at
+        self._resolved.add(id(target))
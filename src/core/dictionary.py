@@ -3,12 +3,26 @@
 負責管理翻譯字典檔的讀取、寫入、合併等操作。
 """
 import json
+import threading
 from pathlib import Path
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Iterable, Iterator, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 
 from ..utils.file_utils import get_dictionaries_dir, get_language_packs_dir
+from .storage import (DictionaryStorage, JsonStorage, STORAGE_JSON, needs_work,
+                      create_storage, get_default_storage)
+
+
+# 字典統計索引檔名（存放於使用者字典目錄的語系資料夾，不是 .json 以免被當成平台）
+INDEX_FILENAME = '_index.meta'
+INDEX_VERSION = 1
+
+# 增量自動儲存日誌的副檔名（<平台>.journal，每行一個變更的項目）
+JOURNAL_SUFFIX = '.journal'
+
+# 保護索引檔的讀取-修改-寫入
+_index_lock = threading.Lock()
 
 
 class TranslationSource(Enum):
@@ -99,12 +113,50 @@ class GameEntry:
                 self.original_desc)
 
 
+@dataclass
+class DictionaryStats:
+    """字典統計（不需解析完整字典即可取得）"""
+    entries: int = 0              # 遊戲數
+    name_translated: int = 0      # 已翻譯名稱數
+    desc_translated: int = 0      # 已翻譯描述數
+    needs_retranslate: int = 0    # 標記重翻數
+
+    @classmethod
+    def from_dictionary(cls, dictionary: Dict[str, 'GameEntry']) -> 'DictionaryStats':
+        """由已載入的字典計算統計"""
+        stats = cls(entries=len(dictionary))
+        for entry in dictionary.values():
+            if entry.has_name_translation():
+                stats.name_translated += 1
+            if entry.has_desc_translation():
+                stats.desc_translated += 1
+            if entry.needs_retranslate:
+                stats.needs_retranslate += 1
+        return stats
+
+    def is_complete(self, translate_name: bool = True, translate_desc: bool = True) -> bool:
+        """
+        是否已沒有需要翻譯的項目（跳過已翻譯項目時可略過整個平台）
+
+        Args:
+            translate_name: 是否翻譯名稱
+            translate_desc: 是否翻譯描述
+        """
+        if self.needs_retranslate:
+            return False
+        if translate_name and self.name_translated < self.entries:
+            return False
+        if translate_desc and self.desc_translated < self.entries:
+            return False
+        return True
+
+
 class DictionaryManager:
     """
     字典檔管理器
 
     功能：
-    - 讀取/寫入字典檔（JSON 格式）
+    - 讀取/寫入字典檔（JSON 或 SQLite，見 storage 模組）
     - 字典檔合併（支援多種策略）
     - 語系包匯入/匯出
 
@@ -112,18 +164,122 @@ class DictionaryManager:
     確保程式更新時不會遺失翻譯資料。
     """
 
-    def __init__(self, dictionaries_path: Optional[Path] = None):
+    def __init__(self, dictionaries_path: Optional[Path] = None,
+                 storage: Optional[DictionaryStorage] = None):
         """
         初始化字典管理器
 
         Args:
             dictionaries_path: 字典檔根目錄，None 使用預設的使用者資料目錄
+            storage: 儲存後端，None 依 storage.set_default_storage 的設定建立
         """
-        self.dictionaries_path = dictionaries_path or get_dictionaries_dir()
+        self.dictionaries_path = Path(dictionaries_path) if dictionaries_path else get_dictionaries_dir()
+        self.storage = storage or create_storage(
+            get_default_storage(), self.dictionaries_path, get_language_packs_dir())
+        self._index_cache: Dict[str, Dict[str, Any]] = {}  # language -> 索引內容
+
+    def _get_index_path(self, language: str) -> Path:
+        """取得統計索引檔路徑"""
+        return self.dictionaries_path / language / INDEX_FILENAME
+
+    def _read_index(self, language: str) -> Dict[str, Any]:
+        """讀取統計索引（快取於記憶體）"""
+        index = self._index_cache.get(language)
+        if index is not None:
+            return index
+
+        index = {}
+        index_path = self._get_index_path(language)
+        if index_path.exists():
+            try:
+                with open(index_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == INDEX_VERSION:
+                    index = data.get('platforms', {})
+            except (OSError, ValueError):
+                index = {}  # 索引損毀時重建即可
+        self._index_cache[language] = index
+        return index
+
+    def _update_index(self, language: str, platform: str,
+                      stats: DictionaryStats, source_path: Path) -> None:
+        """
+        更新單一平台的統計索引
 
-    def _get_dict_path(self, language: str, platform: str) -> Path:
-        """取得字典檔路徑"""
-        return self.dictionaries_path / language / f"{platform}.json"
+        以來源檔案的大小與修改時間判斷索引是否仍有效，檔案被其他程式改動時會自動失效。
+        """
+        try:
+            stat = source_path.stat()
+        except OSError:
+            return
+
+        record = {
+            'path': str(source_path),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            **asdict(stats),
+        }
+
+        with _index_lock:
+            index = self._read_index(language)
+            if index.get(platform) == record:
+                return
+            index[platform] = record
+
+            index_path = self._get_index_path(language)
+            temp_path = index_path.with_suffix('.tmp')
+            try:
+                index_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'version': INDEX_VERSION, 'platforms': index},
+                              f, ensure_ascii=False)
+                temp_path.replace(index_path)
+            except OSError as e:
+                # 索引只是加速用，寫入失敗不影響字典本身
+                print(f"更新字典索引失敗: {index_path}, 錯誤: {e}")
+
+    def get_dictionary_stats(self, language: str, platform: str) -> DictionaryStats:
+        """
+        取得字典統計（優先讀取索引，不需解析完整字典）
+
+        索引不存在或已過期時才載入字典計算，並更新索引。
+
+        Args:
+            language: 語系代碼
+            platform: 平台代碼
+
+        Returns:
+            字典統計
+        """
+        # 有未壓縮的日誌時索引不準確，載入（並壓縮）後重新計算
+        if self._get_journal_path(language, platform).exists():
+            return DictionaryStats.from_dictionary(self.load_dictionary(language, platform))
+
+        # 後端可直接計算（SQLite）時不需要索引
+        counts = self.storage.get_counts(language, platform)
+        if counts is not None:
+            return DictionaryStats(**counts)
+
+        source_path = self.storage.source_path(language, platform)
+        if source_path is None:
+            if self.storage.name == STORAGE_JSON:
+                return DictionaryStats()  # 字典不存在
+            # 尚未匯入資料庫：載入時會自動匯入
+            return DictionaryStats.from_dictionary(self.load_dictionary(language, platform))
+
+        record = self._read_index(language).get(platform)
+        if record and record.get('path') == str(source_path):
+            try:
+                stat = source_path.stat()
+                if (record.get('size') == stat.st_size
+                        and record.get('mtime_ns') == stat.st_mtime_ns):
+                    return DictionaryStats(**{
+                        k: record.get(k, 0) for k in DictionaryStats.__dataclass_fields__})
+            except OSError:
+                pass
+
+        # 索引失效：載入字典（load_dictionary 會順便更新索引）
+        return DictionaryStats.from_dictionary(self.load_dictionary(language, platform))
 
     def load_dictionary(self, language: str, platform: str) -> Dict[str, GameEntry]:
         """
@@ -138,29 +294,15 @@ class DictionaryManager:
         """
         from ..utils import get_game_key
 
-        # 優先從 language_packs 載入（單一來源，更快）
-        language_packs_dir = get_language_packs_dir()
-        pack_path = language_packs_dir / language / f"{platform}.json"
+        data = self.storage.load(language, platform)
 
-        # 如果 language_packs 不存在，嘗試從本機字典載入
-        if not pack_path.exists():
-            dict_path = self._get_dict_path(language, platform)
-            if not dict_path.exists():
-                return {}
-            pack_path = dict_path
+        # 套用上次中斷前未壓縮的增量日誌
+        journal = self._read_journal(language, platform)
+        if journal:
+            data = data or {}
+            data.update(journal)
 
-        try:
-            with open(pack_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
-            # JSON 檔案損壞，備份並重新建立
-            backup_path = pack_path.with_suffix('.json.corrupted')
-            import shutil
-            shutil.move(pack_path, backup_path)
-            print(f"警告：字典檔 {pack_path} 損壞，已備份至 {backup_path}")
-            return {}
-        except Exception as e:
-            print(f"載入字典檔失敗: {pack_path}, 錯誤: {e}")
+        if data is None:
             return {}
 
         # 規範化 key（移除路徑前綴）並更新 entry.key
@@ -172,48 +314,212 @@ class DictionaryManager:
             entry.key = normalized_key
             result[normalized_key] = entry
 
+        if journal:
+            # 壓縮：完整儲存一次並刪除日誌（也會更新索引）
+            self.save_dictionary(language, platform, result)
+            print(f"已套用 {platform} 的 {len(journal)} 筆未儲存變更")
+            return result
+
+        source_path = self.storage.source_path(language, platform)
+        if source_path is not None:
+            self._update_index(language, platform,
+                               DictionaryStats.from_dictionary(result), source_path)
         return result
 
+    def iter_pending_entries(self, language: str, platform: str,
+                             translate_name: bool = True,
+                             translate_desc: bool = True) -> Iterator[Tuple[str, GameEntry]]:
+        """
+        逐筆取得還需要翻譯的項目（SQLite 後端以索引查詢，不載入整個平台）
+
+        Args:
+            language: 語系代碼
+            platform: 平台代碼
+            translate_name: 是否翻譯名稱
+            translate_desc: 是否翻譯描述
+
+        Returns:
+            (遊戲 Key, GameEntry) 的迭代器
+        """
+        from ..utils import get_game_key
+
+        if self._get_journal_path(language, platform).exists():
+            # 有未壓縮的增量日誌：載入完整字典（順便壓縮）後篩選
+            for key, entry in self.load_dictionary(language, platform).items():
+                if needs_work(entry.to_dict(), translate_name, translate_desc):
+                    yield key, entry
+            return
+
+        for old_key, entry_data in self.storage.iter_pending(
+                language, platform, translate_name, translate_desc):
+            entry = GameEntry.from_dict(entry_data)
+            entry.key = get_game_key(old_key)
+            yield entry.key, entry
+
+    def supports_partial_save(self, language: str, platform: str) -> bool:
+        """
+        是否可只寫入變更的項目（可只取出待翻譯項目，不需載入完整字典）
+
+        Args:
+            language: 語系代碼
+            platform: 平台代碼
+        """
+        return (not self._get_journal_path(language, platform).exists()
+                and self.storage.supports_partial_save(language, platform))
+
     def save_dictionary(self, language: str, platform: str,
-                        dictionary: Dict[str, GameEntry]) -> None:
+                        dictionary: Dict[str, GameEntry],
+                        changed_keys: Optional[Iterable[str]] = None) -> None:
         """
-        儲存字典檔（主要存到 language_packs，同時備份到本機）
+        儲存字典檔
+
+        JSON 後端主要存到 language_packs，同時備份到本機；
+        SQLite 後端在指定 changed_keys 時只寫入變更的項目。
 
         Args:
             language: 語系代碼
             platform: 平台代碼
             dictionary: 遊戲字典
+            changed_keys: 有變更的 key（None 表示全部），不支援逐筆寫入的後端會忽略
+        """
+        if changed_keys is not None and self.storage.supports_partial_save(language, platform):
+            changed = set(changed_keys)
+            data = {key: dictionary[key].to_dict() for key in changed if key in dictionary}
+            self.storage.save(language, platform, data, changed)
+        else:
+            # 轉換為可序列化的字典格式
+            data = {key: entry.to_dict() for key, entry in dictionary.items()}
+            self.storage.save(language, platform, data)
+            # 完整儲存後日誌內容都已寫入
+            self._remove_journal(language, platform)
+
+        source_path = self.storage.source_path(language, platform)
+        if source_path is not None:
+            self._update_index(language, platform,
+                               DictionaryStats.from_dictionary(dictionary), source_path)
+
+    def get_dictionary_version(self, language: str, platform: str) -> Optional[str]:
+        """
+        取得字典版本（每次儲存都會改變），用於變更清單判斷字典是否有更新
+
+        Args:
+            language: 語系代碼
+            platform: 平台代碼
+
+        Returns:
+            版本字串；字典不存在或有未壓縮的增量日誌時回傳 None
+        """
+        if self._get_journal_path(language, platform).exists():
+            return None
+        return self.storage.version(language, platform)
+
+    def save_changes(self, language: str, platform: str,
+                     dictionary: Dict[str, GameEntry],
+                     changed_keys: Iterable[str]) -> int:
         """
-        # 轉換為可序列化的字典格式
-        data = {key: entry.to_dict() for key, entry in dictionary.items()}
+        只儲存有變更的項目（自動儲存用）
+
+        支援逐筆寫入的後端（SQLite）直接寫入；JSON 後端則附加到增量日誌，
+        寫入量與變更數成正比，之後由 save_dictionary 或下次載入時壓縮。
+
+        Args:
+            language: 語系代碼
+            platform: 平台代碼
+            dictionary: 遊戲字典
+            changed_keys: 有變更的 key
 
-        # === 主要：儲存到 language_packs 資料夾（版控分享） ===
-        language_packs_dir = get_language_packs_dir()
-        pack_path = language_packs_dir / language / f"{platform}.json"
-        pack_path.parent.mkdir(parents=True, exist_ok=True)
+        Returns:
+            寫入的項目數
+        """
+        changed = [key for key in changed_keys if key in dictionary]
+        if not changed:
+            return 0
+
+        if self.storage.supports_partial_save(language, platform):
+            self.save_dictionary(language, platform, dictionary, changed)
+            return len(changed)
+
+        journal_path = self._get_journal_path(language, platform)
+        journal_path.parent.mkdir(parents=True, exist_ok=True)
+        lines = ''.join(
+            json.dumps({'key': key, 'entry': dictionary[key].to_dict()},
+                       ensure_ascii=False) + '\n'
+            for key in changed)
+        with open(journal_path, 'a', encoding='utf-8') as f:
+            f.write(lines)
+            f.flush()
+        return len(changed)
+
+    def _get_journal_path(self, language: str, platform: str) -> Path:
+        """取得增量日誌路徑"""
+        return self.dictionaries_path / language / f"{platform}{JOURNAL_SUFFIX}"
+
+    def _read_journal(self, language: str, platform: str) -> Dict[str, Dict[str, Any]]:
+        """讀取增量日誌（同一 key 以最後一筆為準）"""
+        journal_path = self._get_journal_path(language, platform)
+        if not journal_path.exists():
+            return {}
 
-        # 使用原子寫入（先寫臨時檔，再重新命名，避免寫入一半損壞）
-        temp_path = pack_path.with_suffix('.tmp')
+        changes = {}
         try:
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            # 原子替換
-            temp_path.replace(pack_path)
-        except Exception as e:
-            if temp_path.exists():
-                temp_path.unlink()
-            raise e
-
-        # === 備份：同時儲存到使用者資料目錄 ===
+            with open(journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # 中斷時寫到一半的最後一行，略過即可
+                        continue
+                    changes[record['key']] = record['entry']
+        except OSError as e:
+            print(f"讀取增量日誌失敗: {journal_path}, 錯誤: {e}")
+        return changes
+
+    def _remove_journal(self, language: str, platform: str) -> None:
+        """刪除增量日誌"""
+        journal_path = self._get_journal_path(language, platform)
         try:
-            dict_path = self._get_dict_path(language, platform)
-            dict_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(dict_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-        except Exception:
-            # 備份失敗不影響主要儲存
+            journal_path.unlink()
+        except FileNotFoundError:
             pass
 
+    def delete_dictionary(self, language: str, platform: str) -> None:
+        """
+        刪除平台字典
+
+        Args:
+            language: 語系代碼
+            platform: 平台代碼
+        """
+        self.storage.delete(language, platform)
+        self._remove_journal(language, platform)
+
+    def export_language_packs(self, language: str,
+                              platforms: Optional[List[str]] = None) -> int:
+        """
+        將字典匯出為 language_packs 的 JSON（版控分享用）
+
+        JSON 後端每次儲存都已寫入 language_packs，不需另外匯出。
+
+        Args:
+            language: 語系代碼
+            platforms: 要匯出的平台，None 表示全部
+
+        Returns:
+            匯出的平台數
+        """
+        if self.storage.name == STORAGE_JSON:
+            return 0
+
+        json_storage = JsonStorage(self.dictionaries_path, get_language_packs_dir())
+        count = 0
+        for platform in platforms if platforms is not None else self.get_available_platforms(language):
+            dictionary = self.load_dictionary(language, platform)
+            if dictionary:
+                json_storage.save(language, platform,
+                                  {key: entry.to_dict() for key, entry in dictionary.items()})
+                count += 1
+        return count
+
     def merge_dictionaries(self, base: Dict[str, GameEntry],
                            incoming: Dict[str, GameEntry],
                            strategy: MergeStrategy = MergeStrategy.MERGE) -> Dict[str, GameEntry]:
@@ -315,7 +621,83 @@ class DictionaryManager:
 
     def get_available_platforms(self, language: str) -> List[str]:
         """取得指定語系下所有可用的平台"""
-        lang_dir = self.dictionaries_path / language
-        if not lang_dir.exists():
-            return []
-        return [f.stem for f in lang_dir.glob('*.json')]
+        return self.storage.list_platforms(language)
+
+
+class DeltaAutosaver:
+    """
+    增量自動儲存
+
+    記錄翻譯過程中有變更的項目，每處理 interval 個項目只寫入這段期間的變更
+    （DictionaryManager.save_changes），平台結束時 finish() 完整儲存一次並壓縮日誌。
+    字典只包含部分項目（partial）時 finish() 只寫入變更，不覆蓋其他項目。
+    """
+
+    def __init__(self, manager: DictionaryManager, language: str, platform: str,
+                 dictionary: Dict[str, GameEntry], interval: int = 10,
+                 partial: bool = False):
+        """
+        初始化
+
+        Args:
+            manager: 字典管理器
+            language: 語系代碼
+            platform: 平台代碼
+            dictionary: 遊戲字典（與翻譯流程共用同一個物件）
+            interval: 每處理幾個項目自動儲存一次
+            partial: dictionary 是否只包含部分項目（需後端支援逐筆寫入）
+        """
+        self.manager = manager
+        self.language = language
+        self.platform = platform
+        self.dictionary = dictionary
+        self.interval = max(1, interval)
+        self.partial = partial
+        self.dirty = set()
+        self._dirty_lock = threading.Lock()  # 項目可能在其他執行緒（串流解析）中標記
+        self.processed = 0
+        self.written = 0  # 自動儲存累計寫入的項目數
+
+    def mark_dirty(self, key: str) -> None:
+        """標記項目已變更"""
+        with self._dirty_lock:
+            self.dirty.add(key)
+
+    def step(self, key: Optional[str] = None, changed: bool = True) -> bool:
+        """
+        處理完一個項目
+
+        Args:
+            key: 項目 key
+            changed: 項目是否有變更
+
+        Returns:
+            這次是否執行了自動儲存
+        """
+        if key is not None and changed:
+            self.mark_dirty(key)
+        self.processed += 1
+        if self.processed % self.interval == 0:
+            self.flush()
+            return True
+        return False
+
+    def flush(self) -> int:
+        """立即寫入目前的變更，回傳寫入的項目數"""
+        with self._dirty_lock:
+            dirty, self.dirty = self.dirty, set()
+        if not dirty:
+            return 0
+        count = self.manager.save_changes(
+            self.language, self.platform, self.dictionary, dirty)
+        self.written += count
+        return count
+
+    def finish(self) -> None:
+        """完整儲存並壓縮日誌（部分字典只寫入剩餘的變更）"""
+        if self.partial:
+            self.flush()
+            return
+        self.manager.save_dictionary(self.language, self.platform, self.dictionary)
+        with self._dirty_lock:
+            self.dirty.clear()
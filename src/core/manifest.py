@@ -0,0 +1,212 @@
+# 變更清單模組
+"""
+記錄各平台上次處理時的狀態，讓各階段略過自上次執行後沒有變更的平台：
+
+- 階段一：來源 gamelist.xml 的大小/修改時間，以及暫存區複本的雜湊
+- 階段二：字典由哪一份暫存區複本產生
+- 階段三：翻譯完成時的字典版本與翻譯選項
+- 階段四：寫回時的字典版本、寫回規則與寫回後的檔案狀態
+
+清單依暫存區路徑分開記錄，同一個程式可處理多個暫存區。
+"""
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..utils.file_utils import get_file_hash
+
+
+MANIFEST_VERSION = 1
+
+
+def file_state(path: Path, with_hash: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    取得檔案狀態
+
+    Args:
+        path: 檔案路徑
+        with_hash: 是否計算內容雜湊
+
+    Returns:
+        {'size', 'mtime_ns'[, 'hash']}，檔案不存在時為 None
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    state = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    if with_hash:
+        state['hash'] = get_file_hash(path)
+    return state
+
+
+def _same_file(recorded: Optional[Dict[str, Any]], path: Path) -> bool:
+    """
+    檔案是否與記錄的狀態相同
+
+    大小與修改時間相同即視為相同；修改時間不同但有記錄雜湊時，再比對內容。
+    """
+    if not recorded:
+        return False
+    current = file_state(path)
+    if current is None or current['size'] != recorded.get('size'):
+        return False
+    if current['mtime_ns'] == recorded.get('mtime_ns'):
+        return True
+    if recorded.get('hash') and get_file_hash(path) == recorded['hash']:
+        recorded['mtime_ns'] = current['mtime_ns']  # 只是被 touch，更新記錄
+        return True
+    return False
+
+
+class ChangeManifest:
+    """
+    各平台處理狀態清單
+
+    使用方式：
+        manifest = ChangeManifest(manifest_path, cache_path)
+        if not manifest.source_unchanged(platform, source, cache):
+            copy(...)
+            manifest.record_copy(platform, source, cache)
+        manifest.save()
+    """
+
+    def __init__(self, path: Path, cache_path: Path):
+        """
+        初始化
+
+        Args:
+            path: 清單檔路徑
+            cache_path: gamelist.xml 暫存區路徑（清單依此分開記錄）
+        """
+        self.path = Path(path)
+        self.scope = str(Path(cache_path).resolve())
+        self._lock = threading.Lock()
+        self._data = self._load()
+
+    def _load(self) -> Dict[str, Any]:
+        """讀取清單檔（不存在或損毀時從空白開始）"""
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == MANIFEST_VERSION:
+                    return data
+            except (OSError, ValueError):
+                pass
+        return {'version': MANIFEST_VERSION, 'caches': {}}
+
+    def save(self) -> None:
+        """寫入清單檔"""
+        with self._lock:
+            temp_path = self.path.with_suffix('.tmp')
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._data, f, ensure_ascii=False, indent=1)
+                temp_path.replace(self.path)
+            except OSError as e:
+                # 清單只是加速用，寫入失敗下次重新處理即可
+                print(f"更新變更清單失敗: {self.path}, 錯誤: {e}")
+
+    def _record(self, platform: str) -> Dict[str, Any]:
+        """取得（必要時建立）平台記錄"""
+        cache = self._data['caches'].setdefault(self.scope, {})
+        return cache.setdefault(platform, {})
+
+    def _cache_known(self, record: Dict[str, Any], cache_file: Path) -> bool:
+        """暫存區檔案是否為階段一複製或階段四寫回的結果（未被其他程式修改）"""
+        if _same_file(record.get('copied'), cache_file):
+            return True
+        written = record.get('written') or {}
+        return _same_file(written.get('state'), cache_file)
+
+    # ==================== 階段一 ====================
+
+    def source_unchanged(self, platform: str, source_file: Path, cache_file: Path,
+                         source_state: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        來源 gamelist.xml 自上次複製後是否未變更（暫存區複本也仍存在）
+
+        Args:
+            source_state: 掃描時已取得的來源狀態（PlatformInfo.gamelist_state），
+                          提供時不再對來源做 stat（網路磁碟上每次 stat 都是一次往返）
+        """
+        record = self._record(platform)
+        source = record.get('source')
+        current = source_state or file_state(source_file)
+        if not source or current is None or current != source:
+            return False
+        return self._cache_known(record, cache_file)
+
+    def record_copy(self, platform: str, source_file: Path, cache_file: Path,
+                    source_state: Optional[Dict[str, Any]] = None) -> None:
+        """記錄已將來源複製到暫存區（source_state 同 source_unchanged）"""
+        with self._lock:
+            record = self._record(platform)
+            record['source'] = dict(source_state) if source_state else file_state(source_file)
+            record['copied'] = file_state(cache_file, with_hash=True)
+
+    # ==================== 階段二 ====================
+
+    def is_built(self, platform: str, language: str, cache_file: Path) -> bool:
+        """字典是否已由目前這份暫存區複本產生"""
+        record = self._record(platform)
+        copied = record.get('copied') or {}
+        built = record.get('built', {}).get(language)
+        return bool(built) and built == copied.get('hash') and \
+            self._cache_known(record, cache_file)
+
+    def record_built(self, platform: str, language: str, cache_file: Path) -> None:
+        """記錄字典已由目前的暫存區複本產生（複本狀態未知時不記錄）"""
+        with self._lock:
+            record = self._record(platform)
+            if self._cache_known(record, cache_file):
+                record.setdefault('built', {})[language] = record['copied']['hash']
+
+    # ==================== 階段三 ====================
+
+    def is_translated(self, platform: str, language: str,
+                      dict_version: Optional[str], options: str) -> bool:
+        """字典自上次以相同選項翻譯完成後是否未變更"""
+        if dict_version is None:
+            return False
+        translated = self._record(platform).get('translated', {}).get(language)
+        return translated == {'dict_version': dict_version, 'options': options}
+
+    def record_translated(self, platform: str, language: str,
+                          dict_version: Optional[str], options: str) -> None:
+        """記錄平台已翻譯完成"""
+        if dict_version is None:
+            return
+        with self._lock:
+            self._record(platform).setdefault('translated', {})[language] = {
+                'dict_version': dict_version, 'options': options}
+
+    # ==================== 階段四 ====================
+
+    def is_written(self, platform: str, language: str, dict_version: Optional[str],
+                   rules: str, cache_file: Path) -> bool:
+        """暫存區檔案是否已是以相同字典版本與規則寫回的結果"""
+        if dict_version is None:
+            return False
+        written = self._record(platform).get('written')
+        if not written or written.get('language') != language:
+            return False
+        return (written.get('dict_version') == dict_version
+                and written.get('rules') == rules
+                and _same_file(written.get('state'), cache_file))
+
+    def record_written(self, platform: str, language: str, dict_version: Optional[str],
+                       rules: str, cache_file: Path) -> None:
+        """記錄寫回完成後的狀態"""
+        if dict_version is None:
+            return
+        with self._lock:
+            self._record(platform)['written'] = {
+                'language': language,
+                'dict_version': dict_version,
+                'rules': rules,
+                'state': file_state(cache_file, with_hash=True),
+            }
@@ -0,0 +1,752 @@
+# 處理流程模組
+"""
+不依賴 UI 的四階段處理流程：
+- scan: 掃描 ROM 資料夾並取回 gamelist.xml
+- build_dictionaries: 產生字典檔
+- translate: 翻譯
+- write_back: 寫回 XML
+
+GUI 的 QThread Worker 與命令列介面（src/cli.py）共用此模組，
+進度與日誌透過回呼輸出，本模組不匯入任何 Qt 套件。
+"""
+import json
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from ..utils.settings import AppSettings, SettingsManager
+from ..utils.file_utils import get_app_data_dir
+from .manifest import ChangeManifest
+
+
+# 變更清單檔名（存放於使用者資料目錄）
+MANIFEST_FILENAME = 'manifest.json'
+
+
+# 進度回呼 (current, total, message)
+ProgressCallback = Callable[[int, int, str], None]
+# 日誌回呼 (level, module, message)
+LogCallback = Callable[[str, str, str], None]
+
+
+class PipelineError(Exception):
+    """階段無法執行（例如尚未完成前一階段）"""
+
+
+def _format_eta(eta_seconds: int) -> str:
+    """格式化預估剩餘時間"""
+    if eta_seconds > 3600:
+        return f"約 {eta_seconds // 3600} 小時 {(eta_seconds % 3600) // 60} 分鐘"
+    elif eta_seconds > 60:
+        return f"約 {eta_seconds // 60} 分鐘"
+    return f"約 {eta_seconds} 秒"
+
+
+class StagePipeline:
+    """
+    四階段處理流程
+
+    使用方式：
+        pipeline = StagePipeline(on_progress=print_progress, on_log=print_log)
+        pipeline.scan(roms_path)
+        pipeline.build_dictionaries('zh-TW')
+        pipeline.translate('zh-TW')
+        pipeline.write_back('zh-TW')
+
+    各階段回傳結果摘要 dict；前置條件不符時拋出 PipelineError。
+    """
+
+    def __init__(self, on_progress: Optional[ProgressCallback] = None,
+                 on_log: Optional[LogCallback] = None,
+                 is_cancelled: Optional[Callable[[], bool]] = None,
+                 settings: Optional[AppSettings] = None,
+                 local_cache_path: str = './gamelists_local',
+                 manifest_path: Optional[Path] = None):
+        """
+        初始化處理流程
+
+        Args:
+            on_progress: 進度回呼 (current, total, message)
+            on_log: 日誌回呼 (level, module, message)
+            is_cancelled: 外部取消檢查函數
+            settings: 應用程式設定，None 時於需要時從設定檔載入
+            local_cache_path: gamelist.xml 暫存區路徑
+            manifest_path: 變更清單檔路徑，None 使用使用者資料目錄的 manifest.json
+        """
+        self._on_progress = on_progress
+        self._on_log = on_log
+        self._is_cancelled = is_cancelled
+        self._cancel_requested = False
+        self.settings = settings
+        self.local_cache_path = Path(local_cache_path)
+        self.manifest_path = Path(manifest_path) if manifest_path else None
+        self._manifest: Optional[ChangeManifest] = None
+
+    def cancel(self) -> None:
+        """要求取消（目前項目完成後停止）"""
+        self._cancel_requested = True
+
+    @property
+    def cancelled(self) -> bool:
+        """是否已要求取消"""
+        return self._cancel_requested or bool(
+            self._is_cancelled and self._is_cancelled())
+
+    def _progress(self, current: int, total: int, message: str) -> None:
+        if self._on_progress:
+            self._on_progress(current, total, message)
+
+    def _log(self, level: str, module: str, message: str) -> None:
+        if self._on_log:
+            self._on_log(level, module, message)
+
+    def _load_settings(self) -> AppSettings:
+        """取得設定（未指定時讀取設定檔）"""
+        if self.settings is None:
+            self.settings = SettingsManager().load()
+        return self.settings
+
+    def _get_manifest(self) -> ChangeManifest:
+        """取得變更清單（第一次使用時載入）"""
+        if self._manifest is None:
+            path = self.manifest_path or get_app_data_dir() / MANIFEST_FILENAME
+            self._manifest = ChangeManifest(path, self.local_cache_path)
+        return self._manifest
+
+    def scan(self, roms_path: str, selected_platforms: Optional[List[str]] = None) -> Dict[str, int]:
+        """
+        階段一：掃描 ROM 資料夾並複製 gamelist.xml 到暫存區
+
+        Args:
+            roms_path: ROM 根目錄（本機路徑或網路磁碟）
+            selected_platforms: 要處理的平台，None 或空清單表示全部
+
+        Returns:
+            {'copied': 複製的平台數, 'unchanged': 來源未變更而略過的平台數}
+        """
+        from . import Scanner
+
+        self._log("INFO", "Stage1", "開始階段一：掃描與取回...")
+        self._progress(0, 100, "正在掃描 ROM 資料夾...")
+
+        settings = self._load_settings()
+        scanner = Scanner(roms_path, str(self.local_cache_path),
+                          max_workers=settings.scan_workers)
+
+        def on_platform(platform, done, total):
+            # 每探測完一個資料夾就更新進度，網路磁碟上不必等全部掃完
+            self._progress(int(done / total * 30), 100, f"掃描: {platform.name}")
+
+        platforms = scanner.scan(on_platform=on_platform)
+
+        self._log("INFO", "Stage1", f"發現 {len(platforms)} 個資料夾")
+        self._progress(30, 100, f"發現 {len(platforms)} 個資料夾")
+
+        platforms_with_gamelist = scanner.get_platforms_with_gamelist()
+
+        # 遞取選中的平台
+        if selected_platforms:
+            platforms_with_gamelist = [
+                p for p in platforms_with_gamelist
+                if p.name in selected_platforms
+            ]
+            self._log("INFO", "Stage1",
+                      f"選中 {len(platforms_with_gamelist)} 個平台進行處理")
+
+        self._log("INFO", "Stage1",
+                  f"有 gamelist.xml 的平台: {len(platforms_with_gamelist)}")
+        self._progress(50, 100, "正在複製 gamelist.xml 到暫存區...")
+
+        # 複製到暫存區（來源自上次複製後未變更的平台直接略過）
+        manifest = self._get_manifest()
+        skip_unchanged = settings.skip_unchanged
+        copied = []
+        unchanged = 0
+        total = len(platforms_with_gamelist)
+        for i, platform in enumerate(platforms_with_gamelist):
+            if self.cancelled:
+                break
+
+            progress = 50 + int((i + 1) / total * 50) if total > 0 else 100
+            cache_file = self.local_cache_path / platform.name / 'gamelist.xml'
+            if skip_unchanged and manifest.source_unchanged(
+                    platform.name, platform.gamelist_path, cache_file,
+                    platform.gamelist_state):
+                unchanged += 1
+                self._progress(
+                    progress, 100, f"未變更: {platform.name} ({i+1}/{total})")
+                continue
+
+            scanner.copy_gamelist_to_cache(platform)
+            manifest.record_copy(platform.name, platform.gamelist_path, cache_file,
+                                 platform.gamelist_state)
+            copied.append(platform.name)
+
+            self._progress(
+                progress, 100, f"複製: {platform.name} ({i+1}/{total})")
+            self._log("INFO", "Stage1", f"  複製: {platform.name}")
+
+        manifest.save()
+
+        self._progress(100, 100, "階段一完成！")
+        self._log("SUCCESS", "Stage1",
+                  f"階段一完成！複製 {len(copied)} 個 gamelist.xml 到暫存區"
+                  f"{f'，{unchanged} 個未變更' if unchanged else ''}")
+
+        return {'copied': len(copied), 'unchanged': unchanged}
+
+    def build_dictionaries(self, language: str, selected_platforms: Optional[List[str]] = None) -> Dict[str, int]:
+        """
+        階段二：由暫存區的 gamelist.xml 產生字典檔
+
+        Args:
+            language: 目標語系
+            selected_platforms: 要處理的平台，None 或空清單表示全部
+
+        Returns:
+            {'platforms': 平台數, 'games': 遊戲數, 'unchanged': 未變更而略過的平台數}
+        """
+        from . import DictionaryManager
+        from ..utils import iter_gamelist, get_game_key
+        from .dictionary import GameEntry
+        from xml.etree.ElementTree import ParseError
+
+        self._log("INFO", "Stage2", "開始階段二：產生字典檔...")
+        self._progress(0, 100, "正在掃描暫存區...")
+
+        gamelists_dir = self.local_cache_path
+        if not gamelists_dir.exists():
+            raise PipelineError("請先執行階段一（掃描取回）")
+
+        dict_manager = DictionaryManager()
+
+        # 收集所有平台
+        platform_dirs = [d for d in gamelists_dir.iterdir(
+        ) if d.is_dir() and (d / 'gamelist.xml').exists()]
+
+        # 過濾選中的平台
+        if selected_platforms:
+            platform_dirs = [
+                d for d in platform_dirs if d.name in selected_platforms]
+            self._log("INFO", "Stage2",
+                      f"選中 {len(platform_dirs)} 個平台進行處理")
+
+        total_platforms = len(platform_dirs)
+        total_games = 0
+        unchanged = 0
+        manifest = self._get_manifest()
+        skip_unchanged = self._load_settings().skip_unchanged
+
+        for i, platform_dir in enumerate(platform_dirs):
+            if self.cancelled:
+                break
+
+            platform_name = platform_dir.name
+            gamelist_path = platform_dir / 'gamelist.xml'
+
+            self._progress(int((i / total_platforms) * 100)
+                           if total_platforms > 0 else 100, 100, f"處理平台: {platform_name}")
+
+            # 字典已由同一份 gamelist 產生過：不需重新解析
+            if (skip_unchanged
+                    and manifest.is_built(platform_name, language, gamelist_path)
+                    and dict_manager.get_dictionary_version(language, platform_name) is not None):
+                unchanged += 1
+                total_games += dict_manager.get_dictionary_stats(
+                    language, platform_name).entries
+                continue
+
+            dictionary = dict_manager.load_dictionary(
+                language, platform_name)
+            existing = len(dictionary)
+
+            # 串流解析：大型 gamelist（MAME/FBNeo）不需整份載入記憶體
+            try:
+                for game in iter_gamelist(gamelist_path):
+                    key = get_game_key(game.path)
+                    if key not in dictionary:
+                        entry = GameEntry(
+                            key=key,
+                            original_name=game.name,
+                            original_desc=game.desc
+                        )
+                        dictionary[key] = entry
+            except ParseError as e:
+                self._log("WARNING", "Stage2",
+                          f"  {platform_name}: gamelist.xml 格式錯誤，只處理到錯誤位置之前: {e}")
+            else:
+                manifest.record_built(platform_name, language, gamelist_path)
+
+            # 沒有新增項目時不重寫字典（字典版本不變，後續階段可略過）
+            if (len(dictionary) > existing
+                    or dict_manager.get_dictionary_version(language, platform_name) is None):
+                dict_manager.save_dictionary(
+                    language, platform_name, dictionary)
+
+            self._log("INFO", "Stage2",
+                      f"  {platform_name}: {len(dictionary)} 個遊戲")
+            total_games += len(dictionary)
+
+        manifest.save()
+
+        self._progress(100, 100, "階段二完成！")
+        self._log("SUCCESS", "Stage2",
+                  f"階段二完成！{total_platforms} 個平台, {total_games} 個遊戲"
+                  f"{f'（{unchanged} 個平台未變更）' if unchanged else ''}")
+
+        return {'platforms': total_platforms, 'games': total_games,
+                'unchanged': unchanged}
+
+    def translate(self, language: str, translate_name: bool = True,
+                  translate_desc: bool = True, skip_translated: bool = True,
+                  selected_platforms: Optional[List[str]] = None,
+                  gemini_api_key: str = "", request_delay: int = 500) -> Dict[str, int]:
+        """
+        階段三：翻譯字典檔
+
+        Args:
+            language: 目標語系
+            translate_name: 是否翻譯名稱
+            translate_desc: 是否翻譯描述
+            skip_translated: 是否跳過已翻譯的項目
+            selected_platforms: 要處理的平台，None 或空清單表示全部
+            gemini_api_key: Gemini API Key（空字串表示不使用）
+            request_delay: API 請求間隔（毫秒）
+
+        Returns:
+            {'translated': 翻譯的遊戲數}
+        """
+        from . import DictionaryManager, TranslationEngine
+        from ..services import WikipediaService, SearchService, TranslateService
+
+        self._log("INFO", "Stage3", "開始階段三：翻譯...")
+        self._progress(0, 100, "正在初始化翻譯服務...")
+
+        dict_manager = DictionaryManager()
+        platforms = dict_manager.get_available_platforms(language)
+
+        if not platforms:
+            raise PipelineError("請先執行階段二（產生字典）")
+
+        # 過濾選中的平台
+        if selected_platforms:
+            platforms = [
+                p for p in platforms if p in selected_platforms]
+            self._log("INFO", "Stage3", f"選中 {len(platforms)} 個平台進行翻譯")
+
+        # 按遊戲數量排序（從少到多），優先翻譯遊戲少的平台
+        # 遊戲數由字典索引取得，不需解析完整字典；字典只在實際翻譯時載入一次
+        platform_stats = {platform: dict_manager.get_dictionary_stats(language, platform)
+                          for platform in platforms}
+        platform_sizes = {platform: stats.entries
+                          for platform, stats in platform_stats.items()}
+
+        # 排序：遊戲數量少的優先
+        platforms = sorted(
+            platforms, key=lambda p: platform_sizes.get(p, 0))
+        self._log("INFO", "Stage3",
+                  f"平台處理順序（按遊戲數量）: {', '.join([f'{p}({platform_sizes[p]})' for p in platforms[:5]])}{'...' if len(platforms) > 5 else ''}")
+
+        # 初始化翻譯引擎
+        translator = TranslationEngine(target_language=language)
+        # 將毫秒轉換為秒
+        delay_seconds = request_delay / 1000.0
+        translator.set_wiki_service(
+            WikipediaService(request_delay=delay_seconds))
+        translator.set_search_service(SearchService(
+            request_delay=delay_seconds * 2))  # 搜尋服務延遲加倍
+        translator.set_translate_api(
+            TranslateService(request_delay=delay_seconds))
+
+        # 如果有 Gemini API Key，初始化 Gemini 服務
+        if gemini_api_key:
+            try:
+                from ..services.gemini import GeminiService
+                gemini = GeminiService(gemini_api_key)
+                translator.set_gemini_service(gemini)
+                self._log("INFO", "Stage3", "Gemini AI 服務已啟用")
+            except Exception as e:
+                self._log("WARNING", "Stage3", f"Gemini 服務初始化失敗: {e}")
+
+        self._progress(5, 100, "翻譯服務初始化完成")
+
+        total_translated = 0
+        saved_platforms = []
+        total_entries = sum(platform_sizes.values())  # 使用已計算的數量
+        processed_entries = 0
+
+        self._log("INFO", "Stage3",
+                  f"共 {len(platforms)} 個平台, {total_entries} 個遊戲待處理")
+
+        start_time = time.time()
+
+        # 讀取性能設定
+        from .async_engine import AsyncTranslationEngine
+        from .dedup import CrossPlatformDedup
+        from .dictionary import DeltaAutosaver
+        settings = self._load_settings()
+
+        # 自上次以相同選項翻譯完成後字典沒有變更的平台（例如未新增遊戲）
+        manifest = self._get_manifest()
+        options = f"name={translate_name},desc={translate_desc}"
+        unchanged_platforms = set()
+        if skip_translated and settings.skip_unchanged:
+            unchanged_platforms = {
+                platform for platform in platforms
+                if manifest.is_translated(
+                    platform, language,
+                    dict_manager.get_dictionary_version(language, platform), options)}
+
+        def skip_reason(platform: str) -> Optional[str]:
+            """不需翻譯的原因（None 表示需要翻譯）"""
+            if not skip_translated:
+                return None
+            if platform in unchanged_platforms:
+                return "自上次翻譯後沒有變更"
+            if platform_stats[platform].is_complete(translate_name, translate_desc):
+                return "已全部翻譯"
+            return None
+
+        # max_workers 為 1 時逐一翻譯；否則由 asyncio 保持多個項目同時進行
+        max_in_flight = settings.max_in_flight if settings.max_workers > 1 else 1
+        async_engine = AsyncTranslationEngine(
+            translator,
+            max_in_flight=max_in_flight,
+            service_limits=settings.service_concurrency)
+        self._log("INFO", "Stage3",
+                  f"🔥 非同步翻譯：同時處理 {max_in_flight} 個項目，"
+                  f"服務併發上限 {async_engine.service_limits}")
+
+        # 跨平台去重：同標題只查詢一次名稱，結果套用到所有選取平台
+        dedup = None
+        dictionaries = {}
+        if (settings.cross_platform_dedup and translate_name
+                and len(unchanged_platforms) < len(platforms)):
+            # 去重需要所有平台的項目（已翻譯完成的平台可提供既有譯名）
+            for platform in platforms:
+                dictionaries[platform] = dict_manager.load_dictionary(
+                    language, platform)
+            dedup = CrossPlatformDedup(translator.clean_filename,
+                                       skip_translated=skip_translated)
+            dedup_stats = dedup.build(dictionaries)
+            representatives = dedup.representatives
+            self._log("INFO", "Stage3",
+                      f"跨平台去重：{dedup_stats.entries} 個項目共 {dedup_stats.titles} 個標題，"
+                      f"需查詢 {len(representatives)} 個")
+            resolved_titles = 0
+
+            def apply_name(entry, output, force_retranslate):
+                """套用代表項目的名稱並分發到同標題項目"""
+                nonlocal resolved_titles
+                resolved_titles += 1
+                self._progress(5, 100,
+                               f"跨平台去重：查詢標題 {resolved_titles}/{len(representatives)}")
+                if output.name:
+                    entry.name = output.name
+                    entry.name_source = output.name_source
+                    entry.name_translated_at = time.strftime(
+                        '%Y-%m-%dT%H:%M:%S')
+                    shared = dedup.fan_out(entry)
+                    self._log("INFO", "Stage3",
+                              f"  ✓ {entry.original_name} → {output.name} ({output.name_source})"
+                              f"{f'，套用至另外 {shared} 個項目' if shared else ''}")
+
+            def report_name_error(entry, error):
+                self._log("ERROR", "Stage3",
+                          f"名稱翻譯失敗: {entry.original_name}: {error}")
+
+            async_engine.run(
+                representatives,
+                translate_name=True,
+                translate_desc=False,
+                skip_translated=False,
+                on_result=apply_name,
+                on_error=report_name_error,
+                is_cancelled=lambda: self.cancelled)
+
+            self._log("SUCCESS", "Stage3",
+                      f"✓ 跨平台去重省下 {dedup_stats.lookups_avoided} 次名稱查詢"
+                      f"（沿用既有譯名 {dedup_stats.reused}，共用查詢結果 {dedup_stats.fanned_out}）")
+
+        for platform in platforms:
+            if self.cancelled:
+                break
+
+            partial = False
+            if platform in dictionaries:
+                dictionary = dictionaries.pop(platform)
+            elif skip_reason(platform):
+                # 依索引或變更清單略過平台，不需載入字典
+                processed_entries += platform_sizes[platform]
+                self._log("INFO", "Stage3", f"  {platform}: {skip_reason(platform)}，略過")
+                continue
+            elif skip_translated and dict_manager.supports_partial_save(language, platform):
+                # 可逐筆寫入的後端（SQLite）只取出待翻譯的項目，不載入整個平台
+                dictionary = dict(dict_manager.iter_pending_entries(
+                    language, platform, translate_name, translate_desc))
+                partial = True
+                processed_entries += platform_sizes[platform] - len(dictionary)
+            else:
+                dictionary = dict_manager.load_dictionary(language, platform)
+
+            # 只寫入變更項目的自動儲存（中斷時保留已翻譯的進度）
+            autosaver = DeltaAutosaver(dict_manager, language, platform, dictionary,
+                                       interval=settings.auto_save_interval,
+                                       partial=partial)
+
+            platform_translated = 0
+            if dedup:
+                # 名稱已由跨平台去重完成的項目（仍需執行下方流程以更新 hash 並儲存）
+                for entry in dictionary.values():
+                    if dedup.is_resolved(entry):
+                        platform_translated += 1
+                        autosaver.mark_dirty(entry.key)
+                if not platform_translated and skip_reason(platform):
+                    processed_entries += platform_sizes[platform]
+                    self._log("INFO", "Stage3", f"  {platform}: {skip_reason(platform)}，略過")
+                    continue
+
+            def apply_output(entry, output, force_retranslate):
+                """套用翻譯結果（在 event loop 執行緒中執行，不需加鎖）"""
+                nonlocal processed_entries, platform_translated
+
+                processed_entries += 1
+                progress = 5 + \
+                    int((processed_entries / total_entries)
+                        * 90) if total_entries > 0 else 100
+                elapsed = time.time() - start_time
+                eta_seconds = int(elapsed / processed_entries *
+                                  (total_entries - processed_entries))
+                display_name = entry.original_name[:25]
+                self._progress(progress, 100,
+                               f"[{platform}] {display_name}... ({processed_entries}/{total_entries}, 剩餘 {_format_eta(eta_seconds)})")
+
+                if output.name:
+                    entry.name = output.name
+                    entry.name_source = output.name_source
+                    entry.name_translated_at = time.strftime(
+                        '%Y-%m-%dT%H:%M:%S')
+                    platform_translated += 1
+                    if force_retranslate:
+                        self._log("SUCCESS", "Stage3",
+                                  f"✓ 重翻名稱：{entry.original_name} → {output.name}")
+                    else:
+                        self._log("INFO", "Stage3",
+                                  f"  ✓ {entry.original_name} → {output.name} ({output.name_source})")
+                if output.desc:
+                    entry.desc = output.desc
+                    entry.desc_source = output.desc_source
+                    entry.desc_translated_at = time.strftime(
+                        '%Y-%m-%dT%H:%M:%S')
+                    if force_retranslate:
+                        desc_preview = output.desc[:50] + "..." if len(
+                            output.desc) > 50 else output.desc
+                        self._log("SUCCESS", "Stage3",
+                                  f"✓ 重翻描述：{entry.original_name} - {desc_preview}")
+
+                # 翻譯完成後清除重翻標記
+                if force_retranslate and (output.name or output.desc):
+                    entry.needs_retranslate = False
+
+                # 更新原文 hash（用於偵測原文變更）
+                entry.update_hashes()
+
+                autosaver.step(entry.key, changed=bool(output.name or output.desc))
+
+            def report_error(entry, error):
+                self._log("ERROR", "Stage3",
+                          f"翻譯失敗: {entry.original_name}: {error}")
+
+            run_stats = async_engine.run(
+                list(dictionary.values()),
+                translate_name=translate_name,
+                translate_desc=translate_desc,
+                skip_translated=skip_translated,
+                on_result=apply_output,
+                on_error=report_error,
+                is_cancelled=lambda: self.cancelled,
+                skip_name=dedup.is_resolved if dedup else None)
+
+            if run_stats.cancelled:
+                self._log("WARNING", "Stage3", "使用者已取消翻譯")
+            elif run_stats.completed:
+                self._log("INFO", "Stage3",
+                          f"[{platform}] 完成 {run_stats.completed} 項，"
+                          f"{run_stats.throughput:.1f} 項/秒")
+
+            # 完整儲存並壓縮增量日誌（只取出待翻譯項目時只寫入變更）
+            autosaver.finish()
+            saved_platforms.append(platform)
+            # 只有全部項目都翻譯完成才記錄，暫時性失敗（網路錯誤、429 等）的項目下次仍會重試
+            if (not run_stats.cancelled and not run_stats.errors
+                    and dict_manager.get_dictionary_stats(language, platform).is_complete(
+                        translate_name, translate_desc)):
+                manifest.record_translated(
+                    platform, language,
+                    dict_manager.get_dictionary_version(language, platform), options)
+            self._log("INFO", "Stage3",
+                      f"  {platform}: 翻譯 {platform_translated} 個")
+            total_translated += platform_translated
+
+        manifest.save()
+
+        # 非 JSON 字典後端：將本次更新的平台匯出到 language_packs（版控分享）
+        exported = dict_manager.export_language_packs(language, saved_platforms)
+        if exported:
+            self._log("INFO", "Dictionary",
+                      f"已匯出 {exported} 個平台的語系包 JSON")
+
+        # 翻譯完成，將快取批次寫入資料庫
+        from ..utils.cache import get_global_cache
+        cache = get_global_cache()
+        cached_count = cache.flush_to_db()
+        if cached_count > 0:
+            self._log("SUCCESS", "Cache",
+                      f"✓ 快取持久化完成：{cached_count} 項")
+        saved = sum(cache.get_negative_hits().values())
+        if saved > 0:
+            self._log("INFO", "Cache",
+                      f"負面快取命中 {saved} 次（省下的網路查詢）")
+
+        self._progress(100, 100, "階段三完成！")
+        self._log("SUCCESS", "Stage3",
+                  f"階段三完成！翻譯 {total_translated} 個遊戲")
+
+        return {'translated': total_translated}
+
+    def write_back(self, language: str, auto_backup: bool = True,
+                   selected_platforms: Optional[List[str]] = None,
+                   write_rules: Optional[dict] = None,
+                   num_workers: Optional[int] = None) -> Dict[str, int]:
+        """
+        階段四：將字典翻譯寫回暫存區的 gamelist.xml
+
+        各平台互不相關，由工作佇列同時處理多個平台（載入字典、備份、解析、寫入）。
+
+        Args:
+            language: 目標語系
+            auto_backup: 是否自動備份
+            selected_platforms: 要處理的平台，None 或空清單表示全部
+            write_rules: 寫回規則設定
+            num_workers: 同時寫回的平台數，None 使用設定檔的 writeback_workers
+
+        Returns:
+            {'updated': 更新的遊戲數, 'changed': 內容有變更的遊戲數,
+             'written': 實際寫入的平台數, 'failed': 失敗數,
+             'unchanged': 字典與規則未變更而略過的平台數}
+        """
+        from . import DictionaryManager, XmlWriter
+        from .writer import DisplayFormat, WriteResult
+        from ..utils.work_queue import WorkQueue
+
+        self._log("INFO", "Stage4", "開始階段四：寫回 XML...")
+        self._progress(0, 100, "正在準備寫回...")
+
+        dict_manager = DictionaryManager()
+        writer = XmlWriter()
+
+        gamelists_dir = self.local_cache_path
+        if not gamelists_dir.exists():
+            raise PipelineError("請先執行階段一（掃描取回）")
+
+        platform_dirs = [d for d in gamelists_dir.iterdir(
+        ) if d.is_dir() and (d / 'gamelist.xml').exists()]
+
+        # 過濾選中的平台
+        if selected_platforms:
+            platform_dirs = [
+                d for d in platform_dirs if d.name in selected_platforms]
+            self._log("INFO", "Stage4",
+                      f"選中 {len(platform_dirs)} 個平台進行寫回")
+
+        # 字典版本、寫回規則與暫存區檔案都和上次寫回時相同的平台直接略過
+        manifest = self._get_manifest()
+        rules_key = json.dumps(write_rules, sort_keys=True, ensure_ascii=False)
+        dict_versions = {d.name: dict_manager.get_dictionary_version(language, d.name)
+                         for d in platform_dirs}
+        unchanged = 0
+        if self._load_settings().skip_unchanged:
+            pending = [d for d in platform_dirs
+                       if not manifest.is_written(d.name, language, dict_versions[d.name],
+                                                  rules_key, d / 'gamelist.xml')]
+            unchanged = len(platform_dirs) - len(pending)
+            if unchanged:
+                self._log("INFO", "Stage4", f"{unchanged} 個平台自上次寫回後沒有變更，略過")
+            platform_dirs = pending
+
+        if num_workers is None:
+            num_workers = self._load_settings().writeback_workers
+        num_workers = max(1, min(num_workers, len(platform_dirs) or 1))
+
+        def write_platform(platform_dir: Path) -> Optional[WriteResult]:
+            """寫回單一平台（在 worker 執行緒中執行）"""
+            dictionary = dict_manager.load_dictionary(
+                language, platform_dir.name)
+            if not dictionary:
+                return None
+            return writer.write_translations(
+                xml_path=platform_dir / 'gamelist.xml',
+                dictionary=dictionary,
+                platform=platform_dir.name,
+                display_format=DisplayFormat.TRANSLATED_ONLY,
+                auto_backup=auto_backup,
+                write_rules=write_rules
+            )
+
+        total = len(platform_dirs)
+        totals = WriteResult()
+        written_platforms = 0
+        done = 0
+
+        def apply_result(platform_dir: Path, result: Optional[WriteResult]):
+            """彙總結果（在本執行緒依完成順序執行）"""
+            nonlocal written_platforms, done
+            done += 1
+            self._progress(int((done / total) * 100), 100,
+                           f"寫回: {platform_dir.name}")
+            if result is None:
+                return
+
+            totals.merge(result)
+            if result.written:
+                written_platforms += 1
+            if result.failed:
+                self._log("ERROR", "Stage4",
+                          f"  {platform_dir.name}: gamelist.xml 解析失敗")
+                return
+            manifest.record_written(platform_dir.name, language,
+                                    dict_versions[platform_dir.name], rules_key,
+                                    platform_dir / 'gamelist.xml')
+            unchanged = "" if result.written else "（內容無變更，未寫入）"
+            self._log("INFO", "Stage4",
+                      f"  {platform_dir.name}: 更新 {result.updated} 個{unchanged}")
+
+        def report_error(platform_dir: Path, error: BaseException):
+            nonlocal done
+            done += 1
+            totals.failed += 1
+            self._log("ERROR", "Stage4",
+                      f"  {platform_dir.name}: 寫回失敗: {error}")
+
+        if num_workers > 1:
+            self._log("INFO", "Stage4", f"同時寫回 {num_workers} 個平台")
+
+        queue_stats = WorkQueue(write_platform, num_workers=num_workers,
+                                name='writeback').run(
+            platform_dirs,
+            on_result=apply_result,
+            on_error=report_error,
+            is_cancelled=lambda: self.cancelled)
+
+        if queue_stats.cancelled:
+            self._log("WARNING", "Stage4", "使用者已取消寫回")
+        manifest.save()
+
+        self._progress(100, 100, "階段四完成！")
+        self._log("SUCCESS", "Stage4",
+                  f"階段四完成！更新 {totals.updated} 個遊戲，"
+                  f"寫入 {written_platforms}/{total} 個平台（{queue_stats.elapsed:.1f} 秒）")
+
+        return {'updated': totals.updated, 'changed': totals.changed,
+                'written': written_platforms, 'failed': totals.failed,
+                'unchanged': unchanged}
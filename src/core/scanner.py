@@ -4,10 +4,18 @@
 """
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, Callable, List, Dict, Optional
 from dataclasses import dataclass
 
+GAMELIST_FILENAME = 'gamelist.xml'
+
+# 探測平台資料夾的預設執行緒數：網路路徑每次 stat 都是一次往返，同時探測較多
+LOCAL_SCAN_WORKERS = 4
+NETWORK_SCAN_WORKERS = 16
+
+
 @dataclass
 class PlatformInfo:
     """遊戲平台資訊"""
@@ -15,6 +23,52 @@ class PlatformInfo:
     path: Path                  # 平台資料夾路徑
     gamelist_path: Optional[Path]  # gamelist.xml 路徑
     has_gamelist: bool          # 是否有 gamelist.xml
+    gamelist_size: Optional[int] = None      # gamelist.xml 大小（位元組）
+    gamelist_mtime_ns: Optional[int] = None  # gamelist.xml 修改時間（奈秒）
+
+    @property
+    def gamelist_state(self) -> Optional[Dict[str, Any]]:
+        """掃描時取得的 gamelist.xml 狀態（與 manifest.file_state 格式相同）"""
+        if not self.has_gamelist or self.gamelist_size is None:
+            return None
+        return {'size': self.gamelist_size, 'mtime_ns': self.gamelist_mtime_ns}
+
+
+def is_network_path(path: Path) -> bool:
+    """
+    是否為網路路徑（UNC 路徑，例如 \\\\BATOCERA\\share 或 \\\\wsl.localhost\\...）
+
+    Args:
+        path: 路徑
+
+    Returns:
+        是否為網路路徑
+    """
+    text = str(path)
+    return text.startswith('\\\\') or text.startswith('//')
+
+
+def _probe_platform(path: Path, name: str) -> PlatformInfo:
+    """
+    探測單一平台資料夾：只對 gamelist.xml 做一次 stat，同時取得是否存在、大小與修改時間
+
+    Args:
+        path: 平台資料夾路徑
+        name: 資料夾名稱
+
+    Returns:
+        平台資訊
+    """
+    gamelist_path = path / GAMELIST_FILENAME
+    try:
+        stat = os.stat(gamelist_path)
+    except OSError:
+        return PlatformInfo(name=name.lower(), path=path,
+                            gamelist_path=None, has_gamelist=False)
+    return PlatformInfo(name=name.lower(), path=path,
+                        gamelist_path=gamelist_path, has_gamelist=True,
+                        gamelist_size=stat.st_size,
+                        gamelist_mtime_ns=stat.st_mtime_ns)
 
 
 class Scanner:
@@ -41,44 +95,63 @@ class Scanner:
         'x68000', 'pc88', 'pc98', 'fba', 'fbneo', 'naomi', 'atomiswave'
     ]
     
-    def __init__(self, roms_path: str, local_cache_path: str = './gamelists_local'):
+    def __init__(self, roms_path: str, local_cache_path: str = './gamelists_local',
+                 max_workers: int = 0):
         """
         初始化掃描器
         
         Args:
             roms_path: ROM 根目錄路徑
             local_cache_path: 本地暫存區路徑
+            max_workers: 同時探測的平台資料夾數，0 表示依路徑自動決定（網路路徑較多）
         """
         self.roms_path = Path(roms_path)
         self.local_cache_path = Path(local_cache_path)
         self.platforms: List[PlatformInfo] = []
+        if max_workers <= 0:
+            max_workers = (NETWORK_SCAN_WORKERS if is_network_path(self.roms_path)
+                           else LOCAL_SCAN_WORKERS)
+        self.max_workers = max_workers
         
-    def scan(self) -> List[PlatformInfo]:
+    def scan(self, on_platform: Optional[Callable[[PlatformInfo, int, int], None]] = None
+             ) -> List[PlatformInfo]:
         """
         掃描 ROM 資料夾，識別所有遊戲平台
+
+        根目錄只列出一次（os.scandir 的 DirEntry 已帶有檔案類型，不需逐一 stat），
+        各平台資料夾的 gamelist.xml 再以多執行緒同時探測。
         
+        Args:
+            on_platform: 每探測完一個平台就呼叫 (平台資訊, 已完成數, 總數)，
+                         在呼叫端執行緒執行，可用於即時顯示進度
+
         Returns:
-            平台資訊清單
+            平台資訊清單（依目錄列出的順序）
         """
         self.platforms = []
         
-        if not self.roms_path.exists():
+        try:
+            with os.scandir(self.roms_path) as it:
+                folders = [(Path(entry.path), entry.name) for entry in it
+                           if entry.is_dir()]
+        except FileNotFoundError:
             raise FileNotFoundError(f"ROM 目錄不存在: {self.roms_path}")
-            
-        # 掃描所有子資料夾
-        for item in self.roms_path.iterdir():
-            if item.is_dir():
-                platform_name = item.name.lower()
-                gamelist_path = item / 'gamelist.xml'
-                
-                platform_info = PlatformInfo(
-                    name=platform_name,
-                    path=item,
-                    gamelist_path=gamelist_path if gamelist_path.exists() else None,
-                    has_gamelist=gamelist_path.exists()
-                )
-                self.platforms.append(platform_info)
-                
+
+        if not folders:
+            return self.platforms
+
+        results: List[Optional[PlatformInfo]] = [None] * len(folders)
+        workers = min(self.max_workers, len(folders))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scan') as executor:
+            futures = {executor.submit(_probe_platform, path, name): index
+                       for index, (path, name) in enumerate(folders)}
+            for done, future in enumerate(as_completed(futures), 1):
+                platform_info = future.result()
+                results[futures[future]] = platform_info
+                if on_platform:
+                    on_platform(platform_info, done, len(folders))
+
+        self.platforms = results
         return self.platforms
     
     def get_platforms_with_gamelist(self) -> List[PlatformInfo]:
@@ -107,7 +180,7 @@ class Scanner:
         cache_dir.mkdir(parents=True, exist_ok=True)
         
         # 複製檔案
-        dest_path = cache_dir / 'gamelist.xml'
+        dest_path = cache_dir / GAMELIST_FILENAME
         shutil.copy2(platform.gamelist_path, dest_path)
         
         return dest_path
@@ -0,0 +1,496 @@
+# 字典儲存後端模組
+"""
+字典檔的可抽換儲存後端：
+- json: 原有格式，主要存到 language_packs（版控分享），同時備份到使用者字典目錄
+- sqlite: 每個語系一個資料庫，逐筆 upsert，自動儲存只寫入變更的項目
+
+後端只處理「key -> 項目 dict」的原始資料，GameEntry 的轉換由 DictionaryManager 負責。
+"""
+import json
+import shutil
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+STORAGE_JSON = 'json'
+STORAGE_SQLITE = 'sqlite'
+
+# 未指定後端時使用的預設值（程式啟動時依設定檔呼叫 set_default_storage）
+_default_storage = STORAGE_JSON
+
+
+def needs_work(entry: Dict[str, Any], translate_name: bool = True,
+               translate_desc: bool = True) -> bool:
+    """
+    項目資料是否還需要翻譯（與 GameEntry.has_*_translation 的判斷相同）
+
+    Args:
+        entry: 項目資料
+        translate_name: 是否翻譯名稱
+        translate_desc: 是否翻譯描述
+    """
+    if entry.get('needs_retranslate'):
+        return True
+    if translate_name and not (entry.get('name') and entry.get('name_source')):
+        return True
+    if translate_desc and not (entry.get('desc') and entry.get('desc_source')):
+        return True
+    return False
+
+
+class DictionaryStorage(ABC):
+    """字典儲存後端基底類別"""
+
+    name = ''
+
+    @abstractmethod
+    def load(self, language: str, platform: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        載入平台字典
+
+        Returns:
+            key -> 項目資料；字典不存在時回傳 None
+        """
+        pass
+
+    def iter_pending(self, language: str, platform: str,
+                     translate_name: bool = True,
+                     translate_desc: bool = True) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        逐筆取得還需要翻譯的項目（不建立完整字典）
+
+        預設載入完整字典後篩選；可直接查詢的後端應覆寫此方法。
+
+        Args:
+            language: 語系代碼
+            platform: 平台代碼
+            translate_name: 是否翻譯名稱（沒有名稱翻譯的項目算待處理）
+            translate_desc: 是否翻譯描述（沒有描述翻譯的項目算待處理）
+
+        Returns:
+            (key, 項目資料) 的迭代器
+        """
+        data = self.load(language, platform) or {}
+        for key, entry in data.items():
+            if needs_work(entry, translate_name, translate_desc):
+                yield key, entry
+
+    @abstractmethod
+    def save(self, language: str, platform: str, data: Dict[str, Dict[str, Any]],
+             changed_keys: Optional[Iterable[str]] = None) -> None:
+        """
+        儲存平台字典
+
+        Args:
+            language: 語系代碼
+            platform: 平台代碼
+            data: key -> 項目資料；changed_keys 為 None 時為完整字典，
+                  否則只需包含變更的項目（changed_keys 中不在 data 的 key 視為刪除）
+            changed_keys: 有變更的 key，None 表示完整寫入
+        """
+        pass
+
+    def supports_partial_save(self, language: str, platform: str) -> bool:
+        """是否可只寫入變更的項目（否則 save 一律需要完整字典）"""
+        return False
+
+    @abstractmethod
+    def delete(self, language: str, platform: str) -> None:
+        """刪除平台字典"""
+        pass
+
+    @abstractmethod
+    def list_platforms(self, language: str) -> List[str]:
+        """列出語系下所有平台"""
+        pass
+
+    def get_counts(self, language: str, platform: str) -> Optional[Dict[str, int]]:
+        """
+        直接由後端取得統計（entries/name_translated/desc_translated/needs_retranslate）
+
+        Returns:
+            統計資料；後端無法便宜取得時回傳 None（改用字典索引）
+        """
+        return None
+
+    def source_path(self, language: str, platform: str) -> Optional[Path]:
+        """字典實際讀取的檔案（用於索引失效判斷），沒有單一檔案時回傳 None"""
+        return None
+
+    def version(self, language: str, platform: str) -> Optional[str]:
+        """
+        字典版本（每次儲存都會改變），用於判斷字典自上次處理後是否有變更
+
+        Returns:
+            版本字串；字典不存在時回傳 None
+        """
+        path = self.source_path(language, platform)
+        if path is None:
+            return None
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    def close(self) -> None:
+        """釋放資源"""
+
+
+class JsonStorage(DictionaryStorage):
+    """JSON 檔案後端（language_packs 為主，使用者字典目錄為備份）"""
+
+    name = STORAGE_JSON
+
+    def __init__(self, dictionaries_path: Path, language_packs_path: Path):
+        """
+        初始化
+
+        Args:
+            dictionaries_path: 使用者字典目錄
+            language_packs_path: 語系包目錄（版控分享）
+        """
+        self.dictionaries_path = Path(dictionaries_path)
+        self.language_packs_path = Path(language_packs_path)
+
+    def _dict_path(self, language: str, platform: str) -> Path:
+        return self.dictionaries_path / language / f"{platform}.json"
+
+    def _pack_path(self, language: str, platform: str) -> Path:
+        return self.language_packs_path / language / f"{platform}.json"
+
+    def source_path(self, language: str, platform: str) -> Optional[Path]:
+        """language_packs 優先，不存在時使用本機字典"""
+        pack_path = self._pack_path(language, platform)
+        if pack_path.exists():
+            return pack_path
+        dict_path = self._dict_path(language, platform)
+        return dict_path if dict_path.exists() else None
+
+    def load(self, language: str, platform: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        path = self.source_path(language, platform)
+        if path is None:
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            # JSON 檔案損壞，備份並重新建立
+            backup_path = path.with_suffix('.json.corrupted')
+            shutil.move(path, backup_path)
+            print(f"警告：字典檔 {path} 損壞，已備份至 {backup_path}")
+            return None
+        except Exception as e:
+            print(f"載入字典檔失敗: {path}, 錯誤: {e}")
+            return None
+
+    def save(self, language: str, platform: str, data: Dict[str, Dict[str, Any]],
+             changed_keys: Optional[Iterable[str]] = None) -> None:
+        # JSON 無法逐筆更新，一律寫入完整內容
+
+        # === 主要：儲存到 language_packs 資料夾（版控分享） ===
+        pack_path = self._pack_path(language, platform)
+        pack_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 使用原子寫入（先寫臨時檔，再重新命名，避免寫入一半損壞）
+        temp_path = pack_path.with_suffix('.tmp')
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            # 原子替換
+            temp_path.replace(pack_path)
+        except Exception as e:
+            if temp_path.exists():
+                temp_path.unlink()
+            raise e
+
+        # === 備份：同時儲存到使用者資料目錄 ===
+        try:
+            dict_path = self._dict_path(language, platform)
+            dict_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(dict_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        except Exception:
+            # 備份失敗不影響主要儲存
+            pass
+
+    def delete(self, language: str, platform: str) -> None:
+        # 只刪除使用者字典，language_packs 由版控管理
+        dict_path = self._dict_path(language, platform)
+        if dict_path.exists():
+            dict_path.unlink()
+
+    def list_platforms(self, language: str) -> List[str]:
+        lang_dir = self.dictionaries_path / language
+        if not lang_dir.exists():
+            return []
+        return [f.stem for f in lang_dir.glob('*.json')]
+
+
+class SqliteStorage(DictionaryStorage):
+    """
+    SQLite 後端（每個語系一個資料庫）
+
+    - 以 (platform, key) 為主鍵逐筆 upsert，自動儲存只寫入變更的項目
+    - name_source/desc_source/needs_retranslate 建有索引，統計直接以 SQL 計算
+    - 待翻譯項目以索引欄位查詢並逐筆讀取（iter_pending），不需載入整個平台
+    - 平台首次載入時若資料庫中沒有資料，會自動從 JSON 字典匯入
+    """
+
+    name = STORAGE_SQLITE
+
+    def __init__(self, db_dir: Path, json_fallback: Optional[JsonStorage] = None):
+        """
+        初始化
+
+        Args:
+            db_dir: 資料庫目錄（檔名為 <語系>.db）
+            json_fallback: 舊的 JSON 字典來源，用於首次載入時匯入
+        """
+        self.db_dir = Path(db_dir)
+        self.json_fallback = json_fallback
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._conn_lock = threading.Lock()
+        self._initialized = set()
+
+    def _db_path(self, language: str) -> Path:
+        return self.db_dir / f"{language}.db"
+
+    def _get_connection(self, language: str) -> sqlite3.Connection:
+        """取得目前執行緒、指定語系的資料庫連線"""
+        conns = getattr(self._local, 'conns', None)
+        if conns is None:
+            conns = self._local.conns = {}
+        conn = conns.get(language)
+        if conn is not None:
+            return conn
+
+        db_path = self._db_path(language)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+
+        with self._conn_lock:
+            if language not in self._initialized:
+                self._init_schema(conn)
+                self._initialized.add(language)
+            self._connections.append(conn)
+
+        conns[language] = conn
+        return conn
+
+    def _init_schema(self, conn: sqlite3.Connection) -> None:
+        """建立資料表與索引"""
+        conn.executescript('''
+            CREATE TABLE IF NOT EXISTS platforms (
+                platform TEXT PRIMARY KEY,
+                updated_at REAL NOT NULL DEFAULT (strftime('%s', 'now')),
+                version INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS entries (
+                platform TEXT NOT NULL,
+                key TEXT NOT NULL,
+                name_source TEXT NOT NULL DEFAULT '',
+                desc_source TEXT NOT NULL DEFAULT '',
+                has_name INTEGER NOT NULL DEFAULT 0,
+                has_desc INTEGER NOT NULL DEFAULT 0,
+                needs_retranslate INTEGER NOT NULL DEFAULT 0,
+                data TEXT NOT NULL,
+                PRIMARY KEY (platform, key)
+            );
+            CREATE INDEX IF NOT EXISTS idx_entries_name_source ON entries(platform, name_source);
+            CREATE INDEX IF NOT EXISTS idx_entries_desc_source ON entries(platform, desc_source);
+            CREATE INDEX IF NOT EXISTS idx_entries_retranslate ON entries(platform, needs_retranslate);
+            CREATE INDEX IF NOT EXISTS idx_entries_has_name ON entries(platform, has_name);
+            CREATE INDEX IF NOT EXISTS idx_entries_has_desc ON entries(platform, has_desc);
+        ''')
+        # 舊版資料庫沒有 version 欄位
+        columns = {row[1] for row in conn.execute('PRAGMA table_info(platforms)')}
+        if 'version' not in columns:
+            conn.execute('ALTER TABLE platforms ADD COLUMN version INTEGER NOT NULL DEFAULT 0')
+        conn.commit()
+
+    @staticmethod
+    def _row(platform: str, key: str, entry: Dict[str, Any]) -> Tuple:
+        """轉換為資料列"""
+        return (
+            platform, key,
+            entry.get('name_source', '') or '',
+            entry.get('desc_source', '') or '',
+            int(bool(entry.get('name') and entry.get('name_source'))),
+            int(bool(entry.get('desc') and entry.get('desc_source'))),
+            int(bool(entry.get('needs_retranslate'))),
+            json.dumps(entry, ensure_ascii=False),
+        )
+
+    def _has_platform(self, conn: sqlite3.Connection, platform: str) -> bool:
+        return conn.execute('SELECT 1 FROM platforms WHERE platform = ?',
+                            (platform,)).fetchone() is not None
+
+    def supports_partial_save(self, language: str, platform: str) -> bool:
+        # 平台已存在於資料庫時才能逐筆寫入
+        return self._has_platform(self._get_connection(language), platform)
+
+    def load(self, language: str, platform: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        conn = self._get_connection(language)
+        if not self._has_platform(conn, platform):
+            # 首次使用：從 JSON 字典匯入
+            if self.json_fallback is None:
+                return None
+            data = self.json_fallback.load(language, platform)
+            if data is None:
+                return None
+            self.save(language, platform, data)
+            return data
+
+        rows = conn.execute('SELECT key, data FROM entries WHERE platform = ?',
+                            (platform,))
+        return {key: json.loads(data) for key, data in rows}
+
+    def iter_pending(self, language: str, platform: str,
+                     translate_name: bool = True,
+                     translate_desc: bool = True) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        conn = self._get_connection(language)
+        if not self._has_platform(conn, platform):
+            # 尚未匯入：由 load 匯入 JSON 字典後篩選
+            yield from super().iter_pending(language, platform, translate_name, translate_desc)
+            return
+
+        # 以索引欄位篩選，只解碼待處理的項目；游標逐筆讀取，不一次取出全部
+        rows = conn.execute('''
+            SELECT key, data FROM entries
+            WHERE platform = ? AND (needs_retranslate = 1
+                                    OR (? AND has_name = 0)
+                                    OR (? AND has_desc = 0))
+        ''', (platform, int(translate_name), int(translate_desc)))
+        for key, data in rows:
+            yield key, json.loads(data)
+
+    def save(self, language: str, platform: str, data: Dict[str, Dict[str, Any]],
+             changed_keys: Optional[Iterable[str]] = None) -> None:
+        conn = self._get_connection(language)
+        with conn:
+            if changed_keys is None or not self._has_platform(conn, platform):
+                # 完整寫入：清除舊資料後重新寫入
+                conn.execute('DELETE FROM entries WHERE platform = ?', (platform,))
+                rows = [self._row(platform, key, entry) for key, entry in data.items()]
+                removed = []
+            else:
+                changed = set(changed_keys)
+                rows = [self._row(platform, key, data[key])
+                        for key in changed if key in data]
+                removed = [(platform, key) for key in changed if key not in data]
+
+            conn.executemany('''
+                INSERT INTO entries (platform, key, name_source, desc_source,
+                                     has_name, has_desc, needs_retranslate, data)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(platform, key) DO UPDATE SET
+                    name_source = excluded.name_source,
+                    desc_source = excluded.desc_source,
+                    has_name = excluded.has_name,
+                    has_desc = excluded.has_desc,
+                    needs_retranslate = excluded.needs_retranslate,
+                    data = excluded.data
+            ''', rows)
+            if removed:
+                conn.executemany('DELETE FROM entries WHERE platform = ? AND key = ?',
+                                 removed)
+            conn.execute('''
+                INSERT INTO platforms (platform, updated_at) VALUES (?, strftime('%s', 'now'))
+                ON CONFLICT(platform) DO UPDATE SET updated_at = excluded.updated_at,
+                                                    version = platforms.version + 1
+            ''', (platform,))
+
+    def delete(self, language: str, platform: str) -> None:
+        conn = self._get_connection(language)
+        with conn:
+            conn.execute('DELETE FROM entries WHERE platform = ?', (platform,))
+            conn.execute('DELETE FROM platforms WHERE platform = ?', (platform,))
+        # 同時刪除舊的 JSON 字典，避免下次載入時又被匯入
+        if self.json_fallback is not None:
+            self.json_fallback.delete(language, platform)
+
+    def list_platforms(self, language: str) -> List[str]:
+        platforms = set()
+        if self._db_path(language).exists():
+            conn = self._get_connection(language)
+            platforms.update(row[0] for row in conn.execute('SELECT platform FROM platforms'))
+        if self.json_fallback is not None:
+            platforms.update(self.json_fallback.list_platforms(language))
+        return sorted(platforms)
+
+    def version(self, language: str, platform: str) -> Optional[str]:
+        conn = self._get_connection(language)
+        row = conn.execute('SELECT version FROM platforms WHERE platform = ?',
+                           (platform,)).fetchone()
+        if row is None:
+            # 尚未匯入：以 JSON 字典的版本為準
+            return self.json_fallback.version(language, platform) if self.json_fallback else None
+        return f"sqlite:{row[0]}"
+
+    def get_counts(self, language: str, platform: str) -> Optional[Dict[str, int]]:
+        conn = self._get_connection(language)
+        if not self._has_platform(conn, platform):
+            return None  # 尚未匯入，交由 DictionaryManager 載入
+        entries, names, descs, retranslate = conn.execute('''
+            SELECT COUNT(*), COALESCE(SUM(has_name), 0), COALESCE(SUM(has_desc), 0),
+                   COALESCE(SUM(needs_retranslate), 0)
+            FROM entries WHERE platform = ?
+        ''', (platform,)).fetchone()
+        return {'entries': entries, 'name_translated': names,
+                'desc_translated': descs, 'needs_retranslate': retranslate}
+
+    def close(self) -> None:
+        with self._conn_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._connections.clear()
+        self._local = threading.local()
+
+
+def set_default_storage(kind: str) -> None:
+    """
+    設定預設的字典儲存後端（程式啟動時依設定檔呼叫）
+
+    Args:
+        kind: 'json' 或 'sqlite'
+    """
+    global _default_storage
+    if kind not in (STORAGE_JSON, STORAGE_SQLITE):
+        print(f"未知的字典儲存後端: {kind}，改用 {STORAGE_JSON}")
+        kind = STORAGE_JSON
+    _default_storage = kind
+
+
+def get_default_storage() -> str:
+    """取得預設的字典儲存後端名稱"""
+    return _default_storage
+
+
+def create_storage(kind: str, dictionaries_path: Path,
+                   language_packs_path: Path) -> DictionaryStorage:
+    """
+    建立字典儲存後端
+
+    Args:
+        kind: 'json' 或 'sqlite'
+        dictionaries_path: 使用者字典目錄（SQLite 資料庫也放在這裡）
+        language_packs_path: 語系包目錄
+
+    Returns:
+        儲存後端
+    """
+    json_storage = JsonStorage(dictionaries_path, language_packs_path)
+    if kind == STORAGE_SQLITE:
+        return SqliteStorage(dictionaries_path, json_fallback=json_storage)
+    return json_storage
@@ -3,11 +3,13 @@
 負責遊戲名稱與描述的翻譯邏輯。
 """
 import re
-from typing import Optional, Tuple, Callable
+import threading
+from typing import Optional, Tuple, Callable, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
 
 from .dictionary import GameEntry, TranslationSource
+from ..utils.name_cleaner import clean
 
 
 class TranslationResult(Enum):
@@ -86,6 +88,41 @@ class TranslationEngine:
         self._gemini_service = None
         self._search_service = None
         self._translate_api = None
+        # 各服務的併發上限（service -> semaphore），未設定表示不限制
+        self._service_gates: Dict[str, threading.BoundedSemaphore] = {}
+
+    def set_service_concurrency(self, limits: Dict[str, int]) -> None:
+        """
+        設定各服務同時進行的請求上限
+
+        多執行緒或 AsyncTranslationEngine 同時翻譯多個項目時，
+        避免單一服務被過多請求塞滿（速率另由 rate_limiter 控制）。
+
+        Args:
+            limits: {服務名稱: 上限}，服務名稱為 wikipedia/gemini/search/translate
+        """
+        self._service_gates = {
+            service: threading.BoundedSemaphore(max(1, int(limit)))
+            for service, limit in limits.items()
+        }
+
+    def _call_service(self, service: str, func: Callable, *args) -> Any:
+        """
+        呼叫外部服務（套用該服務的併發上限）
+
+        Args:
+            service: 服務名稱
+            func: 要呼叫的服務方法
+            *args: 傳給服務方法的參數
+
+        Returns:
+            服務方法的回傳值
+        """
+        gate = self._service_gates.get(service)
+        if gate is None:
+            return func(*args)
+        with gate:
+            return func(*args)
 
     def set_wiki_service(self, service) -> None:
         """設定維基百科服務"""
@@ -113,21 +150,7 @@ class TranslationEngine:
         Returns:
             清理後的遊戲名稱
         """
-        # 移除副檔名
-        name = re.sub(r'\.[a-zA-Z0-9]+$', '', filename)
-
-        # 移除括號內容（區域碼、版本號等）
-        name = re.sub(r'\s*\([^)]*\)', '', name)
-        name = re.sub(r'\s*\[[^\]]*\]', '', name)
-
-        # 移除常見版本標記
-        name = re.sub(r'\s*(Rev\s*\d+|v\d+\.?\d*|Ver\.?\s*\d+)',
-                      '', name, flags=re.IGNORECASE)
-
-        # 清理多餘空白
-        name = re.sub(r'\s+', ' ', name).strip()
-
-        return name
+        return clean(filename)
 
     def should_keep_original(self, text: str, translated: str = "") -> bool:
         """
@@ -338,7 +361,9 @@ class TranslationEngine:
         # 1. 維基百科搜尋（最準確，免費）
         if self._wiki_service:
             try:
-                result = self._wiki_service.search(name, self.target_language)
+                result = self._call_service(
+                    'wikipedia', self._wiki_service.search,
+                    name, self.target_language)
                 if result and result != name:
                     return result, TranslationSource.WIKI.value
             except Exception:
@@ -347,7 +372,8 @@ class TranslationEngine:
         # 2. Gemini AI 翻譯（高品質，需要 key）
         if self._gemini_service:
             try:
-                result = self._gemini_service.translate_game_name(
+                result = self._call_service(
+                    'gemini', self._gemini_service.translate_game_name,
                     name, self.target_language)
                 if result and result != name:
                     return result, "gemini"
@@ -357,7 +383,8 @@ class TranslationEngine:
         # 3. 網路搜尋（免費，備選方案）
         if self._search_service:
             try:
-                result = self._search_service.search(
+                result = self._call_service(
+                    'search', self._search_service.search,
                     name, self.target_language)
                 if result and result != name:
                     return result, TranslationSource.SEARCH.value
@@ -367,7 +394,8 @@ class TranslationEngine:
         # 4. API 直譯（保底方案，免費）
         if self._translate_api:
             try:
-                result = self._translate_api.translate(
+                result = self._call_service(
+                    'translate', self._translate_api.translate,
                     name, self.target_language)
                 if result and result != name:
                     return result, TranslationSource.API.value
@@ -389,7 +417,8 @@ class TranslationEngine:
         # 直接使用 API 翻譯描述
         if self._translate_api:
             try:
-                result = self._translate_api.translate(
+                result = self._call_service(
+                    'translate', self._translate_api.translate,
                     desc, self.target_language)
                 if result:
                     return result, TranslationSource.API.value
@@ -410,14 +439,16 @@ class TranslationEngine:
         """
         # 1. 維基百科搜尋描述
         if self._wiki_service:
-            result = self._wiki_service.get_description(
+            result = self._call_service(
+                'wikipedia', self._wiki_service.get_description,
                 game_name, self.target_language)
             if result:
                 return result, TranslationSource.WIKI.value
 
         # 2. Gemini AI 取得描述（如果有配置）
         if self._gemini_service and hasattr(self._gemini_service, 'get_game_description'):
-            result = self._gemini_service.get_game_description(
+            result = self._call_service(
+                'gemini', self._gemini_service.get_game_description,
                 game_name, self.target_language)
             if result:
                 return result, "gemini"
@@ -3,10 +3,12 @@
 負責將翻譯結果寫回 gamelist.xml。
 """
 import xml.etree.ElementTree as ET
+import xml.parsers.expat as expat
 import shutil
 from pathlib import Path
-from typing import Dict, Optional, List
-from dataclasses import dataclass
+from typing import Dict, Optional, List, Tuple
+from dataclasses import dataclass, field
+from xml.sax.saxutils import escape as xml_escape
 from enum import Enum
 from datetime import datetime
 
@@ -37,8 +39,19 @@ class WriteResult:
     updated: int = 0        # 已更新
     skipped: int = 0        # 已跳過
     failed: int = 0         # 失敗
+    changed: int = 0        # 內容實際有變更的遊戲數
+    written: bool = False   # 是否實際寫入檔案（沒有變更時不寫入）
     backup_path: str = ""   # 備份路徑
 
+    def merge(self, other: 'WriteResult') -> None:
+        """累加另一個平台的寫回結果（backup_path 不合併）"""
+        self.total += other.total
+        self.updated += other.updated
+        self.skipped += other.skipped
+        self.failed += other.failed
+        self.changed += other.changed
+        self.written = self.written or other.written
+
 
 class XmlWriter:
     """
@@ -118,10 +131,14 @@ class XmlWriter:
                            strategy: WriteStrategy = WriteStrategy.DICT_PRIORITY,
                            auto_backup: bool = True,
                            preview_only: bool = False,
-                           write_rules: Optional[Dict] = None) -> WriteResult:
+                           write_rules: Optional[Dict] = None,
+                           patch_mode: bool = True) -> WriteResult:
         """
         將翻譯寫回 XML
 
+        預設使用修補模式：未變更的內容逐位元組保留，只重寫有變更的 <name>/<desc>；
+        沒有任何變更時不寫入檔案也不備份。
+
         Args:
             xml_path: gamelist.xml 路徑
             dictionary: 翻譯字典
@@ -135,12 +152,11 @@ class XmlWriter:
                     "name": {"target": "name|desc|skip", "format": "translated|trans_orig|orig_trans|original"},
                     "desc": {"target": "desc|name|skip", "format": "translated|trans_orig|orig_trans|original"}
                 }
+            patch_mode: 是否使用修補模式；False 時解析完整 XML 樹並重新縮排整個檔案
 
         Returns:
             寫回結果
         """
-        result = WriteResult()
-
         # 預設寫回規則（向後相容）
         if write_rules is None:
             write_rules = {
@@ -148,10 +164,196 @@ class XmlWriter:
                 "desc": {"target": "desc", "format": display_format.value}
             }
 
-        # 備份
-        if auto_backup and not preview_only:
+        name_rule = write_rules.get(
+            'name', {"target": "name", "format": "translated"})
+        desc_rule = write_rules.get(
+            'desc', {"target": "desc", "format": "translated"})
+
+        def plan(entry: GameEntry, name_text: Optional[str],
+                 desc_text: Optional[str]) -> Dict[str, str]:
+            return self._plan_game_update(entry, name_text, desc_text,
+                                          name_rule, desc_rule, strategy)
+
+        if patch_mode:
+            result = self._write_patch(xml_path, dictionary, platform, plan,
+                                       auto_backup, preview_only)
+            if result is not None:
+                return result
+            # 非 UTF-8 編碼的檔案無法以位元組位置修補，改用完整重寫
+
+        return self._write_tree(xml_path, dictionary, platform, plan,
+                                auto_backup, preview_only)
+
+    def _plan_game_update(self, entry: GameEntry,
+                          name_text: Optional[str], desc_text: Optional[str],
+                          name_rule: Dict, desc_rule: Dict,
+                          strategy: WriteStrategy) -> Dict[str, str]:
+        """
+        決定單一遊戲要寫入的欄位內容
+
+        Args:
+            entry: 字典項目
+            name_text: XML 中目前的名稱（元素不存在時為 None）
+            desc_text: XML 中目前的描述（元素不存在時為 None）
+            name_rule: 名稱寫回規則
+            desc_rule: 說明寫回規則
+            strategy: 寫回策略
+
+        Returns:
+            欄位名稱 -> 新內容（空字典表示不更新）
+        """
+        # 準備要寫入各欄位的內容
+        # 結構：{欄位名稱: [(來源, 翻譯值, 原始值, 格式), ...]}
+        writes_to_field = {'name': [], 'desc': []}
+
+        # 處理翻譯名稱的寫入
+        if entry.name and name_rule.get('target') != 'skip':
+            target = name_rule.get('target', 'name')
+            fmt = _get_display_format(name_rule.get('format', 'translated'))
+            writes_to_field[target].append(
+                ('name', entry.name, entry.original_name, fmt))
+
+        # 處理翻譯說明的寫入
+        if entry.desc and desc_rule.get('target') != 'skip':
+            target = desc_rule.get('target', 'desc')
+            fmt = _get_display_format(desc_rule.get('format', 'translated'))
+            writes_to_field[target].append(
+                ('desc', entry.desc, entry.original_desc, fmt))
+
+        updates = {}
+
+        # 寫入 name 欄位
+        if writes_to_field['name']:
+            original = name_text or ""
+            should_update = True
+
+            if strategy == WriteStrategy.SKIP_TRANSLATED:
+                if self._has_non_ascii(original):
+                    should_update = False
+            elif strategy == WriteStrategy.XML_PRIORITY:
+                if original and original != entry.original_name:
+                    should_update = False
+
+            if should_update:
+                # 如果有多個來源要寫入同一欄位，取第一個
+                source, translated, orig, fmt = writes_to_field['name'][0]
+                updates['name'] = self._format_text(translated, orig, fmt)
+
+        # 寫入 desc 欄位
+        if writes_to_field['desc']:
+            original_desc = desc_text or ""
+            should_update_desc = True
+
+            if strategy == WriteStrategy.SKIP_TRANSLATED:
+                if self._has_non_ascii(original_desc):
+                    should_update_desc = False
+
+            if should_update_desc:
+                # 如果有多個來源要寫入同一欄位，取第一個
+                source, translated, orig, fmt = writes_to_field['desc'][0]
+                updates['desc'] = self._format_text(translated, orig, fmt)
+
+        return updates
+
+    def _write_patch(self, xml_path: Path, dictionary: Dict[str, GameEntry],
+                     platform: str, plan, auto_backup: bool,
+                     preview_only: bool) -> Optional[WriteResult]:
+        """
+        修補模式寫回：只替換有變更的 <name>/<desc> 元素，其餘位元組原樣複製
+
+        Returns:
+            寫回結果；檔案不是 UTF-8 編碼時回傳 None（由呼叫端改用完整重寫）
+        """
+        result = WriteResult()
+
+        try:
+            data = xml_path.read_bytes()
+            encoding, games = _scan_game_blocks(data)
+        except (OSError, expat.ExpatError):
+            result.failed = 1
+            return result
+
+        if encoding and encoding.lower() not in ('utf-8', 'utf8'):
+            return None
+
+        # (起始位置, 結束位置, 新內容)，依檔案順序套用
+        edits: List[Tuple[int, int, bytes]] = []
+
+        for game in games:
+            result.total += 1
+
+            # 取得遊戲路徑作為 Key（用 get_game_key 生成與字典一致的 KEY）
+            path_span = game.fields.get('path')
+            if path_span is None or not path_span.text:
+                result.skipped += 1
+                continue
+
+            entry = dictionary.get(get_game_key(path_span.text))
+            if entry is None:
+                result.skipped += 1
+                continue
+
+            name_span = game.fields.get('name')
+            desc_span = game.fields.get('desc')
+            updates = plan(entry,
+                           name_span.text if name_span else None,
+                           desc_span.text if desc_span else None)
+            if not updates:
+                continue
+            result.updated += 1
+
+            game_changed = False
+            for tag, text in updates.items():
+                span = game.fields.get(tag)
+                element = _element_bytes(tag, text)
+                if span is not None:
+                    if span.text == text:
+                        continue  # 內容相同，不需改寫
+                    edits.append((span.start, span.end, element))
+                else:
+                    # 元素不存在：接在最後一個子元素之後，沿用其縮排
+                    edits.append((game.insert_at, game.insert_at,
+                                  b'\n' + game.indent + element))
+                game_changed = True
+
+            if game_changed:
+                result.changed += 1
+
+        # 同一遊戲中 desc 可能排在 name 之前
+        edits.sort(key=lambda edit: edit[0])
+
+        # 沒有任何變更時不寫入（也不需要備份）
+        if preview_only or not edits:
+            return result
+
+        if auto_backup:
             result.backup_path = str(self.backup_file(xml_path, platform))
 
+        view = memoryview(data)
+        temp_path = xml_path.with_suffix('.xml.tmp')
+        try:
+            with open(temp_path, 'wb') as f:
+                position = 0
+                for start, end, content in edits:
+                    f.write(view[position:start])
+                    f.write(content)
+                    position = end
+                f.write(view[position:])
+            temp_path.replace(xml_path)
+        except Exception:
+            if temp_path.exists():
+                temp_path.unlink()
+            raise
+
+        result.written = True
+        return result
+
+    def _write_tree(self, xml_path: Path, dictionary: Dict[str, GameEntry],
+                    platform: str, plan, auto_backup: bool,
+                    preview_only: bool) -> WriteResult:
+        """完整重寫模式：解析整個 XML 樹，更新後重新縮排寫回"""
+        result = WriteResult()
+
         # 解析 XML
         try:
             tree = ET.parse(xml_path)
@@ -160,22 +362,6 @@ class XmlWriter:
             result.failed = 1
             return result
 
-        # 解析 write_rules 的 format 為 DisplayFormat
-        def get_display_format(format_str: str) -> DisplayFormat:
-            """將字串格式轉換為 DisplayFormat 列舉"""
-            format_map = {
-                'translated': DisplayFormat.TRANSLATED_ONLY,
-                'trans_orig': DisplayFormat.TRANSLATED_ORIGINAL,
-                'orig_trans': DisplayFormat.ORIGINAL_TRANSLATED,
-                'original': DisplayFormat.ORIGINAL_ONLY
-            }
-            return format_map.get(format_str, DisplayFormat.TRANSLATED_ONLY)
-
-        name_rule = write_rules.get(
-            'name', {"target": "name", "format": "translated"})
-        desc_rule = write_rules.get(
-            'desc', {"target": "desc", "format": "translated"})
-
         # 遍歷所有遊戲
         for game in root.findall('game'):
             result.total += 1
@@ -197,77 +383,33 @@ class XmlWriter:
             entry = dictionary[game_key]
 
             # 取得 XML 中的 name 和 desc 元素
-            name_elem = game.find('name')
-            desc_elem = game.find('desc')
-
-            # 準備要寫入各欄位的內容
-            # 結構：{欄位名稱: [(來源, 翻譯值, 原始值, 格式), ...]}
-            writes_to_field = {'name': [], 'desc': []}
-
-            # 處理翻譯名稱的寫入
-            if entry.name and name_rule.get('target') != 'skip':
-                target = name_rule.get('target', 'name')
-                fmt = get_display_format(name_rule.get('format', 'translated'))
-                writes_to_field[target].append(
-                    ('name', entry.name, entry.original_name, fmt))
-
-            # 處理翻譯說明的寫入
-            if entry.desc and desc_rule.get('target') != 'skip':
-                target = desc_rule.get('target', 'desc')
-                fmt = get_display_format(desc_rule.get('format', 'translated'))
-                writes_to_field[target].append(
-                    ('desc', entry.desc, entry.original_desc, fmt))
-
-            # 執行寫入
-            updated = False
-
-            # 寫入 name 欄位
-            if writes_to_field['name']:
-                # 如果 name 元素不存在，創建它
-                if name_elem is None:
-                    name_elem = ET.SubElement(game, 'name')
-
-                original = name_elem.text or ""
-                should_update = True
-
-                if strategy == WriteStrategy.SKIP_TRANSLATED:
-                    if self._has_non_ascii(original):
-                        should_update = False
-                elif strategy == WriteStrategy.XML_PRIORITY:
-                    if original and original != entry.original_name:
-                        should_update = False
-
-                if should_update:
-                    # 如果有多個來源要寫入同一欄位，取第一個
-                    source, translated, orig, fmt = writes_to_field['name'][0]
-                    name_elem.text = self._format_text(translated, orig, fmt)
-                    updated = True
-
-            # 寫入 desc 欄位
-            if writes_to_field['desc']:
-                # 如果 desc 元素不存在，創建它
-                if desc_elem is None:
-                    desc_elem = ET.SubElement(game, 'desc')
-
-                original_desc = desc_elem.text or ""
-                should_update_desc = True
-
-                if strategy == WriteStrategy.SKIP_TRANSLATED:
-                    if self._has_non_ascii(original_desc):
-                        should_update_desc = False
-
-                if should_update_desc:
-                    # 如果有多個來源要寫入同一欄位，取第一個
-                    source, translated, orig, fmt = writes_to_field['desc'][0]
-                    desc_elem.text = self._format_text(translated, orig, fmt)
-                    updated = True
-
-            if updated:
-                result.updated += 1
-
-        # 寫入檔案（保留原始格式）
-        if not preview_only:
+            elements = {'name': game.find('name'), 'desc': game.find('desc')}
+            current = {tag: (elem.text or "") if elem is not None else None
+                       for tag, elem in elements.items()}
+            updates = plan(entry, current['name'], current['desc'])
+            if not updates:
+                continue
+            result.updated += 1
+
+            game_changed = False
+            for tag, text in updates.items():
+                elem = elements[tag]
+                # 如果元素不存在，創建它
+                if elem is None:
+                    elem = ET.SubElement(game, tag)
+                if (elem.text or "") != text:
+                    elem.text = text
+                    game_changed = True
+
+            if game_changed:
+                result.changed += 1
+
+        # 寫入檔案（保留原始格式），沒有變更時略過
+        if not preview_only and result.changed:
+            if auto_backup:
+                result.backup_path = str(self.backup_file(xml_path, platform))
             self._write_preserving_format(xml_path, tree)
+            result.written = True
 
         return result
 
@@ -376,3 +518,108 @@ class XmlWriter:
                     })
 
         return changes
+
+
+@dataclass
+class _FieldSpan:
+    """子元素在檔案中的位元組範圍"""
+    start: int
+    end: int
+    text: str
+
+
+@dataclass
+class _GameBlock:
+    """<game> 區塊中修補需要的位置資訊"""
+    fields: Dict[str, _FieldSpan] = field(default_factory=dict)
+    insert_at: int = 0      # 新增元素的插入位置（最後一個子元素之後）
+    indent: bytes = b''     # 子元素的縮排
+
+
+# 修補模式需要記錄位置的子元素
+_PATCH_FIELDS = ('path', 'name', 'desc')
+
+
+def _get_display_format(format_str: str) -> DisplayFormat:
+    """將 write_rules 的格式字串轉換為 DisplayFormat 列舉"""
+    format_map = {
+        'translated': DisplayFormat.TRANSLATED_ONLY,
+        'trans_orig': DisplayFormat.TRANSLATED_ORIGINAL,
+        'orig_trans': DisplayFormat.ORIGINAL_TRANSLATED,
+        'original': DisplayFormat.ORIGINAL_ONLY
+    }
+    return format_map.get(format_str, DisplayFormat.TRANSLATED_ONLY)
+
+
+def _element_bytes(tag: str, text: str) -> bytes:
+    """產生單一文字元素的 UTF-8 內容"""
+    return f"<{tag}>{xml_escape(text)}</{tag}>".encode('utf-8')
+
+
+def _scan_game_blocks(data: bytes) -> Tuple[Optional[str], List[_GameBlock]]:
+    """
+    以 expat 掃描根元素下的 <game>，記錄 path/name/desc 的位元組範圍與文字
+
+    Args:
+        data: gamelist.xml 原始內容
+
+    Returns:
+        (XML 宣告的編碼, <game> 區塊清單)
+
+    Raises:
+        expat.ExpatError: XML 格式錯誤
+    """
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+
+    games: List[_GameBlock] = []
+    encoding = None
+    depth = 0
+    current: Optional[_GameBlock] = None
+    child_tag = None
+    child_start = 0
+    text_parts: List[str] = []
+
+    def on_decl(version, decl_encoding, standalone):
+        nonlocal encoding
+        encoding = decl_encoding
+
+    def on_start(name, attrs):
+        nonlocal depth, current, child_tag, child_start, text_parts
+        depth += 1
+        if depth == 2 and name == 'game':
+            current = _GameBlock()
+        elif depth == 3 and current is not None:
+            child_tag = name
+            child_start = parser.CurrentByteIndex
+            text_parts = []
+
+    def on_end(name):
+        nonlocal depth, current, child_tag
+        if depth == 3 and current is not None:
+            position = parser.CurrentByteIndex
+            # 結束標籤從目前位置開始；空元素（<name/>）時目前位置已在標籤之後
+            end = data.index(b'>', position) + 1 if data.startswith(b'</', position) else position
+            if child_tag in _PATCH_FIELDS and child_tag not in current.fields:
+                current.fields[child_tag] = _FieldSpan(child_start, end, ''.join(text_parts))
+            if not current.insert_at:
+                line_start = data.rfind(b'\n', 0, child_start) + 1
+                indent = data[line_start:child_start]
+                current.indent = indent if not indent.strip() else b''
+            current.insert_at = end
+            child_tag = None
+        elif depth == 2 and current is not None:
+            games.append(current)
+            current = None
+        depth -= 1
+
+    def on_text(text):
+        if child_tag is not None and depth == 3:
+            text_parts.append(text)
+
+    parser.XmlDeclHandler = on_decl
+    parser.StartElementHandler = on_start
+    parser.EndElementHandler = on_end
+    parser.CharacterDataHandler = on_text
+    parser.Parse(data, True)
+    return encoding, games
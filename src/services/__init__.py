@@ -12,7 +12,7 @@ from .wikipedia import WikipediaService
 from .search import SearchService
 from .translate import TranslateService
 from .gemini import GeminiService
-from .gemini_batch import GeminiBatchService, BatchTranslationResult
+from .gemini_batch import GeminiBatchService, BatchTranslationResult, BatchJob
 
 __all__ = [
     'WikipediaService',
@@ -20,5 +20,6 @@ __all__ = [
     'TranslateService',
     'GeminiService',
     'GeminiBatchService',
-    'BatchTranslationResult'
+    'BatchTranslationResult',
+    'BatchJob'
 ]
@@ -3,10 +3,12 @@
 使用 Google Gemini API 進行遊戲名稱翻譯。
 提供比維基百科更精準的翻譯結果。
 """
-import time
 import warnings
 from typing import Optional
 
+from ..utils.cache import NEGATIVE_RESULT, content_key
+from ..utils.rate_limiter import get_rate_limiter, is_rate_limit_error
+
 # 抑制 google-generativeai 的棄用警告
 warnings.filterwarnings('ignore', message='.*google.generativeai.*')
 
@@ -37,6 +39,13 @@ class GeminiService:
         'en': '英文',
     }
 
+    # 使用的模型
+    MODEL_NAME = 'gemini-2.0-flash'
+
+    # 建立模型的函式 (模型名稱) -> 具有 generate_content() 的物件
+    # None 使用 google-generativeai；基準測試改接本機 stub server
+    MODEL_FACTORY = None
+
     def __init__(self, api_key: str, request_delay: float = 1.0):
         """
         初始化 Gemini 服務
@@ -45,7 +54,7 @@ class GeminiService:
             api_key: Google AI API Key
             request_delay: 請求間隔時間（秒），避免超過速率限制
         """
-        if not GEMINI_AVAILABLE:
+        if not GEMINI_AVAILABLE and self.MODEL_FACTORY is None:
             raise ImportError(
                 "請安裝 google-generativeai: pip install google-generativeai")
 
@@ -53,7 +62,8 @@ class GeminiService:
 
         self.api_key = api_key
         self.request_delay = request_delay
-        self._last_request_time = 0
+        # 與 GeminiBatchService 共用同一個限制器（同一組 API 配額）
+        self._limiter = get_rate_limiter('gemini', request_delay)
         self._model = None
         self._initialized = False
         # 全局快取
@@ -64,9 +74,15 @@ class GeminiService:
         if self._initialized:
             return True
 
+        if self.MODEL_FACTORY is not None:
+            # 由類別取得，避免一般函式被綁定成實例方法
+            self._model = type(self).MODEL_FACTORY(self.MODEL_NAME)
+            self._initialized = True
+            return True
+
         try:
             genai.configure(api_key=self.api_key)
-            self._model = genai.GenerativeModel('gemini-2.0-flash')
+            self._model = genai.GenerativeModel(self.MODEL_NAME)
             self._initialized = True
             return True
         except Exception as e:
@@ -74,11 +90,8 @@ class GeminiService:
             return False
 
     def _rate_limit(self) -> None:
-        """速率限制"""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.request_delay:
-            time.sleep(self.request_delay - elapsed)
-        self._last_request_time = time.time()
+        """速率限制（與其他執行緒、其他實例共用同一個限制器）"""
+        self._limiter.acquire()
 
     def translate_game_name(self, game_name: str, language: str = 'zh-TW') -> Optional[str]:
         """
@@ -93,6 +106,8 @@ class GeminiService:
         """
         # 檢查快取
         cached = self.cache.get('gemini', game_name, language)
+        if cached is NEGATIVE_RESULT:
+            return None
         if cached:
             return cached
 
@@ -117,10 +132,12 @@ class GeminiService:
 
         try:
             response = self._model.generate_content(prompt)
+            self._limiter.report_success()
             result = response.text.strip()
 
-            # 過濾無效回應
+            # 過濾無效回應（模型明確表示不知道，記錄為負面快取）
             if not result or result == 'UNKNOWN' or len(result) > 100:
+                self.cache.set_negative('gemini', game_name, language)
                 return None
 
             # 移除可能的引號
@@ -155,6 +172,7 @@ class GeminiService:
 
             for pattern in invalid_patterns:
                 if pattern in result:
+                    self.cache.set_negative('gemini', game_name, language)
                     return None
 
             # 寫入快取
@@ -164,6 +182,8 @@ class GeminiService:
             return result
 
         except Exception as e:
+            if is_rate_limit_error(e):
+                self._limiter.report_throttled()
             print(f"Gemini 翻譯失敗 ({game_name}): {e}")
             return None
 
@@ -178,9 +198,11 @@ class GeminiService:
         Returns:
             翻譯後的描述，失敗返回 None
         """
-        # 檢查快取
-        cached = self.cache.get(
-            'gemini_desc', description[:100], language)  # 用前100字當key
+        # 檢查快取（以完整描述的雜湊當 key，開頭相同的描述不會互相覆蓋）
+        cache_key = content_key(description)
+        cached = self.cache.get('gemini_desc', cache_key, language)
+        if cached is NEGATIVE_RESULT:
+            return None
         if cached:
             return cached
 
@@ -203,6 +225,7 @@ class GeminiService:
 
         try:
             response = self._model.generate_content(prompt)
+            self._limiter.report_success()
             result = response.text.strip()
 
             if not result or len(result) < 5:
@@ -210,12 +233,13 @@ class GeminiService:
 
             # 寫入快取
             if result:
-                self.cache.set(
-                    'gemini_desc', description[:100], language, result)
+                self.cache.set('gemini_desc', cache_key, language, result)
 
             return result
 
         except Exception as e:
+            if is_rate_limit_error(e):
+                self._limiter.report_throttled()
             print(f"Gemini 描述翻譯失敗: {e}")
             return None
 
@@ -2,13 +2,23 @@
 """
 使用 Google Gemini API 進行遊戲名稱批次翻譯。
 一次翻譯多個遊戲名稱，大幅減少 API 呼叫次數。
+遊戲描述也以相同方式批次翻譯（或依遊戲名稱批次產生簡介），
+每批依輸出 token 預算裝入多段描述。
 """
 import json
+import threading
 import time
 import re
 import warnings
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Optional, Dict, List, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from ..utils.batch_sizer import AdaptiveBatchSizer
+from ..utils.cache import NEGATIVE_RESULT, content_key
+from ..utils.json_stream import JsonArrayStream
+from ..utils.rate_limiter import get_quota_limiter, get_rate_limiter, is_rate_limit_error
 
 # 抑制 google-generativeai 的棄用警告
 warnings.filterwarnings('ignore', message='.*google.generativeai.*')
@@ -28,6 +38,111 @@ class BatchTranslationResult:
     failed: List[str]             # 翻譯失敗的遊戲名稱
     total: int                    # 總數
     success_count: int            # 成功數
+    # 確定沒有譯名的遊戲（負面快取命中或模型回答 null），同時也列在 failed 中
+    unknown: List[str] = field(default_factory=list)
+    retries: int = 0              # 失敗或遺漏的項目拆半重送的請求數
+
+
+@dataclass
+class BatchJob:
+    """一組要翻譯的遊戲名稱（通常是一個平台的所有名稱）"""
+    game_names: List[str]
+    platform: str = ""            # 遊戲平台名稱（提升翻譯準確度）
+
+
+class _NameTask:
+    """
+    批次工作：翻譯遊戲名稱（translate_many 的預設模式）
+
+    定義一種批次請求的快取、切批、prompt 與結果清理方式，
+    排程、配額、重試與拆半重送由 GeminiBatchService 共用。
+    """
+
+    cache_service = 'gemini'  # 快取的服務名稱
+    value_field = 'name'      # 回應項目中放結果的欄位
+    adaptive = True           # 是否由 batch_sizer 決定批次大小
+    unit = '個遊戲'            # 進度訊息的項目單位
+
+    def __init__(self, service: 'GeminiBatchService'):
+        self.service = service
+
+    def cache_key(self, text: str) -> str:
+        """快取查詢字串"""
+        return text
+
+    def next_end(self, texts: List[str], start: int) -> int:
+        """從 start 開始切出下一批，回傳結束位置"""
+        return start + self.service.batch_sizer.size
+
+    def output_tokens(self, batch: List[str]) -> int:
+        """預估的輸出 token 數"""
+        return len(batch) * self.service.OUTPUT_TOKENS_PER_ITEM
+
+    def build_prompt(self, batch: List[str], language: str, platform: str) -> str:
+        return self.service._build_prompt(batch, language, platform)
+
+    def clean(self, value: str, original: str) -> Optional[str]:
+        """
+        清理回應中的結果，無效時返回 None
+
+        與原名相同也是有效的翻譯（prompt 要求品牌名、縮寫保留英文原名）。
+        """
+        return self.service._clean_translation(value)
+
+
+class _DescriptionTask(_NameTask):
+    """
+    批次工作：翻譯遊戲描述，generate=True 時改為依遊戲名稱產生簡介
+
+    描述長短差異很大，每批依預估的輸出 token 數裝入，而不是固定項目數。
+    翻譯的快取以完整描述的雜湊為鍵（開頭相同的描述不會互相覆蓋）。
+    """
+
+    value_field = 'text'
+    adaptive = False
+
+    def __init__(self, service: 'GeminiBatchService', generate: bool = False):
+        super().__init__(service)
+        self.generate = generate
+        self.cache_service = 'gemini_desc_gen' if generate else 'gemini_desc'
+        self.unit = '個遊戲簡介' if generate else '段描述'
+
+    def cache_key(self, text: str) -> str:
+        return text if self.generate else content_key(text)
+
+    def item_tokens(self, text: str) -> int:
+        """單一項目預估的輸出 token 數"""
+        if self.generate:
+            return self.service.GENERATED_DESC_TOKENS
+        # 英文譯成中日韓文字約每 2 個字元 1 個 token
+        return len(text) // 2 + self.service.OUTPUT_TOKENS_PER_ITEM
+
+    def next_end(self, texts: List[str], start: int) -> int:
+        budget = self.service.DESC_OUTPUT_BUDGET
+        end = start
+        while end < len(texts) and end - start < self.service.MAX_DESCS_PER_BATCH:
+            cost = self.item_tokens(texts[end])
+            # 至少裝入一段（超過預算的長描述單獨送出）
+            if end > start and cost > budget:
+                break
+            budget -= cost
+            end += 1
+        return end
+
+    def output_tokens(self, batch: List[str]) -> int:
+        return sum(self.item_tokens(text) for text in batch)
+
+    def build_prompt(self, batch: List[str], language: str, platform: str) -> str:
+        return self.service._build_description_prompt(
+            batch, language, platform, self.generate)
+
+    def clean(self, value: str, original: str) -> Optional[str]:
+        text = value.strip()
+        if len(text) < 5 or text == original.strip():
+            return None
+        if text.startswith(('抱歉', '對不起')):
+            return None
+        return text
 
 
 class GeminiBatchService:
@@ -37,6 +152,7 @@ class GeminiBatchService:
     功能：
     - 使用 Gemini Pro 模型批次翻譯遊戲名稱
     - 一次處理多個遊戲，減少 API 呼叫
+    - 批次翻譯遊戲描述，或依遊戲名稱批次產生簡介
     - 支援多語系翻譯
     - JSON 格式輸出
     """
@@ -50,23 +166,95 @@ class GeminiBatchService:
         'en': '英文',
     }
 
-    # 預設批次大小
+    # 預設批次大小（自適應時為初始大小）
     DEFAULT_BATCH_SIZE = 30
 
+    # 自適應批次大小的範圍
+    MIN_BATCH_SIZE = 5
+    MAX_BATCH_SIZE = 300
+
+    # 單次回應的輸出 token 上限
+    MAX_OUTPUT_TOKENS = 8192
+
+    # 結構化輸出的回應格式：[{"id": 1, "name": "譯名"}, {"id": 2, "name": null}]
+    RESPONSE_SCHEMA = {
+        'type': 'ARRAY',
+        'items': {
+            'type': 'OBJECT',
+            'properties': {
+                'id': {'type': 'INTEGER'},
+                'name': {'type': 'STRING', 'nullable': True},
+            },
+            'required': ['id', 'name'],
+        },
+    }
+
+    # 描述模式的回應格式：[{"id": 1, "text": "描述"}, {"id": 2, "text": null}]
+    DESCRIPTION_SCHEMA = {
+        'type': 'ARRAY',
+        'items': {
+            'type': 'OBJECT',
+            'properties': {
+                'id': {'type': 'INTEGER'},
+                'text': {'type': 'STRING', 'nullable': True},
+            },
+            'required': ['id', 'text'],
+        },
+    }
+
+    # 描述模式每批的輸出 token 預算（保留輸出上限的餘裕）與項目數上限
+    DESC_OUTPUT_BUDGET = 5000
+    MAX_DESCS_PER_BATCH = 50
+
+    # 產生簡介時每個遊戲預估的輸出 token 數（約 100 字）
+    GENERATED_DESC_TOKENS = 160
+
+    # translate_many 的模式
+    MODE_NAME = 'name'                  # 翻譯遊戲名稱
+    MODE_DESCRIPTION = 'description'    # 翻譯遊戲描述
+    MODE_GENERATE = 'generate'          # 依遊戲名稱產生簡介
+
     # 最大重試次數
     MAX_RETRIES = 3
 
+    # 預設同時等待回應的批次數
+    DEFAULT_MAX_IN_FLIGHT = 4
+
+    # 預設每分鐘配額（gemini-2.0-flash-lite 免費方案：30 RPM、1,000,000 TPM）
+    DEFAULT_RPM = 30
+    DEFAULT_TPM = 1000000
+
+    # 每個項目預估的輸出 token 數（{"id": 12, "name": "譯名"}）
+    OUTPUT_TOKENS_PER_ITEM = 24
+
+    # 使用的模型（gemini-2.0-flash-lite，比 flash 更便宜）
+    MODEL_NAME = 'gemini-2.0-flash-lite'
+
+    # 建立模型的函式 (模型名稱) -> 具有 generate_content() 的物件
+    # None 使用 google-generativeai；基準測試改接本機 stub server
+    MODEL_FACTORY = None
+
     def __init__(self, api_key: str, batch_size: int = DEFAULT_BATCH_SIZE,
-                 request_delay: float = 1.0):
+                 request_delay: float = 1.0,
+                 max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+                 rpm: int = DEFAULT_RPM,
+                 tpm: int = DEFAULT_TPM,
+                 adaptive_batch_size: bool = True,
+                 stream: bool = True):
         """
         初始化 Gemini 批次服務
 
         Args:
             api_key: Google AI API Key
-            batch_size: 每批次處理的遊戲數量
+            batch_size: 每批次處理的遊戲數量（自適應時為初始大小）
             request_delay: 請求間隔時間（秒），避免超過速率限制
+            max_in_flight: 同時等待回應的批次數上限
+            rpm: 每分鐘請求數上限（0 表示不限制）
+            tpm: 每分鐘 token 數上限（0 表示不限制）
+            adaptive_batch_size: 是否依回應截斷、解析失敗、token 用量與延遲調整批次大小
+            stream: 是否以串流接收回應（邊接收邊解析，截斷時保留已完整的項目）
         """
-        if not GEMINI_AVAILABLE:
+        if not GEMINI_AVAILABLE and self.MODEL_FACTORY is None:
             raise ImportError(
                 "請安裝 google-generativeai: pip install google-generativeai")
 
@@ -74,10 +262,26 @@ class GeminiBatchService:
 
         self.api_key = api_key
         self.batch_size = batch_size
+        self.batch_sizer = AdaptiveBatchSizer(
+            batch_size,
+            min_size=min(self.MIN_BATCH_SIZE, batch_size),
+            max_size=max(self.MAX_BATCH_SIZE, batch_size),
+            max_output_tokens=self.MAX_OUTPUT_TOKENS,
+            enabled=adaptive_batch_size)
         self.request_delay = request_delay
-        self._last_request_time = 0
+        # 與 GeminiService 共用同一個限制器（同一組 API 配額）
+        self._limiter = get_rate_limiter('gemini', request_delay)
+        self.max_in_flight = max(1, max_in_flight)
+        # 每分鐘配額，同一組 API Key 的所有批次共用
+        self._quota = get_quota_limiter('gemini', rpm, tpm)
+        self.stream = stream
         self._model = None
+        self._models = {}  # 其他回應格式的模型 {結果欄位: 模型}
         self._initialized = False
+        # 回應解析統計（各工作執行緒共用）
+        self._parse_lock = threading.Lock()
+        self._parse_stats = {'responses': 0, 'parse_failures': 0,
+                             'truncated': 0, 'malformed_items': 0}
         # 全局快取
         self.cache = get_global_cache()
 
@@ -87,26 +291,64 @@ class GeminiBatchService:
             return True
 
         try:
-            genai.configure(api_key=self.api_key)
-            # 使用 gemini-2.0-flash-lite，比 flash 更便宜
-            self._model = genai.GenerativeModel(
-                'gemini-2.0-flash-lite',
-                generation_config=genai.GenerationConfig(
-                    max_output_tokens=8192,
-                ),
-            )
-            self._initialized = True
-            return True
+            self._model = self._create_model(self.RESPONSE_SCHEMA)
         except Exception as e:
             print(f"Gemini 初始化失敗: {e}")
             return False
+        self._initialized = True
+        return True
+
+    def _create_model(self, response_schema: Dict):
+        """
+        建立模型
+
+        Args:
+            response_schema: 結構化輸出的回應格式
+
+        Returns:
+            具有 generate_content() 的模型
+        """
+        if self.MODEL_FACTORY is not None:
+            # 由類別取得，避免一般函式被綁定成實例方法
+            return type(self).MODEL_FACTORY(self.MODEL_NAME)
+
+        genai.configure(api_key=self.api_key)
+        return genai.GenerativeModel(
+            self.MODEL_NAME,
+            generation_config=genai.GenerationConfig(
+                max_output_tokens=self.MAX_OUTPUT_TOKENS,
+                # 結構化輸出：模型只能產生符合回應格式的 JSON
+                response_mime_type='application/json',
+                response_schema=response_schema,
+            ),
+        )
+
+    def _model_for(self, task: _NameTask):
+        """
+        取得批次工作使用的模型（每種回應格式只建立一次）
+
+        Args:
+            task: 批次工作
+
+        Returns:
+            模型，初始化失敗時返回 None
+        """
+        if not self._ensure_initialized():
+            return None
+        if task.value_field == _NameTask.value_field:
+            return self._model
+
+        if task.value_field not in self._models:
+            try:
+                self._models[task.value_field] = self._create_model(self.DESCRIPTION_SCHEMA)
+            except Exception as e:
+                print(f"Gemini 初始化失敗: {e}")
+                return None
+        return self._models[task.value_field]
 
     def _rate_limit(self) -> None:
-        """速率限制"""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.request_delay:
-            time.sleep(self.request_delay - elapsed)
-        self._last_request_time = time.time()
+        """速率限制（與其他執行緒、其他實例共用同一個限制器）"""
+        self._limiter.acquire()
 
     def _build_prompt(self, game_names: List[str], language: str,
                       platform: str = "") -> str:
@@ -158,13 +400,70 @@ JSON 回覆："""
 
         return prompt
 
-    def _parse_response(self, response_text: str, game_names: List[str]) -> Dict[str, str]:
+    def _build_description_prompt(self, texts: List[str], language: str,
+                                  platform: str = "", generate: bool = False) -> str:
+        """
+        建構描述模式的批次 prompt
+
+        描述可能含換行與編號，輸入以 JSON 陣列列出，由 id 對照回應。
+
+        Args:
+            texts: 描述列表（generate 時為遊戲名稱列表）
+            language: 目標語系
+            platform: 遊戲平台名稱
+            generate: True 時依遊戲名稱產生簡介，False 時翻譯描述
+
+        Returns:
+            完整的 prompt
+        """
+        lang_name = self.LANGUAGE_NAMES.get(language, '中文')
+        input_field = 'name' if generate else 'text'
+        items = json.dumps(
+            [{'id': i + 1, input_field: text} for i, text in enumerate(texts)],
+            ensure_ascii=False)
+
+        platform_hint = ""
+        if platform:
+            platform_hint = f"\n注意：這些遊戲來自「{platform}」平台。"
+
+        if generate:
+            task = f"請為以下每個遊戲寫一段{lang_name}簡介（約 50 到 100 字），介紹遊戲類型、玩法與特色。"
+            rules = f"""2. 只寫確定的內容；不認識該遊戲時 "text" 設為 null，不要依名稱猜測
+3. 遊戲名稱使用官方{lang_name}譯名"""
+            title = "輸入遊戲列表"
+        else:
+            task = f"請將以下遊戲描述翻譯成{lang_name}，保持原意並使用流暢的{lang_name}表達。"
+            rules = f"""2. 遊戲名稱優先使用官方{lang_name}譯名
+3. 完整翻譯每段描述，無法翻譯時 "text" 才設為 null"""
+            title = "輸入描述"
+
+        prompt = f"""你是遊戲翻譯專家。{task}{platform_hint}
+
+規則：
+1. 回答格式必須是 JSON 陣列，每個項目包含 "id"（編號）和 "text"（結果）
+{rules}
+4. 不要加任何解釋文字
+5. 保持編號與輸入一致
+6. 確保 JSON 格式正確，null 不要加引號
+
+{title}（JSON 陣列）：
+{items}
+
+JSON 回覆："""
+
+        return prompt
+
+    def _parse_response(self, response_text: str, game_names: List[str],
+                        unknown: Optional[List[str]] = None,
+                        task: Optional[_NameTask] = None) -> Dict[str, str]:
         """
         解析 Gemini 回應
 
         Args:
             response_text: API 回應文字
             game_names: 原始遊戲名稱列表（用於對照）
+            unknown: 若提供，模型明確回答無法翻譯（null）的遊戲名稱會加入此清單
+            task: 批次工作（決定結果欄位與清理方式，預設為翻譯名稱）
 
         Returns:
             {原名: 翻譯結果} 的字典
@@ -193,31 +492,57 @@ JSON 回覆："""
                 data = json.loads(json_str)
 
                 # 解析每個項目
-                for item in data:
-                    if isinstance(item, dict):
-                        idx = item.get('id')
-                        name = item.get('name')
-
-                        # 確保 id 有效且在範圍內
-                        if idx is not None and 1 <= idx <= len(game_names):
-                            original_name = game_names[idx - 1]
-                            # 只有有效的翻譯才加入結果
-                            if name and name != 'null' and name != original_name:
-                                # 清理翻譯結果
-                                cleaned = self._clean_translation(name)
-                                if cleaned:
-                                    results[original_name] = cleaned
+                results = self._collect_items(data, game_names, unknown, task)
 
         except json.JSONDecodeError as e:
             print(f"JSON 解析錯誤: {e}")
             print(f"原始回應: {response_text[:500]}...")
             # 嘗試逐行解析，盡量搶救部分結果
-            results = self._parse_response_fallback(response_text, game_names)
+            results = self._parse_response_fallback(response_text, game_names, task)
         except Exception as e:
             print(f"解析回應時發生錯誤: {e}")
 
         return results
 
+    def _collect_items(self, items: List, game_names: List[str],
+                       unknown: Optional[List[str]] = None,
+                       task: Optional[_NameTask] = None) -> Dict[str, str]:
+        """
+        將回應的項目對照回原始遊戲名稱
+
+        Args:
+            items: 解析後的項目 [{"id": 編號, "name": 譯名}]
+            game_names: 原始遊戲名稱列表（用於對照）
+            unknown: 若提供，模型明確回答無法翻譯（null）的遊戲名稱會加入此清單
+            task: 批次工作（決定結果欄位與清理方式，預設為翻譯名稱）
+
+        Returns:
+            {原名: 翻譯結果} 的字典
+        """
+        task = task or _NameTask(self)
+        results = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            idx = item.get('id')
+            value = item.get(task.value_field)
+
+            # 確保 id 有效且在範圍內
+            if isinstance(idx, int) and 1 <= idx <= len(game_names):
+                original_name = game_names[idx - 1]
+                if value is None or value == 'null':
+                    # 只有明確回答 null 才視為確定無譯名（會記錄為負面快取）
+                    if unknown is not None:
+                        unknown.append(original_name)
+                    continue
+                # 只有有效的翻譯才加入結果（清理翻譯結果）；
+                # 無效的說明文字視為遺漏，由呼叫端重送或列為失敗
+                if value and isinstance(value, str):
+                    cleaned = task.clean(value, original_name)
+                    if cleaned:
+                        results[original_name] = cleaned
+        return results
+
     def _fix_json_errors(self, json_str: str) -> str:
         """
         修復常見的 JSON 格式錯誤
@@ -249,21 +574,25 @@ JSON 回覆："""
 
         return json_str
 
-    def _parse_response_fallback(self, response_text: str, game_names: List[str]) -> Dict[str, str]:
+    def _parse_response_fallback(self, response_text: str, game_names: List[str],
+                                 task: Optional[_NameTask] = None) -> Dict[str, str]:
         """
         備用解析方法：逐行嘗試解析，盡量搶救部分結果
 
         Args:
             response_text: API 回應文字
             game_names: 原始遊戲名稱列表
+            task: 批次工作（決定結果欄位與清理方式，預設為翻譯名稱）
 
         Returns:
             {原名: 翻譯結果} 的字典
         """
+        task = task or _NameTask(self)
         results = {}
 
         # 使用正則表達式找出所有 {"id": X, "name": "Y"} 格式的項目
-        pattern = r'\{"id"\s*:\s*(\d+)\s*,\s*"name"\s*:\s*"([^"]+)"\s*\}'
+        pattern = (r'\{"id"\s*:\s*(\d+)\s*,\s*"' + task.value_field +
+                   r'"\s*:\s*"([^"]+)"\s*\}')
         matches = re.findall(pattern, response_text)
 
         for idx_str, name in matches:
@@ -271,8 +600,8 @@ JSON 回覆："""
                 idx = int(idx_str)
                 if 1 <= idx <= len(game_names):
                     original_name = game_names[idx - 1]
-                    cleaned = self._clean_translation(name)
-                    if cleaned and cleaned != original_name:
+                    cleaned = task.clean(name, original_name)
+                    if cleaned:
                         results[original_name] = cleaned
             except (ValueError, IndexError):
                 continue
@@ -339,104 +668,489 @@ JSON 回覆："""
 
         return text
 
-    def translate_batch(self, game_names: List[str],
-                        language: str = 'zh-TW',
-                        platform: str = "") -> BatchTranslationResult:
+    def _lookup_cache(self, game_names: List[str], language: str,
+                      task: Optional[_NameTask] = None) -> Tuple[Dict[str, str], List[str], List[str]]:
         """
-        批次翻譯遊戲名稱
+        批次查詢快取
 
         Args:
             game_names: 遊戲名稱列表
             language: 目標語系
-            platform: 遊戲平台名稱（提升翻譯準確度）
+            task: 批次工作（決定快取的服務名稱與鍵，預設為翻譯名稱）
 
         Returns:
-            BatchTranslationResult 包含翻譯結果和失敗清單
+            (已快取的翻譯, 負面快取命中的名稱, 需要翻譯的名稱)
         """
-        if not game_names:
-            return BatchTranslationResult(
-                translations={},
-                failed=[],
-                total=0,
-                success_count=0
-            )
+        task = task or _NameTask(self)
+        keys = {name: task.cache_key(name) for name in game_names}
+        cached = self.cache.get_many(task.cache_service, set(keys.values()), language)
+        translations = {
+            name: cached[key] for name, key in keys.items()
+            if key in cached and cached[key] is not NEGATIVE_RESULT}
+        unknown = [
+            name for name, key in keys.items()
+            if cached.get(key) is NEGATIVE_RESULT]
+        uncached_names = [
+            name for name in game_names if keys[name] not in cached]
+        return translations, unknown, uncached_names
+
+    def _cache_results(self, task: _NameTask, results: Dict[str, Optional[str]],
+                       language: str) -> None:
+        """將結果寫入快取（值為 None 時記錄為負面快取）"""
+        self.cache.set_many(
+            task.cache_service,
+            {task.cache_key(name): value for name, value in results.items()},
+            language)
+
+    def _estimate_tokens(self, prompt: str, output_tokens: int) -> int:
+        """
+        估計一次批次請求使用的 token 數（送出前用於 TPM 配額）
 
-        # 先檢查快取
-        translations = {}
-        uncached_names = []
+        中日韓文字約 1 字 1 token、英文約 4 字元 1 token，
+        以 UTF-8 位元組數 / 3 保守估計輸入，再加上預估的輸出量。
 
-        for name in game_names:
-            cached = self.cache.get('gemini', name, language)
-            if cached:
-                translations[name] = cached
-            else:
-                uncached_names.append(name)
+        Args:
+            prompt: 完整的 prompt
+            output_tokens: 預估的輸出 token 數
 
-        # 如果全部都有快取，直接返回
-        if not uncached_names:
-            return BatchTranslationResult(
-                translations=translations,
-                failed=[],
-                total=len(game_names),
-                success_count=len(translations)
-            )
+        Returns:
+            預估的 token 數
+        """
+        return len(prompt.encode('utf-8')) // 3 + output_tokens
 
-        # 確保 API 已初始化
-        if not self._ensure_initialized():
-            return BatchTranslationResult(
-                translations=translations,
-                failed=uncached_names,
-                total=len(game_names),
-                success_count=len(translations)
-            )
+    @staticmethod
+    def _usage_tokens(response, field_name: str = 'total_token_count') -> Optional[int]:
+        """
+        回應中的實際 token 用量
+
+        Args:
+            response: generate_content 的回應
+            field_name: total_token_count（總量）或 candidates_token_count（輸出）
+
+        Returns:
+            token 數，SDK 未提供時返回 None
+        """
+        usage = getattr(response, 'usage_metadata', None)
+        total = getattr(usage, field_name, None)
+        return total if isinstance(total, int) and total > 0 else None
+
+    @staticmethod
+    def _response_text(response) -> str:
+        """回應文字；被安全過濾等原因擋下而沒有內容時返回空字串"""
+        try:
+            return response.text or ''
+        except ValueError:
+            return ''
+
+    def _iter_response_text(self, response):
+        """
+        逐段取得回應文字
 
-        # 分批處理
-        failed = []
+        串流時依序產生每個片段的文字（沒有內容的片段略過），否則只產生一次完整文字。
+        """
+        if not self.stream:
+            yield self._response_text(response)
+            return
+        for chunk in response:
+            yield self._response_text(chunk)
+
+    def _record_parse(self, parse_failed: bool, truncated: bool, malformed: int) -> None:
+        """記錄一次回應的解析結果"""
+        with self._parse_lock:
+            self._parse_stats['responses'] += 1
+            self._parse_stats['parse_failures'] += int(parse_failed)
+            self._parse_stats['truncated'] += int(truncated)
+            self._parse_stats['malformed_items'] += malformed
+
+    def get_parse_stats(self) -> Dict[str, float]:
+        """
+        取得回應解析統計
+
+        Returns:
+            responses（回應數）、parse_failures（無法完整解析的回應數）、
+            truncated（被截斷的回應數）、malformed_items（格式錯誤的項目數）、
+            failure_rate（解析失敗率）
+        """
+        with self._parse_lock:
+            stats = dict(self._parse_stats)
+        stats['failure_rate'] = (stats['parse_failures'] / stats['responses']
+                                 if stats['responses'] else 0.0)
+        return stats
+
+    @staticmethod
+    def _is_truncated(response, text: str) -> bool:
+        """
+        判斷回應是否因輸出 token 上限被截斷
+
+        Args:
+            response: generate_content 的回應
+            text: 回應文字
+
+        Returns:
+            是否被截斷
+        """
+        candidates = getattr(response, 'candidates', None) or []
+        reason = getattr(candidates[0], 'finish_reason', None) if candidates else None
+        if reason is not None:
+            return getattr(reason, 'name', str(reason)) in ('MAX_TOKENS', '2')
+        # SDK 未提供結束原因：JSON 陣列沒有結尾
+        text = text.strip().rstrip('`').rstrip()
+        return '[' in text and not text.endswith(']')
+
+    def _request_batch(self, batch: List[str], language: str, platform: str = "",
+                       cancel_check=None,
+                       bisected: bool = False,
+                       task: Optional[_NameTask] = None,
+                       model=None) -> Tuple[Optional[Dict[str, str]], List[str]]:
+        """
+        送出單一批次並解析回應（API 錯誤時重試）
+
+        在工作執行緒中執行，不寫入快取也不回報進度，結果由呼叫端依序套用。
+        有回應但部分項目失敗或遺漏時不在這裡重試，由呼叫端拆半重送。
+
+        Args:
+            batch: 遊戲名稱列表
+            language: 目標語系
+            platform: 遊戲平台名稱
+            cancel_check: 取消檢查函數
+            bisected: 是否為拆半重送的批次
+            task: 批次工作（預設為翻譯名稱）
+            model: 使用的模型（預設為翻譯名稱的模型）
 
-        for i in range(0, len(uncached_names), self.batch_size):
-            batch = uncached_names[i:i + self.batch_size]
+        Returns:
+            (翻譯結果，請求失敗時為 None, 模型明確表示無法翻譯的名稱)
+
+        每次回應的截斷、解析結果、輸出 token 數與耗時都會回報給 batch_sizer；
+        拆半重送的批次與描述模式不回報（問題出在特定名稱，或批次依 token 預算切分）。
+        """
+        task = task or _NameTask(self)
+        model = model or self._model
+        prompt = task.build_prompt(batch, language, platform)
+        estimate = self._estimate_tokens(prompt, task.output_tokens(batch))
+        batch_unknown = []
+
+        for retry in range(self.MAX_RETRIES):
+            # 在重試時也檢查取消
+            if cancel_check and cancel_check():
+                break
 
+            # 每分鐘配額（並行的批次共用），等待期間可取消
+            entry = self._quota.acquire(estimate, cancel_check)
+            if entry is None:
+                break
             # 速率限制
             self._rate_limit()
 
-            # 重試機制
-            batch_result = None
-            for retry in range(self.MAX_RETRIES):
-                try:
-                    prompt = self._build_prompt(batch, language, platform)
-                    response = self._model.generate_content(prompt)
+            try:
+                started = time.monotonic()
+                if self.stream:
+                    response = model.generate_content(prompt, stream=True)
+                else:
+                    response = model.generate_content(prompt)
+                # 邊接收邊解析，每個完整的項目立即取出
+                parsed = JsonArrayStream(repair=self._fix_json_errors)
+                for text in self._iter_response_text(response):
+                    parsed.feed(text)
+                elapsed = time.monotonic() - started
+                self._limiter.report_success()
+                self._quota.settle(entry, self._usage_tokens(response) or estimate)
+
+                text = parsed.text
+                if not text:
+                    # 沒有內容（例如被安全過濾擋下）：由呼叫端拆半找出有問題的名稱
+                    return {}, batch_unknown
+
+                truncated = self._is_truncated(response, text)
+                batch_result = self._collect_items(parsed.items, batch, batch_unknown, task)
+                # 沒有收到陣列結尾（且不是截斷）或有格式錯誤的項目，視為解析失敗
+                parse_failed = parsed.errors > 0 or not (parsed.complete or truncated)
+                self._record_parse(parse_failed, truncated, parsed.errors)
+                if parse_failed:
+                    # 未使用結構化輸出的回應：再以舊的修復方式解析，取回答較多的結果
+                    fallback_unknown = []
+                    fallback = self._parse_response(text, batch, fallback_unknown, task)
+                    if len(fallback) + len(fallback_unknown) > len(batch_result) + len(batch_unknown):
+                        batch_result = fallback
+                        batch_unknown[:] = fallback_unknown
+
+                if task.adaptive and not bisected:
+                    self.batch_sizer.record(
+                        len(batch), elapsed,
+                        answered=len(batch_result) + len(batch_unknown),
+                        output_tokens=self._usage_tokens(response, 'candidates_token_count'),
+                        truncated=truncated)
+                return batch_result, batch_unknown
+
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    # 限流：暫停共用限制器，下次重試前會等待
+                    self._limiter.report_throttled()
+                print(f"批次翻譯失敗 (嘗試 {retry + 1}/{self.MAX_RETRIES}): {e}")
+                if retry < self.MAX_RETRIES - 1:
+                    # 在等待重試時分段檢查取消（每秒檢查一次）
+                    wait_time = 2 ** retry
+                    for _ in range(wait_time):
+                        if cancel_check and cancel_check():
+                            break
+                        time.sleep(1)
+
+        return None, batch_unknown
+
+    def translate_many(self, jobs: List[BatchJob],
+                       language: str = 'zh-TW',
+                       progress_callback=None,
+                       cancel_check=None,
+                       on_job_done=None,
+                       mode: str = MODE_NAME) -> List[BatchTranslationResult]:
+        """
+        翻譯多組遊戲名稱（跨平台同時送出多個批次）
 
-                    if response.text:
-                        batch_result = self._parse_response(
-                            response.text, batch)
-                        break
+        所有組別的批次依序排入同一個佇列，最多 max_in_flight 個批次同時等待回應，
+        每次送出前依 RPM/TPM 配額等待。批次結果一律在呼叫端執行緒依送出順序套用
+        （寫入快取、回報進度），組別也依順序完成。
+
+        批次依送出當下的 batch_sizer.size 逐批切出，批次大小會隨回應狀況調整；
+        描述模式則依輸出 token 預算裝入（DESC_OUTPUT_BUDGET）。
+        有回應但部分項目失敗或遺漏時，只將這些項目拆成兩半重送，
+        遞迴直到單一項目，單一項目仍失敗才列為失敗。
+
+        Args:
+            jobs: 要翻譯的組別（通常一個平台一組）
+            language: 目標語系
+            progress_callback: 進度回呼函數 (current, total, message)，為所有組別合計
+            cancel_check: 取消檢查函數，回傳 True 表示要取消；
+                          不再送出新批次，未完成的名稱列為失敗
+            on_job_done: 組別完成回呼 (index, job, result)，依組別順序呼叫，取消後不再呼叫
+            mode: MODE_NAME 翻譯名稱；MODE_DESCRIPTION 翻譯描述（game_names 放描述原文）；
+                  MODE_GENERATE 依遊戲名稱產生簡介
+
+        Returns:
+            各組別的 BatchTranslationResult（與 jobs 順序相同）
+        """
+        if mode == self.MODE_NAME:
+            task = _NameTask(self)
+        elif mode in (self.MODE_DESCRIPTION, self.MODE_GENERATE):
+            task = _DescriptionTask(self, generate=(mode == self.MODE_GENERATE))
+        else:
+            raise ValueError(f"不支援的模式: {mode}")
+
+        def is_cancelled() -> bool:
+            return bool(cancel_check and cancel_check())
+
+        # 先檢查快取，過濾出需要翻譯的（負面快取命中的不再送出）
+        results = []
+        uncached = []  # 各組別需要翻譯的名稱
+        for job_idx, job in enumerate(jobs):
+            translations, unknown, uncached_names = self._lookup_cache(
+                job.game_names, language, task)
+            results.append(BatchTranslationResult(
+                translations=translations,
+                failed=list(unknown),
+                total=len(job.game_names),
+                success_count=len(translations),
+                unknown=unknown
+            ))
+            uncached.append(uncached_names)
+
+        grand_total = sum(result.total for result in results)
+        names_left = [len(names) for names in uncached]  # 各組別尚未套用結果的名稱數
+        sent = [0] * len(jobs)                             # 各組別已送出的名稱數
 
-                except Exception as e:
-                    print(f"批次翻譯失敗 (嘗試 {retry + 1}/{self.MAX_RETRIES}): {e}")
-                    if retry < self.MAX_RETRIES - 1:
-                        time.sleep(2 ** retry)  # 指數退避
+        def translated_count() -> int:
+            return sum(len(result.translations) for result in results)
+
+        if progress_callback:
+            progress_callback(
+                translated_count(),
+                grand_total,
+                f"快取命中 {translated_count()} 筆"
+                f"（確定無譯名 {sum(len(r.unknown) for r in results)} 筆），"
+                f"待翻譯 {sum(names_left)} 筆"
+            )
+
+        next_job = 0  # 下一個要回呼完成的組別
+
+        def finish_ready_jobs() -> None:
+            nonlocal next_job
+            while next_job < len(jobs) and names_left[next_job] == 0:
+                result = results[next_job]
+                result.success_count = len(result.translations)
+                if on_job_done and not is_cancelled():
+                    on_job_done(next_job, jobs[next_job], result)
+                next_job += 1
+
+        # 確保 API 已初始化
+        model = self._model_for(task) if any(names_left) else None
+        if any(names_left) and model is None:
+            for job_idx, names in enumerate(uncached):
+                results[job_idx].failed.extend(names)
+                names_left[job_idx] = 0
+            finish_ready_jobs()
+            return results
+
+        retry_queue = deque()  # [(組別索引, 批次)]：拆半後待重送
+
+        def apply(job_idx: int, batch: List[str],
+                  batch_result: Optional[Dict[str, str]],
+                  batch_unknown: List[str]) -> None:
+            result = results[job_idx]
+
+            # 模型明確表示無法翻譯的項目記錄為負面快取（同時列在 failed 中）
+            if batch_unknown:
+                self._cache_results(task, dict.fromkeys(batch_unknown), language)
+                result.unknown.extend(batch_unknown)
+                result.failed.extend(batch_unknown)
 
             # 處理結果
             if batch_result:
-                for name, trans in batch_result.items():
-                    translations[name] = trans
-                    # 寫入快取
-                    self.cache.set('gemini', name, language, trans)
-
-                # 記錄失敗的項目
-                for name in batch:
-                    if name not in batch_result:
-                        failed.append(name)
+                result.translations.update(batch_result)
+                # 寫入快取
+                self._cache_results(task, batch_result, language)
+
+            # 失敗或遺漏的項目
+            answered = set(batch_result or ()) | set(batch_unknown)
+            missing = [name for name in batch if name not in answered]
+
+            if batch_result is not None and missing and len(batch) > 1 and not is_cancelled():
+                # 有回應但部分項目出問題：只將這些項目拆半重送
+                half = (len(missing) + 1) // 2
+                for part in (missing[:half], missing[half:]):
+                    if part:
+                        retry_queue.append((job_idx, part))
+                        result.retries += 1
+                names_left[job_idx] -= len(batch) - len(missing)
             else:
-                # 整批失敗
-                failed.extend(batch)
-
-        return BatchTranslationResult(
-            translations=translations,
-            failed=failed,
-            total=len(game_names),
-            success_count=len(translations)
-        )
+                # 請求失敗（API 錯誤重試用盡）或單一項目仍失敗
+                result.failed.extend(missing)
+                names_left[job_idx] -= len(batch)
+
+            if progress_callback:
+                progress_callback(
+                    translated_count(),
+                    grand_total,
+                    f"已完成 {translated_count()}/{grand_total}"
+                )
+
+        pending = deque()  # [(組別索引, 批次, future)]，依送出順序
+
+        def apply_ready(block: bool = False) -> None:
+            # 只套用最前面已完成的批次，確保依送出順序套用
+            while pending and (block or pending[0][2].done()):
+                job_idx, batch, future = pending.popleft()
+                apply(job_idx, batch, *future.result())
+            finish_ready_jobs()
+
+        finish_ready_jobs()
+        batch_count = 0
+        with ThreadPoolExecutor(max_workers=self.max_in_flight,
+                                thread_name_prefix='gemini-batch') as executor:
+
+            def wait_for_slot() -> None:
+                # 同時等待回應的批次已達上限：等其中一個完成
+                while True:
+                    running = [f for _, _, f in pending if not f.done()]
+                    if len(running) < self.max_in_flight:
+                        break
+                    wait(running, return_when=FIRST_COMPLETED)
+                apply_ready()
+
+            def submit_retry() -> None:
+                job_idx, batch = retry_queue.popleft()
+                if progress_callback:
+                    platform = jobs[job_idx].platform
+                    prefix = f"[{platform}] " if len(jobs) > 1 and platform else ""
+                    progress_callback(
+                        translated_count(),
+                        grand_total,
+                        f"{prefix}拆半重送 {len(batch)} {task.unit}..."
+                    )
+                future = executor.submit(self._request_batch, batch, language,
+                                         jobs[job_idx].platform, cancel_check, True,
+                                         task, model)
+                pending.append((job_idx, batch, future))
+
+            for job_idx, names in enumerate(uncached):
+                while sent[job_idx] < len(names):
+                    wait_for_slot()
+
+                    # 檢查是否取消
+                    if is_cancelled():
+                        break
+
+                    # 優先重送拆半的批次
+                    if retry_queue:
+                        submit_retry()
+                        continue
+
+                    # 以目前的批次大小（描述模式為 token 預算）切出下一批
+                    start = sent[job_idx]
+                    batch = names[start:task.next_end(names, start)]
+                    sent[job_idx] += len(batch)
+                    batch_count += 1
+
+                    if progress_callback:
+                        platform = jobs[job_idx].platform
+                        prefix = f"[{platform}] " if len(jobs) > 1 and platform else ""
+                        remaining = sum(len(n) - done for n, done in zip(uncached, sent))
+                        progress_callback(
+                            translated_count(),
+                            grand_total,
+                            f"{prefix}批次 {batch_count}：翻譯 {len(batch)} {task.unit}"
+                            f"（尚未送出 {remaining} 個）..."
+                        )
+
+                    future = executor.submit(self._request_batch, batch, language,
+                                             jobs[job_idx].platform, cancel_check, False,
+                                             task, model)
+                    pending.append((job_idx, batch, future))
+
+                if is_cancelled():
+                    break
+
+            # 等待已送出的批次依序套用，期間繼續重送拆半的批次
+            while pending or retry_queue:
+                if retry_queue and not is_cancelled():
+                    wait_for_slot()
+                    if retry_queue and not is_cancelled():
+                        submit_retry()
+                    continue
+                if not pending:
+                    break
+                wait([pending[0][2]])
+                apply_ready()
+
+        # 取消時將未送出的加入失敗清單
+        for job_idx, batch in retry_queue:
+            results[job_idx].failed.extend(batch)
+        for job_idx, names in enumerate(uncached):
+            results[job_idx].failed.extend(names[sent[job_idx]:])
+            results[job_idx].success_count = len(results[job_idx].translations)
+
+        return results
+
+    def translate_batch(self, game_names: List[str],
+                        language: str = 'zh-TW',
+                        platform: str = "") -> BatchTranslationResult:
+        """
+        批次翻譯遊戲名稱
+
+        Args:
+            game_names: 遊戲名稱列表
+            language: 目標語系
+            platform: 遊戲平台名稱（提升翻譯準確度）
+
+        Returns:
+            BatchTranslationResult 包含翻譯結果和失敗清單
+        """
+        if not game_names:
+            return BatchTranslationResult(
+                translations={},
+                failed=[],
+                total=0,
+                success_count=0
+            )
+
+        return self.translate_many([BatchJob(game_names, platform)], language)[0]
 
     def translate_all(self, game_names: List[str],
                       language: str = 'zh-TW',
@@ -444,7 +1158,7 @@ JSON 回覆："""
                       progress_callback=None,
                       cancel_check=None) -> BatchTranslationResult:
         """
-        翻譯所有遊戲名稱（自動分批）
+        翻譯所有遊戲名稱（自動分批，同時送出多個批次）
 
         Args:
             game_names: 遊戲名稱列表
@@ -464,128 +1178,77 @@ JSON 回覆："""
                 success_count=0
             )
 
-        # 先檢查快取，過濾出需要翻譯的
-        translations = {}
-        uncached_names = []
+        return self.translate_many(
+            [BatchJob(game_names, platform)], language,
+            progress_callback=progress_callback,
+            cancel_check=cancel_check)[0]
 
-        for name in game_names:
-            cached = self.cache.get('gemini', name, language)
-            if cached:
-                translations[name] = cached
-            else:
-                uncached_names.append(name)
+    def translate_descriptions(self, descriptions: List[str],
+                               language: str = 'zh-TW',
+                               platform: str = "",
+                               progress_callback=None,
+                               cancel_check=None) -> BatchTranslationResult:
+        """
+        批次翻譯遊戲描述（每批依輸出 token 預算裝入多段描述）
 
-        if progress_callback:
-            progress_callback(
-                len(translations),
-                len(game_names),
-                f"快取命中 {len(translations)} 筆，待翻譯 {len(uncached_names)} 筆"
-            )
+        Args:
+            descriptions: 描述原文列表（重複的描述只翻譯一次）
+            language: 目標語系
+            platform: 遊戲平台名稱
+            progress_callback: 進度回呼函數 (current, total, message)
+            cancel_check: 取消檢查函數，回傳 True 表示要取消
 
-        # 如果全部都有快取，直接返回
-        if not uncached_names:
+        Returns:
+            BatchTranslationResult，translations 為 {描述原文: 翻譯結果}
+        """
+        texts = list(dict.fromkeys(text for text in descriptions if text and text.strip()))
+        if not texts:
             return BatchTranslationResult(
-                translations=translations,
+                translations={},
                 failed=[],
-                total=len(game_names),
-                success_count=len(translations)
-            )
-
-        # 確保 API 已初始化
-        if not self._ensure_initialized():
-            return BatchTranslationResult(
-                translations=translations,
-                failed=uncached_names,
-                total=len(game_names),
-                success_count=len(translations)
+                total=0,
+                success_count=0
             )
 
-        # 計算批次數
-        total_batches = (len(uncached_names) +
-                         self.batch_size - 1) // self.batch_size
-        failed = []
-
-        for batch_idx, i in enumerate(range(0, len(uncached_names), self.batch_size)):
-            # 檢查是否取消
-            if cancel_check and cancel_check():
-                # 將未處理的加入失敗清單
-                remaining = uncached_names[i:]
-                failed.extend(remaining)
-                break
-
-            batch = uncached_names[i:i + self.batch_size]
-
-            if progress_callback:
-                progress_callback(
-                    len(translations),
-                    len(game_names),
-                    f"批次 {batch_idx + 1}/{total_batches}：翻譯 {len(batch)} 個遊戲..."
-                )
-
-            # 速率限制
-            self._rate_limit()
-
-            # 重試機制
-            batch_result = None
-            for retry in range(self.MAX_RETRIES):
-                # 在重試時也檢查取消
-                if cancel_check and cancel_check():
-                    break
-
-                try:
-                    prompt = self._build_prompt(batch, language, platform)
-                    response = self._model.generate_content(prompt)
-
-                    if response.text:
-                        batch_result = self._parse_response(
-                            response.text, batch)
-                        break
-
-                except Exception as e:
-                    print(f"批次翻譯失敗 (嘗試 {retry + 1}/{self.MAX_RETRIES}): {e}")
-                    if retry < self.MAX_RETRIES - 1:
-                        # 在等待重試時分段檢查取消（每秒檢查一次）
-                        wait_time = 2 ** retry
-                        for _ in range(wait_time):
-                            if cancel_check and cancel_check():
-                                break
-                            time.sleep(1)
-
-            # 如果已取消，跳出批次迴圈
-            if cancel_check and cancel_check():
-                remaining = uncached_names[i + self.batch_size:]
-                if remaining:
-                    failed.extend(remaining)
-                break
+        return self.translate_many(
+            [BatchJob(texts, platform)], language,
+            progress_callback=progress_callback,
+            cancel_check=cancel_check,
+            mode=self.MODE_DESCRIPTION)[0]
+
+    def generate_descriptions(self, game_names: List[str],
+                              language: str = 'zh-TW',
+                              platform: str = "",
+                              progress_callback=None,
+                              cancel_check=None) -> BatchTranslationResult:
+        """
+        依遊戲名稱批次產生簡介（沒有描述原文的遊戲使用）
 
-            # 處理結果
-            if batch_result:
-                for name, trans in batch_result.items():
-                    translations[name] = trans
-                    # 寫入快取
-                    self.cache.set('gemini', name, language, trans)
-
-                # 記錄失敗的項目
-                for name in batch:
-                    if name not in batch_result:
-                        failed.append(name)
-            else:
-                # 整批失敗
-                failed.extend(batch)
+        Args:
+            game_names: 遊戲名稱列表
+            language: 目標語系
+            platform: 遊戲平台名稱
+            progress_callback: 進度回呼函數 (current, total, message)
+            cancel_check: 取消檢查函數，回傳 True 表示要取消
 
-            if progress_callback:
-                progress_callback(
-                    len(translations),
-                    len(game_names),
-                    f"已完成 {len(translations)}/{len(game_names)}"
-                )
+        Returns:
+            BatchTranslationResult，translations 為 {遊戲名稱: 簡介}；
+            模型不認識的遊戲列在 unknown 中
+        """
+        names = list(dict.fromkeys(name for name in game_names if name))
+        if not names:
+            return BatchTranslationResult(
+                translations={},
+                failed=[],
+                total=0,
+                success_count=0
+            )
 
-        return BatchTranslationResult(
-            translations=translations,
-            failed=failed,
-            total=len(game_names),
-            success_count=len(translations)
-        )
+        return self.translate_many(
+            [BatchJob(names, platform)], language,
+            progress_callback=progress_callback,
+            cancel_check=cancel_check,
+            mode=self.MODE_GENERATE)[0]
 
     @staticmethod
     def is_available() -> bool:
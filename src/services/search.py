@@ -8,7 +8,8 @@ import requests
 from typing import Optional
 from urllib.parse import quote
 
-from ..utils.cache import get_global_cache
+from ..utils.cache import get_global_cache, NEGATIVE_RESULT
+from ..utils.rate_limiter import get_rate_limiter
 
 
 class SearchService:
@@ -21,6 +22,9 @@ class SearchService:
     - 全局快取支援
     """
 
+    # DuckDuckGo Instant Answer API 網址（基準測試改指向本機 stub server）
+    API_URL = 'https://api.duckduckgo.com/'
+
     def __init__(self, request_delay: float = 2.0):
         """
         初始化搜尋服務
@@ -29,7 +33,7 @@ class SearchService:
             request_delay: 請求間隔時間（秒）
         """
         self.request_delay = request_delay
-        self._last_request_time = 0
+        self._limiter = get_rate_limiter('search', request_delay)
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'BatoceraTranslator/1.0'
@@ -47,11 +51,8 @@ class SearchService:
         self.cache = get_global_cache()
 
     def _rate_limit(self) -> None:
-        """速率限制"""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.request_delay:
-            time.sleep(self.request_delay - elapsed)
-        self._last_request_time = time.time()
+        """速率限制（與其他執行緒、其他實例共用同一個限制器）"""
+        self._limiter.acquire()
 
     def search(self, query: str, language: str = 'zh-TW',
                include_platform: bool = True,
@@ -71,11 +72,11 @@ class SearchService:
         # 檢查快取
         cache_key = f"{query}|{platform_name if include_platform else ''}"
         cached = self.cache.get('search', cache_key, language)
+        if cached is NEGATIVE_RESULT:
+            return None
         if cached:
             return cached
 
-        self._rate_limit()
-
         # 組合搜尋關鍵字
         search_terms = [query]
         if include_platform and platform_name:
@@ -94,7 +95,7 @@ class SearchService:
         search_query = ' '.join(search_terms)
 
         # 使用 DuckDuckGo Instant Answer API
-        url = 'https://api.duckduckgo.com/'
+        url = self.API_URL
         params = {
             'q': search_query,
             'format': 'json',
@@ -105,8 +106,12 @@ class SearchService:
         # 重試機制（最多2次）
         max_retries = 2
         for attempt in range(max_retries):
+            # 每次嘗試都經過限制器（被 429 暫停時重試也會等待）
+            self._rate_limit()
             try:
                 response = self.session.get(url, params=params, timeout=3)
+                self._limiter.report_response(
+                    response.status_code, response.headers.get('Retry-After'))
                 response.raise_for_status()
                 data = response.json()
                 break  # 成功則跳出重試循環
@@ -115,8 +120,7 @@ class SearchService:
                     time.sleep(0.3 * (attempt + 1))
                     continue
                 else:
-                    # 所有重試失敗
-                    self.cache.set('search', cache_key, language, None)
+                    # 所有重試失敗（網路錯誤不快取，下次重新查詢）
                     return None
         else:
             # 不應該到達這裡
@@ -144,13 +148,12 @@ class SearchService:
                     self.cache.set('search', cache_key, language, translated)
                     return translated
 
-            # 寫入空結果快取（避免重複查詢）
-            self.cache.set('search', cache_key, language, None)
+            # 寫入負面快取（避免重複查詢）
+            self.cache.set_negative('search', cache_key, language)
             return None
 
         except requests.RequestException:
-            # 錯誤時也快取空結果
-            self.cache.set('search', cache_key, language, None)
+            # 暫時性錯誤不快取
             return None
 
     def _extract_translated_name(self, text: str, original: str,
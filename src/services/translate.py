@@ -8,6 +8,9 @@ from typing import Optional
 from abc import ABC, abstractmethod
 from enum import Enum
 
+from ..utils.cache import NEGATIVE_RESULT
+from ..utils.rate_limiter import get_rate_limiter, is_rate_limit_error
+
 
 def clean_translation_text(text: Optional[str]) -> Optional[str]:
     """
@@ -84,6 +87,9 @@ class GoogleTransService(BaseTranslateService):
         'en': 'en',
     }
 
+    # 建立翻譯器的函式（None 使用 googletrans.Translator；基準測試改接本機 stub server）
+    TRANSLATOR_FACTORY = None
+
     def __init__(self, request_delay: float = 1.0):
         """
         初始化服務
@@ -94,13 +100,16 @@ class GoogleTransService(BaseTranslateService):
         from ..utils.cache import get_global_cache
 
         self.request_delay = request_delay
-        self._last_request_time = 0
+        self._limiter = get_rate_limiter('googletrans', request_delay)
         self._translator = None
         # 全局快取
         self.cache = get_global_cache()
 
     def _get_translator(self):
         """延遲初始化 googletrans"""
+        if self._translator is None and self.TRANSLATOR_FACTORY is not None:
+            # 由類別取得，避免一般函式被綁定成實例方法
+            self._translator = type(self).TRANSLATOR_FACTORY()
         if self._translator is None:
             try:
                 from googletrans import Translator
@@ -111,11 +120,8 @@ class GoogleTransService(BaseTranslateService):
         return self._translator
 
     def _rate_limit(self) -> None:
-        """速率限制"""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.request_delay:
-            time.sleep(self.request_delay - elapsed)
-        self._last_request_time = time.time()
+        """速率限制（與其他執行緒、其他實例共用同一個限制器）"""
+        self._limiter.acquire()
 
     def translate(self, text: str, target_language: str,
                   source_language: str = 'auto') -> Optional[str]:
@@ -135,11 +141,11 @@ class GoogleTransService(BaseTranslateService):
 
         # 檢查全局快取
         cached = self.cache.get('translate', text, target_language)
+        if cached is NEGATIVE_RESULT:
+            return None
         if cached:
             return cached
 
-        self._rate_limit()
-
         target = self.LANG_CODES.get(target_language, target_language)
         source = 'auto' if source_language == 'auto' else self.LANG_CODES.get(
             source_language, source_language)
@@ -147,18 +153,22 @@ class GoogleTransService(BaseTranslateService):
         # 重試機制（最多重試 3 次）
         max_retries = 3
         for attempt in range(max_retries):
+            # 每次嘗試都經過限制器（被 429 暫停時重試也會等待）
+            self._rate_limit()
             try:
                 translator = self._get_translator()
                 result = translator.translate(text, dest=target, src=source)
+                self._limiter.report_success()
                 translated = clean_translation_text(result.text)
 
-                # 儲存到全局快取
+                # 儲存到全局快取（清理後為空則記錄為負面快取）
                 self.cache.set('translate', text, target_language, translated)
-                return translated
+                return translated or None
             except Exception as e:
+                if is_rate_limit_error(e):
+                    self._limiter.report_throttled()
                 if attempt < max_retries - 1:
                     # 還有重試機會，等待後重試
-                    import time
                     time.sleep(0.5 * (attempt + 1))  # 漸進式延遲：0.5s, 1s, 1.5s
                     continue
                 else:
@@ -191,9 +201,13 @@ class DeepLService(BaseTranslateService):
             api_key: DeepL API Key
             request_delay: 請求間隔時間
         """
+        from ..utils.cache import get_global_cache
+
         self.api_key = api_key
         self.request_delay = request_delay
-        self._last_request_time = 0
+        self._limiter = get_rate_limiter('deepl', request_delay)
+        # 全局快取
+        self.cache = get_global_cache()
 
         try:
             import requests
@@ -202,11 +216,8 @@ class DeepLService(BaseTranslateService):
             raise ImportError("請先安裝 requests: pip install requests")
 
     def _rate_limit(self) -> None:
-        """速率限制"""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.request_delay:
-            time.sleep(self.request_delay - elapsed)
-        self._last_request_time = time.time()
+        """速率限制（與其他執行緒、其他實例共用同一個限制器）"""
+        self._limiter.acquire()
 
     def translate(self, text: str, target_language: str,
                   source_language: str = 'auto') -> Optional[str]:
@@ -224,6 +235,13 @@ class DeepLService(BaseTranslateService):
         if not text:
             return None
 
+        # 檢查全局快取
+        cached = self.cache.get('deepl', text, target_language)
+        if cached is NEGATIVE_RESULT:
+            return None
+        if cached:
+            return cached
+
         self._rate_limit()
 
         target = self.LANG_CODES.get(target_language, 'EN')
@@ -241,16 +259,22 @@ class DeepLService(BaseTranslateService):
 
         try:
             response = self.session.post(self.API_URL, data=data, timeout=30)
+            self._limiter.report_response(
+                response.status_code, response.headers.get('Retry-After'))
             response.raise_for_status()
             result = response.json()
 
             translations = result.get('translations', [])
+            translated = None
             if translations:
-                return clean_translation_text(translations[0].get('text', ''))
+                translated = clean_translation_text(translations[0].get('text', ''))
 
-            return None
+            # API 正常回應但沒有結果時記錄為負面快取
+            self.cache.set('deepl', text, target_language, translated)
+            return translated or None
 
         except Exception:
+            # 網路等暫時性錯誤不快取
             return None
 
 
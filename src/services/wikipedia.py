@@ -3,11 +3,15 @@
 封裝維基百科 API，用於搜尋遊戲名稱的正式譯名。
 """
 import re
+import json
 import time
 import requests
 from typing import Optional, Dict, Any
 from urllib.parse import quote
 
+from ..utils.cache import get_global_cache, NEGATIVE_RESULT
+from ..utils.rate_limiter import get_rate_limiter
+
 
 class WikipediaService:
     """
@@ -17,8 +21,16 @@ class WikipediaService:
     - 搜尋遊戲名稱的維基百科頁面
     - 取得頁面標題（通常是正式譯名）
     - 取得頁面摘要（遊戲描述）
+
+    搜尋結果、頁面資訊與描述都存入全局持久快取（含查不到的負面結果），
+    重新執行時不需要再查詢維基百科。
     """
 
+    # 全局快取中使用的服務名稱
+    CACHE_SEARCH = 'wiki_search'
+    CACHE_PAGE = 'wiki_page'
+    CACHE_DESC = 'wiki_desc'
+
     # 語系對應的維基百科網域
     WIKI_DOMAINS = {
         'zh-TW': 'zh.wikipedia.org',
@@ -34,6 +46,9 @@ class WikipediaService:
         'zh-CN': 'zh-cn',
     }
 
+    # API 網址（{domain} 為 WIKI_DOMAINS 的網域；基準測試改指向本機 stub server）
+    API_URL = 'https://{domain}/w/api.php'
+
     def __init__(self, request_delay: float = 1.0):
         """
         初始化維基百科服務
@@ -42,7 +57,8 @@ class WikipediaService:
             request_delay: 請求間隔時間（秒），避免被封鎖
         """
         self.request_delay = request_delay
-        self._last_request_time = 0
+        # 所有維基百科語系共用同一個限制器
+        self._limiter = get_rate_limiter('wikipedia', request_delay)
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'BatoceraTranslator/1.0 (https://github.com/example/batocera-translator)'
@@ -56,9 +72,8 @@ class WikipediaService:
         self.session.mount('http://', adapter)
         self.session.mount('https://', adapter)
 
-        # 添加記憶體快取 (query + language -> result)
-        self._search_cache = {}
-        self._desc_cache = {}
+        # 持久快取（SQLite，跨執行保留）
+        self.cache = get_global_cache()
 
     def clear_cache(self, query: Optional[str] = None) -> None:
         """
@@ -69,31 +84,25 @@ class WikipediaService:
         """
         if query is None:
             # 清除所有快取
-            self._search_cache.clear()
-            self._desc_cache.clear()
+            for service in (self.CACHE_SEARCH, self.CACHE_PAGE, self.CACHE_DESC):
+                self.cache.delete(service)
         else:
-            # 清除特定查詢的快取（所有語系）
-            keys_to_remove = [
-                k for k in self._search_cache.keys() if k.startswith(f"{query}|")]
-            for key in keys_to_remove:
-                del self._search_cache[key]
-
-            keys_to_remove = [
-                k for k in self._desc_cache.keys() if k.startswith(f"{query}|")]
-            for key in keys_to_remove:
-                del self._desc_cache[key]
+            # 清除特定查詢的快取（所有語系），連同搜尋到的頁面資訊
+            for language in self.WIKI_DOMAINS:
+                title = self.cache.peek(self.CACHE_SEARCH, query, language)
+                if title:
+                    self.cache.delete(self.CACHE_PAGE, title, language)
+            self.cache.delete(self.CACHE_SEARCH, query)
+            self.cache.delete(self.CACHE_DESC, query)
 
     def _rate_limit(self) -> None:
-        """速率限制"""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.request_delay:
-            time.sleep(self.request_delay - elapsed)
-        self._last_request_time = time.time()
+        """速率限制（與其他執行緒、其他實例共用同一個限制器）"""
+        self._limiter.acquire()
 
     def _get_api_url(self, language: str) -> str:
         """取得 API URL"""
         domain = self.WIKI_DOMAINS.get(language, 'en.wikipedia.org')
-        return f"https://{domain}/w/api.php"
+        return self.API_URL.format(domain=domain)
 
     def search(self, query: str, language: str = 'zh-TW') -> Optional[str]:
         """
@@ -107,11 +116,11 @@ class WikipediaService:
             找到的譯名，找不到返回 None
         """
         # 檢查快取
-        cache_key = f"{query}|{language}"
-        if cache_key in self._search_cache:
-            return self._search_cache[cache_key]
-
-        self._rate_limit()
+        cached = self.cache.get(self.CACHE_SEARCH, query, language)
+        if cached is NEGATIVE_RESULT:
+            return None
+        if cached:
+            return cached
 
         api_url = self._get_api_url(language)
 
@@ -133,15 +142,19 @@ class WikipediaService:
         # 重試機制（最多2次）
         max_retries = 2
         for attempt in range(max_retries):
+            # 每次嘗試都經過限制器（被 429 暫停時重試也會等待）
+            self._rate_limit()
             try:
                 response = self.session.get(api_url, params=params, timeout=5)
+                self._limiter.report_response(
+                    response.status_code, response.headers.get('Retry-After'))
                 response.raise_for_status()
                 data = response.json()
 
                 # 取得搜尋結果
                 search_results = data.get('query', {}).get('search', [])
                 if not search_results:
-                    self._search_cache[cache_key] = None
+                    self.cache.set_negative(self.CACHE_SEARCH, query, language)
                     return None
 
                 # 嘗試多個搜尋結果，找到第一個有效的
@@ -151,11 +164,11 @@ class WikipediaService:
                     # 過濾非遊戲結果並驗證翻譯有效性
                     if self._is_game_page(title, query) and self._is_valid_translation(title, query, language):
                         # 儲存到快取
-                        self._search_cache[cache_key] = title
+                        self.cache.set(self.CACHE_SEARCH, query, language, title)
                         return title
 
                 # 沒找到，也要快取結果避免重複查詢
-                self._search_cache[cache_key] = None
+                self.cache.set_negative(self.CACHE_SEARCH, query, language)
                 return None
 
             except requests.RequestException:
@@ -178,6 +191,16 @@ class WikipediaService:
         Returns:
             包含 title 和 extract 的字典
         """
+        # 檢查快取（以 JSON 儲存）
+        cached = self.cache.get(self.CACHE_PAGE, title, language)
+        if cached is NEGATIVE_RESULT:
+            return None
+        if cached:
+            try:
+                return json.loads(cached)
+            except json.JSONDecodeError:
+                pass
+
         self._rate_limit()
 
         api_url = self._get_api_url(language)
@@ -198,17 +221,23 @@ class WikipediaService:
 
         try:
             response = self.session.get(api_url, params=params, timeout=5)
+            self._limiter.report_response(
+                response.status_code, response.headers.get('Retry-After'))
             response.raise_for_status()
             data = response.json()
 
             pages = data.get('query', {}).get('pages', {})
             for page_id, page in pages.items():
                 if page_id == '-1':
+                    self.cache.set_negative(self.CACHE_PAGE, title, language)
                     return None
-                return {
+                info = {
                     'title': page.get('title', ''),
                     'extract': page.get('extract', '')
                 }
+                self.cache.set(self.CACHE_PAGE, title, language,
+                               json.dumps(info, ensure_ascii=False))
+                return info
 
             return None
 
@@ -227,17 +256,18 @@ class WikipediaService:
             遊戲描述文字
         """
         # 檢查快取
-        cache_key = f"{query}|{language}"
-        if cache_key in self._desc_cache:
-            cached = self._desc_cache[cache_key]
+        cached = self.cache.get(self.CACHE_DESC, query, language)
+        if cached is not None:
             print(f"[維基] 使用快取：{query} -> {'有描述' if cached else '無描述'}")
-            return cached
+            return cached or None
 
         print(f"[維基] 開始搜尋描述：{query}")
         title = self.search(query, language)
         if not title:
             print(f"[維基] 搜尋失敗，找不到標題：{query}")
-            self._desc_cache[cache_key] = None
+            # 確定查不到才記錄；網路錯誤不快取，下次重新查詢
+            if self.cache.peek(self.CACHE_SEARCH, query, language) is NEGATIVE_RESULT:
+                self.cache.set_negative(self.CACHE_DESC, query, language)
             return None
 
         print(f"[維基] 找到標題：{title}")
@@ -251,15 +281,19 @@ class WikipediaService:
                 # 描述看起來像電影/書籍，不是遊戲
                 print(f"[維基] 過濾掉非遊戲內容：{title}")
                 print(f"  描述開頭：{desc[:100]}...")
-                self._desc_cache[cache_key] = None
+                self.cache.set_negative(self.CACHE_DESC, query, language)
                 return None
 
             print(f"[維基] 描述驗證通過，長度：{len(desc)}")
-            self._desc_cache[cache_key] = desc
+            if desc:
+                self.cache.set(self.CACHE_DESC, query, language, desc)
+            else:
+                self.cache.set_negative(self.CACHE_DESC, query, language)
             return desc
 
         print(f"[維基] 取得頁面資訊失敗")
-        self._desc_cache[cache_key] = None
+        if self.cache.peek(self.CACHE_PAGE, title, language) is NEGATIVE_RESULT:
+            self.cache.set_negative(self.CACHE_DESC, query, language)
         return None
 
     def _is_game_description(self, desc: str) -> bool:
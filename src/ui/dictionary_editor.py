@@ -14,7 +14,7 @@ from pathlib import Path
 from typing import Dict, Optional
 
 from ..core.dictionary import DictionaryManager, GameEntry
-from ..utils.file_utils import get_dictionaries_dir
+from ..utils.name_cleaner import clean
 
 
 class GameEditDialog(QDialog):
@@ -44,6 +44,12 @@ class GameEditDialog(QDialog):
         original_name_label.setStyleSheet("color: #888;")
         name_layout.addWidget(original_name_label)
         
+        # 翻譯時實際用來查詢的名稱（移除區域碼、版本號等）
+        name_layout.addWidget(QLabel("查詢名稱:"))
+        query_name_label = QLabel(clean(self.entry.original_name))
+        query_name_label.setStyleSheet("color: #888;")
+        name_layout.addWidget(query_name_label)
+        
         name_layout.addWidget(QLabel("翻譯名稱:"))
         self.name_input = QLineEdit(self.entry.name)
         name_layout.addWidget(self.name_input)
@@ -537,10 +543,7 @@ class DictionaryEditorDialog(QDialog):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            dict_path = get_dictionaries_dir() / self.language / f"{self.current_platform}.json"
-            
-            if dict_path.exists():
-                dict_path.unlink()
+            self.dict_manager.delete_dictionary(self.language, self.current_platform)
             
             self.current_platform = None
             self.current_dictionary = {}
@@ -18,8 +18,9 @@ from .log_panel import LogPanel
 from .settings_dialog import SettingsDialog
 from .preview_dialog import PreviewDialog
 from .platform_selector import PlatformSelector
-from ..utils.file_utils import get_dictionaries_dir
 from ..utils.settings import SettingsManager, AppSettings
+from ..utils.rate_limiter import configure_rate_limits
+from ..core.storage import set_default_storage
 
 
 class TranslationWorker(QThread):
@@ -41,12 +42,12 @@ class TranslationWorker(QThread):
         """執行翻譯"""
         try:
             import time
-            from concurrent.futures import ThreadPoolExecutor, as_completed
-            from threading import Lock
             from ..core import Scanner, DictionaryManager, TranslationEngine, XmlWriter
             from ..services import WikipediaService, SearchService, TranslateService
-            from ..utils import parse_gamelist, get_game_key
-            from ..core.dictionary import GameEntry
+            from ..utils import iter_gamelist, get_game_count, get_game_key
+            from xml.etree.ElementTree import ParseError
+            from ..core.dictionary import GameEntry, DeltaAutosaver
+            from ..utils.work_queue import WorkQueue
 
             # 初始化模組
             scanner = Scanner(self.roms_path)
@@ -99,8 +100,8 @@ class TranslationWorker(QThread):
                 # 複製到暫存區
                 cache_path = scanner.copy_gamelist_to_cache(platform)
 
-                # 解析遊戲清單
-                games = parse_gamelist(cache_path)
+                # 快速計數（不建立 XML 樹），遊戲清單於翻譯時串流解析
+                total_games = get_game_count(cache_path)
 
                 # 載入字典
                 dictionary = dict_manager.load_dictionary(
@@ -110,46 +111,40 @@ class TranslationWorker(QThread):
                 auto_save_interval = self.settings.get(
                     'auto_save_interval', 10)
                 max_workers = self.settings.get('max_workers', 1)
-                batch_size = self.settings.get('batch_size', 50)
                 games_processed = 0
 
-                # 執行緒鎖（保護字典更新）
-                dict_lock = Lock()
-
-                def translate_single_game(game):
-                    """翻譯單個遊戲（執行緒安全）"""
-                    import threading
-                    thread_id = threading.current_thread().name
-                    # 簡化執行緒名稱顯示（ThreadPoolExecutor-0_0 -> T0）
-                    thread_num = thread_id.split(
-                        '_')[-1] if '_' in thread_id else thread_id[-1]
-
-                    # 顯示正在處理的遊戲（包含執行緒資訊）
-                    display_name = game.name[:30] if len(
-                        game.name) > 30 else game.name
-                    self.progress.emit(
-                        games_processed, len(games),
-                        f"[執行緒-{thread_num}] {display_name}...")
-
-                    # 建立或取得字典項目
-                    game_key = get_game_key(game.path)
-
-                    with dict_lock:
-                        if game_key not in dictionary:
-                            entry = GameEntry(
-                                key=game_key,
-                                original_name=game.name,
-                                original_desc=game.desc
-                            )
-                            dictionary[game_key] = entry
-                        else:
-                            entry = dictionary[game_key]
-                            # 更新原始資料（可能有變更）
-                            entry.original_name = game.name
-                            entry.original_desc = game.desc
-
-                    # 翻譯（不需要鎖，每個執行緒獨立翻譯）
-                    output = translator.translate_game(
+                # 只寫入變更項目的自動儲存
+                autosaver = DeltaAutosaver(dict_manager, self.language, platform.name,
+                                           dictionary, interval=auto_save_interval)
+
+                def iter_work_items():
+                    """邊解析邊建立/更新字典項目（在工作佇列的 producer 執行緒執行），worker 只負責翻譯"""
+                    try:
+                        for game in iter_gamelist(cache_path):
+                            game_key = get_game_key(game.path)
+                            entry = dictionary.get(game_key)
+                            if entry is None:
+                                entry = GameEntry(
+                                    key=game_key,
+                                    original_name=game.name,
+                                    original_desc=game.desc
+                                )
+                                dictionary[game_key] = entry
+                                autosaver.mark_dirty(game_key)
+                            elif (entry.original_name != game.name
+                                  or entry.original_desc != game.desc):
+                                # 更新原始資料（可能有變更）
+                                entry.original_name = game.name
+                                entry.original_desc = game.desc
+                                autosaver.mark_dirty(game_key)
+                            yield entry
+                    except ParseError as e:
+                        self.log.emit("WARNING", "Scanner",
+                                      f"{platform.name}: gamelist.xml 格式錯誤，只處理到錯誤位置之前: {e}")
+
+                def translate_single_game(entry):
+                    """翻譯單個遊戲（在 worker 執行緒中執行）"""
+                    return translator.translate_game(
                         entry,
                         translate_name=self.settings.get(
                             'translate_name', True),
@@ -159,116 +154,81 @@ class TranslationWorker(QThread):
                             'skip_translated', True)
                     )
 
-                    # 更新字典（需要鎖）
-                    with dict_lock:
-                        if output.name:
-                            entry.name = output.name
-                            entry.name_source = output.name_source
-                            entry.name_translated_at = time.strftime(
-                                '%Y-%m-%dT%H:%M:%S')
-                        if output.desc:
-                            entry.desc = output.desc
-                            entry.desc_source = output.desc_source
-                            entry.desc_translated_at = time.strftime(
-                                '%Y-%m-%dT%H:%M:%S')
-
-                        # 更新原文 hash
-                        entry.update_hashes()
-
-                    # 返回結果（包含執行緒資訊用於日誌）
-                    return (output.result.value, thread_num, game.name)
-
-                # 使用執行緒池翻譯
+                work_queue = WorkQueue(translate_single_game,
+                                       num_workers=max_workers,
+                                       name='translate')
+
+                def apply_result(entry, output):
+                    """套用翻譯結果（在本執行緒依完成順序執行，不需加鎖）"""
+                    nonlocal games_processed
+
+                    if output.name:
+                        entry.name = output.name
+                        entry.name_source = output.name_source
+                        entry.name_translated_at = time.strftime(
+                            '%Y-%m-%dT%H:%M:%S')
+                    if output.desc:
+                        entry.desc = output.desc
+                        entry.desc_source = output.desc_source
+                        entry.desc_translated_at = time.strftime(
+                            '%Y-%m-%dT%H:%M:%S')
+
+                    # 更新原文 hash
+                    entry.update_hashes()
+
+                    status = output.result.value
+                    if status == 'success':
+                        result['translated'] += 1
+                        self.log.emit("SUCCESS", "Translator",
+                                      f"✓ {entry.original_name[:40]}")
+                    elif status == 'skipped':
+                        result['skipped'] += 1
+                    else:
+                        result['failed'] += 1
+
+                    result['games'] += 1
+                    games_processed += 1
+
+                    # 顯示進度與目前忙碌的 worker 數
+                    display_name = entry.original_name[:30]
+                    self.progress.emit(
+                        games_processed, total_games,
+                        f"[{work_queue.busy_count}/{work_queue.num_workers} 忙碌] {display_name}...")
+
+                    # 自動儲存（只寫入變更的項目，避免資料遺失）
+                    if autosaver.step(entry.key, changed=bool(output.name or output.desc)):
+                        self.log.emit(
+                            "INFO", "Dictionary", f"自動儲存進度 ({games_processed}/{total_games})")
+
+                def report_error(entry, error):
+                    self.log.emit(
+                        "ERROR", "Translator", f"翻譯失敗: {str(error)}")
+                    result['failed'] += 1
+
                 if max_workers > 1:
                     self.log.emit("INFO", "Translator",
-                                  f"🔥 啟用多執行緒：{max_workers} 個 worker，批次大小：{batch_size}")
-
-                    # 記錄使用的執行緒
-                    active_threads = set()
-
-                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                        # 批次提交任務
-                        for i in range(0, len(games), batch_size):
-                            if self._is_cancelled:
-                                break
-
-                            batch = games[i:i + batch_size]
-                            futures = {executor.submit(
-                                translate_single_game, game): game for game in batch}
-
-                            for future in as_completed(futures):
-                                if self._is_cancelled:
-                                    break
-
-                                try:
-                                    status, thread_num, game_name = future.result()
-
-                                    # 記錄執行緒使用情況
-                                    active_threads.add(thread_num)
-
-                                    # 每成功處理一個遊戲，記錄日誌（顯示執行緒）
-                                    if status == 'success':
-                                        result['translated'] += 1
-                                        self.log.emit("SUCCESS", "Thread",
-                                                      f"[T{thread_num}] ✓ {game_name[:40]}")
-                                    elif status == 'skipped':
-                                        result['skipped'] += 1
-                                    else:
-                                        result['failed'] += 1
-
-                                    result['games'] += 1
-                                    games_processed += 1
-
-                                    # 每10個遊戲顯示多執行緒狀態
-                                    if games_processed % 10 == 0 and len(active_threads) > 1:
-                                        self.log.emit("INFO", "Threads",
-                                                      f"✓ 多執行緒運作中：已使用 {len(active_threads)} 個執行緒")
-
-                                    # 自動儲存
-                                    if games_processed % auto_save_interval == 0:
-                                        dict_manager.save_dictionary(
-                                            self.language, platform.name, dictionary)
-                                        self.log.emit(
-                                            "INFO", "Dictionary", f"自動儲存進度 ({games_processed}/{len(games)})")
-
-                                except Exception as e:
-                                    self.log.emit(
-                                        "ERROR", "Translator", f"翻譯失敗: {str(e)}")
-                                    result['failed'] += 1
-
-                    # 多執行緒總結
-                    if len(active_threads) > 0:
-                        self.log.emit("SUCCESS", "Threads",
-                                      f"✓ 多執行緒完成：共使用了 {len(active_threads)} 個不同的執行緒")
+                                  f"🔥 啟用多執行緒：{max_workers} 個 worker（工作佇列）")
                 else:
-                    # 單執行緒模式（原有邏輯）
                     self.log.emit("INFO", "Translator", "使用單執行緒模式")
-                    for game in games:
-                        if self._is_cancelled:
-                            break
-
-                        status, thread_num, game_name = translate_single_game(
-                            game)
-                        result['games'] += 1
-                        games_processed += 1
-
-                        if status == 'success':
-                            result['translated'] += 1
-                        elif status == 'skipped':
-                            result['skipped'] += 1
-                        else:
-                            result['failed'] += 1
-
-                        # 自動儲存（避免資料遺失）
-                        if games_processed % auto_save_interval == 0:
-                            dict_manager.save_dictionary(
-                                self.language, platform.name, dictionary)
-                            self.log.emit(
-                                "INFO", "Dictionary", f"自動儲存進度 ({games_processed}/{len(games)})")
-
-                # 最終儲存
-                dict_manager.save_dictionary(
-                    self.language, platform.name, dictionary)
+
+                try:
+                    queue_stats = work_queue.run(
+                        iter_work_items(),
+                        on_result=apply_result,
+                        on_error=report_error,
+                        is_cancelled=lambda: self._is_cancelled)
+                except Exception:
+                    # 讀取遊戲清單失敗：先保存已完成的翻譯，再回報錯誤
+                    autosaver.finish()
+                    raise
+
+                self.log.emit("INFO", "Threads",
+                              f"[{platform.name}] 完成 {queue_stats.completed} 項，"
+                              f"{queue_stats.throughput:.1f} 項/秒，"
+                              f"worker 使用率 {queue_stats.utilization:.0%}")
+
+                # 最終儲存（完整寫入並壓縮增量日誌）
+                autosaver.finish()
 
                 # 寫回 XML（如果設定允許）
                 if self.settings.get('write_back', True) and platform.gamelist_path:
@@ -288,6 +248,10 @@ class TranslationWorker(QThread):
             if cached_count > 0:
                 self.log.emit("SUCCESS", "Cache",
                               f"✓ 快取持久化完成：{cached_count} 項")
+            saved = sum(cache.get_negative_hits().values())
+            if saved > 0:
+                self.log.emit("INFO", "Cache",
+                              f"負面快取命中 {saved} 次（省下的網路查詢）")
 
             self.finished.emit(result)
 
@@ -313,6 +277,14 @@ class StageWorker(QThread):
     def cancel(self):
         self._is_cancelled = True
 
+    def _create_pipeline(self):
+        """建立以本 Worker 訊號輸出進度與日誌的處理流程"""
+        from ..core.pipeline import StagePipeline
+        return StagePipeline(
+            on_progress=self.progress.emit,
+            on_log=self.log.emit,
+            is_cancelled=lambda: self._is_cancelled)
+
 
 class ScanWorker(StageWorker):
     """階段一：掃描取回 Worker"""
@@ -324,53 +296,9 @@ class ScanWorker(StageWorker):
 
     def run(self):
         try:
-            from ..core import Scanner
-
-            self.log.emit("INFO", "Stage1", "開始階段一：掃描與取回...")
-            self.progress.emit(0, 100, "正在掃描 ROM 資料夾...")
-
-            scanner = Scanner(self.roms_path)
-            platforms = scanner.scan()
-
-            self.log.emit("INFO", "Stage1", f"發現 {len(platforms)} 個資料夾")
-            self.progress.emit(30, 100, f"發現 {len(platforms)} 個資料夾")
-
-            platforms_with_gamelist = scanner.get_platforms_with_gamelist()
-
-            # 遞取選中的平台
-            if self.selected_platforms:
-                platforms_with_gamelist = [
-                    p for p in platforms_with_gamelist
-                    if p.name in self.selected_platforms
-                ]
-                self.log.emit("INFO", "Stage1",
-                              f"選中 {len(platforms_with_gamelist)} 個平台進行處理")
-
-            self.log.emit("INFO", "Stage1",
-                          f"有 gamelist.xml 的平台: {len(platforms_with_gamelist)}")
-            self.progress.emit(50, 100, "正在複製 gamelist.xml 到暫存區...")
-
-            # 複製到暫存區
-            copied = []
-            total = len(platforms_with_gamelist)
-            for i, platform in enumerate(platforms_with_gamelist):
-                if self._is_cancelled:
-                    break
-
-                scanner.copy_gamelist_to_cache(platform)
-                copied.append(platform.name)
-
-                progress = 50 + int((i + 1) / total * 50) if total > 0 else 100
-                self.progress.emit(
-                    progress, 100, f"複製: {platform.name} ({i+1}/{total})")
-                self.log.emit("INFO", "Stage1", f"  複製: {platform.name}")
-
-            self.progress.emit(100, 100, "階段一完成！")
-            self.log.emit("SUCCESS", "Stage1",
-                          f"階段一完成！複製 {len(copied)} 個 gamelist.xml 到暫存區")
-
-            self.finished.emit({'copied': len(copied)})
-
+            result = self._create_pipeline().scan(
+                self.roms_path, self.selected_platforms)
+            self.finished.emit(result)
         except Exception as e:
             self.error.emit(str(e))
 
@@ -385,72 +313,9 @@ class DictionaryWorker(StageWorker):
 
     def run(self):
         try:
-            from ..core import DictionaryManager
-            from ..utils import parse_gamelist, get_game_key
-            from ..core.dictionary import GameEntry
-
-            self.log.emit("INFO", "Stage2", "開始階段二：產生字典檔...")
-            self.progress.emit(0, 100, "正在掃描暫存區...")
-
-            gamelists_dir = Path('./gamelists_local')
-            if not gamelists_dir.exists():
-                self.error.emit("請先執行階段一（掃描取回）")
-                return
-
-            dict_manager = DictionaryManager()
-
-            # 收集所有平台
-            platform_dirs = [d for d in gamelists_dir.iterdir(
-            ) if d.is_dir() and (d / 'gamelist.xml').exists()]
-
-            # 過濾選中的平台
-            if self.selected_platforms:
-                platform_dirs = [
-                    d for d in platform_dirs if d.name in self.selected_platforms]
-                self.log.emit("INFO", "Stage2",
-                              f"選中 {len(platform_dirs)} 個平台進行處理")
-
-            total_platforms = len(platform_dirs)
-            total_games = 0
-
-            for i, platform_dir in enumerate(platform_dirs):
-                if self._is_cancelled:
-                    break
-
-                platform_name = platform_dir.name
-                gamelist_path = platform_dir / 'gamelist.xml'
-
-                self.progress.emit(int((i / total_platforms) * 100)
-                                   if total_platforms > 0 else 100, 100, f"處理平台: {platform_name}")
-
-                games = parse_gamelist(gamelist_path)
-                dictionary = dict_manager.load_dictionary(
-                    self.language, platform_name)
-
-                for game in games:
-                    key = get_game_key(game.path)
-                    if key not in dictionary:
-                        entry = GameEntry(
-                            key=key,
-                            original_name=game.name,
-                            original_desc=game.desc
-                        )
-                        dictionary[key] = entry
-
-                dict_manager.save_dictionary(
-                    self.language, platform_name, dictionary)
-
-                self.log.emit("INFO", "Stage2",
-                              f"  {platform_name}: {len(dictionary)} 個遊戲")
-                total_games += len(dictionary)
-
-            self.progress.emit(100, 100, "階段二完成！")
-            self.log.emit("SUCCESS", "Stage2",
-                          f"階段二完成！{total_platforms} 個平台, {total_games} 個遊戲")
-
-            self.finished.emit(
-                {'platforms': total_platforms, 'games': total_games})
-
+            result = self._create_pipeline().build_dictionaries(
+                self.language, self.selected_platforms)
+            self.finished.emit(result)
         except Exception as e:
             self.error.emit(str(e))
 
@@ -470,325 +335,15 @@ class TranslateWorker(StageWorker):
 
     def run(self):
         try:
-            from ..core import DictionaryManager, TranslationEngine
-            from ..services import WikipediaService, SearchService, TranslateService
-
-            self.log.emit("INFO", "Stage3", "開始階段三：翻譯...")
-            self.progress.emit(0, 100, "正在初始化翻譯服務...")
-
-            dict_manager = DictionaryManager()
-            lang_dir = get_dictionaries_dir() / self.language
-
-            if not lang_dir.exists():
-                self.error.emit("請先執行階段二（產生字典）")
-                return
-
-            platforms = [f.stem for f in lang_dir.glob('*.json')]
-
-            # 過濾選中的平台
-            if self.selected_platforms:
-                platforms = [
-                    p for p in platforms if p in self.selected_platforms]
-                self.log.emit("INFO", "Stage3", f"選中 {len(platforms)} 個平台進行翻譯")
-
-            # 按遊戲數量排序（從少到多），優先翻譯遊戲少的平台
-            platform_sizes = {}
-            for platform in platforms:
-                dictionary = dict_manager.load_dictionary(
-                    self.language, platform)
-                platform_sizes[platform] = len(dictionary)
-
-            # 排序：遊戲數量少的優先
-            platforms = sorted(
-                platforms, key=lambda p: platform_sizes.get(p, 0))
-            self.log.emit("INFO", "Stage3",
-                          f"平台處理順序（按遊戲數量）: {', '.join([f'{p}({platform_sizes[p]})' for p in platforms[:5]])}{'...' if len(platforms) > 5 else ''}")
-
-            # 初始化翻譯引擎
-            translator = TranslationEngine(target_language=self.language)
-            # 將毫秒轉換為秒
-            delay_seconds = self.request_delay / 1000.0
-            translator.set_wiki_service(
-                WikipediaService(request_delay=delay_seconds))
-            translator.set_search_service(SearchService(
-                request_delay=delay_seconds * 2))  # 搜尋服務延遲加倍
-            translator.set_translate_api(
-                TranslateService(request_delay=delay_seconds))
-
-            # 如果有 Gemini API Key，初始化 Gemini 服務
-            if self.gemini_api_key:
-                try:
-                    from ..services.gemini import GeminiService
-                    gemini = GeminiService(self.gemini_api_key)
-                    translator.set_gemini_service(gemini)
-                    self.log.emit("INFO", "Stage3", "Gemini AI 服務已啟用")
-                except Exception as e:
-                    self.log.emit("WARNING", "Stage3", f"Gemini 服務初始化失敗: {e}")
-
-            self.progress.emit(5, 100, "翻譯服務初始化完成")
-
-            total_translated = 0
-            total_entries = sum(platform_sizes.values())  # 使用已計算的數量
-            processed_entries = 0
-
-            self.log.emit("INFO", "Stage3",
-                          f"共 {len(platforms)} 個平台, {total_entries} 個遊戲待處理")
-
-            import time
-            start_time = time.time()
-
-            # 讀取性能設定
-            from ..utils.settings import SettingsManager
-            settings_mgr = SettingsManager()
-            settings = settings_mgr.load()
-            max_workers = settings.max_workers
-
-            # 決定是否使用多執行緒
-            use_multithreading = max_workers > 1
-            if use_multithreading:
-                from concurrent.futures import ThreadPoolExecutor, as_completed
-                from threading import Lock
-                self.log.emit("INFO", "Stage3",
-                              f"🔥 啟用多執行緒：{max_workers} 個 worker")
-
-            for platform in platforms:
-                if self._is_cancelled:
-                    break
-
-                dictionary = dict_manager.load_dictionary(
-                    self.language, platform)
-                platform_translated = 0
-
-                entries_list = list(dictionary.values())
-
-                if use_multithreading and len(entries_list) > 5:
-                    # 多執行緒模式
-                    dict_lock = Lock()
-                    active_threads = set()
-
-                    def translate_entry(entry, idx):
-                        """翻譯單個條目（執行緒安全）"""
-                        # 在開始前先檢查取消
-                        if self._is_cancelled:
-                            return (False, "0")
-
-                        import threading
-                        thread_id = threading.current_thread().name
-                        thread_num = thread_id.split(
-                            '_')[-1] if '_' in thread_id else thread_id[-1]
-
-                        nonlocal processed_entries
-
-                        # 更新進度（顯示執行緒資訊）
-                        with dict_lock:
-                            processed_entries += 1
-                            progress = 5 + \
-                                int((processed_entries / total_entries)
-                                    * 90) if total_entries > 0 else 100
-
-                        # 計算 ETA
-                        elapsed = time.time() - start_time
-                        if processed_entries > 0:
-                            avg_time_per_entry = elapsed / processed_entries
-                            remaining_entries = total_entries - processed_entries
-                            eta_seconds = int(
-                                avg_time_per_entry * remaining_entries)
-                            if eta_seconds > 3600:
-                                eta_str = f"約 {eta_seconds // 3600} 小時 {(eta_seconds % 3600) // 60} 分鐘"
-                            elif eta_seconds > 60:
-                                eta_str = f"約 {eta_seconds // 60} 分鐘"
-                            else:
-                                eta_str = f"約 {eta_seconds} 秒"
-                        else:
-                            eta_str = "計算中..."
-
-                        display_name = entry.original_name[:25] if len(
-                            entry.original_name) > 25 else entry.original_name
-                        self.progress.emit(progress, 100,
-                                           f"[T{thread_num}] [{platform}] {display_name}... ({processed_entries}/{total_entries}, 剩餘 {eta_str})")
-
-                        # 再次檢查取消（在實際翻譯前）
-                        if self._is_cancelled:
-                            return (False, thread_num)
-
-                        # 檢查是否需要強制重新翻譯
-                        force_retranslate = entry.needs_retranslate
-                        actual_skip_translated = self.skip_translated and not force_retranslate
-
-                        # 如果是重翻，記錄日誌
-                        if force_retranslate:
-                            self.log.emit("INFO", "Stage3",
-                                          f"[T{thread_num}] 🔄 重翻：{entry.original_name}")
-
-                        # 翻譯
-                        output = translator.translate_game(
-                            entry,
-                            translate_name=self.translate_name,
-                            translate_desc=self.translate_desc,
-                            skip_translated=actual_skip_translated
-                        )
-
-                        # 更新結果
-                        translated = False
-                        with dict_lock:
-                            if output.name:
-                                entry.name = output.name
-                                entry.name_source = output.name_source
-                                entry.name_translated_at = time.strftime(
-                                    '%Y-%m-%dT%H:%M:%S')
-                                translated = True
-                                if force_retranslate:
-                                    self.log.emit("SUCCESS", "Stage3",
-                                                  f"[T{thread_num}] ✓ 重翻名稱：{entry.original_name} → {output.name}")
-                            if output.desc:
-                                entry.desc = output.desc
-                                entry.desc_source = output.desc_source
-                                entry.desc_translated_at = time.strftime(
-                                    '%Y-%m-%dT%H:%M:%S')
-                                translated = True
-                                if force_retranslate:
-                                    desc_preview = output.desc[:50] + "..." if len(
-                                        output.desc) > 50 else output.desc
-                                    self.log.emit("SUCCESS", "Stage3",
-                                                  f"[T{thread_num}] ✓ 重翻描述：{entry.original_name} - {desc_preview}")
-
-                            # 翻譯完成後清除重翻標記
-                            if force_retranslate and (output.name or output.desc):
-                                entry.needs_retranslate = False
-
-                            # 更新原文 hash
-                            entry.update_hashes()
-
-                        if translated:
-                            self.log.emit("INFO", "Stage3",
-                                          f"[T{thread_num}] ✓ {entry.original_name} → {output.name} ({output.name_source})")
-
-                        return (translated, thread_num)
-
-                    # 使用執行緒池處理（分批提交以支援更快的取消）
-                    batch_size = max_workers * 3  # 每批次提交的任務數
-                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                        for batch_start in range(0, len(entries_list), batch_size):
-                            if self._is_cancelled:
-                                self.log.emit("WARNING", "Stage3", "使用者已取消翻譯")
-                                break
-
-                            batch_end = min(
-                                batch_start + batch_size, len(entries_list))
-                            batch_entries = entries_list[batch_start:batch_end]
-
-                            futures = {executor.submit(translate_entry, entry, idx): entry
-                                       for idx, entry in enumerate(batch_entries, start=batch_start)}
-
-                            for future in as_completed(futures):
-                                if self._is_cancelled:
-                                    # 取消所有等待中的任務
-                                    for f in futures:
-                                        f.cancel()
-                                    break
-                                try:
-                                    translated, thread_num = future.result()
-                                    active_threads.add(thread_num)
-                                    if translated:
-                                        platform_translated += 1
-                                except Exception as e:
-                                    import traceback
-                                    error_details = traceback.format_exc()
-                                    self.log.emit("ERROR", "Stage3",
-                                                  f"翻譯失敗: {str(e)}")
-                                    self.log.emit("ERROR", "Stage3",
-                                                  f"詳細錯誤:\n{error_details}")
-
-                            if self._is_cancelled:
-                                break
-
-                    # 顯示多執行緒總結
-                    if len(active_threads) > 0 and not self._is_cancelled:
-                        self.log.emit("SUCCESS", "Stage3",
-                                      f"[{platform}] 多執行緒完成：使用了 {len(active_threads)} 個執行緒，翻譯 {platform_translated} 個遊戲")
-                else:
-                    # 單執行緒模式（遊戲數量少或max_workers=1）
-                    for entry in entries_list:
-                        if self._is_cancelled:
-                            break
-
-                        processed_entries += 1
-                        progress = 5 + \
-                            int((processed_entries / total_entries)
-                                * 90) if total_entries > 0 else 100
-
-                        # 計算預估剩餘時間
-                        elapsed = time.time() - start_time
-                        if processed_entries > 0:
-                            avg_time_per_entry = elapsed / processed_entries
-                            remaining_entries = total_entries - processed_entries
-                            eta_seconds = int(
-                                avg_time_per_entry * remaining_entries)
-
-                            if eta_seconds > 3600:
-                                eta_str = f"約 {eta_seconds // 3600} 小時 {(eta_seconds % 3600) // 60} 分鐘"
-                            elif eta_seconds > 60:
-                                eta_str = f"約 {eta_seconds // 60} 分鐘"
-                            else:
-                                eta_str = f"約 {eta_seconds} 秒"
-                        else:
-                            eta_str = "計算中..."
-
-                        self.progress.emit(
-                            progress, 100, f"[{platform}] {entry.original_name[:25]}... ({processed_entries}/{total_entries}, 剩餘 {eta_str})")
-
-                        # 檢查是否需要強制重新翻譯
-                        force_retranslate = entry.needs_retranslate
-                        actual_skip_translated = self.skip_translated and not force_retranslate
-
-                        output = translator.translate_game(
-                            entry,
-                            translate_name=self.translate_name,
-                            translate_desc=self.translate_desc,
-                            skip_translated=actual_skip_translated
-                        )
-
-                        if output.name:
-                            entry.name = output.name
-                            entry.name_source = output.name_source
-                            entry.name_translated_at = time.strftime(
-                                '%Y-%m-%dT%H:%M:%S')
-                            platform_translated += 1
-                            self.log.emit(
-                                "INFO", "Stage3", f"  ✓ {entry.original_name} → {output.name} ({output.name_source})")
-                        if output.desc:
-                            entry.desc = output.desc
-                            entry.desc_source = output.desc_source
-                            entry.desc_translated_at = time.strftime(
-                                '%Y-%m-%dT%H:%M:%S')
-
-                        # 翻譯完成後清除重翻標記
-                        if force_retranslate and (output.name or output.desc):
-                            entry.needs_retranslate = False
-
-                        # 更新原文 hash（用於偵測原文變更）
-                        entry.update_hashes()
-
-                dict_manager.save_dictionary(
-                    self.language, platform, dictionary)
-                self.log.emit("INFO", "Stage3",
-                              f"  {platform}: 翻譯 {platform_translated} 個")
-                total_translated += platform_translated
-
-            # 翻譯完成，將快取批次寫入資料庫
-            from ..utils.cache import get_global_cache
-            cache = get_global_cache()
-            cached_count = cache.flush_to_db()
-            if cached_count > 0:
-                self.log.emit("SUCCESS", "Cache",
-                              f"✓ 快取持久化完成：{cached_count} 項")
-
-            self.progress.emit(100, 100, "階段三完成！")
-            self.log.emit("SUCCESS", "Stage3",
-                          f"階段三完成！翻譯 {total_translated} 個遊戲")
-
-            self.finished.emit({'translated': total_translated})
-
+            result = self._create_pipeline().translate(
+                self.language,
+                translate_name=self.translate_name,
+                translate_desc=self.translate_desc,
+                skip_translated=self.skip_translated,
+                selected_platforms=self.selected_platforms,
+                gemini_api_key=self.gemini_api_key,
+                request_delay=self.request_delay)
+            self.finished.emit(result)
         except Exception as e:
             self.error.emit(str(e))
 
@@ -805,65 +360,12 @@ class WritebackWorker(StageWorker):
 
     def run(self):
         try:
-            from ..core import DictionaryManager, XmlWriter
-            from ..core.writer import DisplayFormat
-
-            self.log.emit("INFO", "Stage4", "開始階段四：寫回 XML...")
-            self.progress.emit(0, 100, "正在準備寫回...")
-
-            dict_manager = DictionaryManager()
-            writer = XmlWriter()
-
-            gamelists_dir = Path('./gamelists_local')
-            if not gamelists_dir.exists():
-                self.error.emit("請先執行階段一（掃描取回）")
-                return
-
-            platform_dirs = [d for d in gamelists_dir.iterdir(
-            ) if d.is_dir() and (d / 'gamelist.xml').exists()]
-
-            # 過濾選中的平台
-            if self.selected_platforms:
-                platform_dirs = [
-                    d for d in platform_dirs if d.name in self.selected_platforms]
-                self.log.emit("INFO", "Stage4",
-                              f"選中 {len(platform_dirs)} 個平台進行寫回")
-
-            total = len(platform_dirs)
-            total_updated = 0
-
-            for i, platform_dir in enumerate(platform_dirs):
-                if self._is_cancelled:
-                    break
-
-                platform_name = platform_dir.name
-                gamelist_path = platform_dir / 'gamelist.xml'
-
-                progress = int((i / total) * 100) if total > 0 else 100
-                self.progress.emit(progress, 100, f"寫回: {platform_name}")
-
-                dictionary = dict_manager.load_dictionary(
-                    self.language, platform_name)
-
-                if dictionary:
-                    result = writer.write_translations(
-                        xml_path=gamelist_path,
-                        dictionary=dictionary,
-                        platform=platform_name,
-                        display_format=DisplayFormat.TRANSLATED_ONLY,
-                        auto_backup=self.auto_backup,
-                        write_rules=self.write_rules
-                    )
-
-                    self.log.emit("INFO", "Stage4",
-                                  f"  {platform_name}: 更新 {result.updated} 個")
-                    total_updated += result.updated
-
-            self.progress.emit(100, 100, "階段四完成！")
-            self.log.emit("SUCCESS", "Stage4", f"階段四完成！更新 {total_updated} 個遊戲")
-
-            self.finished.emit({'updated': total_updated})
-
+            result = self._create_pipeline().write_back(
+                self.language,
+                auto_backup=self.auto_backup,
+                selected_platforms=self.selected_platforms,
+                write_rules=self.write_rules)
+            self.finished.emit(result)
         except Exception as e:
             self.error.emit(str(e))
 
@@ -873,20 +375,29 @@ class GeminiBatchWorker(StageWorker):
 
     def __init__(self, language: str, selected_platforms: List[str] = None,
                  gemini_api_key: str = "", batch_size: int = 80,
-                 translate_name: bool = True):
+                 translate_name: bool = True, max_in_flight: int = 4,
+                 rpm: int = 30, tpm: int = 1000000,
+                 adaptive_batch_size: bool = True,
+                 translate_desc: bool = False):
         super().__init__()
         self.language = language
         self.selected_platforms = selected_platforms or []
         self.gemini_api_key = gemini_api_key
         self.batch_size = batch_size
         self.translate_name = translate_name
+        self.translate_desc = translate_desc
+        self.max_in_flight = max_in_flight
+        self.rpm = rpm
+        self.tpm = tpm
+        self.adaptive_batch_size = adaptive_batch_size
 
     def run(self):
         try:
             import time
             from ..core import DictionaryManager
-            from ..services.gemini_batch import GeminiBatchService
+            from ..services.gemini_batch import GeminiBatchService, BatchJob
             from ..core.dictionary import TranslationSource
+            from ..utils.name_cleaner import clean
 
             self.log.emit("INFO", "GeminiBatch", "開始 Gemini 批次翻譯...")
             self.progress.emit(0, 100, "正在初始化...")
@@ -898,9 +409,9 @@ class GeminiBatchWorker(StageWorker):
 
             # 初始化服務
             dict_manager = DictionaryManager()
-            lang_dir = get_dictionaries_dir() / self.language
+            platforms = dict_manager.get_available_platforms(self.language)
 
-            if not lang_dir.exists():
+            if not platforms:
                 self.error.emit("請先執行階段二（產生字典）")
                 return
 
@@ -909,14 +420,17 @@ class GeminiBatchWorker(StageWorker):
                 gemini_batch = GeminiBatchService(
                     api_key=self.gemini_api_key,
                     batch_size=self.batch_size,
-                    request_delay=1.0  # 批次模式可以稍微放寬間隔
+                    request_delay=1.0,  # 批次模式可以稍微放寬間隔
+                    max_in_flight=self.max_in_flight,
+                    rpm=self.rpm,
+                    tpm=self.tpm,
+                    adaptive_batch_size=self.adaptive_batch_size
                 )
             except Exception as e:
                 self.error.emit(f"Gemini 服務初始化失敗: {e}")
                 return
 
-            # 取得平台列表
-            platforms = [f.stem for f in lang_dir.glob('*.json')]
+            # 過濾選中的平台
             if self.selected_platforms:
                 platforms = [
                     p for p in platforms if p in self.selected_platforms]
@@ -925,9 +439,18 @@ class GeminiBatchWorker(StageWorker):
 
             # 計算總遊戲數
             total_games = 0
+            total_descs = 0
             platform_games = {}  # {platform: [(key, entry), ...]}
+            platform_descs = {}  # {platform: [(key, entry), ...]}：需要描述的項目
+            platform_dicts = {}  # {platform: dictionary}，更新時沿用，不重複載入
 
             for platform in platforms:
+                # 依字典索引略過沒有待翻譯項目的平台，不需載入字典
+                if dict_manager.get_dictionary_stats(self.language, platform).is_complete(
+                        translate_name=self.translate_name,
+                        translate_desc=self.translate_desc):
+                    continue
+
                 dictionary = dict_manager.load_dictionary(
                     self.language, platform)
                 games_to_translate = []
@@ -939,11 +462,20 @@ class GeminiBatchWorker(StageWorker):
                     elif entry.needs_retranslate:
                         games_to_translate.append((key, entry))
 
+                descs_to_fill = [
+                    (key, entry) for key, entry in dictionary.items()
+                    if self.translate_desc and not entry.has_desc_translation()]
+
+                if games_to_translate or descs_to_fill:
+                    platform_dicts[platform] = dictionary
                 if games_to_translate:
                     platform_games[platform] = games_to_translate
                     total_games += len(games_to_translate)
+                if descs_to_fill:
+                    platform_descs[platform] = descs_to_fill
+                    total_descs += len(descs_to_fill)
 
-            if total_games == 0:
+            if total_games == 0 and total_descs == 0:
                 self.log.emit("INFO", "GeminiBatch", "沒有需要翻譯的遊戲")
                 self.progress.emit(100, 100, "完成！沒有需要翻譯的項目")
                 self.finished.emit({
@@ -954,65 +486,53 @@ class GeminiBatchWorker(StageWorker):
                 return
 
             self.log.emit("INFO", "GeminiBatch",
-                          f"共 {total_games} 個遊戲待翻譯，批次大小 {self.batch_size}")
-            self.progress.emit(5, 100, f"準備處理 {len(platform_games)} 個平台...")
+                          f"共 {total_games} 個遊戲待翻譯，批次大小 {self.batch_size}，"
+                          f"同時送出 {self.max_in_flight} 個批次（RPM {self.rpm}、TPM {self.tpm}）")
+            if total_descs:
+                self.log.emit("INFO", "GeminiBatch",
+                              f"共 {total_descs} 個遊戲待填入描述（依 token 預算分批）")
+            self.progress.emit(5, 100, f"準備處理 {len(platform_dicts)} 個平台...")
 
-            # 按平台分別翻譯（這樣可以傳入平台名稱提升準確度）
+            # 每個平台一組（傳入平台名稱提升準確度），所有平台的批次排入同一個佇列同時送出
             start_time = time.time()
             total_translated = 0
             total_failed = 0
-            processed_games = 0
             failed_entries = []
+            platform_infos = []  # 與 jobs 對應的 {查詢名稱: [(key, entry), ...]}
+            jobs = []
 
-            for platform_idx, (platform, games) in enumerate(platform_games.items()):
-                if self._is_cancelled:
-                    break
-
-                self.log.emit("INFO", "GeminiBatch",
-                              f"[{platform_idx + 1}/{len(platform_games)}] 處理平台: {platform} ({len(games)} 個遊戲)")
-
-                # 取得遊戲名稱列表
-                game_names = [entry.original_name for _, entry in games]
-
-                # 建立名稱到 (key, entry) 的對照表
+            for platform, games in platform_games.items():
+                # 建立清理後名稱到 (key, entry) 的對照表
+                # 與逐一翻譯相同以清理後的名稱查詢：不同區域版本只送一次，也共用同一份快取
                 name_to_info = {}
                 for key, entry in games:
-                    if entry.original_name not in name_to_info:
-                        name_to_info[entry.original_name] = []
-                    name_to_info[entry.original_name].append((key, entry))
+                    query_name = clean(entry.original_name) or entry.original_name
+                    if query_name not in name_to_info:
+                        name_to_info[query_name] = []
+                    name_to_info[query_name].append((key, entry))
 
+                platform_infos.append(name_to_info)
                 # 去重複
-                unique_names = list(name_to_info.keys())
-
-                # 定義進度回呼
-                def progress_callback(current, total, message):
-                    overall_progress = 5 + int(
-                        ((processed_games + current) / total_games) * 90
-                    ) if total_games > 0 else 100
-                    self.progress.emit(overall_progress, 100,
-                                       f"[{platform}] {message}")
-
-                # 定義取消檢查函數
-                def cancel_check():
-                    return self._is_cancelled
-
-                # 執行批次翻譯（傳入平台名稱和取消檢查）
-                result = gemini_batch.translate_all(
-                    unique_names,
-                    self.language,
-                    platform=platform,  # 傳入平台名稱
-                    progress_callback=progress_callback,
-                    cancel_check=cancel_check  # 傳入取消檢查
-                )
+                jobs.append(BatchJob(list(name_to_info.keys()), platform))
 
-                # 檢查是否已取消
-                if self._is_cancelled:
-                    self.log.emit("WARNING", "GeminiBatch", "使用者已取消翻譯")
-                    break
+            # 定義進度回呼（current/total 為所有平台合計）
+            def progress_callback(current, total, message):
+                overall_progress = 5 + int(
+                    (current / total) * 90) if total > 0 else 100
+                self.progress.emit(overall_progress, 100, message)
 
-                # 載入字典準備更新
-                dictionary = dict_manager.load_dictionary(
-                    self.language, platform)
+            # 定義取消檢查函數
+            def cancel_check():
+                return self._is_cancelled
+
+            # 平台完成時回呼（依平台順序，在本執行緒中呼叫）
+            def on_job_done(platform_idx, job, result):
+                nonlocal total_translated, total_failed
+                platform = job.platform
+                name_to_info = platform_infos[platform_idx]
+
+                # 沿用先前載入的字典進行更新
+                dictionary = platform_dicts[platform]
 
                 # 更新成功的翻譯
                 for name, translation in result.translations.items():
@@ -1044,13 +564,45 @@ class GeminiBatchWorker(StageWorker):
                 dict_manager.save_dictionary(
                     self.language, platform, dictionary)
 
-                processed_games += len(games)
+                retried = f"，拆半重送 {result.retries} 次" if result.retries else ""
                 self.log.emit("INFO", "GeminiBatch",
-                              f"[{platform}] 完成：成功 {result.success_count}，失敗 {len(result.failed)}")
+                              f"[{platform_idx + 1}/{len(jobs)}] [{platform}] 完成："
+                              f"成功 {result.success_count}，失敗 {len(result.failed)}{retried}")
+
+            # 執行批次翻譯（傳入取消檢查，取消後不再回呼平台完成）
+            gemini_batch.translate_many(
+                jobs,
+                self.language,
+                progress_callback=progress_callback,
+                cancel_check=cancel_check,  # 傳入取消檢查
+                on_job_done=on_job_done
+            )
+
+            # 描述：名稱完成後再批次填入
+            desc_filled, desc_failed = 0, 0
+            if platform_descs and not self._is_cancelled:
+                desc_filled, desc_failed = self._fill_descriptions(
+                    gemini_batch, platform_descs, platform_dicts, dict_manager,
+                    progress_callback, cancel_check)
+
+            # 檢查是否已取消
+            if self._is_cancelled:
+                self.log.emit("WARNING", "GeminiBatch", "使用者已取消翻譯")
 
             elapsed = time.time() - start_time
             self.log.emit("INFO", "GeminiBatch",
                           f"批次翻譯完成，耗時 {elapsed:.1f} 秒")
+            parse = gemini_batch.get_parse_stats()
+            if parse['responses']:
+                self.log.emit("INFO", "GeminiBatch",
+                              f"回應解析失敗率 {parse['failure_rate']:.1%}"
+                              f"（{parse['parse_failures']}/{parse['responses']}，"
+                              f"截斷 {parse['truncated']} 次）")
+            if self.adaptive_batch_size:
+                sizer = gemini_batch.batch_sizer.get_stats()
+                self.log.emit("INFO", "GeminiBatch",
+                              f"批次大小調整為 {sizer['size']}"
+                              f"（截斷 {sizer['truncated']} 次，無法解析 {sizer['parse_failures']} 次）")
 
             # 將快取寫入資料庫
             from ..utils.cache import get_global_cache
@@ -1059,6 +611,10 @@ class GeminiBatchWorker(StageWorker):
             if cached_count > 0:
                 self.log.emit("SUCCESS", "Cache",
                               f"✓ 快取持久化完成：{cached_count} 項")
+            saved = sum(cache.get_negative_hits().values())
+            if saved > 0:
+                self.log.emit("INFO", "Cache",
+                              f"負面快取命中 {saved} 次（省下的網路查詢）")
 
             # 完成
             self.progress.emit(100, 100, "Gemini 批次翻譯完成！")
@@ -1067,6 +623,8 @@ class GeminiBatchWorker(StageWorker):
                 f"翻譯成功：{total_translated} 個\n"
                 f"翻譯失敗：{total_failed} 個（已標記重翻）"
             )
+            if self.translate_desc:
+                summary += f"\n描述填入：{desc_filled} 個，失敗 {desc_failed} 個"
             self.log.emit("SUCCESS", "GeminiBatch", summary)
 
             if failed_entries and len(failed_entries) <= 10:
@@ -1080,7 +638,9 @@ class GeminiBatchWorker(StageWorker):
             self.finished.emit({
                 'total': total_games,
                 'translated': total_translated,
-                'failed': total_failed
+                'failed': total_failed,
+                'desc_filled': desc_filled,
+                'desc_failed': desc_failed
             })
 
         except Exception as e:
@@ -1089,6 +649,91 @@ class GeminiBatchWorker(StageWorker):
             self.log.emit("ERROR", "GeminiBatch", traceback.format_exc())
             self.error.emit(str(e))
 
+    def _fill_descriptions(self, gemini_batch, platform_descs, platform_dicts,
+                           dict_manager, progress_callback, cancel_check):
+        """
+        批次填入描述：有原文描述的翻譯，沒有的依遊戲名稱產生簡介
+
+        Args:
+            gemini_batch: GeminiBatchService
+            platform_descs: {platform: [(key, entry), ...]} 需要描述的項目
+            platform_dicts: {platform: dictionary} 已載入的字典
+            dict_manager: DictionaryManager
+            progress_callback: 進度回呼函數
+            cancel_check: 取消檢查函數
+
+        Returns:
+            (成功數, 失敗數)
+        """
+        import time
+        from ..services.gemini_batch import GeminiBatchService, BatchJob
+        from ..utils.name_cleaner import clean
+
+        filled = 0
+        failed = 0
+        for mode, label in ((GeminiBatchService.MODE_DESCRIPTION, "描述翻譯"),
+                            (GeminiBatchService.MODE_GENERATE, "簡介產生")):
+            if self._is_cancelled:
+                break
+
+            # 每個平台一組：{描述原文或遊戲名稱: [key, ...]}，相同內容只送一次
+            infos = []
+            jobs = []
+            for platform, entries in platform_descs.items():
+                text_to_keys = {}
+                for key, entry in entries:
+                    has_original = bool(entry.original_desc and entry.original_desc.strip())
+                    if mode == GeminiBatchService.MODE_DESCRIPTION:
+                        if not has_original:
+                            continue
+                        text = entry.original_desc
+                    else:
+                        if has_original:
+                            continue
+                        # 以英文原名產生，不受譯名影響（也共用同一份快取）
+                        text = clean(entry.original_name) or entry.original_name
+                    text_to_keys.setdefault(text, []).append(key)
+                if text_to_keys:
+                    infos.append(text_to_keys)
+                    jobs.append(BatchJob(list(text_to_keys.keys()), platform))
+
+            if not jobs:
+                continue
+
+            def on_job_done(platform_idx, job, result):
+                nonlocal filled, failed
+                text_to_keys = infos[platform_idx]
+                dictionary = platform_dicts[job.platform]
+
+                for text, desc in result.translations.items():
+                    for key in text_to_keys.get(text, []):
+                        if key in dictionary:
+                            entry = dictionary[key]
+                            entry.desc = desc
+                            entry.desc_source = "gemini_batch"
+                            entry.desc_translated_at = time.strftime('%Y-%m-%dT%H:%M:%S')
+                            entry.update_hashes()
+                            filled += 1
+                failed += sum(len(text_to_keys.get(text, [])) for text in result.failed)
+
+                dict_manager.save_dictionary(self.language, job.platform, dictionary)
+                self.log.emit("INFO", "GeminiBatch",
+                              f"[{job.platform}] {label}完成：成功 {result.success_count}，"
+                              f"失敗 {len(result.failed)}")
+
+            self.log.emit("INFO", "GeminiBatch",
+                          f"開始{label}：{sum(len(job.game_names) for job in jobs)} 筆")
+            gemini_batch.translate_many(
+                jobs,
+                self.language,
+                progress_callback=progress_callback,
+                cancel_check=cancel_check,
+                on_job_done=on_job_done,
+                mode=mode
+            )
+
+        return filled, failed
+
 
 class MainWindow(QMainWindow):
     """
@@ -1111,6 +756,10 @@ class MainWindow(QMainWindow):
         self.settings_manager = SettingsManager()
         self.app_settings = self.settings_manager.load()
         self.settings = self._settings_to_dict()
+        # 套用各服務速率限制設定
+        configure_rate_limits(self.app_settings.rate_limits)
+        # 套用字典儲存後端設定
+        set_default_storage(self.app_settings.dictionary_storage)
 
         self._init_ui()
         self._load_settings_to_ui()
@@ -1727,10 +1376,15 @@ class MainWindow(QMainWindow):
         self.stage_worker.error.connect(self._on_stage_error)
         self.stage_worker.start()
 
+    def _has_dictionaries(self) -> bool:
+        """目前語系是否已有字典（階段二是否已執行）"""
+        from ..core import DictionaryManager
+        return bool(DictionaryManager().get_available_platforms(
+            self._get_selected_language()))
+
     def _run_stage_translate(self):
         """階段三：翻譯（非同步）"""
-        lang_dir = get_dictionaries_dir() / self._get_selected_language()
-        if not lang_dir.exists():
+        if not self._has_dictionaries():
             QMessageBox.warning(self, "錯誤", "請先執行階段二（產生字典）")
             return
 
@@ -1759,8 +1413,7 @@ class MainWindow(QMainWindow):
 
     def _run_gemini_batch(self):
         """Gemini 批次翻譯"""
-        lang_dir = get_dictionaries_dir() / self._get_selected_language()
-        if not lang_dir.exists():
+        if not self._has_dictionaries():
             QMessageBox.warning(self, "錯誤", "請先執行階段二（產生字典）")
             return
 
@@ -1793,7 +1446,12 @@ class MainWindow(QMainWindow):
             selected_platforms=selected,
             gemini_api_key=gemini_key,
             batch_size=batch_size,
-            translate_name=self.name_checkbox.isChecked()
+            translate_name=self.name_checkbox.isChecked(),
+            translate_desc=self.desc_checkbox.isChecked(),
+            max_in_flight=self.settings.get('gemini_max_in_flight', 4),
+            rpm=self.settings.get('gemini_rpm', 30),
+            tpm=self.settings.get('gemini_tpm', 1000000),
+            adaptive_batch_size=self.settings.get('gemini_adaptive_batch', True)
         )
         self.stage_worker.progress.connect(self._on_stage_progress)
         self.stage_worker.log.connect(self._on_stage_log)
@@ -1801,7 +1459,8 @@ class MainWindow(QMainWindow):
             lambda r: self._on_stage_finished(
                 "Gemini 批次翻譯",
                 f"翻譯 {r['translated']} 個遊戲\n"
-                f"失敗 {r['failed']} 個（已標記重翻）\n\n"
+                f"失敗 {r['failed']} 個（已標記重翻）\n"
+                f"填入描述 {r.get('desc_filled', 0)} 個\n\n"
                 "失敗的項目可使用「③翻譯」按鈕重新處理"
             )
         )
@@ -6,19 +6,30 @@
 - xml_utils: XML 解析
 - name_cleaner: 檔名清理
 - cache: 全局快取管理
+- rate_limiter: 共用速率限制
+- batch_sizer: 自適應批次大小
+- json_stream: JSON 串流解析
 """
 
 from .logger import Logger, LogLevel
 from .file_utils import ensure_dir, safe_copy, get_file_hash
-from .xml_utils import parse_gamelist, GameInfo
-from .name_cleaner import clean_game_name, get_game_key
-from .cache import GlobalCache, get_global_cache
+from .xml_utils import parse_gamelist, iter_gamelist, get_game_count, GameInfo
+from .name_cleaner import clean, clean_game_name, get_game_key
+from .cache import GlobalCache, get_global_cache, content_key
+from .rate_limiter import (TokenBucket, QuotaLimiter, get_rate_limiter,
+                           get_quota_limiter, configure_rate_limits)
+from .batch_sizer import AdaptiveBatchSizer
+from .json_stream import JsonArrayStream
 
 __all__ = [
     'Logger', 'LogLevel',
     'ensure_dir', 'safe_copy', 'get_file_hash',
-    'parse_gamelist', 'GameInfo',
-    'clean_game_name',
+    'parse_gamelist', 'iter_gamelist', 'get_game_count', 'GameInfo',
+    'clean', 'clean_game_name',
     'get_game_key',
-    'GlobalCache', 'get_global_cache'
+    'GlobalCache', 'get_global_cache', 'content_key',
+    'TokenBucket', 'QuotaLimiter', 'get_rate_limiter', 'get_quota_limiter',
+    'configure_rate_limits',
+    'AdaptiveBatchSizer',
+    'JsonArrayStream'
 ]
@@ -0,0 +1,137 @@
+# 自適應批次大小模組
+"""
+依 LLM 批次請求的回應狀況，在執行期間調整每批次的項目數。
+
+批次越大，每次請求分攤的 prompt 與往返延遲越少，但輸出可能超過
+max_output_tokens 被截斷，模型也較容易漏掉項目或產生格式錯誤。
+以回應截斷、解析失敗、每個項目的輸出 token 數與每秒完成的項目數
+決定下一個批次的大小：
+
+- 回應被截斷或完全無法解析：批次減半，之後不再成長超過失敗大小的 3/4
+- 遺漏項目比例過高：縮小 1/4
+- 依每個項目的平均輸出 token 數，限制在輸出上限（保留餘裕）以內
+- 回應正常：逐步加大；加大後每秒完成的項目數反而下降時，退回先前的大小
+"""
+import threading
+from typing import Optional, Dict, Any
+
+
+class AdaptiveBatchSizer:
+    """
+    執行緒安全的批次大小控制器
+
+    並行送出的批次可能以不同大小送出，只有以目前大小送出的批次
+    會影響成長判斷；截斷與 token 用量則不論大小一律採計。
+    """
+
+    def __init__(self, initial: int, min_size: int = 5, max_size: int = 300,
+                 max_output_tokens: int = 8192, headroom: float = 0.8,
+                 growth: float = 1.25, max_missing_ratio: float = 0.1,
+                 enabled: bool = True):
+        """
+        初始化控制器
+
+        Args:
+            initial: 初始批次大小
+            min_size: 最小批次大小
+            max_size: 最大批次大小
+            max_output_tokens: 模型單次回應的輸出 token 上限
+            headroom: 預估輸出 token 數不超過上限的比例
+            growth: 每次成長的倍數
+            max_missing_ratio: 可接受的遺漏項目比例
+            enabled: False 時固定使用初始大小（只記錄統計）
+        """
+        self._lock = threading.Lock()
+        self.min_size = max(1, int(min_size))
+        self.max_size = max(self.min_size, int(max_size))
+        self.max_output_tokens = max_output_tokens
+        self.headroom = headroom
+        self.growth = growth
+        self.max_missing_ratio = max_missing_ratio
+        self.enabled = enabled
+        self._size = float(min(max(int(initial), self.min_size), self.max_size))
+        self._ceiling = float(self.max_size)
+        self._tokens_per_item: Optional[float] = None
+        self._previous: Optional[tuple] = None  # (成長前的大小, 當時每秒完成的項目數)
+        self._truncated = 0
+        self._parse_failures = 0
+        self._requests = 0
+
+    @property
+    def size(self) -> int:
+        """下一個批次的大小"""
+        return int(self._size)
+
+    def _token_cap(self) -> float:
+        """依每個項目的輸出 token 數估計的批次上限（呼叫端需持有 self._lock）"""
+        if not self._tokens_per_item:
+            return float(self.max_size)
+        return self.max_output_tokens * self.headroom / self._tokens_per_item
+
+    def record(self, size: int, elapsed: float, answered: int,
+               output_tokens: Optional[int] = None,
+               truncated: bool = False) -> None:
+        """
+        記錄一次批次請求的結果
+
+        Args:
+            size: 這次批次的項目數
+            elapsed: 請求耗時（秒）
+            answered: 模型有回答的項目數（包含回答無法翻譯的）
+            output_tokens: 回應的輸出 token 數（SDK 未提供時為 None）
+            truncated: 回應是否因輸出上限被截斷
+        """
+        if size <= 0:
+            return
+
+        with self._lock:
+            self._requests += 1
+            if output_tokens and answered > 0 and not truncated:
+                per_item = output_tokens / answered
+                self._tokens_per_item = per_item if self._tokens_per_item is None \
+                    else self._tokens_per_item * 0.7 + per_item * 0.3
+
+            if truncated or answered == 0:
+                # 截斷或無法解析：這個大小太大
+                if truncated:
+                    self._truncated += 1
+                else:
+                    self._parse_failures += 1
+                if self.enabled:
+                    self._ceiling = max(float(self.min_size), min(self._ceiling, size * 0.75))
+                    self._size = max(float(self.min_size), min(self._size, size * 0.5))
+                    self._previous = None
+                return
+
+            if not self.enabled:
+                return
+
+            if (size - answered) / size > self.max_missing_ratio:
+                # 漏掉太多項目：縮小但不限制之後的成長
+                self._size = max(float(self.min_size), min(self._size, size * 0.75))
+                self._previous = None
+            elif size == self.size:
+                rate = answered / elapsed if elapsed > 0 else float('inf')
+                if self._previous and size > self._previous[0] and rate < self._previous[1] * 0.9:
+                    # 加大後反而變慢：退回先前的大小，不再往上嘗試
+                    self._ceiling = float(self._previous[0])
+                    self._size = float(self._previous[0])
+                    self._previous = None
+                else:
+                    self._previous = (size, rate)
+                    self._size = min(self._size * self.growth, self._ceiling)
+
+            self._size = max(float(self.min_size),
+                             min(self._size, self._token_cap(), float(self.max_size)))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """取得控制器狀態"""
+        with self._lock:
+            return {
+                'size': int(self._size),
+                'ceiling': int(self._ceiling),
+                'tokens_per_item': round(self._tokens_per_item, 1) if self._tokens_per_item else None,
+                'requests': self._requests,
+                'truncated': self._truncated,
+                'parse_failures': self._parse_failures,
+            }
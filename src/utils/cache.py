@@ -3,33 +3,84 @@
 提供持久化快取功能，使用 SQLite 儲存翻譯結果。
 避免重複查詢相同內容，大幅提升效能。
 """
+import atexit
+import hashlib
 import sqlite3
 import json
 import time
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, Iterable
 from threading import Lock
 
 from .file_utils import get_app_data_dir
 
 
+class _NegativeResult:
+    """
+    負面快取標記（查過但確定沒有結果）
+
+    布林值為 False，既有的 `if not cached` 判斷仍然成立；
+    需要區分「沒查過」與「查過但沒有」時，用 `is NEGATIVE_RESULT` 比對。
+    """
+    __slots__ = ()
+
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return 'NEGATIVE_RESULT'
+
+
+# 負面快取標記（單例），資料庫中以 result 為 NULL 儲存
+NEGATIVE_RESULT = _NegativeResult()
+
+
+def content_key(text: str) -> str:
+    """
+    以完整內容產生快取查詢字串（用於遊戲描述等長文字）
+
+    長文字若只取開頭當鍵，開頭相同的內容會互相覆蓋；改用整段文字的雜湊。
+
+    Args:
+        text: 原文
+
+    Returns:
+        SHA-1 十六進位字串
+    """
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
 class GlobalCache:
     """
     全局快取管理器
 
     功能：
     - SQLite 持久化快取
-    - 多執行緒安全
+    - 多執行緒安全（每個執行緒各自持有一條持久連線）
     - 自動過期清理
-    - LRU 記憶體快取
+    - LRU 記憶體快取（OrderedDict，get/set 皆為 O(1)）
+    - 命中次數延遲批次寫回
+    - 背景批次寫入（write-behind）：只寫入新項目，依數量或時間觸發
+    - 負面快取：記錄「查不到」的結果（較短的過期時間），get 時返回 NEGATIVE_RESULT
 
     快取鍵格式：service|query|language
     例如：wikipedia|Super Mario Bros|zh-TW
     """
 
+    # 累積多少個鍵的命中次數後，批次寫回資料庫
+    HIT_FLUSH_THRESHOLD = 500
+
+    # 單一 SQL 語句的參數上限（舊版 SQLite 預設 SQLITE_MAX_VARIABLE_NUMBER 為 999）
+    SQL_PARAM_LIMIT = 900
+
     def __init__(self, cache_file: Optional[Path] = None,
                  max_age_days: int = 30,
-                 memory_cache_size: int = 1000):
+                 memory_cache_size: int = 1000,
+                 flush_threshold: int = 200,
+                 flush_interval: float = 30.0,
+                 negative_max_age_days: float = 7):
         """
         初始化快取管理器
 
@@ -37,6 +88,9 @@ class GlobalCache:
             cache_file: 快取檔案路徑，None 使用預設位置
             max_age_days: 快取過期天數
             memory_cache_size: 記憶體快取大小
+            flush_threshold: 待寫入項目達到此數量時立即寫入資料庫
+            flush_interval: 背景寫入的最長間隔（秒）
+            negative_max_age_days: 負面快取（查不到結果）的過期天數
         """
         if cache_file is None:
             cache_dir = get_app_data_dir() / 'cache'
@@ -46,11 +100,34 @@ class GlobalCache:
         self.cache_file = cache_file
         self.max_age_days = max_age_days
         self.memory_cache_size = memory_cache_size
+        self.flush_threshold = flush_threshold
+        self.flush_interval = flush_interval
+        self.negative_max_age_days = negative_max_age_days
 
-        # 記憶體快取（LRU）
-        self._memory_cache: Dict[str, tuple] = {}  # key -> (value, timestamp)
+        # 記憶體快取（LRU，最近使用的項目在尾端）
+        # key -> (value, timestamp)，value 為 None 表示負面快取
+        self._memory_cache: "OrderedDict[str, tuple]" = OrderedDict()
         self._lock = Lock()
 
+        # 每個執行緒的持久連線，避免每次查詢都重新 connect
+        self._local = threading.local()
+        self._connections: Dict[int, Tuple[threading.Thread, sqlite3.Connection]] = {}
+        self._conn_lock = Lock()
+
+        # 尚未寫回資料庫的命中次數（key -> 次數）
+        self._pending_hits: Dict[str, int] = {}
+
+        # 本次執行中負面快取的命中次數（service -> 次數），即省下的網路查詢
+        self._negative_hits: Dict[str, int] = {}
+
+        # 尚未寫入資料庫的項目（key -> (value, timestamp)），
+        # 與 LRU 分開存放，記憶體快取淘汰時不會遺失
+        self._dirty: Dict[str, tuple] = {}
+        self._flush_lock = Lock()
+        self._flush_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
         # 初始化資料庫
         self._init_db()
 
@@ -76,21 +153,55 @@ class GlobalCache:
 
             # 建立索引加速查詢
             conn.execute('''
-                CREATE INDEX IF NOT EXISTS idx_service_query 
+                CREATE INDEX IF NOT EXISTS idx_service_query
                 ON cache(service, query, language)
             ''')
 
             conn.execute('''
-                CREATE INDEX IF NOT EXISTS idx_created_at 
+                CREATE INDEX IF NOT EXISTS idx_created_at
                 ON cache(created_at)
             ''')
 
             conn.commit()
 
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        取得目前執行緒專屬的資料庫連線
+
+        連線會在同一執行緒內重複使用；建立新連線時順便關閉已結束執行緒
+        留下的連線，避免執行緒池反覆建立時連線數持續累積。
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            return conn
+
+        conn = sqlite3.connect(self.cache_file, timeout=30,
+                               check_same_thread=False)
+        conn.execute('PRAGMA synchronous=NORMAL')
+        self._local.conn = conn
+
+        current = threading.current_thread()
+        with self._conn_lock:
+            for ident, (thread, old_conn) in list(self._connections.items()):
+                if not thread.is_alive():
+                    try:
+                        old_conn.close()
+                    except sqlite3.Error:
+                        pass
+                    del self._connections[ident]
+            self._connections[current.ident] = (current, conn)
+
+        return conn
+
     def _make_key(self, service: str, query: str, language: str) -> str:
         """生成快取鍵"""
         return f"{service}|{query}|{language}"
 
+    def _is_fresh(self, value: Optional[str], timestamp: float, now: float) -> bool:
+        """檢查項目是否未過期（負面快取使用較短的過期時間）"""
+        max_age_days = self.negative_max_age_days if value is None else self.max_age_days
+        return now - timestamp < max_age_days * 86400
+
     def get(self, service: str, query: str, language: str) -> Optional[str]:
         """
         取得快取結果
@@ -101,59 +212,158 @@ class GlobalCache:
             language: 目標語系
 
         Returns:
-            快取的結果，找不到返回 None
+            快取的結果；記錄為查不到時返回 NEGATIVE_RESULT；沒有快取返回 None
         """
+        return self._lookup(service, query, language, record=True)
+
+    def peek(self, service: str, query: str, language: str) -> Optional[str]:
+        """
+        查看快取結果，不計入命中次數與負面快取統計
+
+        用於內部判斷（例如確認剛才的查詢是否記錄為查不到），
+        避免實際已連網的查詢也被算成「省下的網路查詢」。
+
+        Returns:
+            與 get 相同
+        """
+        return self._lookup(service, query, language, record=False)
+
+    def _lookup(self, service: str, query: str, language: str,
+                record: bool) -> Optional[str]:
+        """查詢快取（record 為 False 時不記錄命中）"""
         key = self._make_key(service, query, language)
 
         # 先查記憶體快取
+        need_flush = False
         with self._lock:
-            if key in self._memory_cache:
-                value, timestamp = self._memory_cache[key]
+            # 記憶體快取找不到時，再看待寫入佇列（可能已被 LRU 淘汰但尚未落地）
+            item = self._memory_cache.get(key) or self._dirty.get(key)
+            if item is not None:
+                value, timestamp = item
                 # 檢查是否過期
-                if time.time() - timestamp < self.max_age_days * 86400:
-                    return value
+                if self._is_fresh(value, timestamp, time.time()):
+                    self._add_to_memory_cache(key, value, timestamp)
+                    if record:
+                        need_flush = self._record_hit(key, service, value)
                 else:
                     # 過期，從記憶體移除
-                    del self._memory_cache[key]
+                    self._memory_cache.pop(key, None)
+                    item = None
+
+        if item is not None:
+            if need_flush:
+                self._flush_hits()
+            return NEGATIVE_RESULT if value is None else value
 
         # 查詢資料庫
         try:
-            with sqlite3.connect(self.cache_file, timeout=10.0) as conn:
-                cursor = conn.execute('''
-                    SELECT result, created_at FROM cache 
-                    WHERE key = ?
-                ''', (key,))
-
-                row = cursor.fetchone()
-                if row:
-                    result, created_at = row
-
-                    # 檢查是否過期
-                    age_days = (time.time() - created_at) / 86400
-                    if age_days < self.max_age_days:
-                        # 更新命中次數
-                        conn.execute('''
-                            UPDATE cache SET hit_count = hit_count + 1 
-                            WHERE key = ?
-                        ''', (key,))
-                        conn.commit()
-
-                        # 加入記憶體快取
-                        with self._lock:
-                            self._add_to_memory_cache(key, result, created_at)
-
-                        return result
-                    else:
-                        # 過期，刪除
-                        conn.execute('DELETE FROM cache WHERE key = ?', (key,))
-                        conn.commit()
+            conn = self._get_connection()
+            row = conn.execute('''
+                SELECT result, created_at FROM cache
+                WHERE key = ?
+            ''', (key,)).fetchone()
+
+            if row:
+                result, created_at = row
+
+                # 檢查是否過期
+                if self._is_fresh(result, created_at, time.time()):
+                    # 加入記憶體快取，命中次數延遲寫回
+                    with self._lock:
+                        self._add_to_memory_cache(key, result, created_at)
+                        if record:
+                            need_flush = self._record_hit(key, service, result)
+                    if need_flush:
+                        self._flush_hits()
+                    return NEGATIVE_RESULT if result is None else result
+                else:
+                    # 過期，刪除
+                    conn.execute('DELETE FROM cache WHERE key = ?', (key,))
+                    conn.commit()
 
         except sqlite3.Error as e:
             print(f"快取讀取錯誤: {e}")
 
         return None
 
-    def set(self, service: str, query: str, language: str, result: str):
+    def get_many(self, service: str, queries: Iterable[str],
+                 language: str) -> Dict[str, str]:
+        """
+        批次取得快取結果
+
+        先查記憶體快取，剩下的以 `WHERE key IN (...)` 分段查詢資料庫，
+        每段不超過 SQL_PARAM_LIMIT 個參數。
+
+        Args:
+            service: 服務名稱
+            queries: 查詢內容清單
+            language: 目標語系
+
+        Returns:
+            {查詢內容: 快取結果}，只包含有命中的項目；
+            記錄為查不到的項目值為 NEGATIVE_RESULT
+        """
+        now = time.time()
+        results: Dict[str, Any] = {}
+        missing: Dict[str, str] = {}  # key -> query
+
+        need_flush = False
+        with self._lock:
+            for query in queries:
+                if query in results:
+                    continue
+                key = self._make_key(service, query, language)
+                item = self._memory_cache.get(key) or self._dirty.get(key)
+                if item is not None:
+                    value, timestamp = item
+                    if self._is_fresh(value, timestamp, now):
+                        self._add_to_memory_cache(key, value, timestamp)
+                        need_flush = self._record_hit(
+                            key, service, value) or need_flush
+                        results[query] = NEGATIVE_RESULT if value is None else value
+                        continue
+                    self._memory_cache.pop(key, None)
+                missing[key] = query
+
+        if missing:
+            try:
+                conn = self._get_connection()
+                keys = list(missing.keys())
+                expired = []
+                for i in range(0, len(keys), self.SQL_PARAM_LIMIT):
+                    chunk = keys[i:i + self.SQL_PARAM_LIMIT]
+                    placeholders = ','.join('?' * len(chunk))
+                    rows = conn.execute(
+                        f'SELECT key, result, created_at FROM cache '
+                        f'WHERE key IN ({placeholders})', chunk).fetchall()
+
+                    with self._lock:
+                        for key, result, created_at in rows:
+                            if self._is_fresh(result, created_at, now):
+                                self._add_to_memory_cache(
+                                    key, result, created_at)
+                                need_flush = self._record_hit(
+                                    key, service, result) or need_flush
+                                results[missing[key]] = (
+                                    NEGATIVE_RESULT if result is None else result)
+                            else:
+                                expired.append((key,))
+
+                # 順便清掉過期項目
+                if expired:
+                    conn.executemany(
+                        'DELETE FROM cache WHERE key = ?', expired)
+                    conn.commit()
+
+            except sqlite3.Error as e:
+                print(f"快取批次讀取錯誤: {e}")
+
+        if need_flush:
+            self._flush_hits()
+
+        return results
+
+    def set(self, service: str, query: str, language: str, result: Optional[str]):
         """
         設定快取結果（只寫入記憶體，避免鎖競爭）
 
@@ -161,78 +371,282 @@ class GlobalCache:
             service: 服務名稱
             query: 查詢內容
             language: 目標語系
-            result: 翻譯結果
+            result: 翻譯結果；None 或空字串視為「查不到」，記錄為負面快取
         """
-        if not result:  # 不快取空結果
+        if not result:
+            self.set_negative(service, query, language)
             return
 
         key = self._make_key(service, query, language)
         timestamp = int(time.time())
 
-        # 只加入記憶體快取，避免資料庫寫入鎖競爭
+        # 只加入記憶體快取與待寫入佇列，由背景執行緒批次寫入資料庫
         with self._lock:
             self._add_to_memory_cache(key, result, timestamp)
+            self._dirty[key] = (result, timestamp)
+            dirty_count = len(self._dirty)
 
-    def flush_to_db(self) -> int:
+        self._schedule_flush(dirty_count)
+
+    def set_negative(self, service: str, query: str, language: str):
+        """
+        記錄查詢沒有結果（負面快取）
+
+        只應在確定查不到時呼叫（例如 API 正常回應但沒有結果），
+        網路錯誤等暫時性失敗不應記錄。過期時間為 negative_max_age_days。
+
+        Args:
+            service: 服務名稱
+            query: 查詢內容
+            language: 目標語系
+        """
+        key = self._make_key(service, query, language)
+        timestamp = int(time.time())
+
+        with self._lock:
+            self._add_to_memory_cache(key, None, timestamp)
+            self._dirty[key] = (None, timestamp)
+            dirty_count = len(self._dirty)
+
+        self._schedule_flush(dirty_count)
+
+    def delete(self, service: str, query: Optional[str] = None,
+               language: Optional[str] = None) -> int:
         """
-        將記憶體快取批次寫入資料庫
-        在平台翻譯完成後呼叫，避免翻譯時頻繁寫入
+        刪除快取項目
+
+        Args:
+            service: 服務名稱
+            query: 查詢內容，None 表示該服務的全部項目
+            language: 目標語系，None 表示所有語系
 
         Returns:
-            寫入的項目數量
+            從資料庫刪除的項目數量
         """
-        if not self._memory_cache:
-            return 0
+        def matches(key: str) -> bool:
+            parts = key.split('|', 2)
+            if len(parts) != 3 or parts[0] != service:
+                return False
+            if query is not None and parts[1] != query:
+                return False
+            return language is None or parts[2] == language
+
+        with self._lock:
+            for store in (self._memory_cache, self._dirty, self._pending_hits):
+                for key in [k for k in store if matches(k)]:
+                    del store[key]
+
+        conditions = ['service = ?']
+        params = [service]
+        if query is not None:
+            conditions.append('query = ?')
+            params.append(query)
+        if language is not None:
+            conditions.append('language = ?')
+            params.append(language)
 
         try:
-            with sqlite3.connect(self.cache_file, timeout=30) as conn:
+            conn = self._get_connection()
+            cursor = conn.execute(
+                f'DELETE FROM cache WHERE {" AND ".join(conditions)}', params)
+            conn.commit()
+            return cursor.rowcount
+
+        except sqlite3.Error as e:
+            print(f"快取刪除錯誤: {e}")
+            return 0
+
+    def set_many(self, service: str, results: Dict[str, str], language: str):
+        """
+        批次設定快取結果（只寫入記憶體與待寫入佇列）
+
+        Args:
+            service: 服務名稱
+            results: {查詢內容: 結果}，結果為 None 或空字串時記錄為負面快取
+            language: 目標語系
+        """
+        timestamp = int(time.time())
+
+        with self._lock:
+            for query, result in results.items():
+                value = result or None
+                key = self._make_key(service, query, language)
+                self._add_to_memory_cache(key, value, timestamp)
+                self._dirty[key] = (value, timestamp)
+            dirty_count = len(self._dirty)
+
+        self._schedule_flush(dirty_count)
+
+    def flush_to_db(self) -> int:
+        """
+        將尚未持久化的快取項目批次寫入資料庫
+
+        只寫入 set/set_many 之後還沒落地的項目（dirty set），
+        已寫入過的項目不會重複寫。背景執行緒會依數量/時間自動呼叫，
+        平台翻譯完成後也可手動呼叫確保全部落地。
+
+        Returns:
+            寫入的項目數量
+        """
+        # 序列化寫入，避免兩次 flush 交錯時舊值覆蓋新值
+        with self._flush_lock:
+            with self._lock:
+                if not self._dirty:
+                    pending = {}
+                else:
+                    pending = self._dirty
+                    self._dirty = {}
+                # 尚未落地的項目，其命中次數隨寫入一起帶入（UPDATE 找不到這些列）
+                hits = {key: self._pending_hits.pop(key)
+                        for key in pending if key in self._pending_hits}
+
+            written = 0
+            if pending:
                 items = []
-                with self._lock:
-                    for key, (value, timestamp) in list(self._memory_cache.items()):
-                        # 解析 key
-                        parts = key.split('|', 2)
-                        if len(parts) == 3:
-                            service, query, language = parts
-                            items.append(
-                                (key, service, query, language, value, int(timestamp)))
-
-                # 批次插入
-                if items:
+                for key, (value, timestamp) in pending.items():
+                    # 解析 key
+                    parts = key.split('|', 2)
+                    if len(parts) == 3:
+                        service, query, language = parts
+                        items.append(
+                            (key, service, query, language, value, int(timestamp),
+                             hits.get(key, 0)))
+
+                try:
+                    conn = self._get_connection()
+                    # 批次寫入（保留既有的 hit_count）
                     conn.executemany('''
-                        INSERT OR REPLACE INTO cache 
-                        (key, service, query, language, result, created_at)
-                        VALUES (?, ?, ?, ?, ?, ?)
+                        INSERT INTO cache
+                        (key, service, query, language, result, created_at, hit_count)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(key) DO UPDATE SET
+                            result = excluded.result,
+                            created_at = excluded.created_at,
+                            hit_count = hit_count + excluded.hit_count
                     ''', items)
                     conn.commit()
-                    return len(items)
+                    written = len(items)
+
+                except sqlite3.Error as e:
+                    print(f"批次寫入快取錯誤: {e}")
+                    # 寫入失敗，放回佇列等待下次重試（不覆蓋期間新寫入的值）
+                    with self._lock:
+                        for key, item in pending.items():
+                            self._dirty.setdefault(key, item)
+                        for key, count in hits.items():
+                            self._pending_hits[key] = self._pending_hits.get(
+                                key, 0) + count
+                    return 0
+
+        # 順便寫回累積的命中次數
+        self._flush_hits()
+        return written
+
+    def _schedule_flush(self, dirty_count: int):
+        """
+        排程背景寫入
 
+        第一次寫入時才啟動背景執行緒；待寫入數量達到 flush_threshold 時
+        立即喚醒，否則由背景執行緒每 flush_interval 秒檢查一次。
+        """
+        if self._flusher is None:
+            with self._conn_lock:
+                if self._flusher is None and not self._stop_event.is_set():
+                    self._flusher = threading.Thread(
+                        target=self._flusher_loop,
+                        name='GlobalCacheFlusher',
+                        daemon=True)
+                    self._flusher.start()
+
+        if dirty_count >= self.flush_threshold:
+            self._flush_event.set()
+
+    def _flusher_loop(self):
+        """背景寫入執行緒：達到數量或時間門檻就寫入資料庫"""
+        while not self._stop_event.is_set():
+            self._flush_event.wait(self.flush_interval)
+            self._flush_event.clear()
+            if self._dirty:
+                self.flush_to_db()
+
+    def _record_hit(self, key: str, service: str, value: Optional[str]) -> bool:
+        """
+        記錄一次命中（呼叫端需持有 self._lock）
+
+        Args:
+            key: 快取鍵
+            service: 服務名稱
+            value: 命中的值，None 表示負面快取
+
+        Returns:
+            是否已累積到需要寫回資料庫的數量
+        """
+        self._pending_hits[key] = self._pending_hits.get(key, 0) + 1
+        if value is None:
+            self._negative_hits[service] = self._negative_hits.get(service, 0) + 1
+        return len(self._pending_hits) >= self.HIT_FLUSH_THRESHOLD
+
+    def _flush_hits(self) -> int:
+        """
+        將累積的命中次數以單一交易批次寫回資料庫
+
+        Returns:
+            寫回的鍵數量
+        """
+        with self._lock:
+            # 尚未落地的項目由 flush_to_db 連同寫入，這裡先保留
+            pending = {key: count for key, count in self._pending_hits.items()
+                       if key not in self._dirty}
+            if not pending:
+                return 0
+            for key in pending:
+                del self._pending_hits[key]
+
+        try:
+            conn = self._get_connection()
+            conn.executemany(
+                'UPDATE cache SET hit_count = hit_count + ? WHERE key = ?',
+                [(count, key) for key, count in pending.items()])
+            conn.commit()
         except sqlite3.Error as e:
-            print(f"批次寫入快取錯誤: {e}")
+            print(f"命中次數寫入錯誤: {e}")
             return 0
 
-        return 0
-
-    def _add_to_memory_cache(self, key: str, value: str, timestamp: float):
-        """加入記憶體快取（LRU）"""
-        # 如果超過大小限制，移除最舊的
-        if len(self._memory_cache) >= self.memory_cache_size:
-            # 找出最舊的項目
-            oldest_key = min(self._memory_cache.items(),
-                             key=lambda x: x[1][1])[0]
-            del self._memory_cache[oldest_key]
+        return len(pending)
 
+    def _add_to_memory_cache(self, key: str, value: Optional[str], timestamp: float):
+        """加入記憶體快取（LRU，呼叫端需持有 self._lock）"""
+        if key in self._memory_cache:
+            self._memory_cache.move_to_end(key)
         self._memory_cache[key] = (value, timestamp)
 
+        # 超過大小限制時，移除最久未使用的項目
+        while len(self._memory_cache) > self.memory_cache_size:
+            self._memory_cache.popitem(last=False)
+
+    def get_negative_hits(self) -> Dict[str, int]:
+        """
+        取得本次執行中各服務的負面快取命中次數
+
+        Returns:
+            {服務名稱: 命中次數}，每次命中代表省下一次網路查詢
+        """
+        with self._lock:
+            return dict(self._negative_hits)
+
     def clear_expired(self):
         """清理過期快取"""
         try:
-            with sqlite3.connect(self.cache_file) as conn:
-                cutoff = int(time.time() - self.max_age_days * 86400)
-                conn.execute(
-                    'DELETE FROM cache WHERE created_at < ?', (cutoff,))
-                deleted = conn.total_changes
-                conn.commit()
-                return deleted
+            conn = self._get_connection()
+            now = time.time()
+            cutoff = int(now - self.max_age_days * 86400)
+            negative_cutoff = int(now - self.negative_max_age_days * 86400)
+            cursor = conn.execute(
+                'DELETE FROM cache WHERE created_at < ? '
+                'OR (result IS NULL AND created_at < ?)',
+                (cutoff, negative_cutoff))
+            conn.commit()
+            return cursor.rowcount
 
         except sqlite3.Error as e:
             print(f"快取清理錯誤: {e}")
@@ -240,38 +654,57 @@ class GlobalCache:
 
     def get_stats(self) -> Dict[str, Any]:
         """取得快取統計資訊"""
-        try:
-            with sqlite3.connect(self.cache_file) as conn:
-                cursor = conn.execute('''
-                    SELECT 
-                        COUNT(*) as total,
-                        SUM(hit_count) as total_hits,
-                        COUNT(DISTINCT service) as services,
-                        COUNT(DISTINCT language) as languages
-                    FROM cache
-                ''')
-                row = cursor.fetchone()
-
-                stats = {
-                    'total_entries': row[0],
-                    'total_hits': row[1] or 0,
-                    'services': row[2],
-                    'languages': row[3],
-                    'memory_cache_size': len(self._memory_cache),
-                    'db_size_mb': self.cache_file.stat().st_size / 1024 / 1024
-                }
+        # 先寫回累積的命中次數，統計才會準確
+        self._flush_hits()
 
-                # 各服務統計
-                cursor = conn.execute('''
-                    SELECT service, COUNT(*), SUM(hit_count)
-                    FROM cache GROUP BY service
-                ''')
-                stats['by_service'] = {
-                    row[0]: {'count': row[1], 'hits': row[2] or 0}
-                    for row in cursor.fetchall()
+        try:
+            conn = self._get_connection()
+            cursor = conn.execute('''
+                SELECT
+                    COUNT(*) as total,
+                    SUM(hit_count) as total_hits,
+                    COUNT(DISTINCT service) as services,
+                    COUNT(DISTINCT language) as languages,
+                    SUM(result IS NULL) as negative,
+                    SUM(CASE WHEN result IS NULL THEN hit_count ELSE 0 END)
+                FROM cache
+            ''')
+            row = cursor.fetchone()
+
+            session_negative_hits = self.get_negative_hits()
+
+            stats = {
+                'total_entries': row[0],
+                'total_hits': row[1] or 0,
+                'services': row[2],
+                'languages': row[3],
+                'negative_entries': row[4] or 0,
+                # 負面快取累計命中次數，即省下的網路查詢次數
+                'negative_hits': row[5] or 0,
+                'negative_hits_session': sum(session_negative_hits.values()),
+                'memory_cache_size': len(self._memory_cache),
+                'pending_writes': len(self._dirty),
+                'db_size_mb': self.cache_file.stat().st_size / 1024 / 1024
+            }
+
+            # 各服務統計
+            cursor = conn.execute('''
+                SELECT service, COUNT(*), SUM(hit_count), SUM(result IS NULL),
+                       SUM(CASE WHEN result IS NULL THEN hit_count ELSE 0 END)
+                FROM cache GROUP BY service
+            ''')
+            stats['by_service'] = {
+                row[0]: {
+                    'count': row[1],
+                    'hits': row[2] or 0,
+                    'negative': row[3] or 0,
+                    'negative_hits': row[4] or 0,
+                    'negative_hits_session': session_negative_hits.get(row[0], 0),
                 }
+                for row in cursor.fetchall()
+            }
 
-                return stats
+            return stats
 
         except sqlite3.Error as e:
             print(f"統計資訊錯誤: {e}")
@@ -280,16 +713,37 @@ class GlobalCache:
     def clear_all(self):
         """清空所有快取"""
         try:
-            with sqlite3.connect(self.cache_file) as conn:
-                conn.execute('DELETE FROM cache')
-                conn.commit()
+            conn = self._get_connection()
+            conn.execute('DELETE FROM cache')
+            conn.commit()
 
             with self._lock:
                 self._memory_cache.clear()
+                self._pending_hits.clear()
+                self._negative_hits.clear()
+                self._dirty.clear()
 
         except sqlite3.Error as e:
             print(f"清空快取錯誤: {e}")
 
+    def close(self):
+        """停止背景寫入、寫入所有待寫入項目，並關閉所有執行緒的連線"""
+        self._stop_event.set()
+        self._flush_event.set()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join(timeout=5)
+
+        self.flush_to_db()
+
+        with self._conn_lock:
+            for _, conn in self._connections.values():
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._connections.clear()
+        self._local = threading.local()
+
 
 # 全局單例
 _global_cache: Optional[GlobalCache] = None
@@ -304,5 +758,7 @@ def get_global_cache() -> GlobalCache:
         with _cache_lock:
             if _global_cache is None:
                 _global_cache = GlobalCache()
+                # 程式結束前寫入尚未落地的快取
+                atexit.register(_global_cache.close)
 
     return _global_cache
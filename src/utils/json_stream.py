@@ -0,0 +1,115 @@
+# JSON 串流解析模組
+"""
+逐段解析 LLM 串流回應中的 JSON 陣列。
+
+每收到一段文字就取出已完整的元素，不需要等整個回應結束才解析；
+回應在中途被截斷時，已完整的元素仍然有效。
+單一元素格式錯誤只影響該元素，不會讓整個回應作廢。
+"""
+import json
+from typing import Any, Callable, List, Optional
+
+
+class JsonArrayStream:
+    """
+    JSON 物件陣列的增量解析器
+
+    只處理元素為物件的陣列（結構化輸出的格式），
+    陣列開始前的文字（例如 markdown 程式碼區塊標記）與結束後的文字會被忽略。
+
+    使用方式：
+        stream = JsonArrayStream()
+        for chunk in response:
+            for item in stream.feed(chunk.text):
+                ...
+        stream.complete  # 是否收到陣列結尾
+    """
+
+    def __init__(self, repair: Optional[Callable[[str], str]] = None):
+        """
+        初始化解析器
+
+        Args:
+            repair: 元素無法解析時用來修復 JSON 字串的函式（修復後再試一次）
+        """
+        self.repair = repair
+        self.items: List[Any] = []
+        self.errors = 0           # 無法解析的元素數
+        self.started = False      # 是否已收到陣列開頭
+        self.complete = False     # 是否已收到陣列結尾
+        self._parts: List[str] = []
+        self._element: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    @property
+    def text(self) -> str:
+        """目前收到的完整文字"""
+        return ''.join(self._parts)
+
+    def feed(self, chunk: str) -> List[Any]:
+        """
+        送入一段文字
+
+        Args:
+            chunk: 回應的下一段文字
+
+        Returns:
+            這段文字中完成的元素
+        """
+        self._parts.append(chunk)
+        completed = []
+
+        for ch in chunk:
+            if self.complete:
+                break
+            if not self.started:
+                if ch == '[':
+                    self.started = True
+                continue
+
+            if self._depth == 0:
+                # 元素之間：只關心物件開頭與陣列結尾（逗號、空白略過）
+                if ch == '{':
+                    self._depth = 1
+                    self._element = [ch]
+                elif ch == ']':
+                    self.complete = True
+                continue
+
+            self._element.append(ch)
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == '{':
+                self._depth += 1
+            elif ch == '}':
+                self._depth -= 1
+                if self._depth == 0:
+                    item = self._decode(''.join(self._element))
+                    if item is not None:
+                        self.items.append(item)
+                        completed.append(item)
+
+        return completed
+
+    def _decode(self, element: str) -> Optional[Any]:
+        """解析單一元素，失敗時以 repair 修復後再試一次"""
+        try:
+            return json.loads(element)
+        except json.JSONDecodeError:
+            pass
+        if self.repair is not None:
+            try:
+                return json.loads(self.repair(element))
+            except json.JSONDecodeError:
+                pass
+        self.errors += 1
+        return None
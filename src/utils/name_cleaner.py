@@ -1,9 +1,74 @@
 # 檔名清理工具
 """
 提供遊戲檔名清理相關的工具函式。
+
+清理規則以預先編譯的 (pattern, 取代字串) 步驟依序套用；同一個名稱在翻譯過程中
+會被清理多次（翻譯名稱、搜尋描述、清除快取、跨平台去重），因此結果以 LRU 快取。
 """
 import re
-from typing import Tuple
+from functools import lru_cache
+from typing import List, Pattern, Tuple
+
+
+# 清理結果快取的項目數（一般遊戲庫的名稱數量都在此範圍內）
+CLEAN_CACHE_SIZE = 32768
+
+_CleanSteps = List[Tuple[Pattern, str]]
+
+# 括號內容（區域碼、版本號等）
+_PARENS = re.compile(r'\s*\([^)]*\)')
+_BRACKETS = re.compile(r'\s*\[[^\]]*\]')
+_SPACES = re.compile(r'\s+')
+
+# clean() 使用的步驟（查詢翻譯用的名稱）
+_CLEAN_STEPS: _CleanSteps = [
+    (re.compile(r'\.[a-zA-Z0-9]+$'), ''),  # 副檔名
+    (_PARENS, ''),
+    (_BRACKETS, ''),
+    (re.compile(r'\s*(Rev\s*\d+|v\d+\.?\d*|Ver\.?\s*\d+)', re.IGNORECASE), ''),
+]
+
+# clean_game_name() 使用的步驟（另外移除光碟編號、檔案編號等）
+_GAME_NAME_STEPS: _CleanSteps = [
+    (re.compile(r'\.[a-zA-Z0-9]{2,4}$'), ''),  # 副檔名
+    (_PARENS, ''),
+    (_BRACKETS, ''),
+    # 常見後綴
+    (re.compile(r'\s*-\s*Disc\s*\d+', re.IGNORECASE), ''),
+    (re.compile(r'\s*-\s*Part\s*\d+', re.IGNORECASE), ''),
+    (re.compile(r'\s*-\s*Volume\s*\d+', re.IGNORECASE), ''),
+    (re.compile(r'\s*Rev\s*\d+', re.IGNORECASE), ''),
+    (re.compile(r'\s*v\d+\.?\d*', re.IGNORECASE), ''),
+    (re.compile(r'\s*Ver\.?\s*\d+', re.IGNORECASE), ''),
+    # 檔案編號格式 (例如: 251026-003036_)
+    (re.compile(r'^\d{6}-\d{6}_'), ''),
+    (re.compile(r'_\d{6}-\d{6}$'), ''),
+]
+
+# clean_game_name() 清理空白後再移除的頭尾連字號與底線
+_EDGE_DASH = re.compile(r'^-\s*|\s*-$')
+_EDGE_UNDERSCORE = re.compile(r'^_\s*|\s*_$')
+
+
+def _apply_steps(name: str, steps: _CleanSteps) -> str:
+    """依序套用清理步驟，最後合併多餘空白"""
+    for pattern, replacement in steps:
+        name = pattern.sub(replacement, name)
+    return _SPACES.sub(' ', name).strip()
+
+
+@lru_cache(maxsize=CLEAN_CACHE_SIZE)
+def clean(filename: str) -> str:
+    """
+    清理檔名，移除副檔名、區域碼、版本號等雜訊，作為查詢翻譯用的名稱
+
+    Args:
+        filename: 原始檔名或 gamelist 中的名稱
+
+    Returns:
+        清理後的遊戲名稱
+    """
+    return _apply_steps(filename, _CLEAN_STEPS)
 
 
 def get_game_key(path: str) -> str:
@@ -34,6 +99,7 @@ def get_game_key(path: str) -> str:
     return key
 
 
+@lru_cache(maxsize=CLEAN_CACHE_SIZE)
 def clean_game_name(filename: str) -> str:
     """
     清理遊戲檔名，移除雜訊保留遊戲名稱
@@ -52,37 +118,11 @@ def clean_game_name(filename: str) -> str:
     Returns:
         清理後的遊戲名稱
     """
-    name = filename
-
-    # 移除副檔名
-    name = re.sub(r'\.[a-zA-Z0-9]{2,4}$', '', name)
-
-    # 移除小括號內容
-    name = re.sub(r'\s*\([^)]*\)', '', name)
-
-    # 移除中括號內容
-    name = re.sub(r'\s*\[[^\]]*\]', '', name)
-
-    # 移除常見後綴
-    suffixes = [
-        r'\s*-\s*Disc\s*\d+',
-        r'\s*-\s*Part\s*\d+',
-        r'\s*-\s*Volume\s*\d+',
-        r'\s*Rev\s*\d+',
-        r'\s*v\d+\.?\d*',
-        r'\s*Ver\.?\s*\d+',
-    ]
-    for suffix in suffixes:
-        name = re.sub(suffix, '', name, flags=re.IGNORECASE)
-
-    # 移除檔案編號格式 (例如: 251026-003036_)
-    name = re.sub(r'^\d{6}-\d{6}_', '', name)
-    name = re.sub(r'_\d{6}-\d{6}$', '', name)
+    name = _apply_steps(filename, _GAME_NAME_STEPS)
 
-    # 清理多餘空白與連字號
-    name = re.sub(r'\s+', ' ', name).strip()
-    name = re.sub(r'^-\s*|\s*-$', '', name)
-    name = re.sub(r'^_\s*|\s*_$', '', name)
+    # 清理頭尾的連字號與底線
+    name = _EDGE_DASH.sub('', name)
+    name = _EDGE_UNDERSCORE.sub('', name)
 
     return name
 
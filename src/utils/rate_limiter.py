@@ -0,0 +1,425 @@
+# 速率限制模組
+"""
+提供多執行緒共用的 token bucket 速率限制器。
+
+每個外部服務（主機/API）共用一個限制器，不論建立多少個服務實例、
+開多少個翻譯執行緒，總請求速率都不會超過設定值。
+遇到 HTTP 429 時依 Retry-After 暫停並自動降速，之後逐步恢復。
+"""
+import time
+import threading
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional, Dict, Any, List
+
+
+class TokenBucket:
+    """
+    執行緒安全的 token bucket
+
+    - rate：每秒補充的 token 數（即穩定狀態下每秒請求數）
+    - burst：最多可累積的 token 數（允許短時間爆量的請求數）
+
+    acquire 採預約制：在鎖內扣除 token 並算出需要等待的時間，
+    鎖外再 sleep，多個執行緒會依序排隊而不會同時通過檢查。
+
+    被限流（429）時速率減半（不低於原本的 1/min_rate_divisor），
+    之後每次成功請求逐步恢復到設定值（AIMD）。
+    """
+
+    def __init__(self, rate: float, burst: float = 1,
+                 min_rate_divisor: float = 8.0,
+                 recovery_step: float = 0.1):
+        """
+        初始化限制器
+
+        Args:
+            rate: 每秒請求數
+            burst: 最大爆量請求數
+            min_rate_divisor: 自動降速的下限（設定速率除以此值）
+            recovery_step: 每次成功請求恢復的速率（設定速率的比例）
+        """
+        self._lock = threading.Lock()
+        self.min_rate_divisor = min_rate_divisor
+        self.recovery_step = recovery_step
+        self._throttle_count = 0
+        self.configure(rate, burst)
+        self._tokens = self.burst
+        self._last_refill = time.monotonic()
+
+    def configure(self, rate: float, burst: float = 1) -> None:
+        """
+        更新速率設定（保留目前累積的 token）
+
+        Args:
+            rate: 每秒請求數
+            burst: 最大爆量請求數
+        """
+        rate = max(float(rate), 0.001)
+        burst = max(float(burst), 1.0)
+        with self._lock:
+            self.rate = rate
+            self.burst = burst
+            self._current_rate = rate
+            if hasattr(self, '_tokens'):
+                self._tokens = min(self._tokens, burst)
+
+    @property
+    def current_rate(self) -> float:
+        """目前實際使用的速率（被限流後可能低於設定值）"""
+        return self._current_rate
+
+    @property
+    def throttle_count(self) -> int:
+        """累計被限流的次數"""
+        return self._throttle_count
+
+    def _refill(self, now: float) -> None:
+        """補充 token（呼叫端需持有 self._lock）"""
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self.burst,
+                               self._tokens + elapsed * self._current_rate)
+            self._last_refill = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        預約 token（不等待）
+
+        Args:
+            tokens: 需要的 token 數
+
+        Returns:
+            需要等待的秒數（0 表示可以立即送出）
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= tokens
+            # 被限流暫停時，_last_refill 會在未來，token 從那時才開始補充
+            wait = max(self._last_refill - now, 0.0)
+            if self._tokens < 0:
+                wait += -self._tokens / self._current_rate
+            return wait
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        取得 token，必要時等待
+
+        Args:
+            tokens: 需要的 token 數
+
+        Returns:
+            實際等待的秒數
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def report_throttled(self, retry_after: Optional[float] = None) -> None:
+        """
+        回報被限流（HTTP 429 / 配額用盡）
+
+        暫停所有使用此限制器的請求 retry_after 秒（未提供時依目前速率估算），
+        並將速率減半。
+
+        Args:
+            retry_after: 伺服器要求的等待秒數
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._throttle_count += 1
+            min_rate = self.rate / self.min_rate_divisor
+            self._current_rate = max(self._current_rate / 2, min_rate)
+            if retry_after is None:
+                retry_after = 1.0 / self._current_rate
+            # 暫停期間不累積 token，恢復後也不會瞬間爆量
+            self._tokens = min(self._tokens, 0.0)
+            self._last_refill = max(self._last_refill, now + retry_after)
+
+    def report_success(self) -> None:
+        """回報請求成功，逐步恢復被降低的速率"""
+        if self._current_rate >= self.rate:
+            return
+        with self._lock:
+            self._current_rate = min(
+                self.rate, self._current_rate + self.rate * self.recovery_step)
+
+    def report_response(self, status_code: int,
+                        retry_after: Optional[str] = None) -> None:
+        """
+        依 HTTP 回應狀態調整速率
+
+        Args:
+            status_code: HTTP 狀態碼
+            retry_after: Retry-After 標頭值
+        """
+        if status_code == 429 or (status_code == 503 and retry_after):
+            self.report_throttled(parse_retry_after(retry_after))
+        elif status_code < 400:
+            self.report_success()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """取得限制器狀態"""
+        with self._lock:
+            return {
+                'rate': self.rate,
+                'burst': self.burst,
+                'current_rate': self._current_rate,
+                'throttle_count': self._throttle_count,
+            }
+
+
+class QuotaLimiter:
+    """
+    每分鐘請求數（RPM）與每分鐘 token 數（TPM）的配額限制器
+
+    Gemini 等 LLM API 以每分鐘的請求數與 token 數計算配額，
+    並行送出多個批次時以 60 秒滑動視窗記錄已送出的請求，
+    任一項配額用盡時等待最舊的紀錄移出視窗。
+
+    送出前只能估算 token 數，取得回應後以 settle() 更正為實際用量。
+    """
+
+    WINDOW = 60.0  # 配額計算區間（秒）
+
+    def __init__(self, rpm: int = 0, tpm: int = 0):
+        """
+        初始化限制器
+
+        Args:
+            rpm: 每分鐘請求數上限（0 表示不限制）
+            tpm: 每分鐘 token 數上限（0 表示不限制）
+        """
+        self._lock = threading.Lock()
+        self._entries = deque()  # [送出時間, token 數]
+        self._tokens = 0
+        self.configure(rpm, tpm)
+
+    def configure(self, rpm: int = 0, tpm: int = 0) -> None:
+        """
+        更新配額設定（保留視窗內的紀錄）
+
+        Args:
+            rpm: 每分鐘請求數上限（0 表示不限制）
+            tpm: 每分鐘 token 數上限（0 表示不限制）
+        """
+        with self._lock:
+            self.rpm = max(int(rpm), 0)
+            self.tpm = max(int(tpm), 0)
+
+    def _purge(self, now: float) -> None:
+        """移除超出視窗的紀錄（呼叫端需持有 self._lock）"""
+        while self._entries and self._entries[0][0] <= now - self.WINDOW:
+            self._tokens -= self._entries.popleft()[1]
+
+    def _wait_time(self, tokens: int, now: float) -> float:
+        """距離配額足夠還需要等待的秒數（呼叫端需持有 self._lock）"""
+        self._purge(now)
+        wait = 0.0
+        if self.rpm and len(self._entries) >= self.rpm:
+            oldest = self._entries[len(self._entries) - self.rpm]
+            wait = oldest[0] + self.WINDOW - now
+        if self.tpm and self._entries and self._tokens + tokens > self.tpm:
+            # 依序移出最舊的紀錄，直到剩餘用量加上這次請求不超過上限
+            freed = 0
+            for sent_at, used in self._entries:
+                freed += used
+                if self._tokens - freed + tokens <= self.tpm:
+                    break
+            wait = max(wait, sent_at + self.WINDOW - now)
+        return max(wait, 0.0)
+
+    def acquire(self, tokens: int = 0,
+                cancel_check: Optional[Callable[[], bool]] = None) -> Optional[List]:
+        """
+        取得一次請求的配額，必要時等待
+
+        Args:
+            tokens: 這次請求預估使用的 token 數
+            cancel_check: 取消檢查函數，等待期間每秒檢查一次
+
+        Returns:
+            配額紀錄（傳給 settle 更正實際用量）；等待期間被取消時返回 None
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._wait_time(tokens, now)
+                if wait <= 0:
+                    entry = [now, tokens]
+                    self._entries.append(entry)
+                    self._tokens += tokens
+                    return entry
+            if cancel_check and cancel_check():
+                return None
+            time.sleep(min(wait, 1.0))
+
+    def settle(self, entry: Optional[List], tokens: int) -> None:
+        """
+        以實際用量更正配額紀錄
+
+        Args:
+            entry: acquire 返回的配額紀錄
+            tokens: 實際使用的 token 數
+        """
+        if entry is None:
+            return
+        with self._lock:
+            if any(e is entry for e in self._entries):
+                self._tokens += tokens - entry[1]
+            entry[1] = tokens
+
+    def get_stats(self) -> Dict[str, Any]:
+        """取得視窗內的用量"""
+        with self._lock:
+            self._purge(time.monotonic())
+            return {
+                'rpm': self.rpm,
+                'tpm': self.tpm,
+                'requests': len(self._entries),
+                'tokens': self._tokens,
+            }
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    解析 Retry-After 標頭
+
+    Args:
+        value: 標頭值，可能是秒數或 HTTP 日期
+
+    Returns:
+        等待秒數，無法解析返回 None
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(retry_at.timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """
+    判斷例外是否為限流錯誤（429 / 配額用盡）
+
+    用於無法直接取得 HTTP 回應的 SDK（如 google-generativeai、googletrans）。
+
+    Args:
+        error: 例外物件
+
+    Returns:
+        是否為限流錯誤
+    """
+    if type(error).__name__ in ('ResourceExhausted', 'TooManyRequests'):
+        return True
+    response = getattr(error, 'response', None)
+    if getattr(response, 'status_code', None) == 429:
+        return True
+    message = str(error)
+    return '429' in message or 'Too Many Requests' in message
+
+
+# 服務對應的限制器（以主機/API 區分，同一 API 的多個服務共用）
+_limiters: Dict[str, TokenBucket] = {}
+# 使用者在設定檔中覆寫的速率 {名稱: {'rate': 每秒請求數, 'burst': 爆量數}}
+_overrides: Dict[str, Dict[str, float]] = {}
+# 以每分鐘配額計算的服務（LLM API）對應的配額限制器
+_quotas: Dict[str, QuotaLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def configure_rate_limits(rate_limits: Optional[Dict[str, Dict[str, float]]]) -> None:
+    """
+    套用設定檔中的速率限制（AppSettings.rate_limits）
+
+    Args:
+        rate_limits: {服務名稱: {'rate': 每秒請求數, 'burst': 爆量數}}
+    """
+    with _registry_lock:
+        _overrides.clear()
+        for name, config in (rate_limits or {}).items():
+            if isinstance(config, dict) and config.get('rate'):
+                _overrides[name] = {
+                    'rate': float(config['rate']),
+                    'burst': float(config.get('burst', 1)),
+                }
+
+        for name, config in _overrides.items():
+            if name in _limiters:
+                _limiters[name].configure(config['rate'], config['burst'])
+
+
+def get_rate_limiter(name: str, default_delay: float = 1.0,
+                     default_burst: float = 1) -> TokenBucket:
+    """
+    取得服務共用的速率限制器
+
+    設定檔有覆寫時使用設定值，否則依 default_delay（請求間隔秒數）換算。
+    同名限制器只會建立一次；未被覆寫時，後續呼叫會以新的預設值更新速率。
+
+    Args:
+        name: 限制器名稱（wikipedia, search, googletrans, deepl, gemini）
+        default_delay: 預設請求間隔（秒）
+        default_burst: 預設爆量數
+
+    Returns:
+        TokenBucket 實例
+    """
+    with _registry_lock:
+        config = _overrides.get(name)
+        if config:
+            rate, burst = config['rate'], config['burst']
+        else:
+            rate = 1.0 / default_delay if default_delay > 0 else 1000.0
+            burst = default_burst
+
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = TokenBucket(rate, burst)
+            _limiters[name] = limiter
+        elif limiter.rate != rate or limiter.burst != burst:
+            limiter.configure(rate, burst)
+
+        return limiter
+
+
+def get_quota_limiter(name: str, rpm: int = 0, tpm: int = 0) -> QuotaLimiter:
+    """
+    取得服務共用的配額限制器
+
+    同名限制器只會建立一次，後續呼叫會以新的配額更新設定。
+
+    Args:
+        name: 限制器名稱（gemini）
+        rpm: 每分鐘請求數上限（0 表示不限制）
+        tpm: 每分鐘 token 數上限（0 表示不限制）
+
+    Returns:
+        QuotaLimiter 實例
+    """
+    with _registry_lock:
+        quota = _quotas.get(name)
+        if quota is None:
+            quota = QuotaLimiter(rpm, tpm)
+            _quotas[name] = quota
+        elif quota.rpm != rpm or quota.tpm != tpm:
+            quota.configure(rpm, tpm)
+        return quota
+
+
+def get_rate_limit_stats() -> Dict[str, Dict[str, Any]]:
+    """取得所有限制器的狀態"""
+    with _registry_lock:
+        limiters = dict(_limiters)
+    return {name: limiter.get_stats() for name, limiter in limiters.items()}
@@ -62,6 +62,7 @@ class AppSettings:
 
     # ==================== 字典設定 ====================
     merge_strategy: str = "merge"       # 字典合併策略：merge/fill_empty/overwrite/skip
+    dictionary_storage: str = "json"    # 字典儲存後端：json（language_packs 直接可分享）/sqlite（逐筆寫入，大型字典較快）
 
     # ==================== 寫回規則設定 ====================
     # write_rules: 控制翻譯結果寫入哪個 XML 欄位
@@ -77,10 +78,18 @@ class AppSettings:
     api_key: str = ""                   # 付費翻譯 API 金鑰
     gemini_api_key: str = ""            # Gemini AI API Key（遊戲名稱翻譯用）
     request_delay: int = 500            # API 請求間隔（毫秒），避免被限制可調高至 1000-2000
+    # 各服務速率限制覆寫（未設定的服務依 request_delay 換算）
+    # 格式：{"wikipedia": {"rate": 2, "burst": 4}}，rate 為每秒請求數、burst 為可爆量請求數
+    # 服務名稱：wikipedia/search/googletrans/deepl/gemini
+    rate_limits: dict = field(default_factory=dict)
 
     # ==================== Gemini 批次翻譯設定 ====================
     use_gemini_batch: bool = False      # 是否啟用 Gemini 批次翻譯模式
-    gemini_batch_size: int = 30         # Gemini 每批次翻譯的遊戲數量（建議 20-30）
+    gemini_batch_size: int = 30         # Gemini 每批次翻譯的遊戲數量（建議 20-30，自適應時為初始大小）
+    gemini_adaptive_batch: bool = True  # 依回應截斷、解析失敗、token 用量與延遲自動調整批次大小
+    gemini_max_in_flight: int = 4       # 同時等待回應的批次數（跨平台）
+    gemini_rpm: int = 30                # Gemini 每分鐘請求數上限（依 API 方案調整，0 表示不限制）
+    gemini_tpm: int = 1000000           # Gemini 每分鐘 token 數上限（0 表示不限制）
 
     # ==================== 視窗設定 ====================
     window_width: int = 900             # 視窗寬度
@@ -92,6 +101,13 @@ class AppSettings:
     auto_save_interval: int = 10        # 每翻譯 N 個遊戲自動儲存一次進度
     max_workers: int = 3                # 翻譯執行緒數（建議 2-4，過高可能被 API 限制）
     batch_size: int = 20                # 一般批次處理大小（非 Gemini）
+    max_in_flight: int = 32             # 階段三同時進行的翻譯項目數（非同步排程）
+    # 各服務同時請求上限覆寫，例如 {"wikipedia": 8, "gemini": 4, "search": 2, "translate": 4}
+    service_concurrency: dict = field(default_factory=dict)
+    cross_platform_dedup: bool = True   # 階段三跨平台去重：同標題只查詢一次名稱
+    writeback_workers: int = 4          # 階段四同時寫回的平台數（1 表示逐一處理）
+    scan_workers: int = 0               # 階段一同時探測的平台資料夾數（0 表示自動，網路路徑較多）
+    skip_unchanged: bool = True         # 依變更清單略過自上次執行後沒有變更的平台
 
     # ==================== 進階設定 ====================
     log_level: str = "INFO"             # 日誌等級：DEBUG/INFO/WARNING/ERROR
@@ -0,0 +1,184 @@
+# 工作佇列模組
+"""
+提供有界的生產者/消費者工作佇列。
+
+固定數量的 worker 執行緒持續從佇列取出工作，一個做完立即取下一個，
+不會像「分批提交、等整批完成」那樣讓 worker 空等最慢的項目。
+結果回呼在呼叫 run() 的執行緒中依完成順序執行，更新共用資料不需加鎖。
+"""
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional
+
+
+# 佇列結束標記
+_STOP = object()
+_WORKER_DONE = object()
+_PRODUCER_FAILED = object()
+
+
+@dataclass
+class WorkQueueStats:
+    """工作佇列執行統計"""
+    num_workers: int = 0    # worker 數量
+    submitted: int = 0      # 已放入佇列的項目數
+    completed: int = 0      # 已完成的項目數（含失敗）
+    errors: int = 0         # 發生例外的項目數
+    cancelled: bool = False  # 是否被取消
+    elapsed: float = 0.0    # 總耗時（秒）
+    busy_time: float = 0.0  # 所有 worker 實際工作時間總和（秒）
+
+    @property
+    def throughput(self) -> float:
+        """每秒完成的項目數"""
+        return self.completed / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """worker 使用率（0~1），越接近 1 表示 worker 越少空等"""
+        capacity = self.elapsed * self.num_workers
+        return min(self.busy_time / capacity, 1.0) if capacity > 0 else 0.0
+
+
+class WorkQueue:
+    """
+    有界生產者/消費者工作佇列
+
+    使用方式：
+        work_queue = WorkQueue(translate_one, num_workers=4)
+        stats = work_queue.run(games, on_result=apply_result,
+                               is_cancelled=lambda: self._is_cancelled)
+    """
+
+    def __init__(self, worker_func: Callable[[Any], Any],
+                 num_workers: int = 4,
+                 max_pending: Optional[int] = None,
+                 name: str = 'worker'):
+        """
+        初始化工作佇列
+
+        Args:
+            worker_func: 處理單一項目的函數（在 worker 執行緒中執行）
+            num_workers: worker 執行緒數量
+            max_pending: 佇列中等待的項目上限（預設為 worker 數的 2 倍）
+            name: 執行緒名稱前綴
+        """
+        self.worker_func = worker_func
+        self.num_workers = max(1, num_workers)
+        self.max_pending = max_pending or self.num_workers * 2
+        self.name = name
+        self._busy = 0
+        self._busy_lock = threading.Lock()
+
+    @property
+    def busy_count(self) -> int:
+        """目前正在處理項目的 worker 數"""
+        return self._busy
+
+    def run(self, items: Iterable[Any],
+            on_result: Optional[Callable[[Any, Any], None]] = None,
+            on_error: Optional[Callable[[Any, BaseException], None]] = None,
+            is_cancelled: Optional[Callable[[], bool]] = None) -> WorkQueueStats:
+        """
+        處理所有項目，直到完成或取消
+
+        Args:
+            items: 要處理的項目
+            on_result: 完成回呼 (item, result)，在呼叫端執行緒執行
+            on_error: 例外回呼 (item, exception)，在呼叫端執行緒執行
+            is_cancelled: 取消檢查函數；取消後不再放入新項目，佇列中尚未開始的項目直接捨棄
+
+        Returns:
+            執行統計
+
+        Raises:
+            讀取 items 時發生的例外（已放入佇列的項目仍會處理完再拋出）
+        """
+        stats = WorkQueueStats(num_workers=self.num_workers)
+        cancelled = is_cancelled or (lambda: False)
+        tasks: "queue.Queue" = queue.Queue(maxsize=self.max_pending)
+        results: "queue.Queue" = queue.Queue()
+        start = time.time()
+
+        def worker():
+            busy_time = 0.0
+            while True:
+                item = tasks.get()
+                if item is _STOP:
+                    break
+                if cancelled():
+                    continue  # 已取消：捨棄尚未開始的項目
+
+                with self._busy_lock:
+                    self._busy += 1
+                began = time.perf_counter()
+                try:
+                    results.put((item, self.worker_func(item), None))
+                except Exception as e:
+                    results.put((item, None, e))
+                finally:
+                    busy_time += time.perf_counter() - began
+                    with self._busy_lock:
+                        self._busy -= 1
+            results.put((_WORKER_DONE, busy_time, None))
+
+        def producer():
+            try:
+                for item in items:
+                    if cancelled():
+                        stats.cancelled = True
+                        break
+                    tasks.put(item)  # 佇列滿時阻塞，避免一次載入全部項目
+                    stats.submitted += 1
+            except Exception as e:
+                # 交給呼叫端執行緒，在 run() 結束時拋出
+                results.put((_PRODUCER_FAILED, None, e))
+            finally:
+                for _ in range(self.num_workers):
+                    tasks.put(_STOP)
+
+        threads = [threading.Thread(target=worker, name=f'{self.name}-{i}', daemon=True)
+                   for i in range(self.num_workers)]
+        threads.append(threading.Thread(target=producer,
+                                        name=f'{self.name}-producer', daemon=True))
+        for t in threads:
+            t.start()
+
+        finished_workers = 0
+        producer_error = None
+        while finished_workers < self.num_workers:
+            item, result, error = results.get()
+            if item is _WORKER_DONE:
+                finished_workers += 1
+                stats.busy_time += result
+                continue
+            if item is _PRODUCER_FAILED:
+                producer_error = error
+                continue
+
+            stats.completed += 1
+            try:
+                if error is not None:
+                    stats.errors += 1
+                    if on_error:
+                        on_error(item, error)
+                elif on_result:
+                    on_result(item, result)
+            except Exception as e:
+                stats.errors += 1
+                if on_error:
+                    on_error(item, e)
+
+        for t in threads:
+            t.join()
+
+        if producer_error is not None:
+            raise producer_error
+
+        # 有項目被捨棄表示中途取消
+        if stats.completed < stats.submitted:
+            stats.cancelled = True
+        stats.elapsed = time.time() - start
+        return stats
@@ -4,7 +4,7 @@
 """
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from dataclasses import dataclass
 
 
@@ -38,6 +38,82 @@ class GameInfo:
         }
 
 
+def iter_gamelist(xml_path: Path) -> Iterator[GameInfo]:
+    """
+    逐筆解析 gamelist.xml（串流，不建立完整的 XML 樹）
+
+    每處理完一個 <game> 就清除該元素，記憶體用量與檔案大小無關，
+    呼叫端也可以在讀完整個檔案前就開始處理。
+
+    Args:
+        xml_path: XML 檔案路徑
+
+    Yields:
+        遊戲資訊（缺少 path 或 name 的項目會略過）
+
+    Raises:
+        ET.ParseError: XML 格式錯誤（錯誤位置之前的遊戲已經產出）
+    """
+    if not xml_path.exists():
+        return
+
+    for game_elem in _iter_game_elements(xml_path):
+        game = _game_from_element(game_elem)
+        game_elem.clear()
+        if game is not None:
+            yield game
+
+
+def _iter_game_elements(xml_path: Path) -> Iterator[ET.Element]:
+    """
+    逐一產出根元素下的 <game> 元素（僅限第一層，與 root.findall('game') 相同）
+
+    產出後呼叫端可清除元素；已處理的元素也會從根元素移除以釋放記憶體。
+    """
+    root = None
+    depth = 0
+    for event, elem in ET.iterparse(str(xml_path), events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = elem
+            depth += 1
+            continue
+
+        depth -= 1
+        if depth == 1 and elem.tag == 'game':
+            yield elem
+        if depth == 1:
+            # 根元素不保留已處理的子元素
+            root.clear()
+
+
+def _game_from_element(game_elem: ET.Element) -> Optional[GameInfo]:
+    """由 <game> 元素建立遊戲資訊，缺少必要欄位時回傳 None"""
+    # 取得路徑（必要欄位）
+    path_elem = game_elem.find('path')
+    if path_elem is None or not path_elem.text:
+        return None
+
+    # 取得名稱（必要欄位）
+    name_elem = game_elem.find('name')
+    if name_elem is None or not name_elem.text:
+        return None
+
+    # 取得其他欄位
+    return GameInfo(
+        path=path_elem.text,
+        name=name_elem.text,
+        desc=_get_element_text(game_elem, 'desc'),
+        image=_get_element_text(game_elem, 'image'),
+        rating=_get_element_float(game_elem, 'rating'),
+        releasedate=_get_element_text(game_elem, 'releasedate'),
+        developer=_get_element_text(game_elem, 'developer'),
+        publisher=_get_element_text(game_elem, 'publisher'),
+        genre=_get_element_text(game_elem, 'genre'),
+        players=_get_element_text(game_elem, 'players'),
+    )
+
+
 def parse_gamelist(xml_path: Path) -> List[GameInfo]:
     """
     解析 gamelist.xml
@@ -46,48 +122,12 @@ def parse_gamelist(xml_path: Path) -> List[GameInfo]:
         xml_path: XML 檔案路徑
         
     Returns:
-        遊戲資訊清單
+        遊戲資訊清單（XML 格式錯誤時回傳空清單）
     """
-    games = []
-    
-    if not xml_path.exists():
-        return games
-    
     try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-        
-        for game_elem in root.findall('game'):
-            # 取得路徑（必要欄位）
-            path_elem = game_elem.find('path')
-            if path_elem is None or not path_elem.text:
-                continue
-            
-            # 取得名稱（必要欄位）
-            name_elem = game_elem.find('name')
-            if name_elem is None or not name_elem.text:
-                continue
-            
-            # 取得其他欄位
-            game = GameInfo(
-                path=path_elem.text,
-                name=name_elem.text,
-                desc=_get_element_text(game_elem, 'desc'),
-                image=_get_element_text(game_elem, 'image'),
-                rating=_get_element_float(game_elem, 'rating'),
-                releasedate=_get_element_text(game_elem, 'releasedate'),
-                developer=_get_element_text(game_elem, 'developer'),
-                publisher=_get_element_text(game_elem, 'publisher'),
-                genre=_get_element_text(game_elem, 'genre'),
-                players=_get_element_text(game_elem, 'players'),
-            )
-            
-            games.append(game)
-            
+        return list(iter_gamelist(xml_path))
     except ET.ParseError:
-        pass
-    
-    return games
+        return []
 
 
 def _get_element_text(parent: ET.Element, tag: str) -> str:
@@ -107,23 +147,25 @@ def _get_element_float(parent: ET.Element, tag: str) -> float:
 
 def get_game_count(xml_path: Path) -> int:
     """
-    取得遊戲數量
+    取得遊戲數量（串流計數，不建立 GameInfo 也不保留 XML 樹）
     
     Args:
         xml_path: XML 檔案路徑
         
     Returns:
-        遊戲數量
+        遊戲數量（XML 格式錯誤時為 0）
     """
     if not xml_path.exists():
         return 0
     
+    count = 0
     try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-        return len(root.findall('game'))
+        for game_elem in _iter_game_elements(xml_path):
+            count += 1
+            game_elem.clear()
     except ET.ParseError:
         return 0
+    return count
 
 
 def validate_gamelist(xml_path: Path) -> tuple[bool, str]:
@@ -140,14 +182,24 @@ def validate_gamelist(xml_path: Path) -> tuple[bool, str]:
         return False, "檔案不存在"
     
     try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-        
-        if root.tag != 'gameList':
-            return False, f"根元素應為 gameList，但找到 {root.tag}"
+        root = None
+        has_games = False
+        depth = 0
+        for event, elem in ET.iterparse(str(xml_path), events=('start', 'end')):
+            if event == 'start':
+                if root is None:
+                    root = elem
+                    if root.tag != 'gameList':
+                        return False, f"根元素應為 gameList，但找到 {root.tag}"
+                depth += 1
+                continue
+
+            depth -= 1
+            if depth == 1:
+                has_games = has_games or elem.tag == 'game'
+                root.clear()
         
-        games = root.findall('game')
-        if not games:
+        if not has_games:
             return True, "警告：沒有找到任何遊戲"
         
         return True, ""
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""
+共用的 pytest fixture
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# 將專案根目錄加入 Python Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core import dictionary as dictionary_module
+
+
+@pytest.fixture
+def language_packs(tmp_path, monkeypatch):
+    """暫時將 language_packs 目錄指向 tmp_path/packs"""
+    packs = tmp_path / 'packs'
+    monkeypatch.setattr(dictionary_module, 'get_language_packs_dir', lambda: packs)
+    return packs
+
+
+@pytest.fixture
+def temp_dictionaries(tmp_path, monkeypatch, language_packs):
+    """暫時將使用者字典與 language_packs 目錄指向 tmp_path/dicts 與 tmp_path/packs"""
+    monkeypatch.setattr(dictionary_module, 'get_dictionaries_dir', lambda: tmp_path / 'dicts')
+    return tmp_path
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+非同步翻譯排程測試（不連網，使用假的服務物件）
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# 將專案根目錄加入 Python Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.dictionary import GameEntry
+from src.core.translator import TranslationEngine
+from src.core.async_engine import AsyncTranslationEngine
+
+
+class FakeWikiService:
+    """模擬維基百科服務：記錄同時進行的請求數"""
+
+    def __init__(self, delays=None, default_delay=0.02, fail=()):
+        self.delays = delays or {}
+        self.default_delay = default_delay
+        self.fail = set(fail)
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def search(self, name, language):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delays.get(name, self.default_delay))
+            if name in self.fail:
+                raise RuntimeError("boom")
+            return f"譯名-{name}"
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def clear_cache(self, query=None):
+        pass
+
+
+def make_entries(count, prefix='Game'):
+    return [GameEntry(key=f'{prefix}{i}.zip', original_name=f'{prefix} {i}')
+            for i in range(count)]
+
+
+def make_engine(wiki):
+    engine = TranslationEngine(target_language='ja')
+    engine.set_wiki_service(wiki)
+    return engine
+
+
+def test_slow_entry_does_not_block_others():
+    """測試：單一慢請求不會卡住其他項目（沒有批次屏障）"""
+    wiki = FakeWikiService(delays={'Game 0': 0.5})
+    engine = AsyncTranslationEngine(make_engine(wiki), max_in_flight=4)
+
+    order = []
+    stats = engine.run(make_entries(30), translate_desc=False,
+                       on_result=lambda e, out, force: order.append(e.original_name))
+
+    assert stats.completed == 30
+    assert stats.errors == 0
+    # 慢的項目最後才完成，其餘 29 個由另外 3 個槽位持續處理
+    assert order[-1] == 'Game 0'
+    assert stats.elapsed < 0.5 + 0.3
+
+
+def test_service_concurrency_limit():
+    """測試：同時進行的項目多，但單一服務的併發數受限"""
+    wiki = FakeWikiService(default_delay=0.03)
+    engine = AsyncTranslationEngine(make_engine(wiki), max_in_flight=8,
+                                    service_limits={'wikipedia': 2})
+
+    results = {}
+    stats = engine.run(make_entries(16), translate_desc=False,
+                       on_result=lambda e, out, force: results.update({e.key: out.name}))
+
+    assert stats.completed == 16
+    assert wiki.max_active == 2
+    assert results['Game3.zip'] == '譯名-Game 3'
+
+
+def test_cancellation_stops_submitting():
+    """測試：取消後不再送出新項目，進行中的項目會完成"""
+    wiki = FakeWikiService(default_delay=0.02)
+    engine = AsyncTranslationEngine(make_engine(wiki), max_in_flight=2)
+
+    done = []
+
+    def on_result(entry, output, force):
+        done.append(entry.key)
+
+    stats = engine.run(make_entries(50), translate_desc=False,
+                       on_result=on_result,
+                       is_cancelled=lambda: len(done) >= 5)
+
+    assert stats.cancelled
+    assert stats.submitted < 50
+    assert stats.completed == stats.submitted
+
+
+def test_errors_are_reported():
+    """測試：回呼中的例外不會中斷其他項目"""
+    wiki = FakeWikiService(default_delay=0.01)
+    engine = AsyncTranslationEngine(make_engine(wiki), max_in_flight=3)
+
+    errors = []
+
+    def on_result(entry, output, force):
+        if entry.key == 'Game2.zip':
+            raise ValueError("bad entry")
+
+    stats = engine.run(make_entries(6), translate_desc=False,
+                       on_result=on_result,
+                       on_error=lambda e, err: errors.append(e.key))
+
+    assert stats.completed == 6
+    assert stats.errors == 1
+    assert errors == ['Game2.zip']
+
+
+if __name__ == '__main__':
+    test_slow_entry_does_not_block_others()
+    test_service_concurrency_limit()
+    test_cancellation_stops_submitting()
+    test_errors_are_reported()
+    print("All async engine tests passed")
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+增量自動儲存測試
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# 將專案根目錄加入 Python Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.dictionary import DictionaryManager, DeltaAutosaver, GameEntry
+
+
+def make_dictionary(count=20):
+    return {f'game{i}': GameEntry(key=f'game{i}', original_name=f'Game {i}')
+            for i in range(count)}
+
+
+def translate(entry):
+    entry.name = f'遊戲 {entry.original_name}'
+    entry.name_source = 'api'
+
+
+def test_autosave_writes_only_changes(tmp_path, language_packs):
+    """測試：自動儲存只附加變更的項目，不重寫整個字典"""
+    manager = DictionaryManager(tmp_path / 'dicts')
+    dictionary = make_dictionary()
+    manager.save_dictionary('zh-TW', 'mame', dictionary)
+    pack_path = language_packs / 'zh-TW' / 'mame.json'
+    mtime = pack_path.stat().st_mtime_ns
+
+    autosaver = DeltaAutosaver(manager, 'zh-TW', 'mame', dictionary, interval=5)
+    for i in range(10):
+        entry = dictionary[f'game{i}']
+        if i % 2 == 0:
+            translate(entry)
+        autosaver.step(entry.key, changed=i % 2 == 0)
+
+    # 兩次自動儲存共寫入 5 個翻譯過的項目，字典檔本身未被重寫
+    assert autosaver.written == 5
+    assert pack_path.stat().st_mtime_ns == mtime
+    journal = manager._get_journal_path('zh-TW', 'mame')
+    assert len(journal.read_text(encoding='utf-8').splitlines()) == 5
+
+    autosaver.finish()
+    assert not journal.exists()
+    assert manager.load_dictionary('zh-TW', 'mame')['game4'].name == '遊戲 Game 4'
+
+
+def test_journal_replayed_after_crash(tmp_path, language_packs):
+    """測試：中斷後載入會套用日誌（略過寫到一半的行）並壓縮"""
+    manager = DictionaryManager(tmp_path / 'dicts')
+    dictionary = make_dictionary()
+    manager.save_dictionary('zh-TW', 'mame', dictionary)
+
+    translate(dictionary['game3'])
+    translate(dictionary['game7'])
+    manager.save_changes('zh-TW', 'mame', dictionary, ['game3', 'game7'])
+    journal = manager._get_journal_path('zh-TW', 'mame')
+    with open(journal, 'a', encoding='utf-8') as f:
+        f.write('{"key": "game9", "entry": {"ke')  # 模擬寫入中斷
+
+    # 模擬程式重新啟動
+    fresh = DictionaryManager(tmp_path / 'dicts')
+    assert fresh.get_dictionary_stats('zh-TW', 'mame').name_translated == 2
+    assert not journal.exists()
+
+    loaded = fresh.load_dictionary('zh-TW', 'mame')
+    assert len(loaded) == 20
+    assert loaded['game7'].name == '遊戲 Game 7'
+    assert not loaded['game9'].name
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
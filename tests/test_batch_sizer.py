@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+自適應批次大小測試（成長、截斷、token 上限、延遲退回、遺漏項目）
+"""
+
+import sys
+from pathlib import Path
+
+# 將專案根目錄加入 Python Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.batch_sizer import AdaptiveBatchSizer
+
+
+def test_grows_on_clean_responses():
+    """測試：回應正常且每秒完成的項目數沒有下降時逐步加大"""
+    sizer = AdaptiveBatchSizer(10, max_size=100)
+    sizer.record(10, 1.0, answered=10)
+    assert sizer.size == 12
+    sizer.record(12, 1.1, answered=12)
+    assert sizer.size == 15
+
+    # 以舊大小送出的批次（並行時較晚完成）不影響成長判斷
+    sizer.record(10, 5.0, answered=10)
+    assert sizer.size == 15
+
+
+def test_truncation_halves_and_caps_growth():
+    """測試：回應被截斷時減半，之後不再成長超過失敗大小的 3/4"""
+    sizer = AdaptiveBatchSizer(40, max_size=300)
+    sizer.record(40, 3.0, answered=25, truncated=True)
+    assert sizer.size == 20
+
+    for _ in range(10):
+        sizer.record(sizer.size, 1.0, answered=sizer.size)
+    assert sizer.size == 30
+    assert sizer.get_stats()['truncated'] == 1
+
+
+def test_parse_failure_counts_as_too_large():
+    """測試：完全無法解析的回應視同批次太大"""
+    sizer = AdaptiveBatchSizer(30)
+    sizer.record(30, 2.0, answered=0)
+    assert sizer.size == 15
+    assert sizer.get_stats()['parse_failures'] == 1
+
+
+def test_output_token_ceiling():
+    """測試：依每個項目的輸出 token 數，限制在輸出上限的餘裕以內"""
+    sizer = AdaptiveBatchSizer(10, max_size=300, max_output_tokens=1000, headroom=0.8)
+    for _ in range(20):
+        size = sizer.size
+        sizer.record(size, 1.0, answered=size, output_tokens=size * 20)
+    # 每項 20 token，上限 1000 × 0.8 → 最多 40 項
+    assert sizer.size == 40
+    assert sizer.get_stats()['tokens_per_item'] == 20
+
+
+def test_reverts_when_larger_batch_is_slower():
+    """測試：加大後每秒完成的項目數下降，退回先前的大小並停止成長"""
+    sizer = AdaptiveBatchSizer(10)
+    sizer.record(10, 1.0, answered=10)   # 每秒 10 項
+    assert sizer.size == 12
+    sizer.record(12, 2.0, answered=12)   # 每秒 6 項
+    assert sizer.size == 10
+
+    for _ in range(5):
+        sizer.record(10, 1.0, answered=10)
+    assert sizer.size == 10
+
+
+def test_missing_items_shrink():
+    """測試：模型漏掉太多項目時縮小"""
+    sizer = AdaptiveBatchSizer(20)
+    sizer.record(20, 1.0, answered=12)
+    assert sizer.size == 15
+
+
+def test_disabled_keeps_fixed_size():
+    """測試：停用時固定使用初始大小，仍記錄統計"""
+    sizer = AdaptiveBatchSizer(30, enabled=False)
+    sizer.record(30, 1.0, answered=30)
+    sizer.record(30, 1.0, answered=10, truncated=True)
+    assert sizer.size == 30
+    stats = sizer.get_stats()
+    assert stats['requests'] == 2 and stats['truncated'] == 1
+
+
+if __name__ == '__main__':
+    test_grows_on_clean_responses()
+    test_truncation_halves_and_caps_growth()
+    test_parse_failure_counts_as_too_large()
+    test_output_token_ceiling()
+    test_reverts_when_larger_batch_is_slower()
+    test_missing_items_shrink()
+    test_disabled_keeps_fixed_size()
+    print("All batch sizer tests passed")
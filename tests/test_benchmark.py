@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+基準測試套件測試：stub server 重播、延遲/錯誤注入與量測工具
+"""
+
+import json
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from urllib.parse import urlencode
+
+# 將專案根目錄加入 Python Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.benchmark.metrics import MethodTimer, StageReport, percentile
+from scripts.benchmark.stub_server import (
+    StubGeminiModel, StubHTTPError, StubServer, StubTranslator, request_key)
+from src.utils.rate_limiter import is_rate_limit_error
+
+FIXTURES = project_root / 'scripts' / 'benchmark' / 'fixtures' / 'recorded.json'
+
+
+def get_json(url: str, params: dict) -> dict:
+    with urllib.request.urlopen(f"{url}?{urlencode(params)}", timeout=5) as response:
+        return json.loads(response.read().decode('utf-8'))
+
+
+def test_replays_recorded_and_default_responses():
+    """測試：命中錄製檔時重播，否則回傳各服務查無結果的格式"""
+    fixtures = StubServer.load_fixtures(FIXTURES)
+    with StubServer(fixtures) as stub:
+        api = stub.url + '/wikipedia/zh.wikipedia.org/w/api.php'
+        params = {'action': 'query', 'list': 'search',
+                  'srsearch': 'Contra (video game OR 電子遊戲 OR 遊戲 OR ゲーム)'}
+        data = get_json(api, params)
+        assert data['query']['search'][0]['title'] == '魂斗羅'
+
+        params['srsearch'] = 'Unknown Game (video game OR 電子遊戲 OR 遊戲 OR ゲーム)'
+        assert get_json(api, params)['query']['search'] == []
+        assert get_json(api, {'action': 'query', 'titles': 'Nope'})['query']['pages'] == \
+            {'-1': {'missing': ''}}
+
+        translator = StubTranslator(stub.url)
+        assert translator.translate('Kirby no Block Ball', dest='zh-tw').text == '卡比方塊球'
+        assert translator.translate('Other', dest='zh-tw').text == 'Other'
+
+        # Gemini 批次 prompt：規則說明的編號不算在遊戲清單內
+        prompt = "規則：\n1. 格式\n2. 譯名\n\n輸入遊戲列表：\n1. Contra\n2. Tetris\n3. Dr. Mario\n"
+        reply = json.loads(StubGeminiModel(stub.url, 'gemini-2.0-flash-lite')
+                           .generate_content(prompt).text)
+        assert [item['id'] for item in reply] == [1, 2, 3]
+        assert all(item['name'] is None for item in reply)
+
+        stats = stub.stats
+        assert stats.requests['wikipedia'] == 3 and stats.requests['googletrans'] == 2
+        assert stats.replayed == 2 and stats.missed == 4
+
+
+def test_injected_latency_errors_and_throttling():
+    """測試：延遲、503 與 429 注入"""
+    with StubServer(latency_ms=40) as stub:
+        began = time.perf_counter()
+        StubTranslator(stub.url).translate('Tetris', dest='zh-tw')
+        assert time.perf_counter() - began >= 0.04
+
+    with StubServer(error_rate=1.0) as stub:
+        try:
+            StubTranslator(stub.url).translate('Tetris', dest='zh-tw')
+            assert False, "應拋出 StubHTTPError"
+        except StubHTTPError as e:
+            assert e.status == 503 and not is_rate_limit_error(e)
+        assert stub.stats.errors == 1
+
+    with StubServer(throttle_rate=1.0) as stub:
+        try:
+            StubGeminiModel(stub.url, 'gemini-2.0-flash').generate_content('Tetris')
+            assert False, "應拋出 StubHTTPError"
+        except StubHTTPError as e:
+            assert e.status == 429 and is_rate_limit_error(e)
+
+
+def test_request_keys_match_fixture_format():
+    """測試：錄製檔的鍵值格式"""
+    assert request_key('wikipedia', {'list': 'search', 'srsearch': 'X'}) == 'search:X'
+    assert request_key('wikipedia', {'titles': '魂斗羅'}) == 'page:魂斗羅'
+    assert request_key('duckduckgo', {'q': 'X 遊戲 中文'}) == 'X 遊戲 中文'
+    assert request_key('googletrans', {'text': 'X', 'dest': 'zh-tw'}) == 'zh-tw|X'
+    assert len(request_key('gemini', {'prompt': 'X'})) == 40
+
+
+def test_metrics():
+    """測試：百分位數、方法計時與階段報告"""
+    values = [i / 1000 for i in range(1, 101)]  # 1ms ~ 100ms
+    assert percentile(values, 50) == 0.05
+    assert percentile(values, 99) == 0.099
+    assert percentile([], 50) is None
+
+    class Worker:
+        def work(self, seconds):
+            time.sleep(seconds)
+            return seconds
+
+    original = Worker.__dict__['work']
+    with MethodTimer(Worker, 'work') as recorder:
+        assert Worker().work(0.01) == 0.01
+        Worker().work(0)
+    assert Worker.__dict__['work'] is original
+    assert len(recorder.samples) == 2 and max(recorder.samples) >= 0.01
+
+    report = StageReport.build('3-translate', 100, 'game', 2.0, values, 50 * 1024 * 1024)
+    data = report.to_dict()
+    assert data['throughput'] == 50.0
+    assert data['p50_ms'] == 50.0 and data['p99_ms'] == 99.0
+    assert data['peak_rss_mb'] == 50.0
+
+
+if __name__ == '__main__':
+    test_replays_recorded_and_default_responses()
+    test_injected_latency_errors_and_throttling()
+    test_request_keys_match_fixture_format()
+    test_metrics()
+    print("All benchmark tests passed")
@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+"""
+GlobalCache 功能測試（LRU、持久連線、命中次數批次寫回、負面快取）
+"""
+
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# 將專案根目錄加入 Python Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.cache import GlobalCache, NEGATIVE_RESULT, content_key
+
+
+def test_lru_eviction_order():
+    """測試：記憶體快取淘汰最久未使用的項目"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = GlobalCache(cache_file=Path(temp_dir) / 'cache.db',
+                            memory_cache_size=3)
+
+        cache.set('gemini', 'A', 'zh-TW', '甲')
+        cache.set('gemini', 'B', 'zh-TW', '乙')
+        cache.set('gemini', 'C', 'zh-TW', '丙')
+
+        # 讀取 A，使 B 成為最久未使用的項目
+        assert cache.get('gemini', 'A', 'zh-TW') == '甲'
+        cache.set('gemini', 'D', 'zh-TW', '丁')
+
+        keys = list(cache._memory_cache.keys())
+        assert 'gemini|B|zh-TW' not in keys, "B should be evicted"
+        assert keys[-1] == 'gemini|D|zh-TW'
+        assert len(keys) == 3
+        cache.close()
+
+
+def test_persist_and_reload():
+    """測試：寫入資料庫後，新的實例可以讀取"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_file = Path(temp_dir) / 'cache.db'
+        cache = GlobalCache(cache_file=cache_file)
+        cache.set('wikipedia', 'Tetris', 'zh-TW', '俄羅斯方塊')
+        assert cache.flush_to_db() == 1
+        cache.close()
+
+        reloaded = GlobalCache(cache_file=cache_file)
+        assert reloaded.get('wikipedia', 'Tetris', 'zh-TW') == '俄羅斯方塊'
+        assert reloaded.get('wikipedia', 'Unknown', 'zh-TW') is None
+        reloaded.close()
+
+
+def test_hit_count_is_batched():
+    """測試：命中次數累積後才寫回資料庫"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_file = Path(temp_dir) / 'cache.db'
+        cache = GlobalCache(cache_file=cache_file)
+        cache.set('gemini', 'Metroid', 'zh-TW', '銀河戰士')
+        cache.flush_to_db()
+
+        for _ in range(5):
+            assert cache.get('gemini', 'Metroid', 'zh-TW') == '銀河戰士'
+
+        # 尚未寫回
+        assert cache._pending_hits['gemini|Metroid|zh-TW'] == 5
+
+        stats = cache.get_stats()
+        assert stats['total_hits'] == 5
+        assert not cache._pending_hits
+        cache.close()
+
+
+def test_connection_per_thread():
+    """測試：每個執行緒重複使用自己的連線"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = GlobalCache(cache_file=Path(temp_dir) / 'cache.db')
+        cache.set('gemini', 'Contra', 'zh-TW', '魂斗羅')
+        cache.flush_to_db()
+
+        assert cache._get_connection() is cache._get_connection()
+
+        errors = []
+
+        def worker():
+            try:
+                fresh = cache.get('gemini', 'Contra', 'zh-TW')
+                assert fresh == '魂斗羅'
+                assert cache._get_connection() is cache._get_connection()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert not errors
+        cache.close()
+        assert not cache._connections
+
+
+def test_get_many_chunked():
+    """測試：批次查詢會分段送出並合併記憶體與資料庫的結果"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_file = Path(temp_dir) / 'cache.db'
+        cache = GlobalCache(cache_file=cache_file)
+        cache.set_many('gemini', {f'Game {i}': f'遊戲 {i}' for i in range(25)},
+                       'zh-TW')
+        cache.flush_to_db()
+        cache.close()
+
+        reloaded = GlobalCache(cache_file=cache_file, memory_cache_size=100)
+        reloaded.SQL_PARAM_LIMIT = 7  # 強制分段
+        reloaded.set('gemini', 'Memory Only', 'zh-TW', '僅記憶體')
+
+        queries = [f'Game {i}' for i in range(30)] + ['Memory Only', 'Game 3']
+        found = reloaded.get_many('gemini', queries, 'zh-TW')
+
+        assert len(found) == 26
+        assert found['Game 24'] == '遊戲 24'
+        assert found['Memory Only'] == '僅記憶體'
+        assert 'Game 29' not in found
+        reloaded.close()
+
+
+def test_write_behind_threshold():
+    """測試：待寫入數量達到門檻時，背景執行緒自動寫入資料庫"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_file = Path(temp_dir) / 'cache.db'
+        cache = GlobalCache(cache_file=cache_file, memory_cache_size=2,
+                            flush_threshold=5, flush_interval=60)
+
+        for i in range(5):
+            cache.set('deepl', f'Text {i}', 'zh-TW', f'文字 {i}')
+
+        # 記憶體快取只留 2 筆，其餘仍可從待寫入佇列讀到
+        assert cache.get('deepl', 'Text 0', 'zh-TW') == '文字 0'
+
+        deadline = time.time() + 5
+        while cache._dirty and time.time() < deadline:
+            time.sleep(0.05)
+        assert not cache._dirty, "flusher should persist dirty entries"
+
+        with sqlite3.connect(cache_file) as conn:
+            count = conn.execute('SELECT COUNT(*) FROM cache').fetchone()[0]
+        assert count == 5
+
+        # 已落地的項目不會重複寫入
+        assert cache.flush_to_db() == 0
+        cache.close()
+
+
+def test_close_flushes_pending():
+    """測試：close 會寫入尚未達到門檻的項目"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_file = Path(temp_dir) / 'cache.db'
+        cache = GlobalCache(cache_file=cache_file, flush_threshold=1000,
+                            flush_interval=60)
+        cache.set('gemini', 'Zelda', 'zh-TW', '薩爾達傳說')
+        cache.close()
+
+        reloaded = GlobalCache(cache_file=cache_file)
+        assert reloaded.get('gemini', 'Zelda', 'zh-TW') == '薩爾達傳說'
+        reloaded.close()
+
+
+def test_negative_entry_roundtrip():
+    """測試：負面快取可持久化，並與「沒查過」區分"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_file = Path(temp_dir) / 'cache.db'
+        cache = GlobalCache(cache_file=cache_file)
+        cache.set_negative('wiki_search', 'Obscure Homebrew', 'zh-TW')
+
+        assert cache.get('wiki_search', 'Obscure Homebrew', 'zh-TW') is NEGATIVE_RESULT
+        assert not NEGATIVE_RESULT
+        cache.close()
+
+        reloaded = GlobalCache(cache_file=cache_file)
+        assert reloaded.get('wiki_search', 'Obscure Homebrew', 'zh-TW') is NEGATIVE_RESULT
+        assert reloaded.get('wiki_search', 'Never Asked', 'zh-TW') is None
+
+        found = reloaded.get_many('wiki_search', ['Obscure Homebrew', 'Never Asked'],
+                                  'zh-TW')
+        assert found == {'Obscure Homebrew': NEGATIVE_RESULT}
+        reloaded.close()
+
+
+def test_negative_entry_shorter_ttl():
+    """測試：負面快取使用獨立（較短）的過期時間"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_file = Path(temp_dir) / 'cache.db'
+        cache = GlobalCache(cache_file=cache_file, negative_max_age_days=1)
+        cache.set_negative('wiki_desc', 'Missing', 'zh-TW')
+        cache.set('wiki_desc', 'Found', 'zh-TW', '描述')
+        cache.flush_to_db()
+
+        # 把兩筆都改成兩天前建立
+        two_days_ago = int(time.time() - 2 * 86400)
+        with sqlite3.connect(cache_file) as conn:
+            conn.execute('UPDATE cache SET created_at = ?', (two_days_ago,))
+        cache._memory_cache.clear()
+
+        assert cache.get('wiki_desc', 'Missing', 'zh-TW') is None
+        assert cache.get('wiki_desc', 'Found', 'zh-TW') == '描述'
+
+        cache.set_negative('wiki_desc', 'Missing', 'zh-TW')
+        cache.flush_to_db()
+        with sqlite3.connect(cache_file) as conn:
+            conn.execute('UPDATE cache SET created_at = ?', (two_days_ago,))
+        assert cache.clear_expired() == 1
+        cache.close()
+
+
+def test_delete_by_service_and_query():
+    """測試：可依服務與查詢刪除快取（含尚未寫入的項目）"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = GlobalCache(cache_file=Path(temp_dir) / 'cache.db')
+        cache.set('wiki_search', 'Tetris', 'zh-TW', '俄羅斯方塊')
+        cache.set('wiki_search', 'Tetris', 'ja', 'テトリス')
+        cache.set('wiki_search', 'Contra', 'zh-TW', '魂斗羅')
+        cache.set('gemini', 'Tetris', 'zh-TW', '俄羅斯方塊')
+        cache.flush_to_db()
+        cache.set_negative('wiki_search', 'Tetris', 'ko')  # 尚未寫入
+
+        assert cache.delete('wiki_search', 'Tetris') == 2
+        assert cache.get('wiki_search', 'Tetris', 'ko') is None
+        assert cache.get('wiki_search', 'Tetris', 'ja') is None
+        assert cache.get('wiki_search', 'Contra', 'zh-TW') == '魂斗羅'
+        assert cache.get('gemini', 'Tetris', 'zh-TW') == '俄羅斯方塊'
+
+        cache.delete('wiki_search')
+        assert cache.get('wiki_search', 'Contra', 'zh-TW') is None
+        cache.close()
+
+
+def test_set_none_records_negative_and_stats():
+    """測試：set(None) 記錄負面快取，統計顯示省下的查詢次數"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = GlobalCache(cache_file=Path(temp_dir) / 'cache.db')
+        cache.set('search', 'Unknown Game|', 'zh-TW', None)
+        cache.set_many('gemini', {'Known': '已知', 'Nobody Knows': None}, 'zh-TW')
+
+        for _ in range(3):
+            assert cache.get('search', 'Unknown Game|', 'zh-TW') is NEGATIVE_RESULT
+        found = cache.get_many('gemini', ['Known', 'Nobody Knows'], 'zh-TW')
+        assert found == {'Known': '已知', 'Nobody Knows': NEGATIVE_RESULT}
+
+        # 命中發生在寫入資料庫之前，也要隨寫入一起保存
+        cache.flush_to_db()
+        stats = cache.get_stats()
+        assert stats['negative_entries'] == 2
+        assert stats['negative_hits'] == 4
+        assert stats['negative_hits_session'] == 4
+        assert stats['by_service']['search']['negative_hits'] == 3
+        assert stats['by_service']['gemini']['negative'] == 1
+        assert stats['by_service']['gemini']['hits'] == 2
+        cache.close()
+
+
+def test_peek_does_not_count_hits():
+    """測試：peek 取得相同結果，但不計入命中次數與負面快取統計"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = GlobalCache(cache_file=Path(temp_dir) / 'cache.db')
+        cache.set('wiki_search', 'Unknown', 'zh-TW', None)
+        cache.set('wiki_search', 'Contra', 'zh-TW', '魂斗羅')
+        cache.flush_to_db()
+        cache._memory_cache.clear()  # 資料庫路徑也不計入
+
+        for _ in range(2):
+            assert cache.peek('wiki_search', 'Unknown', 'zh-TW') is NEGATIVE_RESULT
+            assert cache.peek('wiki_search', 'Contra', 'zh-TW') == '魂斗羅'
+        assert cache.peek('wiki_search', 'Missing', 'zh-TW') is None
+        assert cache.get_negative_hits() == {}
+
+        assert cache.get('wiki_search', 'Unknown', 'zh-TW') is NEGATIVE_RESULT
+        assert cache.get_negative_hits() == {'wiki_search': 1}
+        cache.close()
+
+
+def test_content_key_uses_full_text():
+    """測試：長文字以完整內容的雜湊當鍵，開頭相同的內容不會互相覆蓋"""
+    prefix = 'A side-scrolling action game. ' * 5
+    first, second = prefix + 'Ending one.', prefix + 'Ending two.'
+    assert content_key(first) == content_key(first)
+    assert content_key(first) != content_key(second)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = GlobalCache(cache_file=Path(temp_dir) / 'cache.db')
+        cache.set('gemini_desc', content_key(first), 'zh-TW', '結局一')
+        cache.set('gemini_desc', content_key(second), 'zh-TW', '結局二')
+        assert cache.get('gemini_desc', content_key(first), 'zh-TW') == '結局一'
+        assert cache.get('gemini_desc', content_key(second), 'zh-TW') == '結局二'
+        cache.close()
+
+
+if __name__ == '__main__':
+    test_lru_eviction_order()
+    test_persist_and_reload()
+    test_hit_count_is_batched()
+    test_connection_per_thread()
+    test_get_many_chunked()
+    test_write_behind_threshold()
+    test_close_flushes_pending()
+    test_negative_entry_roundtrip()
+    test_negative_entry_shorter_ttl()
+    test_delete_by_service_and_query()
+    test_set_none_records_negative_and_stats()
+    test_peek_does_not_count_hits()
+    test_content_key_uses_full_text()
+    print("All cache tests passed")
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+命令列介面與處理流程測試（不需要 PyQt6）
+"""
+
+import io
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# 將專案根目錄加入 Python Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src import cli
+from src.core.pipeline import StagePipeline, PipelineError
+
+
+GAMELIST = """<?xml version="1.0"?>
+<gameList>
+    <game>
+        <path>./Tetris (USA).nes</path>
+        <name>Tetris</name>
+    </game>
+</gameList>
+"""
+
+
+def run_cli(argv):
+    """執行 CLI 並回傳 (結束碼, JSON 事件列表)"""
+    stream = io.StringIO()
+    code = cli.main(argv, stream=stream)
+    events = [json.loads(line) for line in stream.getvalue().splitlines()]
+    return code, events
+
+
+def test_scan_emits_json_lines():
+    """測試：scan 子命令輸出 JSON Lines 並複製 gamelist.xml"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        (temp / 'roms' / 'nes').mkdir(parents=True)
+        (temp / 'roms' / 'nes' / 'gamelist.xml').write_text(GAMELIST, encoding='utf-8')
+
+        code, events = run_cli([
+            'scan', '--json', '--roms', str(temp / 'roms'),
+            '--cache-dir', str(temp / 'cache'),
+            '--settings', str(temp / 'settings.json')])
+
+        assert code == 0
+        kinds = {event['event'] for event in events}
+        assert {'log', 'progress', 'result'} <= kinds
+        assert all(event['stage'] == 'scan' for event in events)
+        assert events[-1]['result'] == {'copied': 1, 'unchanged': 0}
+        assert (temp / 'cache' / 'nes' / 'gamelist.xml').exists()
+
+        # 來源未變更：第二次執行不再複製
+        code, events = run_cli([
+            'scan', '--json', '--roms', str(temp / 'roms'),
+            '--cache-dir', str(temp / 'cache'),
+            '--settings', str(temp / 'settings.json')])
+        assert code == 0
+        assert events[-1]['result'] == {'copied': 0, 'unchanged': 1}
+        assert (temp / 'manifest.json').exists()
+
+
+def test_missing_prerequisite_reports_error():
+    """測試：前置階段未完成時回報錯誤並回傳非零結束碼"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        code, events = run_cli([
+            'write', '--json', '--cache-dir', str(temp / 'missing'),
+            '--settings', str(temp / 'settings.json')])
+
+        assert code == 1
+        assert events[-1]['event'] == 'error'
+
+        pipeline = StagePipeline(local_cache_path=str(temp / 'missing'))
+        try:
+            pipeline.build_dictionaries('zh-TW')
+            assert False, "應拋出 PipelineError"
+        except PipelineError:
+            pass
+
+
+def test_cli_does_not_import_qt():
+    """測試：CLI 與處理流程不載入 Qt"""
+    assert cli.is_cli_invocation(['translate', '--json'])
+    assert not cli.is_cli_invocation([])
+    assert not any(name.startswith('PyQt') for name in sys.modules)
+
+
+if __name__ == '__main__':
+    test_scan_emits_json_lines()
+    test_missing_prerequisite_reports_error()
+    test_cli_does_not_import_qt()
+    print("All CLI tests passed")
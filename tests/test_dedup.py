@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+跨平台去重測試（不連網，使用假的服務物件）
+"""
+
+import sys
+from pathlib import Path
+
+# 將專案根目錄加入 Python Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.dictionary import GameEntry
+from src.core.translator import TranslationEngine
+from src.core.async_engine import AsyncTranslationEngine
+from src.core.dedup import CrossPlatformDedup
+
+
+class CountingWikiService:
+    """模擬維基百科服務：記錄查詢次數"""
+
+    def __init__(self):
+        self.queries = []
+
+    def search(self, name, language):
+        self.queries.append(name)
+        return f"譯名-{name}"
+
+    def clear_cache(self, query=None):
+        pass
+
+
+def make_dictionaries():
+    return {
+        'nes': {
+            'Tetris (USA).nes': GameEntry(key='Tetris (USA).nes', original_name='Tetris (USA).nes'),
+            'Contra (USA).nes': GameEntry(key='Contra (USA).nes', original_name='Contra (USA).nes'),
+        },
+        'gb': {
+            'Tetris (World) (Rev 1).gb': GameEntry(key='Tetris (World) (Rev 1).gb',
+                                                   original_name='Tetris (World) (Rev 1).gb'),
+            'Pac-Man (USA).gb': GameEntry(key='Pac-Man (USA).gb', original_name='Pac-Man (USA).gb'),
+        },
+        'mame': {
+            'Tetris.zip': GameEntry(key='Tetris.zip', original_name='Tetris.zip'),
+            'Pac-Man.zip': GameEntry(key='Pac-Man.zip', original_name='Pac-Man.zip',
+                                     name='小精靈', name_source='wiki'),
+        },
+    }
+
+
+def test_groups_by_clean_title():
+    """測試：依清理後標題分組，已有譯名的標題直接沿用"""
+    engine = TranslationEngine(target_language='zh-TW')
+    dictionaries = make_dictionaries()
+
+    dedup = CrossPlatformDedup(engine.clean_filename)
+    stats = dedup.build(dictionaries)
+
+    assert stats.entries == 6
+    assert stats.titles == 3
+    # Pac-Man 沿用 mame 的譯名，只剩 Tetris、Contra 需要查詢
+    assert stats.reused == 1
+    assert stats.lookups == 2
+    assert dictionaries['gb']['Pac-Man (USA).gb'].name == '小精靈'
+    assert dedup.is_resolved(dictionaries['gb']['Pac-Man (USA).gb'])
+    assert not dedup.is_resolved(dictionaries['mame']['Pac-Man.zip'])
+
+
+def test_fan_out_avoids_lookups():
+    """測試：每個標題只查詢一次，結果套用到所有平台"""
+    wiki = CountingWikiService()
+    engine = TranslationEngine(target_language='ja')
+    engine.set_wiki_service(wiki)
+    dictionaries = make_dictionaries()
+
+    dedup = CrossPlatformDedup(engine.clean_filename)
+    dedup.build(dictionaries)
+
+    def apply_name(entry, output, force):
+        entry.name = output.name
+        entry.name_source = output.name_source
+        dedup.fan_out(entry)
+
+    AsyncTranslationEngine(engine, max_in_flight=4).run(
+        dedup.representatives, translate_desc=False, skip_translated=False,
+        on_result=apply_name)
+
+    assert sorted(wiki.queries) == ['Contra', 'Tetris']
+    for platform in ('nes', 'gb', 'mame'):
+        tetris = [e for e in dictionaries[platform].values()
+                  if e.original_name.startswith('Tetris')][0]
+        assert tetris.name == '譯名-Tetris'
+        assert dedup.is_resolved(tetris)
+    assert dedup.stats.fanned_out == 2
+    assert dedup.stats.lookups_avoided == 3
+
+    # 逐平台翻譯時，已去重的項目不再查詢名稱
+    wiki.queries.clear()
+    AsyncTranslationEngine(engine, max_in_flight=4).run(
+        list(dictionaries['gb'].values()), translate_desc=False,
+        skip_translated=False, skip_name=dedup.is_resolved)
+    assert wiki.queries == []
+
+
+def test_retranslate_entries_are_excluded():
+    """測試：標記重翻的項目不沿用其他平台的譯名"""
+    engine = TranslationEngine(target_language='zh-TW')
+    entry = GameEntry(key='Tetris.zip', original_name='Tetris.zip',
+                      name='錯誤譯名', name_source='wiki', needs_retranslate=True)
+    dictionaries = {
+        'nes': {'Tetris.nes': GameEntry(key='Tetris.nes', original_name='Tetris.nes')},
+        'mame': {'Tetris.zip': entry},
+    }
+
+    dedup = CrossPlatformDedup(engine.clean_filename)
+    stats = dedup.build(dictionaries)
+
+    assert stats.entries == 1
+    assert stats.reused == 0
+    assert dedup.representatives == [dictionaries['nes']['Tetris.nes']]
+    assert not dedup.is_resolved(entry)
+
+
+if __name__ == '__main__':
+    test_groups_by_clean_title()
+    test_fan_out_avoids_lookups()
+    test_retranslate_entries_are_excluded()
+    print("All dedup tests passed")
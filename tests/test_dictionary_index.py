@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+字典統計索引測試
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# 將專案根目錄加入 Python Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.dictionary import DictionaryManager, DictionaryStats, GameEntry
+
+
+def make_dictionary():
+    return {
+        'a.zip': GameEntry(key='a.zip', original_name='A', name='甲', name_source='wiki'),
+        'b.zip': GameEntry(key='b.zip', original_name='B'),
+        'c.zip': GameEntry(key='c.zip', original_name='C', name='丙', name_source='wiki',
+                           desc='描述', desc_source='api', needs_retranslate=True),
+    }
+
+
+def test_stats_from_index_without_loading(tmp_path, language_packs):
+    """測試：儲存後可由索引取得統計，不需載入字典"""
+    manager = DictionaryManager(tmp_path / 'dicts')
+    manager.save_dictionary('zh-TW', 'nes', make_dictionary())
+
+    def fail_load(*args):
+        raise AssertionError("不應載入完整字典")
+
+    # 新的管理器實例也能讀到索引檔
+    fresh = DictionaryManager(tmp_path / 'dicts')
+    fresh.load_dictionary = fail_load
+    stats = fresh.get_dictionary_stats('zh-TW', 'nes')
+
+    assert stats == DictionaryStats(entries=3, name_translated=2,
+                                    desc_translated=1, needs_retranslate=1)
+    assert not stats.is_complete()
+    assert fresh.get_dictionary_stats('zh-TW', 'snes') == DictionaryStats()
+
+
+def test_index_invalidated_when_file_changes(tmp_path, language_packs):
+    """測試：字典檔被外部修改後，索引自動失效並重新計算"""
+    manager = DictionaryManager(tmp_path / 'dicts')
+    manager.save_dictionary('zh-TW', 'nes', make_dictionary())
+
+    # 外部修改（例如 git pull 更新語系包）
+    time.sleep(0.01)
+    pack_path = language_packs / 'zh-TW' / 'nes.json'
+    data = json.loads(pack_path.read_text(encoding='utf-8'))
+    data['b.zip']['name'] = '乙'
+    data['b.zip']['name_source'] = 'manual'
+    data['c.zip']['needs_retranslate'] = False
+    pack_path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+
+    stats = DictionaryManager(tmp_path / 'dicts').get_dictionary_stats('zh-TW', 'nes')
+    assert stats.name_translated == 3
+    assert stats.needs_retranslate == 0
+    assert stats.is_complete(translate_name=True, translate_desc=False)
+    assert not stats.is_complete(translate_name=True, translate_desc=True)
+
+
+def test_index_is_not_a_platform(tmp_path, language_packs):
+    """測試：索引檔不會被當成平台字典"""
+    manager = DictionaryManager(tmp_path / 'dicts')
+    manager.save_dictionary('zh-TW', 'nes', make_dictionary())
+
+    assert manager.get_available_platforms('zh-TW') == ['nes']
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,428 @@
+# -*- coding: utf-8 -*-
+"""
+Gemini 批次排程測試（同時送出多個批次、依序套用結果、取消、配額、描述模式）
+
+以 MODEL_FACTORY 注入假模型，不需要 API Key 與網路。
+"""
+
+import contextlib
+import json
+import re
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# 將專案根目錄加入 Python Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.services.gemini_batch import GeminiBatchService, BatchJob
+from src.utils import cache as cache_module
+from src.utils.cache import content_key
+
+_NUMBERED_LINE = re.compile(r'^(\d+)\.\s+(.+)$', re.MULTILINE)
+
+
+class FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class BlockedResponse:
+    """被安全過濾擋下的回應：讀取 text 會拋出 ValueError（與 SDK 相同）"""
+
+    @property
+    def text(self):
+        raise ValueError('response was blocked')
+
+
+class FakeModel:
+    """依 prompt 中的遊戲清單回答「譯:原名」，記錄同時進行的請求數"""
+
+    STREAM_CHUNK_SIZE = 16
+
+    def __init__(self, latency=lambda names: 0.05):
+        self.latency = latency
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def respond(self, names):
+        """回應文字，None 表示被擋下"""
+        return json.dumps([{'id': i + 1, 'name': f'譯:{name}'} for i, name in enumerate(names)],
+                          ensure_ascii=False)
+
+    def parse_prompt(self, prompt: str):
+        # 遊戲清單是最後一段從 1 開始的編號清單（前面的規則說明也有編號）
+        names = []
+        for number, name in _NUMBERED_LINE.findall(prompt):
+            if number == '1':
+                names = []
+            names.append(name)
+        return names
+
+    def generate_content(self, prompt: str, stream: bool = False):
+        names = self.parse_prompt(prompt)
+
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.latency(names))
+        finally:
+            with self._lock:
+                self.active -= 1
+
+        text = self.respond(names)
+        if text is None:
+            return [BlockedResponse()] if stream else BlockedResponse()
+        if not stream:
+            return FakeResponse(text)
+        size = self.STREAM_CHUNK_SIZE
+        return [FakeResponse(text[i:i + size]) for i in range(0, len(text), size)]
+
+
+@contextlib.contextmanager
+def make_service(model: FakeModel, **kwargs):
+    """建立使用假模型與暫存快取的服務，離開時還原"""
+    saved_cache = cache_module._global_cache
+    with tempfile.TemporaryDirectory() as temp:
+        cache_module._global_cache = cache_module.GlobalCache(
+            cache_file=Path(temp) / 'cache.db')
+        GeminiBatchService.MODEL_FACTORY = lambda name: model
+        # 固定批次大小，批次數才能預期；不限制每分鐘配額
+        kwargs.setdefault('adaptive_batch_size', False)
+        kwargs.setdefault('rpm', 0)
+        kwargs.setdefault('tpm', 0)
+        try:
+            yield GeminiBatchService(api_key='test', request_delay=0.001, **kwargs)
+        finally:
+            cache_module._global_cache.close()
+            cache_module._global_cache = saved_cache
+            GeminiBatchService.MODEL_FACTORY = None
+
+
+def make_jobs(platforms: int = 3, games: int = 10):
+    return [BatchJob([f'{p} Game {i}' for i in range(games)], f'platform{p}')
+            for p in range(platforms)]
+
+
+def test_batches_in_flight_across_platforms():
+    """測試：跨平台同時送出多個批次，總耗時遠低於逐一送出"""
+    model = FakeModel(latency=lambda names: 0.1)
+    with make_service(model, batch_size=4, max_in_flight=3) as service:
+        jobs = make_jobs()
+
+        start = time.monotonic()
+        results = service.translate_many(jobs, 'zh-TW')
+        elapsed = time.monotonic() - start
+
+    # 3 個平台 × 3 個批次，同時 3 個
+    assert model.calls == 9
+    assert model.max_active == 3
+    assert elapsed < 9 * 0.1 * 0.6
+    for job, result in zip(jobs, results):
+        assert result.success_count == len(job.game_names)
+        assert result.translations[job.game_names[0]] == f'譯:{job.game_names[0]}'
+        assert result.failed == []
+
+
+def test_results_applied_in_submission_order():
+    """測試：較早送出的批次較慢回應時，結果與平台完成回呼仍依順序"""
+    # 第一個平台的批次最慢
+    model = FakeModel(latency=lambda names: 0.3 if names[0].startswith('0 ') else 0.02)
+    progress = []
+    done = []
+
+    def on_job_done(index, job, result):
+        # 回呼時該平台的結果已全部套用、快取已寫入
+        assert result.success_count == len(job.game_names)
+        assert service.cache.get('gemini', job.game_names[-1], 'zh-TW') is not None
+        done.append(index)
+
+    with make_service(model, batch_size=5, max_in_flight=4) as service:
+        results = service.translate_many(
+            make_jobs(), 'zh-TW',
+            progress_callback=lambda current, total, message: progress.append((current, total, message)),
+            on_job_done=on_job_done)
+
+    assert done == [0, 1, 2]
+    assert all(result.success_count == 10 for result in results)
+    # 進度為所有平台合計且不會倒退
+    assert progress[0][2].startswith('快取命中 0 筆')
+    assert all(total == 30 for _, total, _ in progress)
+    currents = [current for current, _, _ in progress]
+    assert currents == sorted(currents)
+    assert currents[-1] == 30
+    assert any(message.startswith('[platform1] 批次') for _, _, message in progress)
+
+
+def test_cancel_stops_submitting_new_batches():
+    """測試：取消後不再送出新批次，未完成的名稱列為失敗，不再回呼平台完成"""
+    model = FakeModel(latency=lambda names: 0.05)
+    cancelled = threading.Event()
+    done = []
+
+    def on_job_done(index, job, result):
+        done.append(index)
+        cancelled.set()
+
+    with make_service(model, batch_size=5, max_in_flight=2) as service:
+        jobs = make_jobs(platforms=4)
+        results = service.translate_many(
+            jobs, 'zh-TW', cancel_check=cancelled.is_set, on_job_done=on_job_done)
+
+    # 第一個平台完成時取消：之後最多再套用已送出的批次
+    assert done == [0]
+    assert model.calls <= 2 + 2
+    for job, result in zip(jobs, results):
+        assert set(result.translations) | set(result.failed) == set(job.game_names)
+    assert len(results[-1].failed) == 10
+
+
+def test_translate_all_uses_cache_and_scheduler():
+    """測試：translate_all 維持原本的介面，快取命中的名稱不再送出"""
+    model = FakeModel(latency=lambda names: 0.01)
+    names = [f'Game {i}' for i in range(7)]
+    with make_service(model, batch_size=3, max_in_flight=2) as service:
+        first = service.translate_all(names, 'zh-TW', platform='nes')
+        second = service.translate_all(names + ['New Game'], 'zh-TW', platform='nes')
+
+    assert first.success_count == 7
+    assert second.success_count == 8
+    # 第一次 3 批，第二次只送出新名稱 1 批
+    assert model.calls == 4
+
+
+class TruncatingModel(FakeModel):
+    """批次超過 limit 個項目時，回應在輸出上限處被截斷"""
+
+    def __init__(self, limit: int):
+        super().__init__(latency=lambda names: 0.01)
+        self.limit = limit
+        self.sizes = []
+
+    def respond(self, names):
+        text = super().respond(names)
+        self.sizes.append(len(names))
+        if len(names) > self.limit:
+            text = text[:len(text) // 2]
+        return text
+
+
+def test_adaptive_batch_size_shrinks_after_truncation():
+    """測試：回應被截斷後，之後的批次自動縮小到不會截斷的大小"""
+    model = TruncatingModel(limit=12)
+    names = [f'Game {i}' for i in range(80)]
+    with make_service(model, batch_size=30, max_in_flight=1,
+                      adaptive_batch_size=True) as service:
+        result = service.translate_all(names, 'zh-TW')
+        stats = service.batch_sizer.get_stats()
+
+    # 30 與 15 都被截斷，之後切出的新批次不超過 12；截斷的項目拆半重送後都完成
+    assert model.sizes[0] == 30
+    assert stats['truncated'] == 2
+    assert stats['size'] <= 12
+    assert result.success_count == len(names)
+    assert result.failed == []
+
+
+class PoisonModel(FakeModel):
+    """含 blocked 名稱的批次沒有回應內容，skipped 名稱的 id 被漏掉"""
+
+    def __init__(self, blocked=(), skipped=()):
+        super().__init__(latency=lambda names: 0.01)
+        self.blocked = set(blocked)
+        self.skipped = set(skipped)
+        self.sizes = []
+
+    def respond(self, names):
+        self.sizes.append(len(names))
+        if set(names) & self.blocked:
+            return None
+        items = json.loads(super().respond(names))
+        return json.dumps([item for item in items if item['name'][2:] not in self.skipped],
+                          ensure_ascii=False)
+
+
+def test_bisect_isolates_blocked_name():
+    """測試：整批沒有回應時拆半重送，只有有問題的名稱多花請求"""
+    model = PoisonModel(blocked=['Game 5'])
+    names = [f'Game {i}' for i in range(8)]
+    with make_service(model, batch_size=8, max_in_flight=2) as service:
+        result = service.translate_all(names, 'zh-TW')
+
+    # 8 → 4+4 → 2+2 → 1+1
+    assert model.sizes == [8, 4, 4, 2, 2, 1, 1]
+    assert result.success_count == 7
+    assert result.failed == ['Game 5']
+    assert result.retries == 6
+
+
+def test_bisect_resends_only_missing_ids():
+    """測試：模型漏掉的項目單獨重送，其他項目不重送；單一項目仍失敗才列為失敗"""
+    model = PoisonModel(skipped=['Game 3', 'Game 9'])
+    names = [f'Game {i}' for i in range(16)]
+    progress = []
+    with make_service(model, batch_size=16, max_in_flight=2) as service:
+        result = service.translate_all(
+            names, 'zh-TW',
+            progress_callback=lambda current, total, message: progress.append(message))
+
+    # 16 → 漏掉 2 個，拆成 1+1
+    assert model.sizes == [16, 1, 1]
+    assert result.success_count == 14
+    assert sorted(result.failed) == ['Game 3', 'Game 9']
+    assert result.retries == 2
+    assert any(message.startswith('拆半重送 1 個遊戲') for message in progress)
+
+
+class LegacyFormatModel(FakeModel):
+    """含 Game 0 的批次以未使用結構化輸出時常見的錯誤格式回應（程式碼區塊、null"）"""
+
+    def respond(self, names):
+        if 'Game 0' not in names:
+            return super().respond(names)
+        items = ', '.join(
+            '{"id": %d, "name": null"}' % (i + 1) if name == 'Game 0'
+            else '{"id": %d, "name": "譯:%s"}' % (i + 1, name)
+            for i, name in enumerate(names))
+        return f'```json\n[{items}]\n```'
+
+
+def test_parse_failure_rate_metric():
+    """測試：串流與非串流都會記錄解析失敗率，格式錯誤的回應仍以舊的修復方式解析"""
+    for stream in (True, False):
+        model = LegacyFormatModel(latency=lambda names: 0.01)
+        names = [f'Game {i}' for i in range(12)]
+        with make_service(model, batch_size=4, max_in_flight=2, stream=stream) as service:
+            result = service.translate_all(names, 'zh-TW')
+            stats = service.get_parse_stats()
+
+        assert result.success_count == 11
+        assert result.unknown == ['Game 0']
+        assert model.calls == 3  # 修復後完整解析，不需要重送
+        assert stats['responses'] == 3
+        assert stats['parse_failures'] == 1
+        assert abs(stats['failure_rate'] - 1 / 3) < 1e-9
+
+
+class AnswerModel(FakeModel):
+    """依 answers 回答指定名稱（未指定的回答「譯:原名」）"""
+
+    def __init__(self, answers, **kwargs):
+        super().__init__(**kwargs)
+        self.answers = answers
+
+    def respond(self, names):
+        return json.dumps([{'id': i + 1, 'name': self.answers.get(name, f'譯:{name}')}
+                           for i, name in enumerate(names)], ensure_ascii=False)
+
+
+def test_only_null_answers_are_negative_cached():
+    """測試：保留原名是有效的翻譯；只有 null 記錄為負面快取，無效的說明文字列為失敗"""
+    model = AnswerModel({'R-Type': 'R-Type', 'Nobody': None, 'Vague': '此遊戲沒有中文譯名'},
+                        latency=lambda names: 0)
+    names = ['R-Type', 'Nobody', 'Vague', 'Contra']
+    with make_service(model, batch_size=4) as service:
+        result = service.translate_all(names, 'zh-TW')
+        assert service.cache.get('gemini', 'R-Type', 'zh-TW') == 'R-Type'
+        assert service.cache.get('gemini', 'Nobody', 'zh-TW') is cache_module.NEGATIVE_RESULT
+        assert service.cache.get('gemini', 'Vague', 'zh-TW') is None
+
+    assert result.translations == {'R-Type': 'R-Type', 'Contra': '譯:Contra'}
+    assert result.unknown == ['Nobody']
+    assert sorted(result.failed) == ['Nobody', 'Vague']
+
+
+class DescriptionModel(FakeModel):
+    """描述模式：依 prompt 中的 JSON 輸入陣列回答「譯:原文」，null_texts 中的項目回答 null"""
+
+    def __init__(self, null_texts=(), **kwargs):
+        super().__init__(**kwargs)
+        self.null_texts = set(null_texts)
+        self.batches = []
+
+    def parse_prompt(self, prompt: str):
+        items = json.loads(re.search(r'^\[\{"id".*\]$', prompt, re.MULTILINE).group(0))
+        texts = [item.get('text', item.get('name')) for item in items]
+        self.batches.append(texts)
+        return texts
+
+    def respond(self, texts):
+        return json.dumps([{'id': i + 1, 'text': None if text in self.null_texts else f'譯:{text}'}
+                           for i, text in enumerate(texts)], ensure_ascii=False)
+
+
+def test_descriptions_packed_by_token_budget():
+    """測試：描述依輸出 token 預算裝入批次，整個平台只需要數十次請求"""
+    model = DescriptionModel(latency=lambda texts: 0)
+    descriptions = [f'Game {i} is a side-scrolling action game. ' + 'x' * (100 + i % 400)
+                    for i in range(600)]
+    with make_service(model, max_in_flight=4) as service:
+        result = service.translate_descriptions(descriptions + descriptions[:10], 'zh-TW')
+        budget = service.DESC_OUTPUT_BUDGET
+        task_tokens = [sum(len(text) // 2 + service.OUTPUT_TOKENS_PER_ITEM for text in batch)
+                       for batch in model.batches]
+
+    # 重複的描述只送一次
+    assert result.total == 600
+    assert result.success_count == 600
+    assert result.translations[descriptions[5]] == f'譯:{descriptions[5]}'
+    assert sum(len(batch) for batch in model.batches) == 600
+    assert 10 <= model.calls <= 40
+    assert all(tokens <= budget for tokens in task_tokens)
+
+
+def test_description_cache_keyed_by_full_text():
+    """測試：開頭相同的描述各自快取（以完整內容的雜湊為鍵），再次翻譯不送出請求"""
+    model = DescriptionModel(latency=lambda texts: 0)
+    prefix = 'A' * 150
+    descriptions = [prefix + ' first ending', prefix + ' second ending']
+    with make_service(model) as service:
+        first = service.translate_descriptions(descriptions, 'zh-TW')
+        second = service.translate_descriptions(descriptions, 'zh-TW')
+        cached = service.cache.get('gemini_desc', content_key(descriptions[1]), 'zh-TW')
+
+    assert first.translations[descriptions[0]] != first.translations[descriptions[1]]
+    assert second.translations == first.translations
+    assert cached == f'譯:{descriptions[1]}'
+    assert model.calls == 1
+
+
+def test_generate_descriptions_by_name():
+    """測試：依遊戲名稱批次產生簡介，不認識的遊戲記錄為負面快取，不與名稱翻譯共用快取"""
+    model = DescriptionModel(null_texts={'Obscure Game'}, latency=lambda texts: 0)
+    names = [f'Game {i}' for i in range(100)] + ['Obscure Game']
+    with make_service(model) as service:
+        service.cache.set('gemini', 'Game 0', 'zh-TW', '遊戲零')  # 名稱翻譯的快取
+        result = service.generate_descriptions(names, 'zh-TW', platform='nes')
+        again = service.generate_descriptions(names, 'zh-TW', platform='nes')
+
+    assert result.success_count == 100
+    assert result.translations['Game 0'] == '譯:Game 0'
+    assert result.unknown == ['Obscure Game']
+    assert again.unknown == ['Obscure Game']
+    # 依每個遊戲的預估輸出 token 數分批，第二次全部命中快取
+    per_batch = GeminiBatchService.DESC_OUTPUT_BUDGET // GeminiBatchService.GENERATED_DESC_TOKENS
+    assert model.calls == -(-len(names) // per_batch)
+
+
+if __name__ == '__main__':
+    test_batches_in_flight_across_platforms()
+    test_results_applied_in_submission_order()
+    test_cancel_stops_submitting_new_batches()
+    test_translate_all_uses_cache_and_scheduler()
+    test_adaptive_batch_size_shrinks_after_truncation()
+    test_bisect_isolates_blocked_name()
+    test_bisect_resends_only_missing_ids()
+    test_parse_failure_rate_metric()
+    test_only_null_answers_are_negative_cached()
+    test_descriptions_packed_by_token_budget()
+    test_description_cache_keyed_by_full_text()
+    test_generate_descriptions_by_name()
+    print("All Gemini scheduler tests passed")
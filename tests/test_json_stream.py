@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+JSON 串流解析測試（跨片段的元素、字串中的括號、截斷、格式錯誤的元素）
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# 將專案根目錄加入 Python Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.json_stream import JsonArrayStream
+
+
+def feed_chunks(stream: JsonArrayStream, text: str, size: int):
+    """將文字切成固定大小的片段送入，回傳每次完成的元素"""
+    completed = []
+    for i in range(0, len(text), size):
+        completed.append(stream.feed(text[i:i + size]))
+    return completed
+
+
+def test_items_completed_across_chunks():
+    """測試：元素跨越片段邊界時，在最後一個片段收到後才完成"""
+    items = [{'id': i, 'name': f'遊戲 {i}'} for i in range(1, 6)]
+    text = json.dumps(items, ensure_ascii=False)
+    stream = JsonArrayStream()
+
+    completed = feed_chunks(stream, text, 7)
+    assert stream.items == items
+    assert stream.complete and stream.errors == 0
+    # 每個元素只回傳一次，且在陣列結束前就陸續取得
+    assert sum(len(batch) for batch in completed) == 5
+    assert completed[0] == []
+    assert sum(len(batch) for batch in completed[:-1]) >= 4
+
+
+def test_strings_with_brackets_and_escapes():
+    """測試：字串中的括號、跳脫的引號不影響元素邊界"""
+    items = [{'id': 1, 'name': 'Zelda {II} ] [x]'}, {'id': 2, 'name': 'Say \"hi\" \\\\ }'}]
+    text = json.dumps(items)
+    stream = JsonArrayStream()
+    feed_chunks(stream, text, 3)
+    assert stream.items == items
+
+
+def test_markdown_fence_and_trailing_text():
+    """測試：陣列前後的 markdown 標記與說明文字會被忽略"""
+    text = '```json\n[\n  {"id": 1, "name": "A"},\n  {"id": 2, "name": null}\n]\n```\n以上'
+    stream = JsonArrayStream()
+    stream.feed(text)
+    assert stream.items == [{'id': 1, 'name': 'A'}, {'id': 2, 'name': None}]
+    assert stream.complete
+    assert stream.text == text
+
+
+def test_truncated_keeps_complete_items():
+    """測試：回應中途截斷時，已完整的元素仍然有效"""
+    stream = JsonArrayStream()
+    stream.feed('[{"id": 1, "name": "A"}, {"id": 2, "na')
+    assert stream.items == [{'id': 1, 'name': 'A'}]
+    assert not stream.complete
+
+
+def test_malformed_item_repair_and_errors():
+    """測試：格式錯誤的元素以 repair 修復，無法修復的只影響該元素"""
+    text = '[{"id": 1, "name": "A",}, {"id": 2 "name": "B"}, {"id": 3, "name": "C"}]'
+
+    stream = JsonArrayStream(repair=lambda s: s.replace(',}', '}'))
+    stream.feed(text)
+    assert stream.items == [{'id': 1, 'name': 'A'}, {'id': 3, 'name': 'C'}]
+    assert stream.errors == 1
+    assert stream.complete
+
+    # 不是陣列的回應
+    prose = JsonArrayStream()
+    prose.feed('抱歉，我不知道這些遊戲。')
+    assert not prose.started and prose.items == []
+
+
+if __name__ == '__main__':
+    test_items_completed_across_chunks()
+    test_strings_with_brackets_and_escapes()
+    test_markdown_fence_and_trailing_text()
+    test_truncated_keeps_complete_items()
+    test_malformed_item_repair_and_errors()
+    print("All JSON stream tests passed")
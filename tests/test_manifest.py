@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""
+變更清單測試：各階段略過沒有變更的平台
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# 將專案根目錄加入 Python Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import src.core as core_module
+from src.core.dictionary import DictionaryManager
+from src.core.manifest import ChangeManifest
+from src.core import storage as storage_module
+from src.core.pipeline import StagePipeline
+from src.core.translator import TranslationEngine, TranslationOutput, TranslationResult
+from src.utils import cache as cache_module
+from src.utils.settings import AppSettings
+
+
+GAMELIST = """<?xml version="1.0"?>
+<gameList>
+    <game>
+        <path>./Tetris (USA).nes</path>
+        <name>Tetris</name>
+    </game>
+</gameList>
+"""
+
+
+def make_pipeline(temp):
+    return StagePipeline(settings=AppSettings(), local_cache_path=str(temp / 'cache'),
+                         manifest_path=temp / 'manifest.json')
+
+
+def run_all(temp):
+    """執行階段一、二、四（階段三需要網路服務）"""
+    pipeline = make_pipeline(temp)
+    return (pipeline.scan(str(temp / 'roms')),
+            pipeline.build_dictionaries('zh-TW'),
+            pipeline.write_back('zh-TW', auto_backup=False))
+
+
+def test_second_run_skips_everything(tmp_path, temp_dictionaries):
+    """測試：來源與字典都沒有變更時，第二次執行全部略過"""
+    for platform in ('nes', 'snes'):
+        (tmp_path / 'roms' / platform).mkdir(parents=True)
+        (tmp_path / 'roms' / platform / 'gamelist.xml').write_text(GAMELIST, encoding='utf-8')
+
+    scan, build, write = run_all(tmp_path)
+    assert scan == {'copied': 2, 'unchanged': 0}
+    assert build['unchanged'] == 0 and build['games'] == 2
+
+    # 翻譯一個平台
+    manager = DictionaryManager()
+    dictionary = manager.load_dictionary('zh-TW', 'nes')
+    dictionary['Tetris (USA)'].name = '俄羅斯方塊'
+    dictionary['Tetris (USA)'].name_source = 'wiki'
+    manager.save_dictionary('zh-TW', 'nes', dictionary)
+
+    scan, build, write = run_all(tmp_path)
+    assert scan == {'copied': 0, 'unchanged': 2}
+    assert build == {'platforms': 2, 'games': 2, 'unchanged': 2}
+    assert write['written'] == 1 and write['unchanged'] == 1
+    assert '俄羅斯方塊' in (tmp_path / 'cache' / 'nes' / 'gamelist.xml').read_text(encoding='utf-8')
+
+    # 寫回後的暫存區也視為已知狀態：第三次執行完全不做事
+    scan, build, write = run_all(tmp_path)
+    assert scan['unchanged'] == 2 and build['unchanged'] == 2
+    assert write['unchanged'] == 2 and write['written'] == 0
+
+
+def test_changed_source_is_copied_again(tmp_path, temp_dictionaries):
+    """測試：來源變更或暫存區被其他程式修改時重新複製"""
+    (tmp_path / 'roms' / 'nes').mkdir(parents=True)
+    source = tmp_path / 'roms' / 'nes' / 'gamelist.xml'
+    source.write_text(GAMELIST, encoding='utf-8')
+    run_all(tmp_path)
+
+    source.write_text(GAMELIST.replace('Tetris</name>', 'Tetris DX</name>'), encoding='utf-8')
+    scan, build, _ = run_all(tmp_path)
+    assert scan['copied'] == 1
+    assert build['unchanged'] == 0
+
+    cache_file = tmp_path / 'cache' / 'nes' / 'gamelist.xml'
+    cache_file.write_text(GAMELIST + '<!-- edited -->', encoding='utf-8')
+    assert make_pipeline(tmp_path).scan(str(tmp_path / 'roms'))['copied'] == 1
+
+    # 只是被 touch（內容相同）仍視為未變更
+    stat = cache_file.stat()
+    os.utime(cache_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    assert make_pipeline(tmp_path).scan(str(tmp_path / 'roms'))['unchanged'] == 1
+
+
+CONTRA = """    <game>
+        <path>./Contra (USA).nes</path>
+        <name>Contra</name>
+    </game>
+"""
+
+
+class FlakyEngine(TranslationEngine):
+    """failing 中的遊戲翻譯時發生網路錯誤的翻譯引擎"""
+
+    calls = []
+    seen = []
+    failing = set()
+
+    def translate_game(self, entry, translate_name=True, translate_desc=True,
+                       skip_translated=True, progress_callback=None):
+        FlakyEngine.seen.append(entry.original_name)
+        if skip_translated and entry.has_name_translation():
+            return TranslationOutput(result=TranslationResult.SKIPPED)
+        FlakyEngine.calls.append(entry.original_name)
+        if entry.original_name in FlakyEngine.failing:
+            raise ConnectionError('429 Too Many Requests')
+        return TranslationOutput(result=TranslationResult.SUCCESS,
+                                 name=f'{entry.original_name}（譯）', name_source='wiki')
+
+
+def test_failed_entries_are_retried(tmp_path, temp_dictionaries, monkeypatch):
+    """測試：有項目暫時翻譯失敗時不記錄為已翻譯，下次執行會重試"""
+    pytest.importorskip('requests')  # 階段三會載入網路服務模組
+    (tmp_path / 'roms' / 'nes').mkdir(parents=True)
+    (tmp_path / 'roms' / 'nes' / 'gamelist.xml').write_text(
+        GAMELIST.replace('</gameList>', CONTRA + '</gameList>'), encoding='utf-8')
+    run_all(tmp_path)
+
+    FlakyEngine.calls = []
+    FlakyEngine.failing = {'Contra'}
+    monkeypatch.setattr(core_module, 'TranslationEngine', FlakyEngine)
+    monkeypatch.setattr(cache_module, '_global_cache',
+                        cache_module.GlobalCache(cache_file=tmp_path / 'cache.db'))
+
+    def translate():
+        make_pipeline(tmp_path).translate('zh-TW', translate_desc=False, request_delay=0)
+        return DictionaryManager().load_dictionary('zh-TW', 'nes')
+
+    dictionary = translate()
+    assert dictionary['Tetris (USA)'].name == 'Tetris（譯）'
+    assert not dictionary['Contra (USA)'].name
+
+    # 第二次執行只重試失敗的項目
+    FlakyEngine.calls = []
+    FlakyEngine.failing = set()
+    dictionary = translate()
+    assert dictionary['Contra (USA)'].name == 'Contra（譯）'
+    assert FlakyEngine.calls == ['Contra']
+
+    # 全部完成後記錄為已翻譯，第三次執行略過
+    FlakyEngine.calls = []
+    translate()
+    assert FlakyEngine.calls == []
+    cache_module._global_cache.close()
+
+
+def test_sqlite_translates_only_pending_entries(tmp_path, temp_dictionaries, monkeypatch):
+    """測試：SQLite 後端的階段三只取出待翻譯項目，不載入整個平台"""
+    pytest.importorskip('requests')  # 階段三會載入網路服務模組
+    monkeypatch.setattr(storage_module, '_default_storage', storage_module.STORAGE_SQLITE)
+    (tmp_path / 'roms' / 'nes').mkdir(parents=True)
+    (tmp_path / 'roms' / 'nes' / 'gamelist.xml').write_text(
+        GAMELIST.replace('</gameList>', CONTRA + '</gameList>'), encoding='utf-8')
+    run_all(tmp_path)
+
+    manager = DictionaryManager()
+    dictionary = manager.load_dictionary('zh-TW', 'nes')
+    dictionary['Tetris (USA)'].name = '俄羅斯方塊'
+    dictionary['Tetris (USA)'].name_source = 'wiki'
+    manager.save_dictionary('zh-TW', 'nes', dictionary)
+    manager.storage.close()
+
+    FlakyEngine.calls = []
+    FlakyEngine.seen = []
+    FlakyEngine.failing = set()
+    monkeypatch.setattr(core_module, 'TranslationEngine', FlakyEngine)
+    monkeypatch.setattr(cache_module, '_global_cache',
+                        cache_module.GlobalCache(cache_file=tmp_path / 'cache.db'))
+    pipeline = StagePipeline(settings=AppSettings(cross_platform_dedup=False),
+                             local_cache_path=str(tmp_path / 'cache'),
+                             manifest_path=tmp_path / 'manifest.json')
+    pipeline.translate('zh-TW', translate_desc=False, request_delay=0)
+    assert FlakyEngine.seen == ['Contra']
+
+    # 只寫入變更的項目，其他項目保留
+    manager = DictionaryManager()
+    dictionary = manager.load_dictionary('zh-TW', 'nes')
+    assert dictionary['Tetris (USA)'].name == '俄羅斯方塊'
+    assert dictionary['Contra (USA)'].name == 'Contra（譯）'
+    manager.storage.close()
+    cache_module._global_cache.close()
+
+
+def test_translated_record_follows_dictionary_version(tmp_path):
+    """測試：字典版本或翻譯選項改變時不再視為已翻譯"""
+    manifest = ChangeManifest(tmp_path / 'manifest.json', tmp_path / 'cache')
+    manifest.record_translated('nes', 'zh-TW', '10:1', 'name=True,desc=False')
+    manifest.save()
+
+    reloaded = ChangeManifest(tmp_path / 'manifest.json', tmp_path / 'cache')
+    assert reloaded.is_translated('nes', 'zh-TW', '10:1', 'name=True,desc=False')
+    assert not reloaded.is_translated('nes', 'zh-TW', '12:2', 'name=True,desc=False')
+    assert not reloaded.is_translated('nes', 'zh-TW', '10:1', 'name=True,desc=True')
+    assert not reloaded.is_translated('nes', 'en', '10:1', 'name=True,desc=False')
+    assert not ChangeManifest(tmp_path / 'manifest.json', tmp_path / 'other').is_translated(
+        'nes', 'zh-TW', '10:1', 'name=True,desc=False')
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
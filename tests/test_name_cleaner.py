@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+檔名清理測試：預先編譯的清理步驟與 LRU 快取
+"""
+
+import sys
+from pathlib import Path
+
+# 將專案根目錄加入 Python Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.translator import TranslationEngine
+from src.utils.name_cleaner import clean, clean_game_name
+
+
+def test_clean():
+    """測試：移除副檔名、括號內容與版本標記"""
+    cases = {
+        "Pang (Europe)": "Pang",
+        "Robocop 2 (Europe)": "Robocop 2",
+        "Super Mario Bros. 3 (USA) (Rev 1).nes": "Super Mario Bros. 3",
+        "Final Fantasy VII [Disc 1] (Japan)": "Final Fantasy VII",
+        "Street Fighter II  Turbo   v1.1": "Street Fighter II Turbo",
+        "Castlevania Ver. 2 (USA)": "Castlevania",
+        "Tintin On The Moon (Europe)": "Tintin On The Moon",
+        "": "",
+    }
+    for name, expected in cases.items():
+        assert clean(name) == expected, (name, clean(name))
+
+
+def test_clean_game_name():
+    """測試：clean_game_name 另外移除光碟編號與檔案編號"""
+    assert clean_game_name("Metal Gear Solid - Disc 2 (USA).chd") == "Metal Gear Solid"
+    assert clean_game_name("251026-003036_Tetris") == "Tetris"
+    assert clean_game_name("Tetris_251026-003036") == "Tetris"
+    assert clean_game_name("- Contra (Japan) -") == "Contra"
+
+
+def test_engine_uses_cached_clean():
+    """測試：TranslationEngine.clean_filename 與 clean 共用同一份快取"""
+    engine = TranslationEngine('zh-TW')
+    clean.cache_clear()
+
+    assert engine.clean_filename("Pang (Europe)") == "Pang"
+    assert engine.clean_filename("Pang (Europe)") == "Pang"
+    assert clean("Pang (Europe)") == "Pang"
+
+    info = clean.cache_info()
+    assert info.misses == 1 and info.hits == 2
+
+
+if __name__ == '__main__':
+    test_clean()
+    test_clean_game_name()
+    test_engine_uses_cached_clean()
+    print("All name cleaner tests passed")
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+速率限制器測試（token bucket、多執行緒、429 自動降速）
+"""
+
+import sys
+import threading
+import time
+from email.utils import formatdate
+from pathlib import Path
+
+# 將專案根目錄加入 Python Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.rate_limiter import (
+    TokenBucket, QuotaLimiter, parse_retry_after, is_rate_limit_error,
+    get_rate_limiter, get_quota_limiter, configure_rate_limits
+)
+
+
+def test_burst_then_steady_rate():
+    """測試：先允許 burst 個請求，之後依速率排隊"""
+    bucket = TokenBucket(rate=20, burst=2)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    # 第三個需要等 1/20 秒，第四個 2/20 秒
+    assert abs(bucket.reserve() - 0.05) < 0.01
+    assert abs(bucket.reserve() - 0.10) < 0.01
+
+
+def test_threads_share_limit():
+    """測試：多個執行緒共用時，總速率不超過設定值"""
+    bucket = TokenBucket(rate=50, burst=1)
+    timestamps = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(5):
+            bucket.acquire()
+            with lock:
+                timestamps.append(time.monotonic())
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # 20 個請求、burst 1，至少需要 19 / 50 秒
+    assert len(timestamps) == 20
+    assert max(timestamps) - start >= 19 / 50 - 0.02
+
+
+def test_throttle_blocks_and_recovers():
+    """測試：429 時暫停並降速，成功後逐步恢復"""
+    bucket = TokenBucket(rate=10, burst=1)
+    bucket.acquire()
+
+    bucket.report_throttled(retry_after=0.2)
+    assert bucket.current_rate == 5
+    assert bucket.throttle_count == 1
+
+    # 暫停期間排隊的請求不會同時放行
+    first = bucket.reserve()
+    second = bucket.reserve()
+    assert first >= 0.19
+    assert second - first >= 1 / 5 - 0.01
+
+    for _ in range(5):
+        bucket.report_success()
+    assert bucket.current_rate == 10
+
+    # 降速有下限
+    for _ in range(10):
+        bucket.report_throttled(retry_after=0)
+    assert bucket.current_rate == 10 / 8
+
+
+def test_report_response():
+    """測試：依 HTTP 狀態碼調整"""
+    bucket = TokenBucket(rate=10, burst=1)
+    bucket.report_response(200)
+    assert bucket.throttle_count == 0
+
+    bucket.report_response(429, '1')
+    assert bucket.throttle_count == 1
+
+    bucket.report_response(503)  # 沒有 Retry-After 的 503 不視為限流
+    assert bucket.throttle_count == 1
+
+
+def test_parse_retry_after():
+    """測試：Retry-After 可以是秒數或 HTTP 日期"""
+    assert parse_retry_after('3') == 3
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('soon') is None
+
+    later = formatdate(time.time() + 30, usegmt=True)
+    assert 25 < parse_retry_after(later) <= 30
+
+
+def test_is_rate_limit_error():
+    """測試：辨識 SDK 拋出的限流錯誤"""
+    class ResourceExhausted(Exception):
+        pass
+
+    assert is_rate_limit_error(ResourceExhausted('quota'))
+    assert is_rate_limit_error(Exception('429 Too Many Requests'))
+    assert not is_rate_limit_error(ValueError('bad json'))
+
+
+def test_registry_shared_and_configurable():
+    """測試：同名限制器共用，設定檔覆寫優先於 request_delay"""
+    try:
+        a = get_rate_limiter('test_service', default_delay=0.5)
+        b = get_rate_limiter('test_service', default_delay=0.5)
+        assert a is b
+        assert a.rate == 2
+
+        configure_rate_limits({'test_service': {'rate': 8, 'burst': 3}})
+        assert a.rate == 8 and a.burst == 3
+
+        # 覆寫後，服務傳入的 request_delay 不再改變速率
+        assert get_rate_limiter('test_service', default_delay=1.0).rate == 8
+    finally:
+        configure_rate_limits({})
+
+
+def test_quota_rpm_window():
+    """測試：每分鐘請求數用盡時，等最舊的請求移出視窗"""
+    quota = QuotaLimiter(rpm=2)
+    quota.WINDOW = 0.2  # 縮短視窗以加快測試
+
+    start = time.monotonic()
+    quota.acquire()
+    quota.acquire()
+    assert time.monotonic() - start < 0.05
+    quota.acquire()
+    assert time.monotonic() - start >= 0.19
+    assert quota.get_stats()['requests'] <= 2
+
+
+def test_quota_tpm_and_settle():
+    """測試：token 配額以預估值預扣，取得實際用量後更正"""
+    quota = QuotaLimiter(tpm=100)
+    quota.WINDOW = 0.2
+
+    entry = quota.acquire(80)
+    # 實際用量較少，更正後剩餘配額足夠，不需等待
+    quota.settle(entry, 30)
+    start = time.monotonic()
+    quota.acquire(60)
+    assert time.monotonic() - start < 0.05
+    assert quota.get_stats()['tokens'] == 90
+
+    # 超過配額：等先前的請求移出視窗
+    quota.acquire(60)
+    assert time.monotonic() - start >= 0.19
+
+    # 單一請求超過上限時，視窗清空後仍可送出
+    assert quota.acquire(500) is not None
+
+
+def test_quota_acquire_cancel():
+    """測試：等待配額期間可以取消"""
+    quota = QuotaLimiter(rpm=1)
+    quota.acquire()
+    start = time.monotonic()
+    assert quota.acquire(cancel_check=lambda: True) is None
+    assert time.monotonic() - start < 1.5
+
+    # 同名配額限制器共用，並以新設定更新
+    shared = get_quota_limiter('test_quota', rpm=10, tpm=1000)
+    assert get_quota_limiter('test_quota', rpm=20, tpm=1000) is shared
+    assert shared.rpm == 20
+
+
+if __name__ == '__main__':
+    test_burst_then_steady_rate()
+    test_threads_share_limit()
+    test_throttle_blocks_and_recovers()
+    test_report_response()
+    test_parse_retry_after()
+    test_is_rate_limit_error()
+    test_registry_shared_and_configurable()
+    test_quota_rpm_window()
+    test_quota_tpm_and_settle()
+    test_quota_acquire_cancel()
+    print("All rate limiter tests passed")
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+掃描器測試：os.scandir 列出資料夾、多執行緒探測與 gamelist.xml 中繼資料
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# 將專案根目錄加入 Python Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.manifest import file_state
+from src.core.scanner import Scanner, is_network_path, LOCAL_SCAN_WORKERS, NETWORK_SCAN_WORKERS
+
+
+def make_roms(root: Path, platforms, without_gamelist=()):
+    """建立測試用 ROM 目錄"""
+    for name in platforms:
+        (root / name).mkdir(parents=True)
+        (root / name / 'gamelist.xml').write_text(
+            f'<gameList><!-- {name} --></gameList>', encoding='utf-8')
+    for name in without_gamelist:
+        (root / name).mkdir(parents=True)
+    (root / 'readme.txt').write_text('not a platform', encoding='utf-8')
+
+
+def test_scan_reports_gamelist_metadata():
+    """測試：掃描結果包含 gamelist.xml 的大小與修改時間，且與 file_state 一致"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        roms = Path(temp_dir)
+        make_roms(roms, ['nes', 'SNES', 'gba'], without_gamelist=['bios'])
+
+        scanner = Scanner(str(roms), max_workers=2)
+        platforms = scanner.scan()
+
+        assert sorted(p.name for p in platforms) == ['bios', 'gba', 'nes', 'snes']
+        by_name = {p.name: p for p in platforms}
+        assert not by_name['bios'].has_gamelist
+        assert by_name['bios'].gamelist_state is None
+
+        nes = by_name['nes']
+        assert nes.has_gamelist and nes.gamelist_path == roms / 'nes' / 'gamelist.xml'
+        assert nes.gamelist_state == file_state(nes.gamelist_path)
+        assert by_name['snes'].path == roms / 'SNES'
+
+        assert sorted(p.name for p in scanner.get_platforms_with_gamelist()) == \
+            ['gba', 'nes', 'snes']
+
+
+def test_scan_preserves_directory_order_and_reports_progress():
+    """測試：結果依目錄列出的順序，每完成一個平台就回呼一次"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        roms = Path(temp_dir)
+        names = [f'platform{i:02d}' for i in range(20)]
+        make_roms(roms, names)
+
+        calls = []
+        platforms = Scanner(str(roms), max_workers=8).scan(
+            on_platform=lambda p, done, total: calls.append((p.name, done, total)))
+
+        with os.scandir(roms) as it:
+            expected = [e.name for e in it if e.is_dir()]
+        assert [p.name for p in platforms] == expected
+        assert sorted(c[0] for c in calls) == sorted(names)
+        assert [c[1] for c in calls] == list(range(1, 21))
+        assert all(c[2] == 20 for c in calls)
+
+
+def test_missing_roms_path_and_network_defaults():
+    """測試：ROM 目錄不存在時拋出例外；網路路徑預設使用較多執行緒"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        try:
+            Scanner(str(Path(temp_dir) / 'missing')).scan()
+            assert False, "應拋出 FileNotFoundError"
+        except FileNotFoundError:
+            pass
+
+        assert Scanner(temp_dir).max_workers == LOCAL_SCAN_WORKERS
+
+    assert is_network_path(Path('//BATOCERA/share/roms'))
+    assert is_network_path('\\\\wsl.localhost\\Ubuntu\\roms')
+    assert not is_network_path(Path('/userdata/roms'))
+    assert Scanner('//BATOCERA/share/roms').max_workers == NETWORK_SCAN_WORKERS
+    assert Scanner('//BATOCERA/share/roms', max_workers=3).max_workers == 3
+
+
+if __name__ == '__main__':
+    test_scan_reports_gamelist_metadata()
+    test_scan_preserves_directory_order_and_reports_progress()
+    test_missing_roms_path_and_network_defaults()
+    print("All scanner tests passed")
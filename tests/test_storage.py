@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+字典儲存後端測試（JSON / SQLite）
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# 將專案根目錄加入 Python Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.dictionary import DictionaryManager, DictionaryStats, GameEntry
+from src.core.storage import JsonStorage, SqliteStorage, create_storage
+
+
+def make_dictionary():
+    return {
+        'a': GameEntry(key='a', original_name='A', name='甲', name_source='wiki'),
+        'b': GameEntry(key='b', original_name='B'),
+        'c': GameEntry(key='c', original_name='C', name='丙', name_source='wiki',
+                           desc='描述', desc_source='api', needs_retranslate=True),
+    }
+
+
+def sqlite_manager(tmp_path):
+    dicts = tmp_path / 'dicts'
+    storage = create_storage('sqlite', dicts, tmp_path / 'packs')
+    return DictionaryManager(dicts, storage=storage), storage
+
+
+def test_sqlite_round_trip_and_counts(tmp_path, language_packs):
+    """測試：SQLite 後端存取結果與 JSON 相同，統計直接由 SQL 計算"""
+    manager, storage = sqlite_manager(tmp_path)
+    assert isinstance(storage, SqliteStorage)
+    manager.save_dictionary('zh-TW', 'nes', make_dictionary())
+
+    loaded = manager.load_dictionary('zh-TW', 'nes')
+    assert set(loaded) == {'a', 'b', 'c'}
+    assert loaded['c'].desc == '描述'
+    assert loaded['c'].needs_retranslate
+
+    manager.load_dictionary = lambda *args: (_ for _ in ()).throw(
+        AssertionError("不應載入完整字典"))
+    assert manager.get_dictionary_stats('zh-TW', 'nes') == DictionaryStats(
+        entries=3, name_translated=2, desc_translated=1, needs_retranslate=1)
+
+    # 預設不寫 JSON
+    assert not (language_packs / 'zh-TW' / 'nes.json').exists()
+    assert manager.get_available_platforms('zh-TW') == ['nes']
+    storage.close()
+
+
+def test_sqlite_partial_save(tmp_path, language_packs):
+    """測試：指定 changed_keys 時只寫入（或刪除）變更的項目"""
+    manager, storage = sqlite_manager(tmp_path)
+    dictionary = make_dictionary()
+    manager.save_dictionary('zh-TW', 'nes', dictionary)
+
+    dictionary['b'].name = '乙'
+    dictionary['b'].name_source = 'api'
+    del dictionary['a']
+    dictionary['x'] = GameEntry(key='x', original_name='X', name='未儲存')
+    manager.save_dictionary('zh-TW', 'nes', dictionary, changed_keys=['b', 'a'])
+
+    loaded = manager.load_dictionary('zh-TW', 'nes')
+    assert set(loaded) == {'b', 'c'}
+    assert loaded['b'].name == '乙'
+    storage.close()
+
+
+def test_iter_pending_entries(tmp_path, language_packs):
+    """測試：逐筆取得待翻譯項目，SQLite 後端以索引欄位查詢，不載入完整字典"""
+    sqlite, storage = sqlite_manager(tmp_path)
+    json_manager = DictionaryManager(
+        tmp_path / 'json', storage=create_storage(
+            'json', tmp_path / 'json', language_packs))
+    for manager in (sqlite, json_manager):
+        manager.save_dictionary('zh-TW', 'nes', make_dictionary())
+    sqlite.load_dictionary = lambda *args: (_ for _ in ()).throw(
+        AssertionError("不應載入完整字典"))
+
+    for manager in (sqlite, json_manager):
+        pending = dict(manager.iter_pending_entries('zh-TW', 'nes', translate_desc=False))
+        assert set(pending) == {'b', 'c'}
+        assert pending['b'].key == 'b'
+        assert pending['b'].original_name == 'B'
+        assert {key for key, _ in manager.iter_pending_entries('zh-TW', 'nes')} == {'a', 'b', 'c'}
+        assert [key for key, _ in manager.iter_pending_entries(
+            'zh-TW', 'nes', translate_name=False, translate_desc=False)] == ['c']
+    storage.close()
+
+
+def test_sqlite_migrates_json_and_exports(tmp_path, language_packs):
+    """測試：首次載入從 JSON 字典匯入，並可匯出回 language_packs"""
+    json_manager = DictionaryManager(tmp_path / 'dicts',
+                                     storage=JsonStorage(tmp_path / 'dicts', language_packs))
+    json_manager.save_dictionary('zh-TW', 'snes', make_dictionary())
+
+    manager, storage = sqlite_manager(tmp_path)
+    loaded = manager.load_dictionary('zh-TW', 'snes')
+    assert loaded['a'].name == '甲'
+
+    loaded['b'].name = '乙'
+    loaded['b'].name_source = 'api'
+    manager.save_dictionary('zh-TW', 'snes', loaded, changed_keys=['b'])
+    assert manager.export_language_packs('zh-TW') == 1
+
+    with open(language_packs / 'zh-TW' / 'snes.json', 'r', encoding='utf-8') as f:
+        exported = json.load(f)
+    assert exported['b']['name'] == '乙'
+
+    manager.delete_dictionary('zh-TW', 'snes')
+    assert manager.get_available_platforms('zh-TW') == []
+    storage.close()
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
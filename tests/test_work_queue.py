@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+工作佇列測試
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# 將專案根目錄加入 Python Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.work_queue import WorkQueue
+
+
+def test_slow_item_does_not_stall_others():
+    """測試：單一慢項目不會讓其他 worker 空等（沒有批次屏障）"""
+    def work(item):
+        time.sleep(0.5 if item == 0 else 0.01)
+        return item * 2
+
+    order = []
+    stats = WorkQueue(work, num_workers=4).run(
+        range(40), on_result=lambda item, result: order.append((item, result)))
+
+    assert stats.completed == 40
+    assert stats.errors == 0
+    assert order[-1] == (0, 0)
+    # 其餘 39 個由另外 3 個 worker 持續處理，總時間接近最慢的單一項目
+    assert stats.elapsed < 0.5 + 0.3
+
+
+def test_callbacks_run_in_caller_thread():
+    """測試：結果回呼在呼叫 run() 的執行緒執行"""
+    caller = threading.current_thread()
+    threads = set()
+
+    WorkQueue(lambda item: item, num_workers=3).run(
+        range(10), on_result=lambda item, result: threads.add(threading.current_thread()))
+
+    assert threads == {caller}
+
+
+def test_cancellation_discards_pending():
+    """測試：取消後不再處理佇列中尚未開始的項目"""
+    done = []
+
+    def work(item):
+        time.sleep(0.01)
+        return item
+
+    stats = WorkQueue(work, num_workers=2).run(
+        range(100),
+        on_result=lambda item, result: done.append(item),
+        is_cancelled=lambda: len(done) >= 5)
+
+    assert stats.cancelled
+    assert stats.completed < 100
+    assert len(done) == stats.completed
+
+
+def test_errors_are_reported():
+    """測試：worker 或回呼中的例外不會中斷其他項目"""
+    def work(item):
+        if item == 3:
+            raise RuntimeError("boom")
+        return item
+
+    def on_result(item, result):
+        if item == 5:
+            raise ValueError("bad result")
+
+    errors = []
+    stats = WorkQueue(work, num_workers=3).run(
+        range(8), on_result=on_result,
+        on_error=lambda item, e: errors.append(item))
+
+    assert stats.completed == 8
+    assert stats.errors == 2
+    assert sorted(errors) == [3, 5]
+
+
+def test_failing_iterator_is_raised():
+    """測試：項目來源拋出例外時，已放入的項目仍處理完，例外由 run() 拋出"""
+    def items():
+        yield 1
+        yield 2
+        raise OSError("disk read failed")
+
+    done = []
+    try:
+        WorkQueue(lambda item: item, num_workers=2).run(
+            items(), on_result=lambda item, result: done.append(item))
+    except OSError as e:
+        assert str(e) == "disk read failed"
+    else:
+        assert False, "run() 應拋出來源的例外"
+    assert sorted(done) == [1, 2]
+
+
+def test_utilization_and_busy_count():
+    """測試：忙碌 worker 數與使用率統計"""
+    busy_seen = []
+    work_queue = WorkQueue(lambda item: time.sleep(0.02), num_workers=4)
+
+    stats = work_queue.run(
+        range(20), on_result=lambda item, result: busy_seen.append(work_queue.busy_count))
+
+    assert max(busy_seen) <= 4
+    assert work_queue.busy_count == 0
+    assert 0.5 < stats.utilization <= 1.0
+    assert stats.throughput > 0
+
+
+if __name__ == '__main__':
+    test_slow_item_does_not_stall_others()
+    test_callbacks_run_in_caller_thread()
+    test_cancellation_discards_pending()
+    test_errors_are_reported()
+    test_failing_iterator_is_raised()
+    test_utilization_and_busy_count()
+    print("All work queue tests passed")
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+階段四平行寫回測試
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# 將專案根目錄加入 Python Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.dictionary import DictionaryManager, GameEntry
+from src.core.pipeline import StagePipeline
+from src.core.writer import WriteResult
+from src.utils.settings import AppSettings
+
+
+GAMELIST = """<?xml version="1.0"?>
+<gameList>
+    <game>
+        <path>./Tetris (USA).nes</path>
+        <name>Tetris</name>
+    </game>
+    <game>
+        <path>./Unknown.nes</path>
+        <name>Unknown</name>
+    </game>
+</gameList>
+"""
+
+
+def make_platforms(temp, count):
+    """建立 count 個平台的暫存區 gamelist 與字典，最後一個平台沒有翻譯"""
+    manager = DictionaryManager()
+    for i in range(count):
+        platform = f'platform{i}'
+        (temp / 'cache' / platform).mkdir(parents=True)
+        (temp / 'cache' / platform / 'gamelist.xml').write_text(GAMELIST, encoding='utf-8')
+        entry = GameEntry(key='Tetris (USA)', original_name='Tetris')
+        if i < count - 1:
+            entry.name = f'俄羅斯方塊 {i}'
+            entry.name_source = 'wiki'
+        manager.save_dictionary('zh-TW', platform, {entry.key: entry})
+
+
+def test_parallel_write_back_aggregates_results(tmp_path, temp_dictionaries):
+    """測試：多個平台同時寫回，結果彙總正確"""
+    make_platforms(tmp_path, 6)
+    # 格式錯誤的平台計入失敗，不影響其他平台
+    (tmp_path / 'cache' / 'broken').mkdir()
+    (tmp_path / 'cache' / 'broken' / 'gamelist.xml').write_text('<gameList><game>', encoding='utf-8')
+    DictionaryManager().save_dictionary(
+        'zh-TW', 'broken', {'x': GameEntry(key='x', original_name='X', name='叉', name_source='wiki')})
+
+    settings = AppSettings()
+    pipeline = StagePipeline(settings=settings, local_cache_path=str(tmp_path / 'cache'),
+                             manifest_path=tmp_path / 'manifest.json')
+    result = pipeline.write_back('zh-TW', auto_backup=False, num_workers=3)
+
+    assert result == {'updated': 5, 'changed': 5, 'written': 5, 'failed': 1, 'unchanged': 0}
+    text = (tmp_path / 'cache' / 'platform2' / 'gamelist.xml').read_text(encoding='utf-8')
+    assert '<name>俄羅斯方塊 2</name>' in text
+    assert (tmp_path / 'cache' / 'platform5' / 'gamelist.xml').read_text(encoding='utf-8') == GAMELIST
+
+    # 再執行一次：依變更清單略過已寫回的平台（失敗的平台仍會重試）
+    again = pipeline.write_back('zh-TW', auto_backup=False, num_workers=3)
+    assert again == {'updated': 0, 'changed': 0, 'written': 0, 'failed': 1, 'unchanged': 6}
+
+    # 不使用變更清單：內容相同，仍不寫入任何檔案
+    settings.skip_unchanged = False
+    forced = pipeline.write_back('zh-TW', auto_backup=False, num_workers=3)
+    assert forced['written'] == 0 and forced['updated'] == 5
+
+
+def test_write_result_merge():
+    """測試：WriteResult 累加"""
+    totals = WriteResult()
+    totals.merge(WriteResult(total=3, updated=2, skipped=1, changed=1, written=True))
+    totals.merge(WriteResult(total=2, failed=1))
+    assert (totals.total, totals.updated, totals.skipped, totals.failed,
+            totals.changed, totals.written) == (5, 2, 1, 1, 1, True)
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
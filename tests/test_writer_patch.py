@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+XML 寫回修補模式測試
+"""
+
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+# 將專案根目錄加入 Python Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.writer import XmlWriter
+from src.core.dictionary import GameEntry
+
+
+GAMELIST = '''<?xml version="1.0" encoding="UTF-8"?>
+<gameList>
+  <!-- scraped -->
+  <game id="1" source="ScreenScraper.fr">
+    <path>./mario.nes</path>
+    <desc>Jump &amp; run</desc>
+    <name>Mario</name>
+    <rating>0.5</rating>
+  </game>
+  <game>
+    <path>./zelda.nes</path>
+    <name>Zelda</name>
+  </game>
+  <game><path>./other.nes</path><name>Other</name></game>
+</gameList>
+'''
+
+
+def make_dictionary():
+    return {
+        'mario': GameEntry(key='mario', original_name='Mario', name='瑪利歐', name_source='wiki',
+                           original_desc='Jump & run', desc='跳躍 <動作>', desc_source='api'),
+        'zelda': GameEntry(key='zelda', original_name='Zelda', desc='薩爾達傳說', desc_source='api'),
+    }
+
+
+def setup(temp_dir, content=GAMELIST, encoding='utf-8'):
+    path = Path(temp_dir) / 'gamelist.xml'
+    path.write_bytes(content.encode(encoding))
+    return path, XmlWriter(backup_path=str(Path(temp_dir) / 'backups'))
+
+
+def test_patch_keeps_unchanged_bytes():
+    """測試：只改寫變更的元素，其餘內容逐位元組保留"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path, writer = setup(temp_dir)
+        result = writer.write_translations(path, make_dictionary(), 'nes')
+
+        assert (result.total, result.updated, result.changed, result.skipped) == (3, 2, 2, 1)
+        assert result.written and Path(result.backup_path).exists()
+
+        expected = (GAMELIST
+                    .replace('<desc>Jump &amp; run</desc>', '<desc>跳躍 &lt;動作&gt;</desc>')
+                    .replace('<name>Mario</name>', '<name>瑪利歐</name>')
+                    .replace('<name>Zelda</name>\n', '<name>Zelda</name>\n    <desc>薩爾達傳說</desc>\n'))
+        assert path.read_text(encoding='utf-8') == expected
+
+        games = ET.parse(path).getroot().findall('game')
+        assert games[0].find('desc').text == '跳躍 <動作>'
+
+
+def test_no_write_when_unchanged():
+    """測試：沒有變更時不寫入也不備份"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path, writer = setup(temp_dir)
+        writer.write_translations(path, make_dictionary(), 'nes', auto_backup=False)
+        mtime = path.stat().st_mtime_ns
+
+        result = writer.write_translations(path, make_dictionary(), 'nes')
+        assert result.updated == 2 and result.changed == 0
+        assert not result.written and not result.backup_path
+        assert path.stat().st_mtime_ns == mtime
+        assert not (Path(temp_dir) / 'backups').exists()
+
+
+def test_non_utf8_falls_back_to_tree():
+    """測試：非 UTF-8 編碼的檔案改用完整重寫"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        content = GAMELIST.replace('UTF-8', 'ISO-8859-1').replace('Jump &amp; run', 'Café')
+        path, writer = setup(temp_dir, content, encoding='latin-1')
+        dictionary = make_dictionary()
+        dictionary['mario'].original_desc = 'Café'
+
+        result = writer.write_translations(path, dictionary, 'nes', auto_backup=False)
+        assert result.written and result.changed == 2
+
+        games = ET.parse(path).getroot().findall('game')
+        assert games[0].find('name').text == '瑪利歐'
+        assert games[1].find('desc').text == '薩爾達傳說'
+
+
+if __name__ == '__main__':
+    test_patch_keeps_unchanged_bytes()
+    test_no_write_when_unchanged()
+    test_non_utf8_falls_back_to_tree()
+    print("All writer patch tests passed")
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+gamelist.xml 串流解析測試
+"""
+
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+# 將專案根目錄加入 Python Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.xml_utils import (iter_gamelist, parse_gamelist,
+                                 get_game_count, validate_gamelist)
+
+
+GAMELIST = '''<?xml version="1.0"?>
+<gameList>
+    <game>
+        <path>./Super Mario Bros.nes</path>
+        <name>Super Mario Bros.</name>
+        <desc>A platform game.</desc>
+        <rating>0.9</rating>
+    </game>
+    <game>
+        <path>./no-name.nes</path>
+    </game>
+    <folder>
+        <game><path>./nested.nes</path><name>Nested</name></game>
+    </folder>
+    <game>
+        <path>./Zelda.nes</path>
+        <name>The Legend of Zelda</name>
+    </game>
+</gameList>
+'''
+
+
+def write(temp_dir, content):
+    path = Path(temp_dir) / 'gamelist.xml'
+    path.write_text(content, encoding='utf-8')
+    return path
+
+
+def test_iter_gamelist_matches_parse():
+    """測試：串流解析只取第一層 <game>，略過缺少名稱的項目"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = write(temp_dir, GAMELIST)
+
+        games = list(iter_gamelist(path))
+        assert [g.name for g in games] == ['Super Mario Bros.', 'The Legend of Zelda']
+        assert games[0].desc == 'A platform game.'
+        assert games[0].rating == 0.9
+        assert parse_gamelist(path) == games
+
+        assert get_game_count(path) == 3
+        assert validate_gamelist(path) == (True, '')
+        assert list(iter_gamelist(Path(temp_dir) / 'missing.xml')) == []
+
+
+def test_iter_gamelist_streams_before_error():
+    """測試：錯誤位置之前的遊戲會先產出，parse_gamelist 維持回傳空清單"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = write(temp_dir, GAMELIST[:GAMELIST.index('<folder>')] + '<game><pa')
+
+        games = iter_gamelist(path)
+        assert next(games).name == 'Super Mario Bros.'
+        try:
+            list(games)
+            assert False, "應拋出 ParseError"
+        except ET.ParseError:
+            pass
+
+        assert parse_gamelist(path) == []
+        assert get_game_count(path) == 0
+        assert validate_gamelist(path)[0] is False
+
+
+def test_validate_root_and_empty():
+    """測試：根元素錯誤與沒有遊戲的情況"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        assert validate_gamelist(write(temp_dir, '<games><game/></games>')) == \
+            (False, "根元素應為 gameList，但找到 games")
+        assert validate_gamelist(write(temp_dir, '<gameList><folder/></gameList>')) == \
+            (True, "警告：沒有找到任何遊戲")
+
+
+if __name__ == '__main__':
+    test_iter_gamelist_matches_parse()
+    test_iter_gamelist_streams_before_error()
+    test_validate_root_and_empty()
+    print("All xml_utils tests passed")